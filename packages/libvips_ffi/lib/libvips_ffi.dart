@@ -35,8 +35,10 @@
 ///
 /// ## Asynchronous API / 异步 API
 ///
-/// For async operations that don't block the UI thread, use [VipsPipelineCompute]:
-/// 对于不阻塞 UI 线程的异步操作，使用 [VipsPipelineCompute]：
+/// For async operations that don't block the UI thread, use [VipsPipelineCompute].
+/// Jobs run on a pool of long-lived isolates ([VipsIsolatePool]):
+/// 对于不阻塞 UI 线程的异步操作，使用 [VipsPipelineCompute]，任务在常驻 isolate 池
+/// （[VipsIsolatePool]）中执行：
 ///
 /// ```dart
 /// final result = await VipsPipelineCompute.processFile(
@@ -67,10 +69,12 @@ export 'package:libvips_ffi_core/libvips_ffi_core.dart';
 // 导出平台加载器和 initVips 函数
 export 'src/platform_loader.dart' show PlatformVipsLoader, initVips;
 
-// Export compute-based async API (uses Flutter's compute).
-// 导出基于 compute 的异步 API（使用 Flutter 的 compute）。
+// Export isolate-based async API (runs on a pool of worker isolates).
+// 导出基于 isolate 的异步 API（在工作 isolate 池中执行）。
 export 'src/compute/types.dart' show VipsComputeResult;
 export 'src/compute/pipeline_compute.dart' show VipsPipelineCompute;
+export 'src/compute/vips_isolate_pool.dart'
+    show VipsIsolatePool, VipsCancelToken, VipsCancelledException, initVipsWorker;
 
 // Re-export api package for pipeline-based processing.
 // 重新导出 api 包，用于基于管道的处理。
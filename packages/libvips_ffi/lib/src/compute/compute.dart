@@ -5,3 +5,4 @@ library;
 
 export 'types.dart';
 export 'pipeline_compute.dart';
+export 'vips_isolate_pool.dart';
@@ -1,9 +1,11 @@
+import 'dart:async';
+import 'dart:isolate';
+
 import 'package:flutter/foundation.dart';
 import 'package:libvips_ffi_api/libvips_ffi_api.dart';
-import 'package:libvips_ffi_core/libvips_ffi_core.dart' as core;
 
-import '../platform_loader.dart';
 import 'types.dart';
+import 'vips_isolate_pool.dart';
 
 /// Parameters for pipeline-based compute operations.
 class PipelineComputeParams {
@@ -24,34 +26,54 @@ class JoinPipelineComputeParams {
 class PipelineCallbackParams {
   final String? inputPath;
   final Uint8List? inputData;
+
+  /// Native input whose ownership moves to the executing isolate.
+  final VipsNativeBufferHandle? inputNative;
   final VipsPipeline Function(VipsPipeline) operation;
   final String outputFormat;
 
   PipelineCallbackParams({
     this.inputPath,
     this.inputData,
+    this.inputNative,
     required this.operation,
     this.outputFormat = '.png',
   });
 }
 
+/// Encoded output of a worker job.
+///
+/// 工作 isolate 的编码结果，数据以 [TransferableTypedData] 传回主 isolate，不再复制。
+class _EncodedResult {
+  final TransferableTypedData data;
+  final int width;
+  final int height;
+  final int bands;
+
+  _EncodedResult(this.data, {this.width = 0, this.height = 0, this.bands = 0});
+
+  VipsComputeResult materialize() => VipsComputeResult(
+        data: data.materialize().asUint8List(),
+        width: width,
+        height: height,
+        bands: bands,
+      );
+}
+
 /// Execute a JoinPipelineSpec in an isolate.
 ///
 /// 在 isolate 中执行 JoinPipelineSpec。
 VipsComputeResult executeJoinPipelineIsolate(JoinPipelineComputeParams params) {
-  initVips();
-  initVipsApi(core.vipsLibrary);
-
-  try {
-    if (params.outputPath != null) {
-      params.spec.executeToFile(params.outputPath!);
-      return VipsComputeResult(data: Uint8List(0), width: 0, height: 0, bands: 0);
-    } else {
-      final result = params.spec.execute();
-      return VipsComputeResult(data: result, width: 0, height: 0, bands: 0);
-    }
-  } finally {
-    // Note: don't shutdown vips here as it may be reused
+  initVipsWorker();
+  return _runJoinPipeline(params).materialize();
+}
+
+_EncodedResult _runJoinPipeline(JoinPipelineComputeParams params) {
+  if (params.outputPath != null) {
+    params.spec.executeToFile(params.outputPath!);
+    return _EncodedResult(TransferableTypedData.fromList(const []));
+  } else {
+    return _EncodedResult(params.spec.executeTransferable());
   }
 }
 
@@ -60,21 +82,13 @@ VipsComputeResult executeJoinPipelineIsolate(JoinPipelineComputeParams params) {
 /// 在 isolate 中执行 PipelineSpec。
 VipsComputeResult executePipelineIsolate(PipelineComputeParams params) {
   // Initialize both core libvips and api bindings in this isolate
-  initVips();
-  initVipsApi(core.vipsLibrary);
-
-  try {
-    // Execute the pipeline spec - execute() handles everything internally
-    final result = params.spec.execute();
-    return VipsComputeResult(
-      data: result,
-      width: 0, // Width/height not available from execute()
-      height: 0,
-      bands: 0,
-    );
-  } finally {
-    // Note: don't shutdown vips here as it may be reused
-  }
+  initVipsWorker();
+  return _runPipeline(params).materialize();
+}
+
+_EncodedResult _runPipeline(PipelineComputeParams params) {
+  // Width/height not available from execute()
+  return _EncodedResult(params.spec.executeTransferable());
 }
 
 /// Execute a VipsPipeline callback in an isolate.
@@ -82,39 +96,33 @@ VipsComputeResult executePipelineIsolate(PipelineComputeParams params) {
 /// 在 isolate 中执行 VipsPipeline 回调。
 VipsComputeResult executePipelineCallbackIsolate(PipelineCallbackParams params) {
   // Initialize libvips in this isolate
-  initVips();
-
-  try {
-    // Create pipeline from input
-    late VipsPipeline pipeline;
-    if (params.inputPath != null) {
-      pipeline = VipsPipeline.fromFile(params.inputPath!);
-    } else if (params.inputData != null) {
-      pipeline = VipsPipeline.fromBuffer(params.inputData!);
-    } else {
-      throw ArgumentError('Must provide inputPath or inputData');
-    }
+  initVipsWorker();
+  return _runPipelineCallback(params).materialize();
+}
 
-    // Apply user operation
-    pipeline = params.operation(pipeline);
+_EncodedResult _runPipelineCallback(PipelineCallbackParams params) {
+  // Create pipeline from input
+  late VipsPipeline pipeline;
+  if (params.inputPath != null) {
+    pipeline = VipsPipeline.fromFile(params.inputPath!);
+  } else if (params.inputData != null) {
+    pipeline = VipsPipeline.fromBuffer(params.inputData!);
+  } else if (params.inputNative != null) {
+    pipeline = VipsPipeline.fromNativeBuffer(VipsNativeBuffer.adopt(params.inputNative!));
+  } else {
+    throw ArgumentError('Must provide inputPath, inputData or inputNative');
+  }
 
-    // Get result
-    final data = pipeline.toBuffer(format: params.outputFormat);
-    final width = pipeline.image.width;
-    final height = pipeline.image.height;
-    final bands = pipeline.image.bands;
+  // Apply user operation
+  pipeline = params.operation(pipeline);
 
-    pipeline.dispose();
+  // 编码前读取尺寸（toTransferable 会释放 pipeline）
+  final width = pipeline.width;
+  final height = pipeline.height;
+  final bands = pipeline.bands;
+  final data = pipeline.toTransferable(format: params.outputFormat);
 
-    return VipsComputeResult(
-      data: data,
-      width: width,
-      height: height,
-      bands: bands,
-    );
-  } finally {
-    // Note: don't shutdown vips here as it may be reused
-  }
+  return _EncodedResult(data, width: width, height: height, bands: bands);
 }
 
 /// High-level API for executing PipelineSpec or VipsPipeline in isolates.
@@ -132,6 +140,11 @@ VipsComputeResult executePipelineCallbackIsolate(PipelineCallbackParams params)
 /// );
 /// ```
 ///
+/// Jobs run on [VipsIsolatePool.shared], whose isolates initialize libvips
+/// once and are reused; pass [VipsIsolatePool] to use another pool and a
+/// [VipsCancelToken] to cancel a job.
+/// 任务在 [VipsIsolatePool.shared] 中执行，其 isolate 只初始化一次 libvips 并被复用。
+///
 /// ## Using VipsPipeline callback (more flexible)
 /// ```dart
 /// final result = await VipsPipelineCompute.processFile(
@@ -143,17 +156,81 @@ VipsComputeResult executePipelineCallbackIsolate(PipelineCallbackParams params)
 /// );
 /// ```
 class VipsPipelineCompute {
-  /// Execute a PipelineSpec asynchronously using Flutter's compute.
+  /// Execute a PipelineSpec asynchronously in a worker isolate.
+  ///
+  /// 在工作 isolate 中异步执行 PipelineSpec。
   ///
-  /// 使用 Flutter 的 compute 异步执行 PipelineSpec。
-  static Future<Uint8List> execute(PipelineSpec spec) async {
-    final result = await compute(
-      executePipelineIsolate,
-      PipelineComputeParams(spec: spec),
+  /// Input owned by [spec] moves to the job (see [PipelineSpec.handOff])
+  /// and is freed if the job is cancelled or fails before it starts.
+  /// [spec] 持有的输入转交给任务；任务未开始就被取消或失败时释放该输入。
+  static Future<Uint8List> execute(
+    PipelineSpec spec, {
+    VipsIsolatePool? pool,
+    VipsCancelToken? cancelToken,
+  }) async {
+    final owned = spec.handOff();
+    final params = PipelineComputeParams(spec: owned);
+    final result = await (pool ?? VipsIsolatePool.shared).run(
+      () => _runPipeline(params),
+      cancelToken: cancelToken,
+      onDiscard: owned.releaseInput,
     );
-    return result.data;
+    return result.data.materialize().asUint8List();
+  }
+
+  /// Execute a PipelineSpec in a worker isolate and stream the output
+  /// into [sink] as it is encoded.
+  ///
+  /// 在工作 isolate 中执行 PipelineSpec，编码输出边生成边写入 [sink]。
+  ///
+  /// [sink] is not closed. Combine with [PipelineSpec.inputStream] to go
+  /// from an HTTP body to a socket without holding either image in memory.
+  /// There is no cancel token: a running job cannot be interrupted, and
+  /// the output already written to [sink] could not be taken back.
+  /// If the job fails, [sink] is released before the error is thrown.
+  /// 不会关闭 [sink]；没有取消令牌，正在执行的任务无法中断。
+  static Future<void> executeToSink(
+    PipelineSpec spec,
+    StreamSink<List<int>> sink, {
+    VipsIsolatePool? pool,
+  }) async {
+    final workers = pool ?? VipsIsolatePool.shared;
+    if (workers.isClosed) throw StateError('VipsIsolatePool has been closed');
+    final owned = spec.handOff();
+    final VipsStreamTarget target;
+    try {
+      target = VipsStreamTarget(sink);
+    } catch (_) {
+      owned.releaseInput();
+      rethrow;
+    }
+    var sent = true;
+    try {
+      await workers.run(
+        _descriptorTask(owned, target.descriptor),
+        onDiscard: () {
+          // 任务未发送：描述符仍归本 isolate，关闭写端让输出结束
+          sent = false;
+          target.close();
+          owned.releaseInput();
+        },
+      );
+    } catch (_) {
+      // 已发送的任务崩溃时无法确定描述符是否已关闭，不再等待输出
+      if (sent) target.abort();
+      // 报告任务的错误；输出端的错误（如 sink 已关闭）通常是其原因
+      target.done.ignore();
+      rethrow;
+    }
+    target.takeDescriptor();
+    await target.done;
   }
 
+  /// Kept apart from [executeToSink] so that the closure sent to the worker
+  /// captures only [spec] and [descriptor].
+  static void Function() _descriptorTask(PipelineSpec spec, int descriptor) =>
+      () => spec.executeToDescriptor(descriptor);
+
   /// Process a file using VipsPipeline callback.
   ///
   /// 使用 VipsPipeline 回调处理文件。
@@ -165,15 +242,17 @@ class VipsPipelineCompute {
     String filePath,
     VipsPipeline Function(VipsPipeline) operation, {
     String outputFormat = '.png',
+    VipsIsolatePool? pool,
+    VipsCancelToken? cancelToken,
   }) {
-    return compute(
-      executePipelineCallbackIsolate,
-      PipelineCallbackParams(
-        inputPath: filePath,
-        operation: operation,
-        outputFormat: outputFormat,
-      ),
+    final params = PipelineCallbackParams(
+      inputPath: filePath,
+      operation: operation,
+      outputFormat: outputFormat,
     );
+    return (pool ?? VipsIsolatePool.shared)
+        .run(() => _runPipelineCallback(params), cancelToken: cancelToken)
+        .then((result) => result.materialize());
   }
 
   /// Process buffer data using VipsPipeline callback.
@@ -187,15 +266,47 @@ class VipsPipelineCompute {
     Uint8List data,
     VipsPipeline Function(VipsPipeline) operation, {
     String outputFormat = '.png',
+    VipsIsolatePool? pool,
+    VipsCancelToken? cancelToken,
   }) {
-    return compute(
-      executePipelineCallbackIsolate,
-      PipelineCallbackParams(
-        inputData: data,
-        operation: operation,
-        outputFormat: outputFormat,
-      ),
+    final params = PipelineCallbackParams(
+      inputData: data,
+      operation: operation,
+      outputFormat: outputFormat,
     );
+    return (pool ?? VipsIsolatePool.shared)
+        .run(() => _runPipelineCallback(params), cancelToken: cancelToken)
+        .then((result) => result.materialize());
+  }
+
+  /// Process data in native memory using VipsPipeline callback.
+  ///
+  /// 使用 VipsPipeline 回调处理原生内存中的数据。
+  ///
+  /// Ownership of [buffer] moves to the worker isolate, which hands the
+  /// memory to libvips without copying it. The memory is freed if the job
+  /// is cancelled or fails before it starts.
+  /// [buffer] 的所有权转移给工作 isolate，数据不经复制直接交给 libvips。
+  static Future<VipsComputeResult> processNativeBuffer(
+    VipsNativeBuffer buffer,
+    VipsPipeline Function(VipsPipeline) operation, {
+    String outputFormat = '.png',
+    VipsIsolatePool? pool,
+    VipsCancelToken? cancelToken,
+  }) {
+    final handle = buffer.transfer();
+    final params = PipelineCallbackParams(
+      inputNative: handle,
+      operation: operation,
+      outputFormat: outputFormat,
+    );
+    return (pool ?? VipsIsolatePool.shared)
+        .run(
+          () => _runPipelineCallback(params),
+          cancelToken: cancelToken,
+          onDiscard: () => VipsNativeBuffer.adopt(handle).free(),
+        )
+        .then((result) => result.materialize());
   }
 
   /// Create a new PipelineSpec for building operations.
@@ -217,22 +328,29 @@ class VipsPipelineCompute {
   ///     .outputPng(),
   /// );
   /// ```
-  static Future<Uint8List> executeJoin(JoinPipelineSpec spec) async {
-    final result = await compute(
-      executeJoinPipelineIsolate,
-      JoinPipelineComputeParams(spec: spec),
-    );
-    return result.data;
+  static Future<Uint8List> executeJoin(
+    JoinPipelineSpec spec, {
+    VipsIsolatePool? pool,
+    VipsCancelToken? cancelToken,
+  }) async {
+    final params = JoinPipelineComputeParams(spec: spec);
+    final result = await (pool ?? VipsIsolatePool.shared)
+        .run(() => _runJoinPipeline(params), cancelToken: cancelToken);
+    return result.data.materialize().asUint8List();
   }
 
   /// Execute a JoinPipelineSpec and save to file.
   ///
   /// 执行 JoinPipelineSpec 并保存到文件。
-  static Future<void> executeJoinToFile(JoinPipelineSpec spec, String outputPath) async {
-    await compute(
-      executeJoinPipelineIsolate,
-      JoinPipelineComputeParams(spec: spec, outputPath: outputPath),
-    );
+  static Future<void> executeJoinToFile(
+    JoinPipelineSpec spec,
+    String outputPath, {
+    VipsIsolatePool? pool,
+    VipsCancelToken? cancelToken,
+  }) async {
+    final params = JoinPipelineComputeParams(spec: spec, outputPath: outputPath);
+    await (pool ?? VipsIsolatePool.shared)
+        .run(() => _runJoinPipeline(params), cancelToken: cancelToken);
   }
 
   /// Create a new JoinPipelineSpec for joining multiple images.
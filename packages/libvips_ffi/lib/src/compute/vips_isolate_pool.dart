@@ -0,0 +1,476 @@
+import 'dart:async';
+import 'dart:collection';
+import 'dart:io';
+import 'dart:isolate';
+
+import 'package:libvips_ffi_api/libvips_ffi_api.dart';
+import 'package:libvips_ffi_core/libvips_ffi_core.dart' as core;
+
+import '../platform_loader.dart';
+
+/// Initializes libvips in a worker isolate.
+///
+/// 在工作 isolate 中初始化 libvips。
+void initVipsWorker() {
+  initVips();
+  initVipsApi(core.vipsLibrary);
+}
+
+/// Thrown by [VipsIsolatePool.run] when the job was cancelled.
+///
+/// 任务被取消时由 [VipsIsolatePool.run] 抛出。
+class VipsCancelledException implements Exception {
+  const VipsCancelledException();
+
+  @override
+  String toString() => 'VipsCancelledException: job was cancelled';
+}
+
+/// Cancels jobs submitted to a [VipsIsolatePool].
+///
+/// 取消提交到 [VipsIsolatePool] 的任务。
+///
+/// A job that is still queued is removed from the queue. A job that is
+/// already running finishes in its worker (libvips operations cannot be
+/// interrupted safely), but its result is discarded.
+/// 仍在队列中的任务会被移除；正在执行的任务会在工作 isolate 中执行完，但结果被丢弃。
+class VipsCancelToken {
+  final List<void Function()> _listeners = [];
+  bool _cancelled = false;
+
+  /// Whether [cancel] has been called.
+  ///
+  /// 是否已调用 [cancel]。
+  bool get isCancelled => _cancelled;
+
+  /// Cancel every job using this token.
+  ///
+  /// 取消所有使用此 token 的任务。
+  void cancel() {
+    if (_cancelled) return;
+    _cancelled = true;
+    for (final listener in List.of(_listeners)) {
+      listener();
+    }
+    _listeners.clear();
+  }
+
+  void _onCancel(void Function() listener) => _listeners.add(listener);
+
+  void _remove(void Function() listener) => _listeners.remove(listener);
+}
+
+/// A pool of long-lived isolates with libvips already initialized.
+///
+/// 预先初始化 libvips 的常驻 isolate 池。
+///
+/// Spawning an isolate and initializing libvips in it can cost more than
+/// a small operation such as a thumbnail. The pool spawns workers on
+/// demand, up to [size], initializes each once with [initializer], and
+/// then feeds them jobs from a queue.
+/// 启动 isolate 并初始化 libvips 的开销可能比缩略图这类小操作本身还大。
+/// 池按需启动最多 [size] 个工作 isolate，每个只初始化一次，之后从队列中取任务执行。
+///
+/// At most [maxQueued] jobs wait in the queue; further calls to [run]
+/// wait until there is room (backpressure).
+/// 队列中最多等待 [maxQueued] 个任务，超出时 [run] 会等待队列有空位（背压）。
+///
+/// ```dart
+/// final pool = VipsIsolatePool();
+/// final thumbs = await Future.wait([
+///   for (final path in paths)
+///     pool.run(() => (PipelineSpec()..input(path)..thumbnail(200)).execute()),
+/// ]);
+/// await pool.close();
+/// ```
+class VipsIsolatePool {
+  /// Maximum number of worker isolates.
+  ///
+  /// 工作 isolate 的最大数量。
+  final int size;
+
+  /// Maximum number of jobs waiting for a worker.
+  ///
+  /// 等待执行的任务的最大数量。
+  final int maxQueued;
+
+  /// Runs once in each worker before its first job.
+  ///
+  /// 每个工作 isolate 在执行第一个任务前运行一次。
+  final void Function() initializer;
+
+  final Queue<_PoolJob> _queue = Queue();
+  final Queue<Completer<void>> _waitingForRoom = Queue();
+  final List<_PoolWorker> _idle = [];
+  final Set<_PoolWorker> _workers = {};
+  int _starting = 0;
+  bool _closed = false;
+
+  VipsIsolatePool({
+    int? size,
+    this.maxQueued = 64,
+    this.initializer = initVipsWorker,
+  }) : size = size ?? defaultSize;
+
+  /// Number of processors minus one for the UI isolate, at least one.
+  ///
+  /// 处理器数量减一（留给 UI isolate），至少为一。
+  static int get defaultSize =>
+      Platform.numberOfProcessors > 1 ? Platform.numberOfProcessors - 1 : 1;
+
+  static VipsIsolatePool? _shared;
+
+  /// The pool used by [VipsPipelineCompute] when no pool is given.
+  ///
+  /// [VipsPipelineCompute] 未指定池时使用的共享池。
+  static VipsIsolatePool get shared {
+    final pool = _shared;
+    if (pool != null && !pool._closed) return pool;
+    return _shared = VipsIsolatePool();
+  }
+
+  /// Number of jobs waiting for a worker.
+  ///
+  /// 等待执行的任务数。
+  int get queued => _queue.length;
+
+  /// Number of running worker isolates.
+  ///
+  /// 正在运行的工作 isolate 数。
+  int get workers => _workers.length;
+
+  /// Whether [close] has been called.
+  ///
+  /// 是否已调用 [close]。
+  bool get isClosed => _closed;
+
+  /// Run [task] in a worker isolate and return its result.
+  ///
+  /// 在工作 isolate 中执行 [task] 并返回结果。
+  ///
+  /// [task] and its result are sent between isolates, so they must not
+  /// capture native resources such as a [VipsImg].
+  /// [task] 及其结果会在 isolate 之间传递，不能引用 [VipsImg] 等原生资源。
+  ///
+  /// [onDiscard] runs if the job fails before [task] was sent to a worker
+  /// (cancelled while queued, pool closed, workers failed to start), so
+  /// that resources whose ownership [task] was to take can be released.
+  /// Once sent, [task] is responsible for them.
+  /// [onDiscard] 在任务发送给工作 isolate 之前失败时调用，用于释放本应由 [task] 接管的资源。
+  Future<R> run<R>(
+    FutureOr<R> Function() task, {
+    VipsCancelToken? cancelToken,
+    void Function()? onDiscard,
+  }) async {
+    try {
+      if (_closed) throw StateError('VipsIsolatePool has been closed');
+      if (cancelToken?.isCancelled ?? false) throw const VipsCancelledException();
+
+      while (_queue.length >= maxQueued) {
+        final room = Completer<void>();
+        _waitingForRoom.add(room);
+        await room.future;
+        if (_closed) throw StateError('VipsIsolatePool has been closed');
+        if (cancelToken?.isCancelled ?? false) throw const VipsCancelledException();
+      }
+    } catch (_) {
+      onDiscard?.call();
+      rethrow;
+    }
+
+    final job = _PoolJob<R>(task, cancelToken, onDiscard);
+    if (cancelToken != null) {
+      job.onCancel = () {
+        // 仍在队列中的任务直接移除
+        if (_queue.remove(job)) _releaseRoom();
+        job.fail(const VipsCancelledException(), StackTrace.current);
+      };
+      cancelToken._onCancel(job.onCancel!);
+    }
+    _queue.add(job);
+    _schedule();
+    return job.completer.future;
+  }
+
+  /// Stop all workers.
+  ///
+  /// 停止所有工作 isolate。
+  ///
+  /// Queued and running jobs finish first, unless [force] is true, in
+  /// which case they fail with a [StateError].
+  /// 默认等待队列中和正在执行的任务完成；[force] 为 true 时这些任务以 [StateError] 失败。
+  Future<void> close({bool force = false}) async {
+    if (_closed) return;
+    _closed = true;
+    for (final room in _waitingForRoom) {
+      room.complete();
+    }
+    _waitingForRoom.clear();
+
+    if (force) {
+      final error = StateError('VipsIsolatePool has been closed');
+      while (_queue.isNotEmpty) {
+        _queue.removeFirst().fail(error, StackTrace.current);
+      }
+      for (final worker in List.of(_workers)) {
+        worker.job?.fail(error, StackTrace.current);
+        worker.kill(immediate: true);
+      }
+    } else {
+      await Future.wait([
+        for (final job in [..._queue, for (final w in _workers) if (w.job != null) w.job!])
+          job.completer.future.then((_) {}, onError: (Object _) {}),
+      ]);
+      for (final worker in List.of(_workers)) {
+        worker.kill();
+      }
+    }
+    _workers.clear();
+    _idle.clear();
+  }
+
+  void _releaseRoom() {
+    if (_waitingForRoom.isNotEmpty) _waitingForRoom.removeFirst().complete();
+  }
+
+  void _schedule() {
+    while (_queue.isNotEmpty && _idle.isNotEmpty) {
+      final job = _queue.removeFirst();
+      _releaseRoom();
+      if (job.isDone) continue;
+      final worker = _idle.removeLast();
+      if (!worker.start(job)) _idle.add(worker);
+    }
+    // 按需启动工作 isolate
+    final wanted = _queue.length - _starting;
+    for (var i = 0; i < wanted && _workers.length + _starting < size; i++) {
+      _spawn();
+    }
+  }
+
+  Future<void> _spawn() async {
+    _starting++;
+    try {
+      final worker = await _PoolWorker.spawn(initializer, _onWorkerIdle, _onWorkerExit);
+      _starting--;
+      if (_closed && _queue.isEmpty) {
+        worker.kill();
+        return;
+      }
+      _workers.add(worker);
+      _onWorkerIdle(worker);
+    } catch (error, stackTrace) {
+      _starting--;
+      // 初始化失败：没有可用的工作 isolate 时，队列中的任务全部失败
+      if (_workers.isEmpty && _starting == 0) {
+        while (_queue.isNotEmpty) {
+          _queue.removeFirst().fail(error, stackTrace);
+          _releaseRoom();
+        }
+      }
+    }
+  }
+
+  void _onWorkerIdle(_PoolWorker worker) {
+    if (_closed && _queue.isEmpty) {
+      _workers.remove(worker);
+      worker.kill();
+      return;
+    }
+    _idle.add(worker);
+    _schedule();
+  }
+
+  void _onWorkerExit(_PoolWorker worker, Object error, StackTrace stackTrace) {
+    _workers.remove(worker);
+    _idle.remove(worker);
+    worker.job?.fail(error, stackTrace);
+    // 关闭过程中队列里仍有任务时也要补充工作 isolate，否则 close() 会一直等待
+    if (!_closed || _queue.isNotEmpty) _schedule();
+  }
+}
+
+class _PoolJob<R> {
+  final FutureOr<R> Function() task;
+  final VipsCancelToken? cancelToken;
+  final void Function()? onDiscard;
+  final Completer<R> completer = Completer<R>();
+  void Function()? onCancel;
+
+  /// Whether [task] was sent to a worker.
+  bool sent = false;
+
+  _PoolJob(this.task, this.cancelToken, this.onDiscard);
+
+  bool get isDone => completer.isCompleted;
+
+  void _detach() {
+    if (onCancel != null) cancelToken?._remove(onCancel!);
+  }
+
+  void complete(Object? value) {
+    if (isDone) return;
+    _detach();
+    completer.complete(value as R);
+  }
+
+  void fail(Object error, StackTrace stackTrace) {
+    if (isDone) return;
+    _detach();
+    // 未发送的任务由调用方释放其资源
+    if (!sent) onDiscard?.call();
+    completer.completeError(error, stackTrace);
+  }
+}
+
+/// Message sent to a worker: the task, or null to stop.
+typedef _WorkerMessage = FutureOr<Object?> Function()?;
+
+class _PoolWorker {
+  final Isolate isolate;
+  final SendPort _commands;
+  final ReceivePort _responses;
+  final ReceivePort _exit;
+  _PoolJob? job;
+
+  _PoolWorker._(this.isolate, this._commands, this._responses, this._exit);
+
+  static Future<_PoolWorker> spawn(
+    void Function() initializer,
+    void Function(_PoolWorker) onIdle,
+    void Function(_PoolWorker, Object, StackTrace) onExit,
+  ) async {
+    final responses = ReceivePort();
+    final exit = ReceivePort();
+    final Isolate isolate;
+    try {
+      isolate = await Isolate.spawn(
+        _workerMain,
+        (responses.sendPort, initializer),
+        onError: exit.sendPort,
+        onExit: exit.sendPort,
+        errorsAreFatal: true,
+        debugName: 'vips_worker',
+      );
+    } catch (_) {
+      responses.close();
+      exit.close();
+      rethrow;
+    }
+
+    final ready = Completer<SendPort>();
+    late final _PoolWorker worker;
+    responses.listen((message) {
+      if (!ready.isCompleted) {
+        // 第一条消息：命令端口或初始化错误
+        if (message is SendPort) {
+          ready.complete(message);
+        } else {
+          final (error, stack) = message as (Object, String);
+          ready.completeError(error, StackTrace.fromString(stack));
+        }
+        return;
+      }
+      final current = worker.job;
+      worker.job = null;
+      final (ok, value, stack) = message as (bool, Object?, String?);
+      if (ok) {
+        current?.complete(value);
+      } else {
+        current?.fail(value!, StackTrace.fromString(stack ?? ''));
+      }
+      onIdle(worker);
+    });
+    exit.listen((message) {
+      // onError 发送 [error, stack]，onExit 发送 null
+      final error = message is List
+          ? RemoteError('${message[0]}', '${message[1]}')
+          : StateError('vips worker isolate exited');
+      if (!ready.isCompleted) {
+        ready.completeError(error, StackTrace.current);
+      } else {
+        onExit(worker, error, StackTrace.current);
+      }
+      responses.close();
+      exit.close();
+    });
+
+    try {
+      final commands = await ready.future;
+      return worker = _PoolWorker._(isolate, commands, responses, exit);
+    } catch (_) {
+      isolate.kill(priority: Isolate.immediate);
+      responses.close();
+      exit.close();
+      rethrow;
+    }
+  }
+
+  /// Send [job] to the worker; false if [job] cannot be sent.
+  bool start(_PoolJob job) {
+    try {
+      _commands.send(job.task as _WorkerMessage);
+    } catch (error, stackTrace) {
+      // 任务引用了无法跨 isolate 传递的对象
+      job.fail(ArgumentError('Task is not sendable: $error'), stackTrace);
+      return false;
+    }
+    this.job = job;
+    job.sent = true;
+    return true;
+  }
+
+  /// 默认在当前任务完成后退出，[immediate] 为 true 时立即终止
+  void kill({bool immediate = false}) {
+    if (immediate) {
+      isolate.kill(priority: Isolate.immediate);
+    } else {
+      _commands.send(null);
+    }
+    _responses.close();
+    _exit.close();
+  }
+}
+
+Future<void> _workerMain((SendPort, void Function()) args) async {
+  final (responses, initializer) = args;
+  try {
+    initializer();
+  } catch (error, stackTrace) {
+    _sendError(responses, error, stackTrace, (e, s) => (e, s));
+    return;
+  }
+
+  final commands = ReceivePort();
+  responses.send(commands.sendPort);
+  await for (final message in commands) {
+    final task = message as _WorkerMessage;
+    if (task == null) break;
+    try {
+      final result = await task();
+      try {
+        responses.send((true, result, null));
+      } catch (error) {
+        // 结果无法跨 isolate 传递
+        responses.send((false, ArgumentError('Result is not sendable: $error'), null));
+      }
+    } catch (error, stackTrace) {
+      _sendError(responses, error, stackTrace, (e, s) => (false, e, s));
+    }
+  }
+  commands.close();
+}
+
+/// Send [error], or its description if it cannot cross isolates.
+void _sendError(
+  SendPort port,
+  Object error,
+  StackTrace stackTrace,
+  Object Function(Object error, String stack) message,
+) {
+  try {
+    port.send(message(error, stackTrace.toString()));
+  } catch (_) {
+    port.send(message(RemoteError(error.toString(), ''), stackTrace.toString()));
+  }
+}
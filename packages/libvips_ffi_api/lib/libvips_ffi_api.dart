@@ -47,10 +47,13 @@ export 'src/vips_api_init.dart'
         convolutionBindings,
         resampleBindings,
         complexBindings,
-        mosaicingBindings;
+        mosaicingBindings,
+        generatedBindings;
 
 // Image wrapper
 export 'src/image/vips_img.dart' show VipsImg;
+export 'src/image/vips_native_buffer.dart' show VipsNativeBuffer, VipsNativeBufferHandle;
+export 'src/image/vips_stream.dart' show VipsStreamSource, VipsStreamTarget;
 
 // Pipeline
 export 'src/pipeline/vips_pipeline.dart' show VipsPipeline;
@@ -81,6 +84,7 @@ export 'src/types/save_options.dart';
 // Spec (for serializable pipelines)
 export 'src/spec/operation_spec.dart';
 export 'src/spec/pipeline_spec.dart';
+export 'src/spec/spec_optimizer.dart' show optimizeOperations;
 export 'src/spec/join_pipeline_spec.dart';
 
 // Binding classes
@@ -98,3 +102,5 @@ export 'src/bindings/convolution_bindings.dart' show VipsConvolutionBindings;
 export 'src/bindings/resample_bindings.dart' show VipsResampleBindings;
 export 'src/bindings/complex_bindings.dart' show VipsComplexBindings;
 export 'src/bindings/mosaicing_bindings.dart' show VipsMosaicingBindings;
+// Generated variadic bindings, option structs and the enums they use
+export 'src/bindings/generated/generated_bindings.dart';
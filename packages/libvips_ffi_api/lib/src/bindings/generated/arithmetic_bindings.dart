@@ -0,0 +1,701 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsAbsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAbsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAcosNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAcosDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAcoshNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAcoshDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAddNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAddDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAddalphaNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAddalphaDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAsinNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAsinDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAsinhNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAsinhDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAtanNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAtanDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAtan2Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAtan2Dart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAtan2ConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAtan2ConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAtan2Const1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAtan2Const1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAtanhNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAtanhDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAvgNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAvgDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCeilNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCeilDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCosNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCosDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCoshNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCoshDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDeviateNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDeviateDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDivideNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDivideDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsExpNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsExpDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsExp10Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsExp10Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFloorNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFloorDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLogNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLogDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLog10Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLog10Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLogmatNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double sigma,
+  ffi.Double min_ampl,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLogmatDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double sigma,
+  double min_ampl,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMathNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt math,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMathDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int math,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMath2Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt math2,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMath2Dart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int math2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMath2ConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt math2,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMath2ConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int math2,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMath2Const1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt math2,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMath2Const1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int math2,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatrixprintNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatrixprintDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaxNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaxDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaxpairNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaxpairDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMinNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMinDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMinpairNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMinpairDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMultiplyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMultiplyDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPowNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPowDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPowConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPowConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPowConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPowConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPremultiplyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPremultiplyDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRintNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRintDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRoundNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt round,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRoundDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int round,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSignNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSignDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSinNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSinDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSinesNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSinesDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSinhNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSinhDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsStatsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsStatsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSubtractNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSubtractDart = int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTanNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTanDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTanhNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTanhDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsUnpremultiplyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsUnpremultiplyDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Arithmetic variadic function bindings.
+class VipsGeneratedArithmeticBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedArithmeticBindings(this._lib);
+
+  late final _abs = _lib.lookup<ffi.NativeFunction<_VipsAbsNative>>('vips_abs').asFunction<_VipsAbsDart>();
+  late final _acos = _lib.lookup<ffi.NativeFunction<_VipsAcosNative>>('vips_acos').asFunction<_VipsAcosDart>();
+  late final _acosh = _lib.lookup<ffi.NativeFunction<_VipsAcoshNative>>('vips_acosh').asFunction<_VipsAcoshDart>();
+  late final _add = _lib.lookup<ffi.NativeFunction<_VipsAddNative>>('vips_add').asFunction<_VipsAddDart>();
+  late final _addalpha = _lib.lookup<ffi.NativeFunction<_VipsAddalphaNative>>('vips_addalpha').asFunction<_VipsAddalphaDart>();
+  late final _asin = _lib.lookup<ffi.NativeFunction<_VipsAsinNative>>('vips_asin').asFunction<_VipsAsinDart>();
+  late final _asinh = _lib.lookup<ffi.NativeFunction<_VipsAsinhNative>>('vips_asinh').asFunction<_VipsAsinhDart>();
+  late final _atan = _lib.lookup<ffi.NativeFunction<_VipsAtanNative>>('vips_atan').asFunction<_VipsAtanDart>();
+  late final _atan2 = _lib.lookup<ffi.NativeFunction<_VipsAtan2Native>>('vips_atan2').asFunction<_VipsAtan2Dart>();
+  late final _atan2Const = _lib.lookup<ffi.NativeFunction<_VipsAtan2ConstNative>>('vips_atan2_const').asFunction<_VipsAtan2ConstDart>();
+  late final _atan2Const1 = _lib.lookup<ffi.NativeFunction<_VipsAtan2Const1Native>>('vips_atan2_const1').asFunction<_VipsAtan2Const1Dart>();
+  late final _atanh = _lib.lookup<ffi.NativeFunction<_VipsAtanhNative>>('vips_atanh').asFunction<_VipsAtanhDart>();
+  late final _avg = _lib.lookup<ffi.NativeFunction<_VipsAvgNative>>('vips_avg').asFunction<_VipsAvgDart>();
+  late final _ceil = _lib.lookup<ffi.NativeFunction<_VipsCeilNative>>('vips_ceil').asFunction<_VipsCeilDart>();
+  late final _cos = _lib.lookup<ffi.NativeFunction<_VipsCosNative>>('vips_cos').asFunction<_VipsCosDart>();
+  late final _cosh = _lib.lookup<ffi.NativeFunction<_VipsCoshNative>>('vips_cosh').asFunction<_VipsCoshDart>();
+  late final _deviate = _lib.lookup<ffi.NativeFunction<_VipsDeviateNative>>('vips_deviate').asFunction<_VipsDeviateDart>();
+  late final _divide = _lib.lookup<ffi.NativeFunction<_VipsDivideNative>>('vips_divide').asFunction<_VipsDivideDart>();
+  late final _exp = _lib.lookup<ffi.NativeFunction<_VipsExpNative>>('vips_exp').asFunction<_VipsExpDart>();
+  late final _exp10 = _lib.lookup<ffi.NativeFunction<_VipsExp10Native>>('vips_exp10').asFunction<_VipsExp10Dart>();
+  late final _floor = _lib.lookup<ffi.NativeFunction<_VipsFloorNative>>('vips_floor').asFunction<_VipsFloorDart>();
+  late final _log = _lib.lookup<ffi.NativeFunction<_VipsLogNative>>('vips_log').asFunction<_VipsLogDart>();
+  late final _log10 = _lib.lookup<ffi.NativeFunction<_VipsLog10Native>>('vips_log10').asFunction<_VipsLog10Dart>();
+  late final _logmat = _lib.lookup<ffi.NativeFunction<_VipsLogmatNative>>('vips_logmat').asFunction<_VipsLogmatDart>();
+  late final _math = _lib.lookup<ffi.NativeFunction<_VipsMathNative>>('vips_math').asFunction<_VipsMathDart>();
+  late final _math2 = _lib.lookup<ffi.NativeFunction<_VipsMath2Native>>('vips_math2').asFunction<_VipsMath2Dart>();
+  late final _math2Const = _lib.lookup<ffi.NativeFunction<_VipsMath2ConstNative>>('vips_math2_const').asFunction<_VipsMath2ConstDart>();
+  late final _math2Const1 = _lib.lookup<ffi.NativeFunction<_VipsMath2Const1Native>>('vips_math2_const1').asFunction<_VipsMath2Const1Dart>();
+  late final _matrixprint = _lib.lookup<ffi.NativeFunction<_VipsMatrixprintNative>>('vips_matrixprint').asFunction<_VipsMatrixprintDart>();
+  late final _max = _lib.lookup<ffi.NativeFunction<_VipsMaxNative>>('vips_max').asFunction<_VipsMaxDart>();
+  late final _maxpair = _lib.lookup<ffi.NativeFunction<_VipsMaxpairNative>>('vips_maxpair').asFunction<_VipsMaxpairDart>();
+  late final _min = _lib.lookup<ffi.NativeFunction<_VipsMinNative>>('vips_min').asFunction<_VipsMinDart>();
+  late final _minpair = _lib.lookup<ffi.NativeFunction<_VipsMinpairNative>>('vips_minpair').asFunction<_VipsMinpairDart>();
+  late final _multiply = _lib.lookup<ffi.NativeFunction<_VipsMultiplyNative>>('vips_multiply').asFunction<_VipsMultiplyDart>();
+  late final _pow = _lib.lookup<ffi.NativeFunction<_VipsPowNative>>('vips_pow').asFunction<_VipsPowDart>();
+  late final _powConst = _lib.lookup<ffi.NativeFunction<_VipsPowConstNative>>('vips_pow_const').asFunction<_VipsPowConstDart>();
+  late final _powConst1 = _lib.lookup<ffi.NativeFunction<_VipsPowConst1Native>>('vips_pow_const1').asFunction<_VipsPowConst1Dart>();
+  late final _premultiply = _lib.lookup<ffi.NativeFunction<_VipsPremultiplyNative>>('vips_premultiply').asFunction<_VipsPremultiplyDart>();
+  late final _rint = _lib.lookup<ffi.NativeFunction<_VipsRintNative>>('vips_rint').asFunction<_VipsRintDart>();
+  late final _round = _lib.lookup<ffi.NativeFunction<_VipsRoundNative>>('vips_round').asFunction<_VipsRoundDart>();
+  late final _sign = _lib.lookup<ffi.NativeFunction<_VipsSignNative>>('vips_sign').asFunction<_VipsSignDart>();
+  late final _sin = _lib.lookup<ffi.NativeFunction<_VipsSinNative>>('vips_sin').asFunction<_VipsSinDart>();
+  late final _sines = _lib.lookup<ffi.NativeFunction<_VipsSinesNative>>('vips_sines').asFunction<_VipsSinesDart>();
+  late final _sinh = _lib.lookup<ffi.NativeFunction<_VipsSinhNative>>('vips_sinh').asFunction<_VipsSinhDart>();
+  late final _stats = _lib.lookup<ffi.NativeFunction<_VipsStatsNative>>('vips_stats').asFunction<_VipsStatsDart>();
+  late final _subtract = _lib.lookup<ffi.NativeFunction<_VipsSubtractNative>>('vips_subtract').asFunction<_VipsSubtractDart>();
+  late final _tan = _lib.lookup<ffi.NativeFunction<_VipsTanNative>>('vips_tan').asFunction<_VipsTanDart>();
+  late final _tanh = _lib.lookup<ffi.NativeFunction<_VipsTanhNative>>('vips_tanh').asFunction<_VipsTanhDart>();
+  late final _unpremultiply = _lib.lookup<ffi.NativeFunction<_VipsUnpremultiplyNative>>('vips_unpremultiply').asFunction<_VipsUnpremultiplyDart>();
+
+  int abs(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _abs(in$, out, ffi.nullptr);
+  int acos(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _acos(in$, out, ffi.nullptr);
+  int acosh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _acosh(in$, out, ffi.nullptr);
+  int add(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _add(left, right, out, ffi.nullptr);
+  int addalpha(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _addalpha(in$, out, ffi.nullptr);
+  int asin(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _asin(in$, out, ffi.nullptr);
+  int asinh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _asinh(in$, out, ffi.nullptr);
+  int atan(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _atan(in$, out, ffi.nullptr);
+  int atan2(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _atan2(left, right, out, ffi.nullptr);
+  int atan2Const(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _atan2Const(in$, out, c, n, ffi.nullptr);
+  int atan2Const1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _atan2Const1(in$, out, c, ffi.nullptr);
+  int atanh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _atanh(in$, out, ffi.nullptr);
+  int avg(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Double> out) => _avg(in$, out, ffi.nullptr);
+  int ceil(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _ceil(in$, out, ffi.nullptr);
+  int cos(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _cos(in$, out, ffi.nullptr);
+  int cosh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _cosh(in$, out, ffi.nullptr);
+  int deviate(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Double> out) => _deviate(in$, out, ffi.nullptr);
+  int divide(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _divide(left, right, out, ffi.nullptr);
+  int exp(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _exp(in$, out, ffi.nullptr);
+  int exp10(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _exp10(in$, out, ffi.nullptr);
+  int floor(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _floor(in$, out, ffi.nullptr);
+  int log(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _log(in$, out, ffi.nullptr);
+  int log10(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _log10(in$, out, ffi.nullptr);
+  int logmat(ffi.Pointer<ffi.Pointer<VipsImage>> out, double sigma, double min_ampl) => _logmat(out, sigma, min_ampl, ffi.nullptr);
+  int math(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int math) => _math(in$, out, math, ffi.nullptr);
+  int math2(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out, int math2) => _math2(left, right, out, math2, ffi.nullptr);
+  int math2Const(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int math2, ffi.Pointer<ffi.Double> c, int n) => _math2Const(in$, out, math2, c, n, ffi.nullptr);
+  int math2Const1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int math2, double c) => _math2Const1(in$, out, math2, c, ffi.nullptr);
+  int matrixprint(ffi.Pointer<VipsImage> in$) => _matrixprint(in$, ffi.nullptr);
+  int max(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Double> out) => _max(in$, out, ffi.nullptr);
+  int maxpair(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _maxpair(left, right, out, ffi.nullptr);
+  int min(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Double> out) => _min(in$, out, ffi.nullptr);
+  int minpair(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _minpair(left, right, out, ffi.nullptr);
+  int multiply(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _multiply(left, right, out, ffi.nullptr);
+  int pow(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _pow(left, right, out, ffi.nullptr);
+  int powConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _powConst(in$, out, c, n, ffi.nullptr);
+  int powConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _powConst1(in$, out, c, ffi.nullptr);
+  int premultiply(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _premultiply(in$, out, ffi.nullptr);
+  int rint(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rint(in$, out, ffi.nullptr);
+  int round(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int round) => _round(in$, out, round, ffi.nullptr);
+  int sign(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sign(in$, out, ffi.nullptr);
+  int sin(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sin(in$, out, ffi.nullptr);
+  int sines(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _sines(out, width, height, ffi.nullptr);
+  int sinh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sinh(in$, out, ffi.nullptr);
+  int stats(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _stats(in$, out, ffi.nullptr);
+  int subtract(ffi.Pointer<VipsImage> in1, ffi.Pointer<VipsImage> in2, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _subtract(in1, in2, out, ffi.nullptr);
+  int tan(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _tan(in$, out, ffi.nullptr);
+  int tanh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _tanh(in$, out, ffi.nullptr);
+  int unpremultiply(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _unpremultiply(in$, out, ffi.nullptr);
+}
@@ -0,0 +1,480 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsCMC2LChNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCMC2LChDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCMC2XYZNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCMC2XYZDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCMYK2XYZNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCMYK2XYZDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHSV2sRGBNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHSV2sRGBDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLCh2CMCNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLCh2CMCDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLCh2LabNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLCh2LabDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLab2LChNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLab2LChDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLab2LabQNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLab2LabQDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLab2LabSNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLab2LabSDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLab2XYZNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLab2XYZDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLabQ2LabNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLabQ2LabDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLabQ2LabSNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLabQ2LabSDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLabQ2sRGBNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLabQ2sRGBDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLabS2LabNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLabS2LabDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLabS2LabQNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLabS2LabQDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsXYZ2CMYKNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsXYZ2CMYKDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsXYZ2LabNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsXYZ2LabDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsXYZ2YxyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsXYZ2YxyDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsXYZ2scRGBNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsXYZ2scRGBDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsYxy2LabNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsYxy2LabDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsYxy2XYZNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsYxy2XYZDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsColourspaceNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int space,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsColourspaceDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int space,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsColourspaceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int space,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsColourspaceOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int space,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDECMCNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDECMCDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFalsecolourNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFalsecolourDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsIccExportNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsIccExportDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsIccImportNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsIccImportDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsIccTransformNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> output_profile,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsIccTransformDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> output_profile,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSRGB2HSVNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSRGB2HSVDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSRGB2scRGBNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSRGB2scRGBDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsScRGB2BWNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsScRGB2BWDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsScRGB2XYZNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsScRGB2XYZDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsScRGB2sRGBNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsScRGB2sRGBDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_colourspace`.
+class VipsColourspaceOptions {
+  static final _sourceSpaceKey = vipsOptionKey('source_space');
+
+  final int? sourceSpace;
+
+  const VipsColourspaceOptions({
+    this.sourceSpace,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (sourceSpace != null) slots.addInt(_sourceSpaceKey, sourceSpace!);
+    return slots;
+  }
+}
+
+/// Colour variadic function bindings.
+class VipsGeneratedColourBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedColourBindings(this._lib);
+
+  late final _cMC2LCh = _lib.lookup<ffi.NativeFunction<_VipsCMC2LChNative>>('vips_CMC2LCh').asFunction<_VipsCMC2LChDart>();
+  late final _cMC2XYZ = _lib.lookup<ffi.NativeFunction<_VipsCMC2XYZNative>>('vips_CMC2XYZ').asFunction<_VipsCMC2XYZDart>();
+  late final _cMYK2XYZ = _lib.lookup<ffi.NativeFunction<_VipsCMYK2XYZNative>>('vips_CMYK2XYZ').asFunction<_VipsCMYK2XYZDart>();
+  late final _hSV2sRGB = _lib.lookup<ffi.NativeFunction<_VipsHSV2sRGBNative>>('vips_HSV2sRGB').asFunction<_VipsHSV2sRGBDart>();
+  late final _lCh2CMC = _lib.lookup<ffi.NativeFunction<_VipsLCh2CMCNative>>('vips_LCh2CMC').asFunction<_VipsLCh2CMCDart>();
+  late final _lCh2Lab = _lib.lookup<ffi.NativeFunction<_VipsLCh2LabNative>>('vips_LCh2Lab').asFunction<_VipsLCh2LabDart>();
+  late final _lab2LCh = _lib.lookup<ffi.NativeFunction<_VipsLab2LChNative>>('vips_Lab2LCh').asFunction<_VipsLab2LChDart>();
+  late final _lab2LabQ = _lib.lookup<ffi.NativeFunction<_VipsLab2LabQNative>>('vips_Lab2LabQ').asFunction<_VipsLab2LabQDart>();
+  late final _lab2LabS = _lib.lookup<ffi.NativeFunction<_VipsLab2LabSNative>>('vips_Lab2LabS').asFunction<_VipsLab2LabSDart>();
+  late final _lab2XYZ = _lib.lookup<ffi.NativeFunction<_VipsLab2XYZNative>>('vips_Lab2XYZ').asFunction<_VipsLab2XYZDart>();
+  late final _labQ2Lab = _lib.lookup<ffi.NativeFunction<_VipsLabQ2LabNative>>('vips_LabQ2Lab').asFunction<_VipsLabQ2LabDart>();
+  late final _labQ2LabS = _lib.lookup<ffi.NativeFunction<_VipsLabQ2LabSNative>>('vips_LabQ2LabS').asFunction<_VipsLabQ2LabSDart>();
+  late final _labQ2sRGB = _lib.lookup<ffi.NativeFunction<_VipsLabQ2sRGBNative>>('vips_LabQ2sRGB').asFunction<_VipsLabQ2sRGBDart>();
+  late final _labS2Lab = _lib.lookup<ffi.NativeFunction<_VipsLabS2LabNative>>('vips_LabS2Lab').asFunction<_VipsLabS2LabDart>();
+  late final _labS2LabQ = _lib.lookup<ffi.NativeFunction<_VipsLabS2LabQNative>>('vips_LabS2LabQ').asFunction<_VipsLabS2LabQDart>();
+  late final _xYZ2CMYK = _lib.lookup<ffi.NativeFunction<_VipsXYZ2CMYKNative>>('vips_XYZ2CMYK').asFunction<_VipsXYZ2CMYKDart>();
+  late final _xYZ2Lab = _lib.lookup<ffi.NativeFunction<_VipsXYZ2LabNative>>('vips_XYZ2Lab').asFunction<_VipsXYZ2LabDart>();
+  late final _xYZ2Yxy = _lib.lookup<ffi.NativeFunction<_VipsXYZ2YxyNative>>('vips_XYZ2Yxy').asFunction<_VipsXYZ2YxyDart>();
+  late final _xYZ2scRGB = _lib.lookup<ffi.NativeFunction<_VipsXYZ2scRGBNative>>('vips_XYZ2scRGB').asFunction<_VipsXYZ2scRGBDart>();
+  late final _yxy2Lab = _lib.lookup<ffi.NativeFunction<_VipsYxy2LabNative>>('vips_Yxy2Lab').asFunction<_VipsYxy2LabDart>();
+  late final _yxy2XYZ = _lib.lookup<ffi.NativeFunction<_VipsYxy2XYZNative>>('vips_Yxy2XYZ').asFunction<_VipsYxy2XYZDart>();
+  late final _colourspace = _lib.lookup<ffi.NativeFunction<_VipsColourspaceNative>>('vips_colourspace').asFunction<_VipsColourspaceDart>();
+  late final _colourspaceOptions = _lib.lookup<ffi.NativeFunction<_VipsColourspaceOptionsNative>>('vips_colourspace').asFunction<_VipsColourspaceOptionsDart>();
+  late final _dECMC = _lib.lookup<ffi.NativeFunction<_VipsDECMCNative>>('vips_dECMC').asFunction<_VipsDECMCDart>();
+  late final _falsecolour = _lib.lookup<ffi.NativeFunction<_VipsFalsecolourNative>>('vips_falsecolour').asFunction<_VipsFalsecolourDart>();
+  late final _iccExport = _lib.lookup<ffi.NativeFunction<_VipsIccExportNative>>('vips_icc_export').asFunction<_VipsIccExportDart>();
+  late final _iccImport = _lib.lookup<ffi.NativeFunction<_VipsIccImportNative>>('vips_icc_import').asFunction<_VipsIccImportDart>();
+  late final _iccTransform = _lib.lookup<ffi.NativeFunction<_VipsIccTransformNative>>('vips_icc_transform').asFunction<_VipsIccTransformDart>();
+  late final _sRGB2HSV = _lib.lookup<ffi.NativeFunction<_VipsSRGB2HSVNative>>('vips_sRGB2HSV').asFunction<_VipsSRGB2HSVDart>();
+  late final _sRGB2scRGB = _lib.lookup<ffi.NativeFunction<_VipsSRGB2scRGBNative>>('vips_sRGB2scRGB').asFunction<_VipsSRGB2scRGBDart>();
+  late final _scRGB2BW = _lib.lookup<ffi.NativeFunction<_VipsScRGB2BWNative>>('vips_scRGB2BW').asFunction<_VipsScRGB2BWDart>();
+  late final _scRGB2XYZ = _lib.lookup<ffi.NativeFunction<_VipsScRGB2XYZNative>>('vips_scRGB2XYZ').asFunction<_VipsScRGB2XYZDart>();
+  late final _scRGB2sRGB = _lib.lookup<ffi.NativeFunction<_VipsScRGB2sRGBNative>>('vips_scRGB2sRGB').asFunction<_VipsScRGB2sRGBDart>();
+
+  int cMC2LCh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _cMC2LCh(in$, out, ffi.nullptr);
+  int cMC2XYZ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _cMC2XYZ(in$, out, ffi.nullptr);
+  int cMYK2XYZ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _cMYK2XYZ(in$, out, ffi.nullptr);
+  int hSV2sRGB(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _hSV2sRGB(in$, out, ffi.nullptr);
+  int lCh2CMC(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lCh2CMC(in$, out, ffi.nullptr);
+  int lCh2Lab(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lCh2Lab(in$, out, ffi.nullptr);
+  int lab2LCh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lab2LCh(in$, out, ffi.nullptr);
+  int lab2LabQ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lab2LabQ(in$, out, ffi.nullptr);
+  int lab2LabS(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lab2LabS(in$, out, ffi.nullptr);
+  int lab2XYZ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lab2XYZ(in$, out, ffi.nullptr);
+  int labQ2Lab(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _labQ2Lab(in$, out, ffi.nullptr);
+  int labQ2LabS(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _labQ2LabS(in$, out, ffi.nullptr);
+  int labQ2sRGB(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _labQ2sRGB(in$, out, ffi.nullptr);
+  int labS2Lab(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _labS2Lab(in$, out, ffi.nullptr);
+  int labS2LabQ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _labS2LabQ(in$, out, ffi.nullptr);
+  int xYZ2CMYK(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _xYZ2CMYK(in$, out, ffi.nullptr);
+  int xYZ2Lab(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _xYZ2Lab(in$, out, ffi.nullptr);
+  int xYZ2Yxy(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _xYZ2Yxy(in$, out, ffi.nullptr);
+  int xYZ2scRGB(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _xYZ2scRGB(in$, out, ffi.nullptr);
+  int yxy2Lab(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _yxy2Lab(in$, out, ffi.nullptr);
+  int yxy2XYZ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _yxy2XYZ(in$, out, ffi.nullptr);
+  int colourspace(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int space, [VipsColourspaceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _colourspace(in$, out, space, ffi.nullptr);
+    return _colourspaceOptions(in$, out, space, slots.intKey(0), slots.intValue(0), ffi.nullptr);
+  }
+  int dECMC(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _dECMC(left, right, out, ffi.nullptr);
+  int falsecolour(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _falsecolour(in$, out, ffi.nullptr);
+  int iccExport(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _iccExport(in$, out, ffi.nullptr);
+  int iccImport(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _iccImport(in$, out, ffi.nullptr);
+  int iccTransform(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Char> output_profile) => _iccTransform(in$, out, output_profile, ffi.nullptr);
+  int sRGB2HSV(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sRGB2HSV(in$, out, ffi.nullptr);
+  int sRGB2scRGB(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sRGB2scRGB(in$, out, ffi.nullptr);
+  int scRGB2BW(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _scRGB2BW(in$, out, ffi.nullptr);
+  int scRGB2XYZ(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _scRGB2XYZ(in$, out, ffi.nullptr);
+  int scRGB2sRGB(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _scRGB2sRGB(in$, out, ffi.nullptr);
+}
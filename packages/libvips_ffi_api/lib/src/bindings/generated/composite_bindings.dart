@@ -0,0 +1,190 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsCompositeNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.Pointer<ffi.Int> mode,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCompositeDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Int> mode,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsComposite2Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> base,
+  ffi.Pointer<VipsImage> overlay,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt mode,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsComposite2Dart = int Function(
+  ffi.Pointer<VipsImage> base,
+  ffi.Pointer<VipsImage> overlay,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int mode,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGlobalbalanceNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGlobalbalanceDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatchNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int xr1,
+  ffi.Int yr1,
+  ffi.Int xs1,
+  ffi.Int ys1,
+  ffi.Int xr2,
+  ffi.Int yr2,
+  ffi.Int xs2,
+  ffi.Int ys2,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatchDart = int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int xr1,
+  int yr1,
+  int xs1,
+  int ys1,
+  int xr2,
+  int yr2,
+  int xs2,
+  int ys2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMergeNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt direction,
+  ffi.Int dx,
+  ffi.Int dy,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMergeDart = int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int direction,
+  int dx,
+  int dy,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMosaicNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt direction,
+  ffi.Int xref,
+  ffi.Int yref,
+  ffi.Int xsec,
+  ffi.Int ysec,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMosaicDart = int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int direction,
+  int xref,
+  int yref,
+  int xsec,
+  int ysec,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMosaic1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt direction,
+  ffi.Int xr1,
+  ffi.Int yr1,
+  ffi.Int xs1,
+  ffi.Int ys1,
+  ffi.Int xr2,
+  ffi.Int yr2,
+  ffi.Int xs2,
+  ffi.Int ys2,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMosaic1Dart = int Function(
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<VipsImage> sec,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int direction,
+  int xr1,
+  int yr1,
+  int xs1,
+  int ys1,
+  int xr2,
+  int yr2,
+  int xs2,
+  int ys2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRemosaicNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> old_str,
+  ffi.Pointer<ffi.Char> new_str,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRemosaicDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> old_str,
+  ffi.Pointer<ffi.Char> new_str,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Composite variadic function bindings.
+class VipsGeneratedCompositeBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedCompositeBindings(this._lib);
+
+  late final _composite = _lib.lookup<ffi.NativeFunction<_VipsCompositeNative>>('vips_composite').asFunction<_VipsCompositeDart>();
+  late final _composite2 = _lib.lookup<ffi.NativeFunction<_VipsComposite2Native>>('vips_composite2').asFunction<_VipsComposite2Dart>();
+  late final _globalbalance = _lib.lookup<ffi.NativeFunction<_VipsGlobalbalanceNative>>('vips_globalbalance').asFunction<_VipsGlobalbalanceDart>();
+  late final _match = _lib.lookup<ffi.NativeFunction<_VipsMatchNative>>('vips_match').asFunction<_VipsMatchDart>();
+  late final _merge = _lib.lookup<ffi.NativeFunction<_VipsMergeNative>>('vips_merge').asFunction<_VipsMergeDart>();
+  late final _mosaic = _lib.lookup<ffi.NativeFunction<_VipsMosaicNative>>('vips_mosaic').asFunction<_VipsMosaicDart>();
+  late final _mosaic1 = _lib.lookup<ffi.NativeFunction<_VipsMosaic1Native>>('vips_mosaic1').asFunction<_VipsMosaic1Dart>();
+  late final _remosaic = _lib.lookup<ffi.NativeFunction<_VipsRemosaicNative>>('vips_remosaic').asFunction<_VipsRemosaicDart>();
+
+  int composite(ffi.Pointer<ffi.Pointer<VipsImage>> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n, ffi.Pointer<ffi.Int> mode) => _composite(in$, out, n, mode, ffi.nullptr);
+  int composite2(ffi.Pointer<VipsImage> base, ffi.Pointer<VipsImage> overlay, ffi.Pointer<ffi.Pointer<VipsImage>> out, int mode) => _composite2(base, overlay, out, mode, ffi.nullptr);
+  int globalbalance(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _globalbalance(in$, out, ffi.nullptr);
+  int match(ffi.Pointer<VipsImage> ref, ffi.Pointer<VipsImage> sec, ffi.Pointer<ffi.Pointer<VipsImage>> out, int xr1, int yr1, int xs1, int ys1, int xr2, int yr2, int xs2, int ys2) => _match(ref, sec, out, xr1, yr1, xs1, ys1, xr2, yr2, xs2, ys2, ffi.nullptr);
+  int merge(ffi.Pointer<VipsImage> ref, ffi.Pointer<VipsImage> sec, ffi.Pointer<ffi.Pointer<VipsImage>> out, int direction, int dx, int dy) => _merge(ref, sec, out, direction, dx, dy, ffi.nullptr);
+  int mosaic(ffi.Pointer<VipsImage> ref, ffi.Pointer<VipsImage> sec, ffi.Pointer<ffi.Pointer<VipsImage>> out, int direction, int xref, int yref, int xsec, int ysec) => _mosaic(ref, sec, out, direction, xref, yref, xsec, ysec, ffi.nullptr);
+  int mosaic1(ffi.Pointer<VipsImage> ref, ffi.Pointer<VipsImage> sec, ffi.Pointer<ffi.Pointer<VipsImage>> out, int direction, int xr1, int yr1, int xs1, int ys1, int xr2, int yr2, int xs2, int ys2) => _mosaic1(ref, sec, out, direction, xr1, yr1, xs1, ys1, xr2, yr2, xs2, ys2, ffi.nullptr);
+  int remosaic(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Char> old_str, ffi.Pointer<ffi.Char> new_str) => _remosaic(in$, out, old_str, new_str, ffi.nullptr);
+}
@@ -0,0 +1,503 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsAutorotNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAutorotDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandmeanNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandmeanDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsByteswapNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsByteswapDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int format,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int format,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastCharNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastCharDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastComplexNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastComplexDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastDoubleNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastDoubleDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastDpcomplexNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastDpcomplexDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastFloatNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastFloatDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastIntNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastIntDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastShortNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastShortDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastUcharNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastUcharDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastUintNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastUintDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCastUshortNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCastUshortDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCopyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCopyDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCopyFileNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCopyFileDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFlattenNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFlattenDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFlattenOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsFlattenOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFlattenOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsFlattenOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGammaNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGammaDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsInvertNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsInvertDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLinecacheNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLinecacheDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatrixinvertNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> m,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatrixinvertDart = int Function(
+  ffi.Pointer<VipsImage> m,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMsbNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMsbDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRecombNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> m,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRecombDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> m,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRotNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt angle,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRotDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int angle,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRot180Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRot180Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRot270Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRot270Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRot45Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRot45Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRot90Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRot90Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsScaleNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsScaleDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSequentialNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSequentialDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTilecacheNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTilecacheDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTranspose3dNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTranspose3dDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_flatten`.
+class VipsFlattenOptions {
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _maxAlphaKey = vipsOptionKey('max_alpha');
+
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final double? maxAlpha;
+
+  const VipsFlattenOptions({
+    this.background,
+    this.maxAlpha,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (maxAlpha != null) slots.addDouble(_maxAlphaKey, maxAlpha!);
+    return slots;
+  }
+}
+
+/// Conversion variadic function bindings.
+class VipsGeneratedConversionBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedConversionBindings(this._lib);
+
+  late final _autorot = _lib.lookup<ffi.NativeFunction<_VipsAutorotNative>>('vips_autorot').asFunction<_VipsAutorotDart>();
+  late final _bandmean = _lib.lookup<ffi.NativeFunction<_VipsBandmeanNative>>('vips_bandmean').asFunction<_VipsBandmeanDart>();
+  late final _byteswap = _lib.lookup<ffi.NativeFunction<_VipsByteswapNative>>('vips_byteswap').asFunction<_VipsByteswapDart>();
+  late final _cast = _lib.lookup<ffi.NativeFunction<_VipsCastNative>>('vips_cast').asFunction<_VipsCastDart>();
+  late final _castChar = _lib.lookup<ffi.NativeFunction<_VipsCastCharNative>>('vips_cast_char').asFunction<_VipsCastCharDart>();
+  late final _castComplex = _lib.lookup<ffi.NativeFunction<_VipsCastComplexNative>>('vips_cast_complex').asFunction<_VipsCastComplexDart>();
+  late final _castDouble = _lib.lookup<ffi.NativeFunction<_VipsCastDoubleNative>>('vips_cast_double').asFunction<_VipsCastDoubleDart>();
+  late final _castDpcomplex = _lib.lookup<ffi.NativeFunction<_VipsCastDpcomplexNative>>('vips_cast_dpcomplex').asFunction<_VipsCastDpcomplexDart>();
+  late final _castFloat = _lib.lookup<ffi.NativeFunction<_VipsCastFloatNative>>('vips_cast_float').asFunction<_VipsCastFloatDart>();
+  late final _castInt = _lib.lookup<ffi.NativeFunction<_VipsCastIntNative>>('vips_cast_int').asFunction<_VipsCastIntDart>();
+  late final _castShort = _lib.lookup<ffi.NativeFunction<_VipsCastShortNative>>('vips_cast_short').asFunction<_VipsCastShortDart>();
+  late final _castUchar = _lib.lookup<ffi.NativeFunction<_VipsCastUcharNative>>('vips_cast_uchar').asFunction<_VipsCastUcharDart>();
+  late final _castUint = _lib.lookup<ffi.NativeFunction<_VipsCastUintNative>>('vips_cast_uint').asFunction<_VipsCastUintDart>();
+  late final _castUshort = _lib.lookup<ffi.NativeFunction<_VipsCastUshortNative>>('vips_cast_ushort').asFunction<_VipsCastUshortDart>();
+  late final _copy = _lib.lookup<ffi.NativeFunction<_VipsCopyNative>>('vips_copy').asFunction<_VipsCopyDart>();
+  late final _copyFile = _lib.lookup<ffi.NativeFunction<_VipsCopyFileNative>>('vips_copy_file').asFunction<_VipsCopyFileDart>();
+  late final _flatten = _lib.lookup<ffi.NativeFunction<_VipsFlattenNative>>('vips_flatten').asFunction<_VipsFlattenDart>();
+  late final _flattenOptions = _lib.lookup<ffi.NativeFunction<_VipsFlattenOptionsNative>>('vips_flatten').asFunction<_VipsFlattenOptionsDart>();
+  late final _flattenOptionsD = _lib.lookup<ffi.NativeFunction<_VipsFlattenOptionsDNative>>('vips_flatten').asFunction<_VipsFlattenOptionsDDart>();
+  late final _gamma = _lib.lookup<ffi.NativeFunction<_VipsGammaNative>>('vips_gamma').asFunction<_VipsGammaDart>();
+  late final _invert = _lib.lookup<ffi.NativeFunction<_VipsInvertNative>>('vips_invert').asFunction<_VipsInvertDart>();
+  late final _linecache = _lib.lookup<ffi.NativeFunction<_VipsLinecacheNative>>('vips_linecache').asFunction<_VipsLinecacheDart>();
+  late final _matrixinvert = _lib.lookup<ffi.NativeFunction<_VipsMatrixinvertNative>>('vips_matrixinvert').asFunction<_VipsMatrixinvertDart>();
+  late final _msb = _lib.lookup<ffi.NativeFunction<_VipsMsbNative>>('vips_msb').asFunction<_VipsMsbDart>();
+  late final _recomb = _lib.lookup<ffi.NativeFunction<_VipsRecombNative>>('vips_recomb').asFunction<_VipsRecombDart>();
+  late final _rot = _lib.lookup<ffi.NativeFunction<_VipsRotNative>>('vips_rot').asFunction<_VipsRotDart>();
+  late final _rot180 = _lib.lookup<ffi.NativeFunction<_VipsRot180Native>>('vips_rot180').asFunction<_VipsRot180Dart>();
+  late final _rot270 = _lib.lookup<ffi.NativeFunction<_VipsRot270Native>>('vips_rot270').asFunction<_VipsRot270Dart>();
+  late final _rot45 = _lib.lookup<ffi.NativeFunction<_VipsRot45Native>>('vips_rot45').asFunction<_VipsRot45Dart>();
+  late final _rot90 = _lib.lookup<ffi.NativeFunction<_VipsRot90Native>>('vips_rot90').asFunction<_VipsRot90Dart>();
+  late final _scale = _lib.lookup<ffi.NativeFunction<_VipsScaleNative>>('vips_scale').asFunction<_VipsScaleDart>();
+  late final _sequential = _lib.lookup<ffi.NativeFunction<_VipsSequentialNative>>('vips_sequential').asFunction<_VipsSequentialDart>();
+  late final _tilecache = _lib.lookup<ffi.NativeFunction<_VipsTilecacheNative>>('vips_tilecache').asFunction<_VipsTilecacheDart>();
+  late final _transpose3d = _lib.lookup<ffi.NativeFunction<_VipsTranspose3dNative>>('vips_transpose3d').asFunction<_VipsTranspose3dDart>();
+
+  int autorot(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _autorot(in$, out, ffi.nullptr);
+  int bandmean(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandmean(in$, out, ffi.nullptr);
+  int byteswap(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _byteswap(in$, out, ffi.nullptr);
+  int cast(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int format) => _cast(in$, out, format, ffi.nullptr);
+  int castChar(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castChar(in$, out, ffi.nullptr);
+  int castComplex(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castComplex(in$, out, ffi.nullptr);
+  int castDouble(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castDouble(in$, out, ffi.nullptr);
+  int castDpcomplex(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castDpcomplex(in$, out, ffi.nullptr);
+  int castFloat(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castFloat(in$, out, ffi.nullptr);
+  int castInt(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castInt(in$, out, ffi.nullptr);
+  int castShort(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castShort(in$, out, ffi.nullptr);
+  int castUchar(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castUchar(in$, out, ffi.nullptr);
+  int castUint(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castUint(in$, out, ffi.nullptr);
+  int castUshort(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _castUshort(in$, out, ffi.nullptr);
+  int copy(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _copy(in$, out, ffi.nullptr);
+  int copyFile(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _copyFile(in$, out, ffi.nullptr);
+  int flatten(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsFlattenOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _flatten(in$, out, ffi.nullptr);
+    if (slots.doublesFirst) return _flattenOptionsD(in$, out, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), ffi.nullptr);
+    return _flattenOptions(in$, out, slots.intKey(0), slots.intValue(0), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int gamma(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _gamma(in$, out, ffi.nullptr);
+  int invert(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _invert(in$, out, ffi.nullptr);
+  int linecache(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _linecache(in$, out, ffi.nullptr);
+  int matrixinvert(ffi.Pointer<VipsImage> m, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _matrixinvert(m, out, ffi.nullptr);
+  int msb(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _msb(in$, out, ffi.nullptr);
+  int recomb(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> m) => _recomb(in$, out, m, ffi.nullptr);
+  int rot(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int angle) => _rot(in$, out, angle, ffi.nullptr);
+  int rot180(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rot180(in$, out, ffi.nullptr);
+  int rot270(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rot270(in$, out, ffi.nullptr);
+  int rot45(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rot45(in$, out, ffi.nullptr);
+  int rot90(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rot90(in$, out, ffi.nullptr);
+  int scale(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _scale(in$, out, ffi.nullptr);
+  int sequential(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sequential(in$, out, ffi.nullptr);
+  int tilecache(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _tilecache(in$, out, ffi.nullptr);
+  int transpose3d(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _transpose3d(in$, out, ffi.nullptr);
+}
@@ -0,0 +1,338 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsCannyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCannyDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCompassNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCompassDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConvNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConvDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConvaNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConvaDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConvasepNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConvasepDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConvfNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConvfDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConviNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConviDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConvsepNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConvsepDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGaussblurNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double sigma,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGaussblurDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double sigma,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGaussblurOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double sigma,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsGaussblurOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double sigma,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGaussblurOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double sigma,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsGaussblurOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double sigma,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPrewittNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPrewittDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsScharrNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsScharrDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSharpenNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSharpenDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSharpenOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsSharpenOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Char> key2, double value2,
+  ffi.Pointer<ffi.Char> key3, double value3,
+  ffi.Pointer<ffi.Char> key4, double value4,
+  ffi.Pointer<ffi.Char> key5, double value5,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSobelNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSobelDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_gaussblur`.
+class VipsGaussblurOptions {
+  static final _precisionKey = vipsOptionKey('precision');
+  static final _minAmplKey = vipsOptionKey('min_ampl');
+
+  final VipsPrecision? precision;
+  final double? minAmpl;
+
+  const VipsGaussblurOptions({
+    this.precision,
+    this.minAmpl,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (precision != null) slots.addInt(_precisionKey, precision!.value);
+    if (minAmpl != null) slots.addDouble(_minAmplKey, minAmpl!);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_sharpen`.
+class VipsSharpenOptions {
+  static final _sigmaKey = vipsOptionKey('sigma');
+  static final _x1Key = vipsOptionKey('x1');
+  static final _y2Key = vipsOptionKey('y2');
+  static final _y3Key = vipsOptionKey('y3');
+  static final _m1Key = vipsOptionKey('m1');
+  static final _m2Key = vipsOptionKey('m2');
+
+  final double? sigma;
+  final double? x1;
+  final double? y2;
+  final double? y3;
+  final double? m1;
+  final double? m2;
+
+  const VipsSharpenOptions({
+    this.sigma,
+    this.x1,
+    this.y2,
+    this.y3,
+    this.m1,
+    this.m2,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (sigma != null) slots.addDouble(_sigmaKey, sigma!);
+    if (x1 != null) slots.addDouble(_x1Key, x1!);
+    if (y2 != null) slots.addDouble(_y2Key, y2!);
+    if (y3 != null) slots.addDouble(_y3Key, y3!);
+    if (m1 != null) slots.addDouble(_m1Key, m1!);
+    if (m2 != null) slots.addDouble(_m2Key, m2!);
+    return slots;
+  }
+}
+
+/// Convolution variadic function bindings.
+class VipsGeneratedConvolutionBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedConvolutionBindings(this._lib);
+
+  late final _canny = _lib.lookup<ffi.NativeFunction<_VipsCannyNative>>('vips_canny').asFunction<_VipsCannyDart>();
+  late final _compass = _lib.lookup<ffi.NativeFunction<_VipsCompassNative>>('vips_compass').asFunction<_VipsCompassDart>();
+  late final _conv = _lib.lookup<ffi.NativeFunction<_VipsConvNative>>('vips_conv').asFunction<_VipsConvDart>();
+  late final _conva = _lib.lookup<ffi.NativeFunction<_VipsConvaNative>>('vips_conva').asFunction<_VipsConvaDart>();
+  late final _convasep = _lib.lookup<ffi.NativeFunction<_VipsConvasepNative>>('vips_convasep').asFunction<_VipsConvasepDart>();
+  late final _convf = _lib.lookup<ffi.NativeFunction<_VipsConvfNative>>('vips_convf').asFunction<_VipsConvfDart>();
+  late final _convi = _lib.lookup<ffi.NativeFunction<_VipsConviNative>>('vips_convi').asFunction<_VipsConviDart>();
+  late final _convsep = _lib.lookup<ffi.NativeFunction<_VipsConvsepNative>>('vips_convsep').asFunction<_VipsConvsepDart>();
+  late final _gaussblur = _lib.lookup<ffi.NativeFunction<_VipsGaussblurNative>>('vips_gaussblur').asFunction<_VipsGaussblurDart>();
+  late final _gaussblurOptions = _lib.lookup<ffi.NativeFunction<_VipsGaussblurOptionsNative>>('vips_gaussblur').asFunction<_VipsGaussblurOptionsDart>();
+  late final _gaussblurOptionsD = _lib.lookup<ffi.NativeFunction<_VipsGaussblurOptionsDNative>>('vips_gaussblur').asFunction<_VipsGaussblurOptionsDDart>();
+  late final _prewitt = _lib.lookup<ffi.NativeFunction<_VipsPrewittNative>>('vips_prewitt').asFunction<_VipsPrewittDart>();
+  late final _scharr = _lib.lookup<ffi.NativeFunction<_VipsScharrNative>>('vips_scharr').asFunction<_VipsScharrDart>();
+  late final _sharpen = _lib.lookup<ffi.NativeFunction<_VipsSharpenNative>>('vips_sharpen').asFunction<_VipsSharpenDart>();
+  late final _sharpenOptions = _lib.lookup<ffi.NativeFunction<_VipsSharpenOptionsNative>>('vips_sharpen').asFunction<_VipsSharpenOptionsDart>();
+  late final _sobel = _lib.lookup<ffi.NativeFunction<_VipsSobelNative>>('vips_sobel').asFunction<_VipsSobelDart>();
+
+  int canny(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _canny(in$, out, ffi.nullptr);
+  int compass(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _compass(in$, out, mask, ffi.nullptr);
+  int conv(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _conv(in$, out, mask, ffi.nullptr);
+  int conva(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _conva(in$, out, mask, ffi.nullptr);
+  int convasep(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _convasep(in$, out, mask, ffi.nullptr);
+  int convf(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _convf(in$, out, mask, ffi.nullptr);
+  int convi(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _convi(in$, out, mask, ffi.nullptr);
+  int convsep(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask) => _convsep(in$, out, mask, ffi.nullptr);
+  int gaussblur(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double sigma, [VipsGaussblurOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _gaussblur(in$, out, sigma, ffi.nullptr);
+    if (slots.doublesFirst) return _gaussblurOptionsD(in$, out, sigma, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), ffi.nullptr);
+    return _gaussblurOptions(in$, out, sigma, slots.intKey(0), slots.intValue(0), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int prewitt(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _prewitt(in$, out, ffi.nullptr);
+  int scharr(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _scharr(in$, out, ffi.nullptr);
+  int sharpen(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsSharpenOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _sharpen(in$, out, ffi.nullptr);
+    return _sharpenOptions(in$, out, slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), slots.doubleKey(2), slots.doubleValue(2), slots.doubleKey(3), slots.doubleValue(3), slots.doubleKey(4), slots.doubleValue(4), slots.doubleKey(5), slots.doubleValue(5), ffi.nullptr);
+  }
+  int sobel(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _sobel(in$, out, ffi.nullptr);
+}
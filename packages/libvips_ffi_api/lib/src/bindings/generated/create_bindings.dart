@@ -0,0 +1,452 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsBlackNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBlackDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBuildlutNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBuildlutDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEyeNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEyeDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFractsurfNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double fractal_dimension,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFractsurfDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double fractal_dimension,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGaussmatNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double sigma,
+  ffi.Double min_ampl,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGaussmatDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double sigma,
+  double min_ampl,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGaussnoiseNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGaussnoiseDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGreyNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGreyDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsIdentityNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsIdentityDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsInvertlutNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsInvertlutDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskButterworthNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double order,
+  ffi.Double frequency_cutoff,
+  ffi.Double amplitude_cutoff,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskButterworthDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double order,
+  double frequency_cutoff,
+  double amplitude_cutoff,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskButterworthBandNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double order,
+  ffi.Double frequency_cutoff_x,
+  ffi.Double frequency_cutoff_y,
+  ffi.Double radius,
+  ffi.Double amplitude_cutoff,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskButterworthBandDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double order,
+  double frequency_cutoff_x,
+  double frequency_cutoff_y,
+  double radius,
+  double amplitude_cutoff,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskButterworthRingNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double order,
+  ffi.Double frequency_cutoff,
+  ffi.Double amplitude_cutoff,
+  ffi.Double ringwidth,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskButterworthRingDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double order,
+  double frequency_cutoff,
+  double amplitude_cutoff,
+  double ringwidth,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskFractalNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double fractal_dimension,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskFractalDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double fractal_dimension,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskGaussianNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double frequency_cutoff,
+  ffi.Double amplitude_cutoff,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskGaussianDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double frequency_cutoff,
+  double amplitude_cutoff,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskGaussianBandNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double frequency_cutoff_x,
+  ffi.Double frequency_cutoff_y,
+  ffi.Double radius,
+  ffi.Double amplitude_cutoff,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskGaussianBandDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double frequency_cutoff_x,
+  double frequency_cutoff_y,
+  double radius,
+  double amplitude_cutoff,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskGaussianRingNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double frequency_cutoff,
+  ffi.Double amplitude_cutoff,
+  ffi.Double ringwidth,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskGaussianRingDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double frequency_cutoff,
+  double amplitude_cutoff,
+  double ringwidth,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskIdealNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double frequency_cutoff,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskIdealDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double frequency_cutoff,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskIdealBandNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double frequency_cutoff_x,
+  ffi.Double frequency_cutoff_y,
+  ffi.Double radius,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskIdealBandDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double frequency_cutoff_x,
+  double frequency_cutoff_y,
+  double radius,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaskIdealRingNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Double frequency_cutoff,
+  ffi.Double ringwidth,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaskIdealRingDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  double frequency_cutoff,
+  double ringwidth,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPerlinNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPerlinDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSdfNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.UnsignedInt shape,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSdfDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  int shape,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTextNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> text,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTextDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> text,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTonelutNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTonelutDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWorleyNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWorleyDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsXyzNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsXyzDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsZoneNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsZoneDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Create variadic function bindings.
+class VipsGeneratedCreateBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedCreateBindings(this._lib);
+
+  late final _black = _lib.lookup<ffi.NativeFunction<_VipsBlackNative>>('vips_black').asFunction<_VipsBlackDart>();
+  late final _buildlut = _lib.lookup<ffi.NativeFunction<_VipsBuildlutNative>>('vips_buildlut').asFunction<_VipsBuildlutDart>();
+  late final _eye = _lib.lookup<ffi.NativeFunction<_VipsEyeNative>>('vips_eye').asFunction<_VipsEyeDart>();
+  late final _fractsurf = _lib.lookup<ffi.NativeFunction<_VipsFractsurfNative>>('vips_fractsurf').asFunction<_VipsFractsurfDart>();
+  late final _gaussmat = _lib.lookup<ffi.NativeFunction<_VipsGaussmatNative>>('vips_gaussmat').asFunction<_VipsGaussmatDart>();
+  late final _gaussnoise = _lib.lookup<ffi.NativeFunction<_VipsGaussnoiseNative>>('vips_gaussnoise').asFunction<_VipsGaussnoiseDart>();
+  late final _grey = _lib.lookup<ffi.NativeFunction<_VipsGreyNative>>('vips_grey').asFunction<_VipsGreyDart>();
+  late final _identity = _lib.lookup<ffi.NativeFunction<_VipsIdentityNative>>('vips_identity').asFunction<_VipsIdentityDart>();
+  late final _invertlut = _lib.lookup<ffi.NativeFunction<_VipsInvertlutNative>>('vips_invertlut').asFunction<_VipsInvertlutDart>();
+  late final _maskButterworth = _lib.lookup<ffi.NativeFunction<_VipsMaskButterworthNative>>('vips_mask_butterworth').asFunction<_VipsMaskButterworthDart>();
+  late final _maskButterworthBand = _lib.lookup<ffi.NativeFunction<_VipsMaskButterworthBandNative>>('vips_mask_butterworth_band').asFunction<_VipsMaskButterworthBandDart>();
+  late final _maskButterworthRing = _lib.lookup<ffi.NativeFunction<_VipsMaskButterworthRingNative>>('vips_mask_butterworth_ring').asFunction<_VipsMaskButterworthRingDart>();
+  late final _maskFractal = _lib.lookup<ffi.NativeFunction<_VipsMaskFractalNative>>('vips_mask_fractal').asFunction<_VipsMaskFractalDart>();
+  late final _maskGaussian = _lib.lookup<ffi.NativeFunction<_VipsMaskGaussianNative>>('vips_mask_gaussian').asFunction<_VipsMaskGaussianDart>();
+  late final _maskGaussianBand = _lib.lookup<ffi.NativeFunction<_VipsMaskGaussianBandNative>>('vips_mask_gaussian_band').asFunction<_VipsMaskGaussianBandDart>();
+  late final _maskGaussianRing = _lib.lookup<ffi.NativeFunction<_VipsMaskGaussianRingNative>>('vips_mask_gaussian_ring').asFunction<_VipsMaskGaussianRingDart>();
+  late final _maskIdeal = _lib.lookup<ffi.NativeFunction<_VipsMaskIdealNative>>('vips_mask_ideal').asFunction<_VipsMaskIdealDart>();
+  late final _maskIdealBand = _lib.lookup<ffi.NativeFunction<_VipsMaskIdealBandNative>>('vips_mask_ideal_band').asFunction<_VipsMaskIdealBandDart>();
+  late final _maskIdealRing = _lib.lookup<ffi.NativeFunction<_VipsMaskIdealRingNative>>('vips_mask_ideal_ring').asFunction<_VipsMaskIdealRingDart>();
+  late final _perlin = _lib.lookup<ffi.NativeFunction<_VipsPerlinNative>>('vips_perlin').asFunction<_VipsPerlinDart>();
+  late final _sdf = _lib.lookup<ffi.NativeFunction<_VipsSdfNative>>('vips_sdf').asFunction<_VipsSdfDart>();
+  late final _text = _lib.lookup<ffi.NativeFunction<_VipsTextNative>>('vips_text').asFunction<_VipsTextDart>();
+  late final _tonelut = _lib.lookup<ffi.NativeFunction<_VipsTonelutNative>>('vips_tonelut').asFunction<_VipsTonelutDart>();
+  late final _worley = _lib.lookup<ffi.NativeFunction<_VipsWorleyNative>>('vips_worley').asFunction<_VipsWorleyDart>();
+  late final _xyz = _lib.lookup<ffi.NativeFunction<_VipsXyzNative>>('vips_xyz').asFunction<_VipsXyzDart>();
+  late final _zone = _lib.lookup<ffi.NativeFunction<_VipsZoneNative>>('vips_zone').asFunction<_VipsZoneDart>();
+
+  int black(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _black(out, width, height, ffi.nullptr);
+  int buildlut(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _buildlut(in$, out, ffi.nullptr);
+  int eye(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _eye(out, width, height, ffi.nullptr);
+  int fractsurf(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double fractal_dimension) => _fractsurf(out, width, height, fractal_dimension, ffi.nullptr);
+  int gaussmat(ffi.Pointer<ffi.Pointer<VipsImage>> out, double sigma, double min_ampl) => _gaussmat(out, sigma, min_ampl, ffi.nullptr);
+  int gaussnoise(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _gaussnoise(out, width, height, ffi.nullptr);
+  int grey(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _grey(out, width, height, ffi.nullptr);
+  int identity(ffi.Pointer<ffi.Pointer<VipsImage>> out) => _identity(out, ffi.nullptr);
+  int invertlut(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _invertlut(in$, out, ffi.nullptr);
+  int maskButterworth(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double order, double frequency_cutoff, double amplitude_cutoff) => _maskButterworth(out, width, height, order, frequency_cutoff, amplitude_cutoff, ffi.nullptr);
+  int maskButterworthBand(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double order, double frequency_cutoff_x, double frequency_cutoff_y, double radius, double amplitude_cutoff) => _maskButterworthBand(out, width, height, order, frequency_cutoff_x, frequency_cutoff_y, radius, amplitude_cutoff, ffi.nullptr);
+  int maskButterworthRing(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double order, double frequency_cutoff, double amplitude_cutoff, double ringwidth) => _maskButterworthRing(out, width, height, order, frequency_cutoff, amplitude_cutoff, ringwidth, ffi.nullptr);
+  int maskFractal(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double fractal_dimension) => _maskFractal(out, width, height, fractal_dimension, ffi.nullptr);
+  int maskGaussian(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double frequency_cutoff, double amplitude_cutoff) => _maskGaussian(out, width, height, frequency_cutoff, amplitude_cutoff, ffi.nullptr);
+  int maskGaussianBand(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double frequency_cutoff_x, double frequency_cutoff_y, double radius, double amplitude_cutoff) => _maskGaussianBand(out, width, height, frequency_cutoff_x, frequency_cutoff_y, radius, amplitude_cutoff, ffi.nullptr);
+  int maskGaussianRing(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double frequency_cutoff, double amplitude_cutoff, double ringwidth) => _maskGaussianRing(out, width, height, frequency_cutoff, amplitude_cutoff, ringwidth, ffi.nullptr);
+  int maskIdeal(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double frequency_cutoff) => _maskIdeal(out, width, height, frequency_cutoff, ffi.nullptr);
+  int maskIdealBand(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double frequency_cutoff_x, double frequency_cutoff_y, double radius) => _maskIdealBand(out, width, height, frequency_cutoff_x, frequency_cutoff_y, radius, ffi.nullptr);
+  int maskIdealRing(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, double frequency_cutoff, double ringwidth) => _maskIdealRing(out, width, height, frequency_cutoff, ringwidth, ffi.nullptr);
+  int perlin(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _perlin(out, width, height, ffi.nullptr);
+  int sdf(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, int shape) => _sdf(out, width, height, shape, ffi.nullptr);
+  int text(ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Char> text) => _text(out, text, ffi.nullptr);
+  int tonelut(ffi.Pointer<ffi.Pointer<VipsImage>> out) => _tonelut(out, ffi.nullptr);
+  int worley(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _worley(out, width, height, ffi.nullptr);
+  int xyz(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _xyz(out, width, height, ffi.nullptr);
+  int zone(ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _zone(out, width, height, ffi.nullptr);
+}
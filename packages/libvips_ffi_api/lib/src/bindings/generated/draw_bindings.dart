@@ -0,0 +1,292 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsDrawCircleNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  ffi.Int n,
+  ffi.Int cx,
+  ffi.Int cy,
+  ffi.Int radius,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawCircleDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  int n,
+  int cx,
+  int cy,
+  int radius,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawCircle1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Double ink,
+  ffi.Int cx,
+  ffi.Int cy,
+  ffi.Int radius,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawCircle1Dart = int Function(
+  ffi.Pointer<VipsImage> image,
+  double ink,
+  int cx,
+  int cy,
+  int radius,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawFloodNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  ffi.Int n,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawFloodDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  int n,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawFlood1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Double ink,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawFlood1Dart = int Function(
+  ffi.Pointer<VipsImage> image,
+  double ink,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawImageNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<VipsImage> sub,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawImageDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<VipsImage> sub,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawLineNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  ffi.Int n,
+  ffi.Int x1,
+  ffi.Int y1,
+  ffi.Int x2,
+  ffi.Int y2,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawLineDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  int n,
+  int x1,
+  int y1,
+  int x2,
+  int y2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawLine1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Double ink,
+  ffi.Int x1,
+  ffi.Int y1,
+  ffi.Int x2,
+  ffi.Int y2,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawLine1Dart = int Function(
+  ffi.Pointer<VipsImage> image,
+  double ink,
+  int x1,
+  int y1,
+  int x2,
+  int y2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawMaskNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  ffi.Int n,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawMaskDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  int n,
+  ffi.Pointer<VipsImage> mask,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawMask1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Double ink,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawMask1Dart = int Function(
+  ffi.Pointer<VipsImage> image,
+  double ink,
+  ffi.Pointer<VipsImage> mask,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawPointNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  ffi.Int n,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawPointDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  int n,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawPoint1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Double ink,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawPoint1Dart = int Function(
+  ffi.Pointer<VipsImage> image,
+  double ink,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawRectNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  ffi.Int n,
+  ffi.Int left,
+  ffi.Int top,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawRectDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Double> ink,
+  int n,
+  int left,
+  int top,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawRect1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Double ink,
+  ffi.Int left,
+  ffi.Int top,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawRect1Dart = int Function(
+  ffi.Pointer<VipsImage> image,
+  double ink,
+  int left,
+  int top,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDrawSmudgeNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Int left,
+  ffi.Int top,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDrawSmudgeDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  int left,
+  int top,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Draw variadic function bindings.
+class VipsGeneratedDrawBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedDrawBindings(this._lib);
+
+  late final _drawCircle = _lib.lookup<ffi.NativeFunction<_VipsDrawCircleNative>>('vips_draw_circle').asFunction<_VipsDrawCircleDart>();
+  late final _drawCircle1 = _lib.lookup<ffi.NativeFunction<_VipsDrawCircle1Native>>('vips_draw_circle1').asFunction<_VipsDrawCircle1Dart>();
+  late final _drawFlood = _lib.lookup<ffi.NativeFunction<_VipsDrawFloodNative>>('vips_draw_flood').asFunction<_VipsDrawFloodDart>();
+  late final _drawFlood1 = _lib.lookup<ffi.NativeFunction<_VipsDrawFlood1Native>>('vips_draw_flood1').asFunction<_VipsDrawFlood1Dart>();
+  late final _drawImage = _lib.lookup<ffi.NativeFunction<_VipsDrawImageNative>>('vips_draw_image').asFunction<_VipsDrawImageDart>();
+  late final _drawLine = _lib.lookup<ffi.NativeFunction<_VipsDrawLineNative>>('vips_draw_line').asFunction<_VipsDrawLineDart>();
+  late final _drawLine1 = _lib.lookup<ffi.NativeFunction<_VipsDrawLine1Native>>('vips_draw_line1').asFunction<_VipsDrawLine1Dart>();
+  late final _drawMask = _lib.lookup<ffi.NativeFunction<_VipsDrawMaskNative>>('vips_draw_mask').asFunction<_VipsDrawMaskDart>();
+  late final _drawMask1 = _lib.lookup<ffi.NativeFunction<_VipsDrawMask1Native>>('vips_draw_mask1').asFunction<_VipsDrawMask1Dart>();
+  late final _drawPoint = _lib.lookup<ffi.NativeFunction<_VipsDrawPointNative>>('vips_draw_point').asFunction<_VipsDrawPointDart>();
+  late final _drawPoint1 = _lib.lookup<ffi.NativeFunction<_VipsDrawPoint1Native>>('vips_draw_point1').asFunction<_VipsDrawPoint1Dart>();
+  late final _drawRect = _lib.lookup<ffi.NativeFunction<_VipsDrawRectNative>>('vips_draw_rect').asFunction<_VipsDrawRectDart>();
+  late final _drawRect1 = _lib.lookup<ffi.NativeFunction<_VipsDrawRect1Native>>('vips_draw_rect1').asFunction<_VipsDrawRect1Dart>();
+  late final _drawSmudge = _lib.lookup<ffi.NativeFunction<_VipsDrawSmudgeNative>>('vips_draw_smudge').asFunction<_VipsDrawSmudgeDart>();
+
+  int drawCircle(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Double> ink, int n, int cx, int cy, int radius) => _drawCircle(image, ink, n, cx, cy, radius, ffi.nullptr);
+  int drawCircle1(ffi.Pointer<VipsImage> image, double ink, int cx, int cy, int radius) => _drawCircle1(image, ink, cx, cy, radius, ffi.nullptr);
+  int drawFlood(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Double> ink, int n, int x, int y) => _drawFlood(image, ink, n, x, y, ffi.nullptr);
+  int drawFlood1(ffi.Pointer<VipsImage> image, double ink, int x, int y) => _drawFlood1(image, ink, x, y, ffi.nullptr);
+  int drawImage(ffi.Pointer<VipsImage> image, ffi.Pointer<VipsImage> sub, int x, int y) => _drawImage(image, sub, x, y, ffi.nullptr);
+  int drawLine(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Double> ink, int n, int x1, int y1, int x2, int y2) => _drawLine(image, ink, n, x1, y1, x2, y2, ffi.nullptr);
+  int drawLine1(ffi.Pointer<VipsImage> image, double ink, int x1, int y1, int x2, int y2) => _drawLine1(image, ink, x1, y1, x2, y2, ffi.nullptr);
+  int drawMask(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Double> ink, int n, ffi.Pointer<VipsImage> mask, int x, int y) => _drawMask(image, ink, n, mask, x, y, ffi.nullptr);
+  int drawMask1(ffi.Pointer<VipsImage> image, double ink, ffi.Pointer<VipsImage> mask, int x, int y) => _drawMask1(image, ink, mask, x, y, ffi.nullptr);
+  int drawPoint(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Double> ink, int n, int x, int y) => _drawPoint(image, ink, n, x, y, ffi.nullptr);
+  int drawPoint1(ffi.Pointer<VipsImage> image, double ink, int x, int y) => _drawPoint1(image, ink, x, y, ffi.nullptr);
+  int drawRect(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Double> ink, int n, int left, int top, int width, int height) => _drawRect(image, ink, n, left, top, width, height, ffi.nullptr);
+  int drawRect1(ffi.Pointer<VipsImage> image, double ink, int left, int top, int width, int height) => _drawRect1(image, ink, left, top, width, height, ffi.nullptr);
+  int drawSmudge(ffi.Pointer<VipsImage> image, int left, int top, int width, int height) => _drawSmudge(image, left, top, width, height, ffi.nullptr);
+}
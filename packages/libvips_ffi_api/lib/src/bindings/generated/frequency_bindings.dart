@@ -0,0 +1,85 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsFreqmultNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFreqmultDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> mask,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFwfftNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFwfftDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsInvfftNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsInvfftDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPhasecorNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPhasecorDart = int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSpectrumNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSpectrumDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Frequency variadic function bindings.
+class VipsGeneratedFrequencyBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedFrequencyBindings(this._lib);
+
+  late final _freqmult = _lib.lookup<ffi.NativeFunction<_VipsFreqmultNative>>('vips_freqmult').asFunction<_VipsFreqmultDart>();
+  late final _fwfft = _lib.lookup<ffi.NativeFunction<_VipsFwfftNative>>('vips_fwfft').asFunction<_VipsFwfftDart>();
+  late final _invfft = _lib.lookup<ffi.NativeFunction<_VipsInvfftNative>>('vips_invfft').asFunction<_VipsInvfftDart>();
+  late final _phasecor = _lib.lookup<ffi.NativeFunction<_VipsPhasecorNative>>('vips_phasecor').asFunction<_VipsPhasecorDart>();
+  late final _spectrum = _lib.lookup<ffi.NativeFunction<_VipsSpectrumNative>>('vips_spectrum').asFunction<_VipsSpectrumDart>();
+
+  int freqmult(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsImage> mask, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _freqmult(in$, mask, out, ffi.nullptr);
+  int fwfft(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _fwfft(in$, out, ffi.nullptr);
+  int invfft(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _invfft(in$, out, ffi.nullptr);
+  int phasecor(ffi.Pointer<VipsImage> in1, ffi.Pointer<VipsImage> in2, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _phasecor(in1, in2, out, ffi.nullptr);
+  int spectrum(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _spectrum(in$, out, ffi.nullptr);
+}
@@ -0,0 +1,61 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+
+import 'dart:ffi' as ffi;
+
+import 'arithmetic_bindings.dart';
+import 'colour_bindings.dart';
+import 'composite_bindings.dart';
+import 'conversion_bindings.dart';
+import 'convolution_bindings.dart';
+import 'create_bindings.dart';
+import 'draw_bindings.dart';
+import 'frequency_bindings.dart';
+import 'geometry_bindings.dart';
+import 'histogram_bindings.dart';
+import 'io_bindings.dart';
+import 'morphology_bindings.dart';
+import 'other_bindings.dart';
+import 'relational_bindings.dart';
+import 'resample_bindings.dart';
+
+export 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart'
+    show VipsAccess, VipsExtend, VipsFailOn, VipsForeignSubsample, VipsForeignWebpPreset, VipsIntent, VipsKernel, VipsPrecision, VipsSize;
+export 'colour_bindings.dart'
+    show VipsColourspaceOptions;
+export 'conversion_bindings.dart'
+    show VipsFlattenOptions;
+export 'convolution_bindings.dart'
+    show VipsGaussblurOptions, VipsSharpenOptions;
+export 'geometry_bindings.dart'
+    show VipsEmbedOptions, VipsSmartcropOptions;
+export 'io_bindings.dart'
+    show VipsGifloadBufferOptions, VipsGifloadOptions, VipsGifloadSourceOptions, VipsHeifloadBufferOptions, VipsHeifloadOptions, VipsHeifloadSourceOptions, VipsImageNewFromBufferOptions, VipsImageNewFromFileOptions, VipsImageNewFromSourceOptions, VipsJpegloadBufferOptions, VipsJpegloadOptions, VipsJpegloadSourceOptions, VipsJpegsaveBufferOptions, VipsJpegsaveOptions, VipsJpegsaveTargetOptions, VipsPngloadBufferOptions, VipsPngloadOptions, VipsPngloadSourceOptions, VipsPngsaveBufferOptions, VipsPngsaveOptions, VipsPngsaveTargetOptions, VipsTiffloadBufferOptions, VipsTiffloadOptions, VipsTiffloadSourceOptions, VipsWebploadBufferOptions, VipsWebploadOptions, VipsWebploadSourceOptions, VipsWebpsaveBufferOptions, VipsWebpsaveOptions, VipsWebpsaveTargetOptions;
+export 'other_bindings.dart'
+    show VipsLinearOptions;
+export 'resample_bindings.dart'
+    show VipsAffineOptions, VipsResizeOptions, VipsRotateOptions, VipsThumbnailBufferOptions, VipsThumbnailImageOptions, VipsThumbnailOptions, VipsThumbnailSourceOptions;
+export '../vips_option_slots.dart' show VipsOptionSlots;
+
+/// All generated variadic bindings, grouped by category.
+class VipsGeneratedBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedBindings(this._lib);
+
+  late final arithmetic = VipsGeneratedArithmeticBindings(_lib);
+  late final colour = VipsGeneratedColourBindings(_lib);
+  late final composite = VipsGeneratedCompositeBindings(_lib);
+  late final conversion = VipsGeneratedConversionBindings(_lib);
+  late final convolution = VipsGeneratedConvolutionBindings(_lib);
+  late final create = VipsGeneratedCreateBindings(_lib);
+  late final draw = VipsGeneratedDrawBindings(_lib);
+  late final frequency = VipsGeneratedFrequencyBindings(_lib);
+  late final geometry = VipsGeneratedGeometryBindings(_lib);
+  late final histogram = VipsGeneratedHistogramBindings(_lib);
+  late final io = VipsGeneratedIoBindings(_lib);
+  late final morphology = VipsGeneratedMorphologyBindings(_lib);
+  late final other = VipsGeneratedOtherBindings(_lib);
+  late final relational = VipsGeneratedRelationalBindings(_lib);
+  late final resample = VipsGeneratedResampleBindings(_lib);
+}
@@ -0,0 +1,443 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsArrayjoinNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsArrayjoinDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandjoinNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandjoinDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandjoin2Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandjoin2Dart = int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandjoinConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandjoinConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandjoinConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandjoinConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCropNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int left,
+  ffi.Int top,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCropDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int left,
+  int top,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEmbedNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEmbedDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int x,
+  int y,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEmbedOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsEmbedOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int x,
+  int y,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsExtractAreaNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int left,
+  ffi.Int top,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsExtractAreaDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int left,
+  int top,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsExtractBandNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int band,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsExtractBandDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int band,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFlipNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt direction,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFlipDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int direction,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGravityNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt direction,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGravityDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int direction,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGridNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int tile_height,
+  ffi.Int across,
+  ffi.Int down,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGridDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int tile_height,
+  int across,
+  int down,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsInsertNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> main,
+  ffi.Pointer<VipsImage> sub,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsInsertDart = int Function(
+  ffi.Pointer<VipsImage> main,
+  ffi.Pointer<VipsImage> sub,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJoinNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt direction,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJoinDart = int Function(
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int direction,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsReplicateNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int across,
+  ffi.Int down,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsReplicateDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int across,
+  int down,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSmartcropNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSmartcropDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSmartcropOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsSmartcropOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSubsampleNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int xfac,
+  ffi.Int yfac,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSubsampleDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int xfac,
+  int yfac,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWrapNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWrapDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsZoomNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int xfac,
+  ffi.Int yfac,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsZoomDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int xfac,
+  int yfac,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_embed`.
+class VipsEmbedOptions {
+  static final _extendKey = vipsOptionKey('extend');
+  static final _backgroundKey = vipsOptionKey('background');
+
+  final VipsExtend? extend;
+  final ffi.Pointer<VipsArrayDouble>? background;
+
+  const VipsEmbedOptions({
+    this.extend,
+    this.background,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (extend != null) slots.addInt(_extendKey, extend!.value);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_smartcrop`.
+class VipsSmartcropOptions {
+  static final _interestingKey = vipsOptionKey('interesting');
+  static final _premultipliedKey = vipsOptionKey('premultiplied');
+
+  final int? interesting;
+  final bool? premultiplied;
+
+  const VipsSmartcropOptions({
+    this.interesting,
+    this.premultiplied,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (interesting != null) slots.addInt(_interestingKey, interesting!);
+    if (premultiplied != null) slots.addInt(_premultipliedKey, premultiplied! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Geometry variadic function bindings.
+class VipsGeneratedGeometryBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedGeometryBindings(this._lib);
+
+  late final _arrayjoin = _lib.lookup<ffi.NativeFunction<_VipsArrayjoinNative>>('vips_arrayjoin').asFunction<_VipsArrayjoinDart>();
+  late final _bandjoin = _lib.lookup<ffi.NativeFunction<_VipsBandjoinNative>>('vips_bandjoin').asFunction<_VipsBandjoinDart>();
+  late final _bandjoin2 = _lib.lookup<ffi.NativeFunction<_VipsBandjoin2Native>>('vips_bandjoin2').asFunction<_VipsBandjoin2Dart>();
+  late final _bandjoinConst = _lib.lookup<ffi.NativeFunction<_VipsBandjoinConstNative>>('vips_bandjoin_const').asFunction<_VipsBandjoinConstDart>();
+  late final _bandjoinConst1 = _lib.lookup<ffi.NativeFunction<_VipsBandjoinConst1Native>>('vips_bandjoin_const1').asFunction<_VipsBandjoinConst1Dart>();
+  late final _crop = _lib.lookup<ffi.NativeFunction<_VipsCropNative>>('vips_crop').asFunction<_VipsCropDart>();
+  late final _embed = _lib.lookup<ffi.NativeFunction<_VipsEmbedNative>>('vips_embed').asFunction<_VipsEmbedDart>();
+  late final _embedOptions = _lib.lookup<ffi.NativeFunction<_VipsEmbedOptionsNative>>('vips_embed').asFunction<_VipsEmbedOptionsDart>();
+  late final _extractArea = _lib.lookup<ffi.NativeFunction<_VipsExtractAreaNative>>('vips_extract_area').asFunction<_VipsExtractAreaDart>();
+  late final _extractBand = _lib.lookup<ffi.NativeFunction<_VipsExtractBandNative>>('vips_extract_band').asFunction<_VipsExtractBandDart>();
+  late final _flip = _lib.lookup<ffi.NativeFunction<_VipsFlipNative>>('vips_flip').asFunction<_VipsFlipDart>();
+  late final _gravity = _lib.lookup<ffi.NativeFunction<_VipsGravityNative>>('vips_gravity').asFunction<_VipsGravityDart>();
+  late final _grid = _lib.lookup<ffi.NativeFunction<_VipsGridNative>>('vips_grid').asFunction<_VipsGridDart>();
+  late final _insert = _lib.lookup<ffi.NativeFunction<_VipsInsertNative>>('vips_insert').asFunction<_VipsInsertDart>();
+  late final _join = _lib.lookup<ffi.NativeFunction<_VipsJoinNative>>('vips_join').asFunction<_VipsJoinDart>();
+  late final _replicate = _lib.lookup<ffi.NativeFunction<_VipsReplicateNative>>('vips_replicate').asFunction<_VipsReplicateDart>();
+  late final _smartcrop = _lib.lookup<ffi.NativeFunction<_VipsSmartcropNative>>('vips_smartcrop').asFunction<_VipsSmartcropDart>();
+  late final _smartcropOptions = _lib.lookup<ffi.NativeFunction<_VipsSmartcropOptionsNative>>('vips_smartcrop').asFunction<_VipsSmartcropOptionsDart>();
+  late final _subsample = _lib.lookup<ffi.NativeFunction<_VipsSubsampleNative>>('vips_subsample').asFunction<_VipsSubsampleDart>();
+  late final _wrap = _lib.lookup<ffi.NativeFunction<_VipsWrapNative>>('vips_wrap').asFunction<_VipsWrapDart>();
+  late final _zoom = _lib.lookup<ffi.NativeFunction<_VipsZoomNative>>('vips_zoom').asFunction<_VipsZoomDart>();
+
+  int arrayjoin(ffi.Pointer<ffi.Pointer<VipsImage>> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n) => _arrayjoin(in$, out, n, ffi.nullptr);
+  int bandjoin(ffi.Pointer<ffi.Pointer<VipsImage>> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n) => _bandjoin(in$, out, n, ffi.nullptr);
+  int bandjoin2(ffi.Pointer<VipsImage> in1, ffi.Pointer<VipsImage> in2, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandjoin2(in1, in2, out, ffi.nullptr);
+  int bandjoinConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _bandjoinConst(in$, out, c, n, ffi.nullptr);
+  int bandjoinConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _bandjoinConst1(in$, out, c, ffi.nullptr);
+  int crop(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int left, int top, int width, int height) => _crop(in$, out, left, top, width, height, ffi.nullptr);
+  int embed(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int x, int y, int width, int height, [VipsEmbedOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _embed(in$, out, x, y, width, height, ffi.nullptr);
+    return _embedOptions(in$, out, x, y, width, height, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), ffi.nullptr);
+  }
+  int extractArea(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int left, int top, int width, int height) => _extractArea(in$, out, left, top, width, height, ffi.nullptr);
+  int extractBand(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int band) => _extractBand(in$, out, band, ffi.nullptr);
+  int flip(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int direction) => _flip(in$, out, direction, ffi.nullptr);
+  int gravity(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int direction, int width, int height) => _gravity(in$, out, direction, width, height, ffi.nullptr);
+  int grid(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int tile_height, int across, int down) => _grid(in$, out, tile_height, across, down, ffi.nullptr);
+  int insert(ffi.Pointer<VipsImage> main, ffi.Pointer<VipsImage> sub, ffi.Pointer<ffi.Pointer<VipsImage>> out, int x, int y) => _insert(main, sub, out, x, y, ffi.nullptr);
+  int join(ffi.Pointer<VipsImage> in1, ffi.Pointer<VipsImage> in2, ffi.Pointer<ffi.Pointer<VipsImage>> out, int direction) => _join(in1, in2, out, direction, ffi.nullptr);
+  int replicate(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int across, int down) => _replicate(in$, out, across, down, ffi.nullptr);
+  int smartcrop(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, [VipsSmartcropOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _smartcrop(in$, out, width, height, ffi.nullptr);
+    return _smartcropOptions(in$, out, width, height, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), ffi.nullptr);
+  }
+  int subsample(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int xfac, int yfac) => _subsample(in$, out, xfac, yfac, ffi.nullptr);
+  int wrap(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _wrap(in$, out, ffi.nullptr);
+  int zoom(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int xfac, int yfac) => _zoom(in$, out, xfac, yfac, ffi.nullptr);
+}
@@ -0,0 +1,246 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsHistCumNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistCumDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistEntropyNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistEntropyDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistEqualNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistEqualDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistFindNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistFindDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistFindIndexedNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> index,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistFindIndexedDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> index,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistFindNdimNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistFindNdimDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistIsmonotonicNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<gboolean> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistIsmonotonicDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<gboolean> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistLocalNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistLocalDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistMatchNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistMatchDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistNormNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistNormDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHistPlotNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHistPlotDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMeasureNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int h,
+  ffi.Int v,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMeasureDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int h,
+  int v,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPercentNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Double percent,
+  ffi.Pointer<ffi.Int> threshold,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPercentDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  double percent,
+  ffi.Pointer<ffi.Int> threshold,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsProfileNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> columns,
+  ffi.Pointer<ffi.Pointer<VipsImage>> rows,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsProfileDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> columns,
+  ffi.Pointer<ffi.Pointer<VipsImage>> rows,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsProjectNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> columns,
+  ffi.Pointer<ffi.Pointer<VipsImage>> rows,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsProjectDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> columns,
+  ffi.Pointer<ffi.Pointer<VipsImage>> rows,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsStdifNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsStdifDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Histogram variadic function bindings.
+class VipsGeneratedHistogramBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedHistogramBindings(this._lib);
+
+  late final _histCum = _lib.lookup<ffi.NativeFunction<_VipsHistCumNative>>('vips_hist_cum').asFunction<_VipsHistCumDart>();
+  late final _histEntropy = _lib.lookup<ffi.NativeFunction<_VipsHistEntropyNative>>('vips_hist_entropy').asFunction<_VipsHistEntropyDart>();
+  late final _histEqual = _lib.lookup<ffi.NativeFunction<_VipsHistEqualNative>>('vips_hist_equal').asFunction<_VipsHistEqualDart>();
+  late final _histFind = _lib.lookup<ffi.NativeFunction<_VipsHistFindNative>>('vips_hist_find').asFunction<_VipsHistFindDart>();
+  late final _histFindIndexed = _lib.lookup<ffi.NativeFunction<_VipsHistFindIndexedNative>>('vips_hist_find_indexed').asFunction<_VipsHistFindIndexedDart>();
+  late final _histFindNdim = _lib.lookup<ffi.NativeFunction<_VipsHistFindNdimNative>>('vips_hist_find_ndim').asFunction<_VipsHistFindNdimDart>();
+  late final _histIsmonotonic = _lib.lookup<ffi.NativeFunction<_VipsHistIsmonotonicNative>>('vips_hist_ismonotonic').asFunction<_VipsHistIsmonotonicDart>();
+  late final _histLocal = _lib.lookup<ffi.NativeFunction<_VipsHistLocalNative>>('vips_hist_local').asFunction<_VipsHistLocalDart>();
+  late final _histMatch = _lib.lookup<ffi.NativeFunction<_VipsHistMatchNative>>('vips_hist_match').asFunction<_VipsHistMatchDart>();
+  late final _histNorm = _lib.lookup<ffi.NativeFunction<_VipsHistNormNative>>('vips_hist_norm').asFunction<_VipsHistNormDart>();
+  late final _histPlot = _lib.lookup<ffi.NativeFunction<_VipsHistPlotNative>>('vips_hist_plot').asFunction<_VipsHistPlotDart>();
+  late final _measure = _lib.lookup<ffi.NativeFunction<_VipsMeasureNative>>('vips_measure').asFunction<_VipsMeasureDart>();
+  late final _percent = _lib.lookup<ffi.NativeFunction<_VipsPercentNative>>('vips_percent').asFunction<_VipsPercentDart>();
+  late final _profile = _lib.lookup<ffi.NativeFunction<_VipsProfileNative>>('vips_profile').asFunction<_VipsProfileDart>();
+  late final _project = _lib.lookup<ffi.NativeFunction<_VipsProjectNative>>('vips_project').asFunction<_VipsProjectDart>();
+  late final _stdif = _lib.lookup<ffi.NativeFunction<_VipsStdifNative>>('vips_stdif').asFunction<_VipsStdifDart>();
+
+  int histCum(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histCum(in$, out, ffi.nullptr);
+  int histEntropy(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Double> out) => _histEntropy(in$, out, ffi.nullptr);
+  int histEqual(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histEqual(in$, out, ffi.nullptr);
+  int histFind(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histFind(in$, out, ffi.nullptr);
+  int histFindIndexed(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsImage> index, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histFindIndexed(in$, index, out, ffi.nullptr);
+  int histFindNdim(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histFindNdim(in$, out, ffi.nullptr);
+  int histIsmonotonic(ffi.Pointer<VipsImage> in$, ffi.Pointer<gboolean> out) => _histIsmonotonic(in$, out, ffi.nullptr);
+  int histLocal(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _histLocal(in$, out, width, height, ffi.nullptr);
+  int histMatch(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsImage> ref, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histMatch(in$, ref, out, ffi.nullptr);
+  int histNorm(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histNorm(in$, out, ffi.nullptr);
+  int histPlot(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _histPlot(in$, out, ffi.nullptr);
+  int measure(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int h, int v) => _measure(in$, out, h, v, ffi.nullptr);
+  int percent(ffi.Pointer<VipsImage> in$, double percent, ffi.Pointer<ffi.Int> threshold) => _percent(in$, percent, threshold, ffi.nullptr);
+  int profile(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> columns, ffi.Pointer<ffi.Pointer<VipsImage>> rows) => _profile(in$, columns, rows, ffi.nullptr);
+  int project(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> columns, ffi.Pointer<ffi.Pointer<VipsImage>> rows) => _project(in$, columns, rows, ffi.nullptr);
+  int stdif(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height) => _stdif(in$, out, width, height, ffi.nullptr);
+}
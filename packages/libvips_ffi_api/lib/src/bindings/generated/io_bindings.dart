@@ -0,0 +1,4181 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsAnalyzeloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAnalyzeloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCsvloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCsvloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCsvloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCsvloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCsvsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCsvsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCsvsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCsvsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDzsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> name,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDzsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> name,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDzsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDzsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDzsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDzsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFitsloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFitsloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFitssaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFitssaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGifloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifloadOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsGifloadOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGifloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifloadBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsGifloadBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGifloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifloadSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsGifloadSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGifsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGifsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGifsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGifsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHeifloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifloadOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsHeifloadOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHeifloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifloadBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsHeifloadBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHeifloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifloadSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsHeifloadSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHeifsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHeifsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHeifsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHeifsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageNewFromBufferNative = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImageNewFromBufferDart = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageNewFromBufferOptionsNative = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsImageNewFromBufferOptionsDart = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageNewFromFileNative = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Char> name,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImageNewFromFileDart = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Char> name,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageNewFromFileOptionsNative = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Char> name,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsImageNewFromFileOptionsDart = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<ffi.Char> name,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageNewFromSourceNative = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImageNewFromSourceDart = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageNewFromSourceOptionsNative = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsImageNewFromSourceOptionsDart = ffi.Pointer<VipsImage> Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Char> option_string,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageWriteToBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> suffix,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> size,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImageWriteToBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> suffix,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> size,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageWriteToFileNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Char> name,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImageWriteToFileDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Pointer<ffi.Char> name,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImageWriteToTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> suffix,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImageWriteToTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> suffix,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJp2kloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJp2kloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJp2kloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJp2kloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJp2kloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJp2kloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJp2ksaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJp2ksaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJp2ksaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJp2ksaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJp2ksaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJp2ksaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegloadOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsJpegloadOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegloadBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsJpegloadBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegloadSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsJpegloadSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsJpegsaveOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Char> key12, int value12,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsJpegsaveBufferOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Char> key12, int value12,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveMimeNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegsaveMimeDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJpegsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJpegsaveTargetOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsJpegsaveTargetOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Char> key12, int value12,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJxlloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJxlloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJxlloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJxlloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJxlloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJxlloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJxlsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJxlsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJxlsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJxlsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsJxlsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsJxlsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMagickloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMagickloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMagickloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMagickloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMagicksaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMagicksaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMagicksaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMagicksaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatrixloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatrixloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatrixloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatrixloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatrixsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatrixsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMatrixsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMatrixsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsNiftiloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsNiftiloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsNiftiloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsNiftiloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsNiftisaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsNiftisaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsOpenexrloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsOpenexrloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsOpenslideloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsOpenslideloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsOpenslideloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsOpenslideloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPdfloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPdfloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPdfloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPdfloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPdfloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPdfloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPngloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngloadOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngloadOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPngloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngloadBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngloadBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPngloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngloadSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngloadSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPngsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngsaveOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, double value11,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngsaveOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPngsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngsaveBufferOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, double value11,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveBufferOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngsaveBufferOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPngsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveTargetOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngsaveTargetOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, double value11,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPngsaveTargetOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsPngsaveTargetOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPpmloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPpmloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPpmloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPpmloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPpmsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPpmsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPpmsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPpmsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsProfileLoadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> name,
+  ffi.Pointer<ffi.Pointer<VipsBlob>> profile,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsProfileLoadDart = int Function(
+  ffi.Pointer<ffi.Char> name,
+  ffi.Pointer<ffi.Pointer<VipsBlob>> profile,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRadloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRadloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRadloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRadloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRadloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRadloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRadsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRadsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRadsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRadsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRadsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRadsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRawloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Int bands,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRawloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  int bands,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRawsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRawsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRawsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRawsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRawsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRawsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSvgloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSvgloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSvgloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSvgloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSvgloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSvgloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSvgloadStringNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> str,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSvgloadStringDart = int Function(
+  ffi.Pointer<ffi.Char> str,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTiffloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffloadOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsTiffloadOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffloadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTiffloadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffloadBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsTiffloadBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTiffloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffloadSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsTiffloadSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTiffsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTiffsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsTiffsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsTiffsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsVipsloadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsVipsloadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsVipsloadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsVipsloadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsVipssaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsVipssaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsVipssaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsVipssaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebploadDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebploadOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, double value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadOptionsDNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebploadOptionsDDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebploadBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebploadBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, double value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadBufferOptionsDNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebploadBufferOptionsDDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebploadSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebploadSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, double value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebploadSourceOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebploadSourceOptionsDDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebpsaveDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebpsaveOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Char> key12, int value12,
+  ffi.Pointer<ffi.Char> key13, int value13,
+  ffi.Pointer<ffi.Char> key14, int value14,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveBufferNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebpsaveBufferDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebpsaveBufferOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Void>> buf,
+  ffi.Pointer<ffi.Size> len,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Char> key12, int value12,
+  ffi.Pointer<ffi.Char> key13, int value13,
+  ffi.Pointer<ffi.Char> key14, int value14,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveMimeNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebpsaveMimeDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveTargetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWebpsaveTargetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWebpsaveTargetOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsWebpsaveTargetOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsTarget> target,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Char> key10, int value10,
+  ffi.Pointer<ffi.Char> key11, int value11,
+  ffi.Pointer<ffi.Char> key12, int value12,
+  ffi.Pointer<ffi.Char> key13, int value13,
+  ffi.Pointer<ffi.Char> key14, int value14,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_gifload`.
+class VipsGifloadOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsGifloadOptions({
+    this.page,
+    this.n,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_gifload_buffer`.
+class VipsGifloadBufferOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsGifloadBufferOptions({
+    this.page,
+    this.n,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_gifload_source`.
+class VipsGifloadSourceOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsGifloadSourceOptions({
+    this.page,
+    this.n,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_heifload`.
+class VipsHeifloadOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _thumbnailKey = vipsOptionKey('thumbnail');
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? thumbnail;
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsHeifloadOptions({
+    this.page,
+    this.n,
+    this.thumbnail,
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (thumbnail != null) slots.addInt(_thumbnailKey, thumbnail! ? 1 : 0);
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_heifload_buffer`.
+class VipsHeifloadBufferOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _thumbnailKey = vipsOptionKey('thumbnail');
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? thumbnail;
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsHeifloadBufferOptions({
+    this.page,
+    this.n,
+    this.thumbnail,
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (thumbnail != null) slots.addInt(_thumbnailKey, thumbnail! ? 1 : 0);
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_heifload_source`.
+class VipsHeifloadSourceOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _thumbnailKey = vipsOptionKey('thumbnail');
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? thumbnail;
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsHeifloadSourceOptions({
+    this.page,
+    this.n,
+    this.thumbnail,
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (thumbnail != null) slots.addInt(_thumbnailKey, thumbnail! ? 1 : 0);
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_image_new_from_buffer`.
+class VipsImageNewFromBufferOptions {
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsImageNewFromBufferOptions({
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_image_new_from_file`.
+class VipsImageNewFromFileOptions {
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsImageNewFromFileOptions({
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_image_new_from_source`.
+class VipsImageNewFromSourceOptions {
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsImageNewFromSourceOptions({
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_jpegload`.
+class VipsJpegloadOptions {
+  static final _shrinkKey = vipsOptionKey('shrink');
+  static final _autorotateKey = vipsOptionKey('autorotate');
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? shrink;
+  final bool? autorotate;
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsJpegloadOptions({
+    this.shrink,
+    this.autorotate,
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (shrink != null) slots.addInt(_shrinkKey, shrink!);
+    if (autorotate != null) slots.addInt(_autorotateKey, autorotate! ? 1 : 0);
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_jpegload_buffer`.
+class VipsJpegloadBufferOptions {
+  static final _shrinkKey = vipsOptionKey('shrink');
+  static final _autorotateKey = vipsOptionKey('autorotate');
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? shrink;
+  final bool? autorotate;
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsJpegloadBufferOptions({
+    this.shrink,
+    this.autorotate,
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (shrink != null) slots.addInt(_shrinkKey, shrink!);
+    if (autorotate != null) slots.addInt(_autorotateKey, autorotate! ? 1 : 0);
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_jpegload_source`.
+class VipsJpegloadSourceOptions {
+  static final _shrinkKey = vipsOptionKey('shrink');
+  static final _autorotateKey = vipsOptionKey('autorotate');
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? shrink;
+  final bool? autorotate;
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsJpegloadSourceOptions({
+    this.shrink,
+    this.autorotate,
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (shrink != null) slots.addInt(_shrinkKey, shrink!);
+    if (autorotate != null) slots.addInt(_autorotateKey, autorotate! ? 1 : 0);
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_jpegsave`.
+class VipsJpegsaveOptions {
+  static final _qKey = vipsOptionKey('Q');
+  static final _optimizeCodingKey = vipsOptionKey('optimize_coding');
+  static final _interlaceKey = vipsOptionKey('interlace');
+  static final _trellisQuantKey = vipsOptionKey('trellis_quant');
+  static final _overshootDeringingKey = vipsOptionKey('overshoot_deringing');
+  static final _optimizeScansKey = vipsOptionKey('optimize_scans');
+  static final _quantTableKey = vipsOptionKey('quant_table');
+  static final _subsampleModeKey = vipsOptionKey('subsample_mode');
+  static final _restartIntervalKey = vipsOptionKey('restart_interval');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? q;
+  final bool? optimizeCoding;
+  final bool? interlace;
+  final bool? trellisQuant;
+  final bool? overshootDeringing;
+  final bool? optimizeScans;
+  final int? quantTable;
+  final VipsForeignSubsample? subsampleMode;
+  final int? restartInterval;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsJpegsaveOptions({
+    this.q,
+    this.optimizeCoding,
+    this.interlace,
+    this.trellisQuant,
+    this.overshootDeringing,
+    this.optimizeScans,
+    this.quantTable,
+    this.subsampleMode,
+    this.restartInterval,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (q != null) slots.addInt(_qKey, q!);
+    if (optimizeCoding != null) slots.addInt(_optimizeCodingKey, optimizeCoding! ? 1 : 0);
+    if (interlace != null) slots.addInt(_interlaceKey, interlace! ? 1 : 0);
+    if (trellisQuant != null) slots.addInt(_trellisQuantKey, trellisQuant! ? 1 : 0);
+    if (overshootDeringing != null) slots.addInt(_overshootDeringingKey, overshootDeringing! ? 1 : 0);
+    if (optimizeScans != null) slots.addInt(_optimizeScansKey, optimizeScans! ? 1 : 0);
+    if (quantTable != null) slots.addInt(_quantTableKey, quantTable!);
+    if (subsampleMode != null) slots.addInt(_subsampleModeKey, subsampleMode!.value);
+    if (restartInterval != null) slots.addInt(_restartIntervalKey, restartInterval!);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_jpegsave_buffer`.
+class VipsJpegsaveBufferOptions {
+  static final _qKey = vipsOptionKey('Q');
+  static final _optimizeCodingKey = vipsOptionKey('optimize_coding');
+  static final _interlaceKey = vipsOptionKey('interlace');
+  static final _trellisQuantKey = vipsOptionKey('trellis_quant');
+  static final _overshootDeringingKey = vipsOptionKey('overshoot_deringing');
+  static final _optimizeScansKey = vipsOptionKey('optimize_scans');
+  static final _quantTableKey = vipsOptionKey('quant_table');
+  static final _subsampleModeKey = vipsOptionKey('subsample_mode');
+  static final _restartIntervalKey = vipsOptionKey('restart_interval');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? q;
+  final bool? optimizeCoding;
+  final bool? interlace;
+  final bool? trellisQuant;
+  final bool? overshootDeringing;
+  final bool? optimizeScans;
+  final int? quantTable;
+  final VipsForeignSubsample? subsampleMode;
+  final int? restartInterval;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsJpegsaveBufferOptions({
+    this.q,
+    this.optimizeCoding,
+    this.interlace,
+    this.trellisQuant,
+    this.overshootDeringing,
+    this.optimizeScans,
+    this.quantTable,
+    this.subsampleMode,
+    this.restartInterval,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (q != null) slots.addInt(_qKey, q!);
+    if (optimizeCoding != null) slots.addInt(_optimizeCodingKey, optimizeCoding! ? 1 : 0);
+    if (interlace != null) slots.addInt(_interlaceKey, interlace! ? 1 : 0);
+    if (trellisQuant != null) slots.addInt(_trellisQuantKey, trellisQuant! ? 1 : 0);
+    if (overshootDeringing != null) slots.addInt(_overshootDeringingKey, overshootDeringing! ? 1 : 0);
+    if (optimizeScans != null) slots.addInt(_optimizeScansKey, optimizeScans! ? 1 : 0);
+    if (quantTable != null) slots.addInt(_quantTableKey, quantTable!);
+    if (subsampleMode != null) slots.addInt(_subsampleModeKey, subsampleMode!.value);
+    if (restartInterval != null) slots.addInt(_restartIntervalKey, restartInterval!);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_jpegsave_target`.
+class VipsJpegsaveTargetOptions {
+  static final _qKey = vipsOptionKey('Q');
+  static final _optimizeCodingKey = vipsOptionKey('optimize_coding');
+  static final _interlaceKey = vipsOptionKey('interlace');
+  static final _trellisQuantKey = vipsOptionKey('trellis_quant');
+  static final _overshootDeringingKey = vipsOptionKey('overshoot_deringing');
+  static final _optimizeScansKey = vipsOptionKey('optimize_scans');
+  static final _quantTableKey = vipsOptionKey('quant_table');
+  static final _subsampleModeKey = vipsOptionKey('subsample_mode');
+  static final _restartIntervalKey = vipsOptionKey('restart_interval');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? q;
+  final bool? optimizeCoding;
+  final bool? interlace;
+  final bool? trellisQuant;
+  final bool? overshootDeringing;
+  final bool? optimizeScans;
+  final int? quantTable;
+  final VipsForeignSubsample? subsampleMode;
+  final int? restartInterval;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsJpegsaveTargetOptions({
+    this.q,
+    this.optimizeCoding,
+    this.interlace,
+    this.trellisQuant,
+    this.overshootDeringing,
+    this.optimizeScans,
+    this.quantTable,
+    this.subsampleMode,
+    this.restartInterval,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (q != null) slots.addInt(_qKey, q!);
+    if (optimizeCoding != null) slots.addInt(_optimizeCodingKey, optimizeCoding! ? 1 : 0);
+    if (interlace != null) slots.addInt(_interlaceKey, interlace! ? 1 : 0);
+    if (trellisQuant != null) slots.addInt(_trellisQuantKey, trellisQuant! ? 1 : 0);
+    if (overshootDeringing != null) slots.addInt(_overshootDeringingKey, overshootDeringing! ? 1 : 0);
+    if (optimizeScans != null) slots.addInt(_optimizeScansKey, optimizeScans! ? 1 : 0);
+    if (quantTable != null) slots.addInt(_quantTableKey, quantTable!);
+    if (subsampleMode != null) slots.addInt(_subsampleModeKey, subsampleMode!.value);
+    if (restartInterval != null) slots.addInt(_restartIntervalKey, restartInterval!);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_pngload`.
+class VipsPngloadOptions {
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsPngloadOptions({
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_pngload_buffer`.
+class VipsPngloadBufferOptions {
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsPngloadBufferOptions({
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_pngload_source`.
+class VipsPngloadSourceOptions {
+  static final _unlimitedKey = vipsOptionKey('unlimited');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final bool? unlimited;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsPngloadSourceOptions({
+    this.unlimited,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (unlimited != null) slots.addInt(_unlimitedKey, unlimited! ? 1 : 0);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_pngsave`.
+class VipsPngsaveOptions {
+  static final _compressionKey = vipsOptionKey('compression');
+  static final _interlaceKey = vipsOptionKey('interlace');
+  static final _filterKey = vipsOptionKey('filter');
+  static final _paletteKey = vipsOptionKey('palette');
+  static final _qKey = vipsOptionKey('Q');
+  static final _ditherKey = vipsOptionKey('dither');
+  static final _bitdepthKey = vipsOptionKey('bitdepth');
+  static final _effortKey = vipsOptionKey('effort');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? compression;
+  final bool? interlace;
+  final int? filter;
+  final bool? palette;
+  final int? q;
+  final double? dither;
+  final int? bitdepth;
+  final int? effort;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsPngsaveOptions({
+    this.compression,
+    this.interlace,
+    this.filter,
+    this.palette,
+    this.q,
+    this.dither,
+    this.bitdepth,
+    this.effort,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (compression != null) slots.addInt(_compressionKey, compression!);
+    if (interlace != null) slots.addInt(_interlaceKey, interlace! ? 1 : 0);
+    if (filter != null) slots.addInt(_filterKey, filter!);
+    if (palette != null) slots.addInt(_paletteKey, palette! ? 1 : 0);
+    if (q != null) slots.addInt(_qKey, q!);
+    if (dither != null) slots.addDouble(_ditherKey, dither!);
+    if (bitdepth != null) slots.addInt(_bitdepthKey, bitdepth!);
+    if (effort != null) slots.addInt(_effortKey, effort!);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_pngsave_buffer`.
+class VipsPngsaveBufferOptions {
+  static final _compressionKey = vipsOptionKey('compression');
+  static final _interlaceKey = vipsOptionKey('interlace');
+  static final _filterKey = vipsOptionKey('filter');
+  static final _paletteKey = vipsOptionKey('palette');
+  static final _qKey = vipsOptionKey('Q');
+  static final _ditherKey = vipsOptionKey('dither');
+  static final _bitdepthKey = vipsOptionKey('bitdepth');
+  static final _effortKey = vipsOptionKey('effort');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? compression;
+  final bool? interlace;
+  final int? filter;
+  final bool? palette;
+  final int? q;
+  final double? dither;
+  final int? bitdepth;
+  final int? effort;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsPngsaveBufferOptions({
+    this.compression,
+    this.interlace,
+    this.filter,
+    this.palette,
+    this.q,
+    this.dither,
+    this.bitdepth,
+    this.effort,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (compression != null) slots.addInt(_compressionKey, compression!);
+    if (interlace != null) slots.addInt(_interlaceKey, interlace! ? 1 : 0);
+    if (filter != null) slots.addInt(_filterKey, filter!);
+    if (palette != null) slots.addInt(_paletteKey, palette! ? 1 : 0);
+    if (q != null) slots.addInt(_qKey, q!);
+    if (dither != null) slots.addDouble(_ditherKey, dither!);
+    if (bitdepth != null) slots.addInt(_bitdepthKey, bitdepth!);
+    if (effort != null) slots.addInt(_effortKey, effort!);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_pngsave_target`.
+class VipsPngsaveTargetOptions {
+  static final _compressionKey = vipsOptionKey('compression');
+  static final _interlaceKey = vipsOptionKey('interlace');
+  static final _filterKey = vipsOptionKey('filter');
+  static final _paletteKey = vipsOptionKey('palette');
+  static final _qKey = vipsOptionKey('Q');
+  static final _ditherKey = vipsOptionKey('dither');
+  static final _bitdepthKey = vipsOptionKey('bitdepth');
+  static final _effortKey = vipsOptionKey('effort');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? compression;
+  final bool? interlace;
+  final int? filter;
+  final bool? palette;
+  final int? q;
+  final double? dither;
+  final int? bitdepth;
+  final int? effort;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsPngsaveTargetOptions({
+    this.compression,
+    this.interlace,
+    this.filter,
+    this.palette,
+    this.q,
+    this.dither,
+    this.bitdepth,
+    this.effort,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (compression != null) slots.addInt(_compressionKey, compression!);
+    if (interlace != null) slots.addInt(_interlaceKey, interlace! ? 1 : 0);
+    if (filter != null) slots.addInt(_filterKey, filter!);
+    if (palette != null) slots.addInt(_paletteKey, palette! ? 1 : 0);
+    if (q != null) slots.addInt(_qKey, q!);
+    if (dither != null) slots.addDouble(_ditherKey, dither!);
+    if (bitdepth != null) slots.addInt(_bitdepthKey, bitdepth!);
+    if (effort != null) slots.addInt(_effortKey, effort!);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_tiffload`.
+class VipsTiffloadOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _autorotateKey = vipsOptionKey('autorotate');
+  static final _subifdKey = vipsOptionKey('subifd');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? autorotate;
+  final int? subifd;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsTiffloadOptions({
+    this.page,
+    this.n,
+    this.autorotate,
+    this.subifd,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (autorotate != null) slots.addInt(_autorotateKey, autorotate! ? 1 : 0);
+    if (subifd != null) slots.addInt(_subifdKey, subifd!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_tiffload_buffer`.
+class VipsTiffloadBufferOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _autorotateKey = vipsOptionKey('autorotate');
+  static final _subifdKey = vipsOptionKey('subifd');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? autorotate;
+  final int? subifd;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsTiffloadBufferOptions({
+    this.page,
+    this.n,
+    this.autorotate,
+    this.subifd,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (autorotate != null) slots.addInt(_autorotateKey, autorotate! ? 1 : 0);
+    if (subifd != null) slots.addInt(_subifdKey, subifd!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_tiffload_source`.
+class VipsTiffloadSourceOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _autorotateKey = vipsOptionKey('autorotate');
+  static final _subifdKey = vipsOptionKey('subifd');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final bool? autorotate;
+  final int? subifd;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsTiffloadSourceOptions({
+    this.page,
+    this.n,
+    this.autorotate,
+    this.subifd,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (autorotate != null) slots.addInt(_autorotateKey, autorotate! ? 1 : 0);
+    if (subifd != null) slots.addInt(_subifdKey, subifd!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_webpload`.
+class VipsWebploadOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _scaleKey = vipsOptionKey('scale');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final double? scale;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsWebploadOptions({
+    this.page,
+    this.n,
+    this.scale,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (scale != null) slots.addDouble(_scaleKey, scale!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_webpload_buffer`.
+class VipsWebploadBufferOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _scaleKey = vipsOptionKey('scale');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final double? scale;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsWebploadBufferOptions({
+    this.page,
+    this.n,
+    this.scale,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (scale != null) slots.addDouble(_scaleKey, scale!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_webpload_source`.
+class VipsWebploadSourceOptions {
+  static final _pageKey = vipsOptionKey('page');
+  static final _nKey = vipsOptionKey('n');
+  static final _scaleKey = vipsOptionKey('scale');
+  static final _memoryKey = vipsOptionKey('memory');
+  static final _accessKey = vipsOptionKey('access');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _revalidateKey = vipsOptionKey('revalidate');
+
+  final int? page;
+  final int? n;
+  final double? scale;
+  final bool? memory;
+  final VipsAccess? access;
+  final VipsFailOn? failOn;
+  final bool? revalidate;
+
+  const VipsWebploadSourceOptions({
+    this.page,
+    this.n,
+    this.scale,
+    this.memory,
+    this.access,
+    this.failOn,
+    this.revalidate,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (page != null) slots.addInt(_pageKey, page!);
+    if (n != null) slots.addInt(_nKey, n!);
+    if (scale != null) slots.addDouble(_scaleKey, scale!);
+    if (memory != null) slots.addInt(_memoryKey, memory! ? 1 : 0);
+    if (access != null) slots.addInt(_accessKey, access!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (revalidate != null) slots.addInt(_revalidateKey, revalidate! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_webpsave`.
+class VipsWebpsaveOptions {
+  static final _qKey = vipsOptionKey('Q');
+  static final _losslessKey = vipsOptionKey('lossless');
+  static final _presetKey = vipsOptionKey('preset');
+  static final _smartSubsampleKey = vipsOptionKey('smart_subsample');
+  static final _nearLosslessKey = vipsOptionKey('near_lossless');
+  static final _alphaQKey = vipsOptionKey('alpha_q');
+  static final _minSizeKey = vipsOptionKey('min_size');
+  static final _kminKey = vipsOptionKey('kmin');
+  static final _kmaxKey = vipsOptionKey('kmax');
+  static final _effortKey = vipsOptionKey('effort');
+  static final _mixedKey = vipsOptionKey('mixed');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? q;
+  final bool? lossless;
+  final VipsForeignWebpPreset? preset;
+  final bool? smartSubsample;
+  final bool? nearLossless;
+  final int? alphaQ;
+  final bool? minSize;
+  final int? kmin;
+  final int? kmax;
+  final int? effort;
+  final bool? mixed;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsWebpsaveOptions({
+    this.q,
+    this.lossless,
+    this.preset,
+    this.smartSubsample,
+    this.nearLossless,
+    this.alphaQ,
+    this.minSize,
+    this.kmin,
+    this.kmax,
+    this.effort,
+    this.mixed,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (q != null) slots.addInt(_qKey, q!);
+    if (lossless != null) slots.addInt(_losslessKey, lossless! ? 1 : 0);
+    if (preset != null) slots.addInt(_presetKey, preset!.value);
+    if (smartSubsample != null) slots.addInt(_smartSubsampleKey, smartSubsample! ? 1 : 0);
+    if (nearLossless != null) slots.addInt(_nearLosslessKey, nearLossless! ? 1 : 0);
+    if (alphaQ != null) slots.addInt(_alphaQKey, alphaQ!);
+    if (minSize != null) slots.addInt(_minSizeKey, minSize! ? 1 : 0);
+    if (kmin != null) slots.addInt(_kminKey, kmin!);
+    if (kmax != null) slots.addInt(_kmaxKey, kmax!);
+    if (effort != null) slots.addInt(_effortKey, effort!);
+    if (mixed != null) slots.addInt(_mixedKey, mixed! ? 1 : 0);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_webpsave_buffer`.
+class VipsWebpsaveBufferOptions {
+  static final _qKey = vipsOptionKey('Q');
+  static final _losslessKey = vipsOptionKey('lossless');
+  static final _presetKey = vipsOptionKey('preset');
+  static final _smartSubsampleKey = vipsOptionKey('smart_subsample');
+  static final _nearLosslessKey = vipsOptionKey('near_lossless');
+  static final _alphaQKey = vipsOptionKey('alpha_q');
+  static final _minSizeKey = vipsOptionKey('min_size');
+  static final _kminKey = vipsOptionKey('kmin');
+  static final _kmaxKey = vipsOptionKey('kmax');
+  static final _effortKey = vipsOptionKey('effort');
+  static final _mixedKey = vipsOptionKey('mixed');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? q;
+  final bool? lossless;
+  final VipsForeignWebpPreset? preset;
+  final bool? smartSubsample;
+  final bool? nearLossless;
+  final int? alphaQ;
+  final bool? minSize;
+  final int? kmin;
+  final int? kmax;
+  final int? effort;
+  final bool? mixed;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsWebpsaveBufferOptions({
+    this.q,
+    this.lossless,
+    this.preset,
+    this.smartSubsample,
+    this.nearLossless,
+    this.alphaQ,
+    this.minSize,
+    this.kmin,
+    this.kmax,
+    this.effort,
+    this.mixed,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (q != null) slots.addInt(_qKey, q!);
+    if (lossless != null) slots.addInt(_losslessKey, lossless! ? 1 : 0);
+    if (preset != null) slots.addInt(_presetKey, preset!.value);
+    if (smartSubsample != null) slots.addInt(_smartSubsampleKey, smartSubsample! ? 1 : 0);
+    if (nearLossless != null) slots.addInt(_nearLosslessKey, nearLossless! ? 1 : 0);
+    if (alphaQ != null) slots.addInt(_alphaQKey, alphaQ!);
+    if (minSize != null) slots.addInt(_minSizeKey, minSize! ? 1 : 0);
+    if (kmin != null) slots.addInt(_kminKey, kmin!);
+    if (kmax != null) slots.addInt(_kmaxKey, kmax!);
+    if (effort != null) slots.addInt(_effortKey, effort!);
+    if (mixed != null) slots.addInt(_mixedKey, mixed! ? 1 : 0);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_webpsave_target`.
+class VipsWebpsaveTargetOptions {
+  static final _qKey = vipsOptionKey('Q');
+  static final _losslessKey = vipsOptionKey('lossless');
+  static final _presetKey = vipsOptionKey('preset');
+  static final _smartSubsampleKey = vipsOptionKey('smart_subsample');
+  static final _nearLosslessKey = vipsOptionKey('near_lossless');
+  static final _alphaQKey = vipsOptionKey('alpha_q');
+  static final _minSizeKey = vipsOptionKey('min_size');
+  static final _kminKey = vipsOptionKey('kmin');
+  static final _kmaxKey = vipsOptionKey('kmax');
+  static final _effortKey = vipsOptionKey('effort');
+  static final _mixedKey = vipsOptionKey('mixed');
+  static final _keepKey = vipsOptionKey('keep');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _pageHeightKey = vipsOptionKey('page_height');
+  static final _profileKey = vipsOptionKey('profile');
+
+  final int? q;
+  final bool? lossless;
+  final VipsForeignWebpPreset? preset;
+  final bool? smartSubsample;
+  final bool? nearLossless;
+  final int? alphaQ;
+  final bool? minSize;
+  final int? kmin;
+  final int? kmax;
+  final int? effort;
+  final bool? mixed;
+  final int? keep;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final int? pageHeight;
+  final ffi.Pointer<ffi.Char>? profile;
+
+  const VipsWebpsaveTargetOptions({
+    this.q,
+    this.lossless,
+    this.preset,
+    this.smartSubsample,
+    this.nearLossless,
+    this.alphaQ,
+    this.minSize,
+    this.kmin,
+    this.kmax,
+    this.effort,
+    this.mixed,
+    this.keep,
+    this.background,
+    this.pageHeight,
+    this.profile,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (q != null) slots.addInt(_qKey, q!);
+    if (lossless != null) slots.addInt(_losslessKey, lossless! ? 1 : 0);
+    if (preset != null) slots.addInt(_presetKey, preset!.value);
+    if (smartSubsample != null) slots.addInt(_smartSubsampleKey, smartSubsample! ? 1 : 0);
+    if (nearLossless != null) slots.addInt(_nearLosslessKey, nearLossless! ? 1 : 0);
+    if (alphaQ != null) slots.addInt(_alphaQKey, alphaQ!);
+    if (minSize != null) slots.addInt(_minSizeKey, minSize! ? 1 : 0);
+    if (kmin != null) slots.addInt(_kminKey, kmin!);
+    if (kmax != null) slots.addInt(_kmaxKey, kmax!);
+    if (effort != null) slots.addInt(_effortKey, effort!);
+    if (mixed != null) slots.addInt(_mixedKey, mixed! ? 1 : 0);
+    if (keep != null) slots.addInt(_keepKey, keep!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (pageHeight != null) slots.addInt(_pageHeightKey, pageHeight!);
+    if (profile != null) slots.addInt(_profileKey, profile!.address);
+    return slots;
+  }
+}
+
+/// Io variadic function bindings.
+class VipsGeneratedIoBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedIoBindings(this._lib);
+
+  late final _analyzeload = _lib.lookup<ffi.NativeFunction<_VipsAnalyzeloadNative>>('vips_analyzeload').asFunction<_VipsAnalyzeloadDart>();
+  late final _csvload = _lib.lookup<ffi.NativeFunction<_VipsCsvloadNative>>('vips_csvload').asFunction<_VipsCsvloadDart>();
+  late final _csvloadSource = _lib.lookup<ffi.NativeFunction<_VipsCsvloadSourceNative>>('vips_csvload_source').asFunction<_VipsCsvloadSourceDart>();
+  late final _csvsave = _lib.lookup<ffi.NativeFunction<_VipsCsvsaveNative>>('vips_csvsave').asFunction<_VipsCsvsaveDart>();
+  late final _csvsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsCsvsaveTargetNative>>('vips_csvsave_target').asFunction<_VipsCsvsaveTargetDart>();
+  late final _dzsave = _lib.lookup<ffi.NativeFunction<_VipsDzsaveNative>>('vips_dzsave').asFunction<_VipsDzsaveDart>();
+  late final _dzsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsDzsaveBufferNative>>('vips_dzsave_buffer').asFunction<_VipsDzsaveBufferDart>();
+  late final _dzsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsDzsaveTargetNative>>('vips_dzsave_target').asFunction<_VipsDzsaveTargetDart>();
+  late final _fitsload = _lib.lookup<ffi.NativeFunction<_VipsFitsloadNative>>('vips_fitsload').asFunction<_VipsFitsloadDart>();
+  late final _fitssave = _lib.lookup<ffi.NativeFunction<_VipsFitssaveNative>>('vips_fitssave').asFunction<_VipsFitssaveDart>();
+  late final _gifload = _lib.lookup<ffi.NativeFunction<_VipsGifloadNative>>('vips_gifload').asFunction<_VipsGifloadDart>();
+  late final _gifloadOptions = _lib.lookup<ffi.NativeFunction<_VipsGifloadOptionsNative>>('vips_gifload').asFunction<_VipsGifloadOptionsDart>();
+  late final _gifloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsGifloadBufferNative>>('vips_gifload_buffer').asFunction<_VipsGifloadBufferDart>();
+  late final _gifloadBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsGifloadBufferOptionsNative>>('vips_gifload_buffer').asFunction<_VipsGifloadBufferOptionsDart>();
+  late final _gifloadSource = _lib.lookup<ffi.NativeFunction<_VipsGifloadSourceNative>>('vips_gifload_source').asFunction<_VipsGifloadSourceDart>();
+  late final _gifloadSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsGifloadSourceOptionsNative>>('vips_gifload_source').asFunction<_VipsGifloadSourceOptionsDart>();
+  late final _gifsave = _lib.lookup<ffi.NativeFunction<_VipsGifsaveNative>>('vips_gifsave').asFunction<_VipsGifsaveDart>();
+  late final _gifsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsGifsaveBufferNative>>('vips_gifsave_buffer').asFunction<_VipsGifsaveBufferDart>();
+  late final _gifsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsGifsaveTargetNative>>('vips_gifsave_target').asFunction<_VipsGifsaveTargetDart>();
+  late final _heifload = _lib.lookup<ffi.NativeFunction<_VipsHeifloadNative>>('vips_heifload').asFunction<_VipsHeifloadDart>();
+  late final _heifloadOptions = _lib.lookup<ffi.NativeFunction<_VipsHeifloadOptionsNative>>('vips_heifload').asFunction<_VipsHeifloadOptionsDart>();
+  late final _heifloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsHeifloadBufferNative>>('vips_heifload_buffer').asFunction<_VipsHeifloadBufferDart>();
+  late final _heifloadBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsHeifloadBufferOptionsNative>>('vips_heifload_buffer').asFunction<_VipsHeifloadBufferOptionsDart>();
+  late final _heifloadSource = _lib.lookup<ffi.NativeFunction<_VipsHeifloadSourceNative>>('vips_heifload_source').asFunction<_VipsHeifloadSourceDart>();
+  late final _heifloadSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsHeifloadSourceOptionsNative>>('vips_heifload_source').asFunction<_VipsHeifloadSourceOptionsDart>();
+  late final _heifsave = _lib.lookup<ffi.NativeFunction<_VipsHeifsaveNative>>('vips_heifsave').asFunction<_VipsHeifsaveDart>();
+  late final _heifsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsHeifsaveBufferNative>>('vips_heifsave_buffer').asFunction<_VipsHeifsaveBufferDart>();
+  late final _heifsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsHeifsaveTargetNative>>('vips_heifsave_target').asFunction<_VipsHeifsaveTargetDart>();
+  late final _imageNewFromBuffer = _lib.lookup<ffi.NativeFunction<_VipsImageNewFromBufferNative>>('vips_image_new_from_buffer').asFunction<_VipsImageNewFromBufferDart>();
+  late final _imageNewFromBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsImageNewFromBufferOptionsNative>>('vips_image_new_from_buffer').asFunction<_VipsImageNewFromBufferOptionsDart>();
+  late final _imageNewFromFile = _lib.lookup<ffi.NativeFunction<_VipsImageNewFromFileNative>>('vips_image_new_from_file').asFunction<_VipsImageNewFromFileDart>();
+  late final _imageNewFromFileOptions = _lib.lookup<ffi.NativeFunction<_VipsImageNewFromFileOptionsNative>>('vips_image_new_from_file').asFunction<_VipsImageNewFromFileOptionsDart>();
+  late final _imageNewFromSource = _lib.lookup<ffi.NativeFunction<_VipsImageNewFromSourceNative>>('vips_image_new_from_source').asFunction<_VipsImageNewFromSourceDart>();
+  late final _imageNewFromSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsImageNewFromSourceOptionsNative>>('vips_image_new_from_source').asFunction<_VipsImageNewFromSourceOptionsDart>();
+  late final _imageWriteToBuffer = _lib.lookup<ffi.NativeFunction<_VipsImageWriteToBufferNative>>('vips_image_write_to_buffer').asFunction<_VipsImageWriteToBufferDart>();
+  late final _imageWriteToFile = _lib.lookup<ffi.NativeFunction<_VipsImageWriteToFileNative>>('vips_image_write_to_file').asFunction<_VipsImageWriteToFileDart>();
+  late final _imageWriteToTarget = _lib.lookup<ffi.NativeFunction<_VipsImageWriteToTargetNative>>('vips_image_write_to_target').asFunction<_VipsImageWriteToTargetDart>();
+  late final _jp2kload = _lib.lookup<ffi.NativeFunction<_VipsJp2kloadNative>>('vips_jp2kload').asFunction<_VipsJp2kloadDart>();
+  late final _jp2kloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsJp2kloadBufferNative>>('vips_jp2kload_buffer').asFunction<_VipsJp2kloadBufferDart>();
+  late final _jp2kloadSource = _lib.lookup<ffi.NativeFunction<_VipsJp2kloadSourceNative>>('vips_jp2kload_source').asFunction<_VipsJp2kloadSourceDart>();
+  late final _jp2ksave = _lib.lookup<ffi.NativeFunction<_VipsJp2ksaveNative>>('vips_jp2ksave').asFunction<_VipsJp2ksaveDart>();
+  late final _jp2ksaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsJp2ksaveBufferNative>>('vips_jp2ksave_buffer').asFunction<_VipsJp2ksaveBufferDart>();
+  late final _jp2ksaveTarget = _lib.lookup<ffi.NativeFunction<_VipsJp2ksaveTargetNative>>('vips_jp2ksave_target').asFunction<_VipsJp2ksaveTargetDart>();
+  late final _jpegload = _lib.lookup<ffi.NativeFunction<_VipsJpegloadNative>>('vips_jpegload').asFunction<_VipsJpegloadDart>();
+  late final _jpegloadOptions = _lib.lookup<ffi.NativeFunction<_VipsJpegloadOptionsNative>>('vips_jpegload').asFunction<_VipsJpegloadOptionsDart>();
+  late final _jpegloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsJpegloadBufferNative>>('vips_jpegload_buffer').asFunction<_VipsJpegloadBufferDart>();
+  late final _jpegloadBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsJpegloadBufferOptionsNative>>('vips_jpegload_buffer').asFunction<_VipsJpegloadBufferOptionsDart>();
+  late final _jpegloadSource = _lib.lookup<ffi.NativeFunction<_VipsJpegloadSourceNative>>('vips_jpegload_source').asFunction<_VipsJpegloadSourceDart>();
+  late final _jpegloadSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsJpegloadSourceOptionsNative>>('vips_jpegload_source').asFunction<_VipsJpegloadSourceOptionsDart>();
+  late final _jpegsave = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveNative>>('vips_jpegsave').asFunction<_VipsJpegsaveDart>();
+  late final _jpegsaveOptions = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveOptionsNative>>('vips_jpegsave').asFunction<_VipsJpegsaveOptionsDart>();
+  late final _jpegsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveBufferNative>>('vips_jpegsave_buffer').asFunction<_VipsJpegsaveBufferDart>();
+  late final _jpegsaveBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveBufferOptionsNative>>('vips_jpegsave_buffer').asFunction<_VipsJpegsaveBufferOptionsDart>();
+  late final _jpegsaveMime = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveMimeNative>>('vips_jpegsave_mime').asFunction<_VipsJpegsaveMimeDart>();
+  late final _jpegsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveTargetNative>>('vips_jpegsave_target').asFunction<_VipsJpegsaveTargetDart>();
+  late final _jpegsaveTargetOptions = _lib.lookup<ffi.NativeFunction<_VipsJpegsaveTargetOptionsNative>>('vips_jpegsave_target').asFunction<_VipsJpegsaveTargetOptionsDart>();
+  late final _jxlload = _lib.lookup<ffi.NativeFunction<_VipsJxlloadNative>>('vips_jxlload').asFunction<_VipsJxlloadDart>();
+  late final _jxlloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsJxlloadBufferNative>>('vips_jxlload_buffer').asFunction<_VipsJxlloadBufferDart>();
+  late final _jxlloadSource = _lib.lookup<ffi.NativeFunction<_VipsJxlloadSourceNative>>('vips_jxlload_source').asFunction<_VipsJxlloadSourceDart>();
+  late final _jxlsave = _lib.lookup<ffi.NativeFunction<_VipsJxlsaveNative>>('vips_jxlsave').asFunction<_VipsJxlsaveDart>();
+  late final _jxlsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsJxlsaveBufferNative>>('vips_jxlsave_buffer').asFunction<_VipsJxlsaveBufferDart>();
+  late final _jxlsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsJxlsaveTargetNative>>('vips_jxlsave_target').asFunction<_VipsJxlsaveTargetDart>();
+  late final _magickload = _lib.lookup<ffi.NativeFunction<_VipsMagickloadNative>>('vips_magickload').asFunction<_VipsMagickloadDart>();
+  late final _magickloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsMagickloadBufferNative>>('vips_magickload_buffer').asFunction<_VipsMagickloadBufferDart>();
+  late final _magicksave = _lib.lookup<ffi.NativeFunction<_VipsMagicksaveNative>>('vips_magicksave').asFunction<_VipsMagicksaveDart>();
+  late final _magicksaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsMagicksaveBufferNative>>('vips_magicksave_buffer').asFunction<_VipsMagicksaveBufferDart>();
+  late final _matload = _lib.lookup<ffi.NativeFunction<_VipsMatloadNative>>('vips_matload').asFunction<_VipsMatloadDart>();
+  late final _matrixload = _lib.lookup<ffi.NativeFunction<_VipsMatrixloadNative>>('vips_matrixload').asFunction<_VipsMatrixloadDart>();
+  late final _matrixloadSource = _lib.lookup<ffi.NativeFunction<_VipsMatrixloadSourceNative>>('vips_matrixload_source').asFunction<_VipsMatrixloadSourceDart>();
+  late final _matrixsave = _lib.lookup<ffi.NativeFunction<_VipsMatrixsaveNative>>('vips_matrixsave').asFunction<_VipsMatrixsaveDart>();
+  late final _matrixsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsMatrixsaveTargetNative>>('vips_matrixsave_target').asFunction<_VipsMatrixsaveTargetDart>();
+  late final _niftiload = _lib.lookup<ffi.NativeFunction<_VipsNiftiloadNative>>('vips_niftiload').asFunction<_VipsNiftiloadDart>();
+  late final _niftiloadSource = _lib.lookup<ffi.NativeFunction<_VipsNiftiloadSourceNative>>('vips_niftiload_source').asFunction<_VipsNiftiloadSourceDart>();
+  late final _niftisave = _lib.lookup<ffi.NativeFunction<_VipsNiftisaveNative>>('vips_niftisave').asFunction<_VipsNiftisaveDart>();
+  late final _openexrload = _lib.lookup<ffi.NativeFunction<_VipsOpenexrloadNative>>('vips_openexrload').asFunction<_VipsOpenexrloadDart>();
+  late final _openslideload = _lib.lookup<ffi.NativeFunction<_VipsOpenslideloadNative>>('vips_openslideload').asFunction<_VipsOpenslideloadDart>();
+  late final _openslideloadSource = _lib.lookup<ffi.NativeFunction<_VipsOpenslideloadSourceNative>>('vips_openslideload_source').asFunction<_VipsOpenslideloadSourceDart>();
+  late final _pdfload = _lib.lookup<ffi.NativeFunction<_VipsPdfloadNative>>('vips_pdfload').asFunction<_VipsPdfloadDart>();
+  late final _pdfloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsPdfloadBufferNative>>('vips_pdfload_buffer').asFunction<_VipsPdfloadBufferDart>();
+  late final _pdfloadSource = _lib.lookup<ffi.NativeFunction<_VipsPdfloadSourceNative>>('vips_pdfload_source').asFunction<_VipsPdfloadSourceDart>();
+  late final _pngload = _lib.lookup<ffi.NativeFunction<_VipsPngloadNative>>('vips_pngload').asFunction<_VipsPngloadDart>();
+  late final _pngloadOptions = _lib.lookup<ffi.NativeFunction<_VipsPngloadOptionsNative>>('vips_pngload').asFunction<_VipsPngloadOptionsDart>();
+  late final _pngloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsPngloadBufferNative>>('vips_pngload_buffer').asFunction<_VipsPngloadBufferDart>();
+  late final _pngloadBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsPngloadBufferOptionsNative>>('vips_pngload_buffer').asFunction<_VipsPngloadBufferOptionsDart>();
+  late final _pngloadSource = _lib.lookup<ffi.NativeFunction<_VipsPngloadSourceNative>>('vips_pngload_source').asFunction<_VipsPngloadSourceDart>();
+  late final _pngloadSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsPngloadSourceOptionsNative>>('vips_pngload_source').asFunction<_VipsPngloadSourceOptionsDart>();
+  late final _pngsave = _lib.lookup<ffi.NativeFunction<_VipsPngsaveNative>>('vips_pngsave').asFunction<_VipsPngsaveDart>();
+  late final _pngsaveOptions = _lib.lookup<ffi.NativeFunction<_VipsPngsaveOptionsNative>>('vips_pngsave').asFunction<_VipsPngsaveOptionsDart>();
+  late final _pngsaveOptionsD = _lib.lookup<ffi.NativeFunction<_VipsPngsaveOptionsDNative>>('vips_pngsave').asFunction<_VipsPngsaveOptionsDDart>();
+  late final _pngsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsPngsaveBufferNative>>('vips_pngsave_buffer').asFunction<_VipsPngsaveBufferDart>();
+  late final _pngsaveBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsPngsaveBufferOptionsNative>>('vips_pngsave_buffer').asFunction<_VipsPngsaveBufferOptionsDart>();
+  late final _pngsaveBufferOptionsD = _lib.lookup<ffi.NativeFunction<_VipsPngsaveBufferOptionsDNative>>('vips_pngsave_buffer').asFunction<_VipsPngsaveBufferOptionsDDart>();
+  late final _pngsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsPngsaveTargetNative>>('vips_pngsave_target').asFunction<_VipsPngsaveTargetDart>();
+  late final _pngsaveTargetOptions = _lib.lookup<ffi.NativeFunction<_VipsPngsaveTargetOptionsNative>>('vips_pngsave_target').asFunction<_VipsPngsaveTargetOptionsDart>();
+  late final _pngsaveTargetOptionsD = _lib.lookup<ffi.NativeFunction<_VipsPngsaveTargetOptionsDNative>>('vips_pngsave_target').asFunction<_VipsPngsaveTargetOptionsDDart>();
+  late final _ppmload = _lib.lookup<ffi.NativeFunction<_VipsPpmloadNative>>('vips_ppmload').asFunction<_VipsPpmloadDart>();
+  late final _ppmloadSource = _lib.lookup<ffi.NativeFunction<_VipsPpmloadSourceNative>>('vips_ppmload_source').asFunction<_VipsPpmloadSourceDart>();
+  late final _ppmsave = _lib.lookup<ffi.NativeFunction<_VipsPpmsaveNative>>('vips_ppmsave').asFunction<_VipsPpmsaveDart>();
+  late final _ppmsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsPpmsaveTargetNative>>('vips_ppmsave_target').asFunction<_VipsPpmsaveTargetDart>();
+  late final _profileLoad = _lib.lookup<ffi.NativeFunction<_VipsProfileLoadNative>>('vips_profile_load').asFunction<_VipsProfileLoadDart>();
+  late final _radload = _lib.lookup<ffi.NativeFunction<_VipsRadloadNative>>('vips_radload').asFunction<_VipsRadloadDart>();
+  late final _radloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsRadloadBufferNative>>('vips_radload_buffer').asFunction<_VipsRadloadBufferDart>();
+  late final _radloadSource = _lib.lookup<ffi.NativeFunction<_VipsRadloadSourceNative>>('vips_radload_source').asFunction<_VipsRadloadSourceDart>();
+  late final _radsave = _lib.lookup<ffi.NativeFunction<_VipsRadsaveNative>>('vips_radsave').asFunction<_VipsRadsaveDart>();
+  late final _radsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsRadsaveBufferNative>>('vips_radsave_buffer').asFunction<_VipsRadsaveBufferDart>();
+  late final _radsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsRadsaveTargetNative>>('vips_radsave_target').asFunction<_VipsRadsaveTargetDart>();
+  late final _rawload = _lib.lookup<ffi.NativeFunction<_VipsRawloadNative>>('vips_rawload').asFunction<_VipsRawloadDart>();
+  late final _rawsave = _lib.lookup<ffi.NativeFunction<_VipsRawsaveNative>>('vips_rawsave').asFunction<_VipsRawsaveDart>();
+  late final _rawsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsRawsaveBufferNative>>('vips_rawsave_buffer').asFunction<_VipsRawsaveBufferDart>();
+  late final _rawsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsRawsaveTargetNative>>('vips_rawsave_target').asFunction<_VipsRawsaveTargetDart>();
+  late final _svgload = _lib.lookup<ffi.NativeFunction<_VipsSvgloadNative>>('vips_svgload').asFunction<_VipsSvgloadDart>();
+  late final _svgloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsSvgloadBufferNative>>('vips_svgload_buffer').asFunction<_VipsSvgloadBufferDart>();
+  late final _svgloadSource = _lib.lookup<ffi.NativeFunction<_VipsSvgloadSourceNative>>('vips_svgload_source').asFunction<_VipsSvgloadSourceDart>();
+  late final _svgloadString = _lib.lookup<ffi.NativeFunction<_VipsSvgloadStringNative>>('vips_svgload_string').asFunction<_VipsSvgloadStringDart>();
+  late final _tiffload = _lib.lookup<ffi.NativeFunction<_VipsTiffloadNative>>('vips_tiffload').asFunction<_VipsTiffloadDart>();
+  late final _tiffloadOptions = _lib.lookup<ffi.NativeFunction<_VipsTiffloadOptionsNative>>('vips_tiffload').asFunction<_VipsTiffloadOptionsDart>();
+  late final _tiffloadBuffer = _lib.lookup<ffi.NativeFunction<_VipsTiffloadBufferNative>>('vips_tiffload_buffer').asFunction<_VipsTiffloadBufferDart>();
+  late final _tiffloadBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsTiffloadBufferOptionsNative>>('vips_tiffload_buffer').asFunction<_VipsTiffloadBufferOptionsDart>();
+  late final _tiffloadSource = _lib.lookup<ffi.NativeFunction<_VipsTiffloadSourceNative>>('vips_tiffload_source').asFunction<_VipsTiffloadSourceDart>();
+  late final _tiffloadSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsTiffloadSourceOptionsNative>>('vips_tiffload_source').asFunction<_VipsTiffloadSourceOptionsDart>();
+  late final _tiffsave = _lib.lookup<ffi.NativeFunction<_VipsTiffsaveNative>>('vips_tiffsave').asFunction<_VipsTiffsaveDart>();
+  late final _tiffsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsTiffsaveBufferNative>>('vips_tiffsave_buffer').asFunction<_VipsTiffsaveBufferDart>();
+  late final _tiffsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsTiffsaveTargetNative>>('vips_tiffsave_target').asFunction<_VipsTiffsaveTargetDart>();
+  late final _vipsload = _lib.lookup<ffi.NativeFunction<_VipsVipsloadNative>>('vips_vipsload').asFunction<_VipsVipsloadDart>();
+  late final _vipsloadSource = _lib.lookup<ffi.NativeFunction<_VipsVipsloadSourceNative>>('vips_vipsload_source').asFunction<_VipsVipsloadSourceDart>();
+  late final _vipssave = _lib.lookup<ffi.NativeFunction<_VipsVipssaveNative>>('vips_vipssave').asFunction<_VipsVipssaveDart>();
+  late final _vipssaveTarget = _lib.lookup<ffi.NativeFunction<_VipsVipssaveTargetNative>>('vips_vipssave_target').asFunction<_VipsVipssaveTargetDart>();
+  late final _webpload = _lib.lookup<ffi.NativeFunction<_VipsWebploadNative>>('vips_webpload').asFunction<_VipsWebploadDart>();
+  late final _webploadOptions = _lib.lookup<ffi.NativeFunction<_VipsWebploadOptionsNative>>('vips_webpload').asFunction<_VipsWebploadOptionsDart>();
+  late final _webploadOptionsD = _lib.lookup<ffi.NativeFunction<_VipsWebploadOptionsDNative>>('vips_webpload').asFunction<_VipsWebploadOptionsDDart>();
+  late final _webploadBuffer = _lib.lookup<ffi.NativeFunction<_VipsWebploadBufferNative>>('vips_webpload_buffer').asFunction<_VipsWebploadBufferDart>();
+  late final _webploadBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsWebploadBufferOptionsNative>>('vips_webpload_buffer').asFunction<_VipsWebploadBufferOptionsDart>();
+  late final _webploadBufferOptionsD = _lib.lookup<ffi.NativeFunction<_VipsWebploadBufferOptionsDNative>>('vips_webpload_buffer').asFunction<_VipsWebploadBufferOptionsDDart>();
+  late final _webploadSource = _lib.lookup<ffi.NativeFunction<_VipsWebploadSourceNative>>('vips_webpload_source').asFunction<_VipsWebploadSourceDart>();
+  late final _webploadSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsWebploadSourceOptionsNative>>('vips_webpload_source').asFunction<_VipsWebploadSourceOptionsDart>();
+  late final _webploadSourceOptionsD = _lib.lookup<ffi.NativeFunction<_VipsWebploadSourceOptionsDNative>>('vips_webpload_source').asFunction<_VipsWebploadSourceOptionsDDart>();
+  late final _webpsave = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveNative>>('vips_webpsave').asFunction<_VipsWebpsaveDart>();
+  late final _webpsaveOptions = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveOptionsNative>>('vips_webpsave').asFunction<_VipsWebpsaveOptionsDart>();
+  late final _webpsaveBuffer = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveBufferNative>>('vips_webpsave_buffer').asFunction<_VipsWebpsaveBufferDart>();
+  late final _webpsaveBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveBufferOptionsNative>>('vips_webpsave_buffer').asFunction<_VipsWebpsaveBufferOptionsDart>();
+  late final _webpsaveMime = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveMimeNative>>('vips_webpsave_mime').asFunction<_VipsWebpsaveMimeDart>();
+  late final _webpsaveTarget = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveTargetNative>>('vips_webpsave_target').asFunction<_VipsWebpsaveTargetDart>();
+  late final _webpsaveTargetOptions = _lib.lookup<ffi.NativeFunction<_VipsWebpsaveTargetOptionsNative>>('vips_webpsave_target').asFunction<_VipsWebpsaveTargetOptionsDart>();
+
+  int analyzeload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _analyzeload(filename, out, ffi.nullptr);
+  int csvload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _csvload(filename, out, ffi.nullptr);
+  int csvloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _csvloadSource(source, out, ffi.nullptr);
+  int csvsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _csvsave(in$, filename, ffi.nullptr);
+  int csvsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _csvsaveTarget(in$, target, ffi.nullptr);
+  int dzsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> name) => _dzsave(in$, name, ffi.nullptr);
+  int dzsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _dzsaveBuffer(in$, buf, len, ffi.nullptr);
+  int dzsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _dzsaveTarget(in$, target, ffi.nullptr);
+  int fitsload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _fitsload(filename, out, ffi.nullptr);
+  int fitssave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _fitssave(in$, filename, ffi.nullptr);
+  int gifload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsGifloadOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _gifload(filename, out, ffi.nullptr);
+    return _gifloadOptions(filename, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), ffi.nullptr);
+  }
+  int gifloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsGifloadBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _gifloadBuffer(buf, len, out, ffi.nullptr);
+    return _gifloadBufferOptions(buf, len, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), ffi.nullptr);
+  }
+  int gifloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsGifloadSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _gifloadSource(source, out, ffi.nullptr);
+    return _gifloadSourceOptions(source, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), ffi.nullptr);
+  }
+  int gifsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _gifsave(in$, filename, ffi.nullptr);
+  int gifsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _gifsaveBuffer(in$, buf, len, ffi.nullptr);
+  int gifsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _gifsaveTarget(in$, target, ffi.nullptr);
+  int heifload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsHeifloadOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _heifload(filename, out, ffi.nullptr);
+    return _heifloadOptions(filename, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), ffi.nullptr);
+  }
+  int heifloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsHeifloadBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _heifloadBuffer(buf, len, out, ffi.nullptr);
+    return _heifloadBufferOptions(buf, len, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), ffi.nullptr);
+  }
+  int heifloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsHeifloadSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _heifloadSource(source, out, ffi.nullptr);
+    return _heifloadSourceOptions(source, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), ffi.nullptr);
+  }
+  int heifsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _heifsave(in$, filename, ffi.nullptr);
+  int heifsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _heifsaveBuffer(in$, buf, len, ffi.nullptr);
+  int heifsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _heifsaveTarget(in$, target, ffi.nullptr);
+  ffi.Pointer<VipsImage> imageNewFromBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Char> option_string, [VipsImageNewFromBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _imageNewFromBuffer(buf, len, option_string, ffi.nullptr);
+    return _imageNewFromBufferOptions(buf, len, option_string, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), ffi.nullptr);
+  }
+  ffi.Pointer<VipsImage> imageNewFromFile(ffi.Pointer<ffi.Char> name, [VipsImageNewFromFileOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _imageNewFromFile(name, ffi.nullptr);
+    return _imageNewFromFileOptions(name, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), ffi.nullptr);
+  }
+  ffi.Pointer<VipsImage> imageNewFromSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Char> option_string, [VipsImageNewFromSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _imageNewFromSource(source, option_string, ffi.nullptr);
+    return _imageNewFromSourceOptions(source, option_string, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), ffi.nullptr);
+  }
+  int imageWriteToBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> suffix, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> size) => _imageWriteToBuffer(in$, suffix, buf, size, ffi.nullptr);
+  int imageWriteToFile(ffi.Pointer<VipsImage> image, ffi.Pointer<ffi.Char> name) => _imageWriteToFile(image, name, ffi.nullptr);
+  int imageWriteToTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> suffix, ffi.Pointer<VipsTarget> target) => _imageWriteToTarget(in$, suffix, target, ffi.nullptr);
+  int jp2kload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _jp2kload(filename, out, ffi.nullptr);
+  int jp2kloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _jp2kloadBuffer(buf, len, out, ffi.nullptr);
+  int jp2kloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _jp2kloadSource(source, out, ffi.nullptr);
+  int jp2ksave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _jp2ksave(in$, filename, ffi.nullptr);
+  int jp2ksaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _jp2ksaveBuffer(in$, buf, len, ffi.nullptr);
+  int jp2ksaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _jp2ksaveTarget(in$, target, ffi.nullptr);
+  int jpegload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsJpegloadOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _jpegload(filename, out, ffi.nullptr);
+    return _jpegloadOptions(filename, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), ffi.nullptr);
+  }
+  int jpegloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsJpegloadBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _jpegloadBuffer(buf, len, out, ffi.nullptr);
+    return _jpegloadBufferOptions(buf, len, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), ffi.nullptr);
+  }
+  int jpegloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsJpegloadSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _jpegloadSource(source, out, ffi.nullptr);
+    return _jpegloadSourceOptions(source, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), ffi.nullptr);
+  }
+  int jpegsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename, [VipsJpegsaveOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _jpegsave(in$, filename, ffi.nullptr);
+    return _jpegsaveOptions(in$, filename, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.intKey(11), slots.intValue(11), slots.intKey(12), slots.intValue(12), ffi.nullptr);
+  }
+  int jpegsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len, [VipsJpegsaveBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _jpegsaveBuffer(in$, buf, len, ffi.nullptr);
+    return _jpegsaveBufferOptions(in$, buf, len, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.intKey(11), slots.intValue(11), slots.intKey(12), slots.intValue(12), ffi.nullptr);
+  }
+  int jpegsaveMime(ffi.Pointer<VipsImage> in$) => _jpegsaveMime(in$, ffi.nullptr);
+  int jpegsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target, [VipsJpegsaveTargetOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _jpegsaveTarget(in$, target, ffi.nullptr);
+    return _jpegsaveTargetOptions(in$, target, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.intKey(11), slots.intValue(11), slots.intKey(12), slots.intValue(12), ffi.nullptr);
+  }
+  int jxlload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _jxlload(filename, out, ffi.nullptr);
+  int jxlloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _jxlloadBuffer(buf, len, out, ffi.nullptr);
+  int jxlloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _jxlloadSource(source, out, ffi.nullptr);
+  int jxlsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _jxlsave(in$, filename, ffi.nullptr);
+  int jxlsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _jxlsaveBuffer(in$, buf, len, ffi.nullptr);
+  int jxlsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _jxlsaveTarget(in$, target, ffi.nullptr);
+  int magickload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _magickload(filename, out, ffi.nullptr);
+  int magickloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _magickloadBuffer(buf, len, out, ffi.nullptr);
+  int magicksave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _magicksave(in$, filename, ffi.nullptr);
+  int magicksaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _magicksaveBuffer(in$, buf, len, ffi.nullptr);
+  int matload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _matload(filename, out, ffi.nullptr);
+  int matrixload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _matrixload(filename, out, ffi.nullptr);
+  int matrixloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _matrixloadSource(source, out, ffi.nullptr);
+  int matrixsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _matrixsave(in$, filename, ffi.nullptr);
+  int matrixsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _matrixsaveTarget(in$, target, ffi.nullptr);
+  int niftiload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _niftiload(filename, out, ffi.nullptr);
+  int niftiloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _niftiloadSource(source, out, ffi.nullptr);
+  int niftisave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _niftisave(in$, filename, ffi.nullptr);
+  int openexrload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _openexrload(filename, out, ffi.nullptr);
+  int openslideload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _openslideload(filename, out, ffi.nullptr);
+  int openslideloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _openslideloadSource(source, out, ffi.nullptr);
+  int pdfload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _pdfload(filename, out, ffi.nullptr);
+  int pdfloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _pdfloadBuffer(buf, len, out, ffi.nullptr);
+  int pdfloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _pdfloadSource(source, out, ffi.nullptr);
+  int pngload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsPngloadOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _pngload(filename, out, ffi.nullptr);
+    return _pngloadOptions(filename, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), ffi.nullptr);
+  }
+  int pngloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsPngloadBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _pngloadBuffer(buf, len, out, ffi.nullptr);
+    return _pngloadBufferOptions(buf, len, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), ffi.nullptr);
+  }
+  int pngloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsPngloadSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _pngloadSource(source, out, ffi.nullptr);
+    return _pngloadSourceOptions(source, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), ffi.nullptr);
+  }
+  int pngsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename, [VipsPngsaveOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _pngsave(in$, filename, ffi.nullptr);
+    if (slots.doublesFirst) return _pngsaveOptionsD(in$, filename, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), ffi.nullptr);
+    return _pngsaveOptions(in$, filename, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int pngsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len, [VipsPngsaveBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _pngsaveBuffer(in$, buf, len, ffi.nullptr);
+    if (slots.doublesFirst) return _pngsaveBufferOptionsD(in$, buf, len, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), ffi.nullptr);
+    return _pngsaveBufferOptions(in$, buf, len, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int pngsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target, [VipsPngsaveTargetOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _pngsaveTarget(in$, target, ffi.nullptr);
+    if (slots.doublesFirst) return _pngsaveTargetOptionsD(in$, target, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), ffi.nullptr);
+    return _pngsaveTargetOptions(in$, target, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int ppmload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _ppmload(filename, out, ffi.nullptr);
+  int ppmloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _ppmloadSource(source, out, ffi.nullptr);
+  int ppmsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _ppmsave(in$, filename, ffi.nullptr);
+  int ppmsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _ppmsaveTarget(in$, target, ffi.nullptr);
+  int profileLoad(ffi.Pointer<ffi.Char> name, ffi.Pointer<ffi.Pointer<VipsBlob>> profile) => _profileLoad(name, profile, ffi.nullptr);
+  int radload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _radload(filename, out, ffi.nullptr);
+  int radloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _radloadBuffer(buf, len, out, ffi.nullptr);
+  int radloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _radloadSource(source, out, ffi.nullptr);
+  int radsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _radsave(in$, filename, ffi.nullptr);
+  int radsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _radsaveBuffer(in$, buf, len, ffi.nullptr);
+  int radsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _radsaveTarget(in$, target, ffi.nullptr);
+  int rawload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, int bands) => _rawload(filename, out, width, height, bands, ffi.nullptr);
+  int rawsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _rawsave(in$, filename, ffi.nullptr);
+  int rawsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _rawsaveBuffer(in$, buf, len, ffi.nullptr);
+  int rawsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _rawsaveTarget(in$, target, ffi.nullptr);
+  int svgload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _svgload(filename, out, ffi.nullptr);
+  int svgloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _svgloadBuffer(buf, len, out, ffi.nullptr);
+  int svgloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _svgloadSource(source, out, ffi.nullptr);
+  int svgloadString(ffi.Pointer<ffi.Char> str, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _svgloadString(str, out, ffi.nullptr);
+  int tiffload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsTiffloadOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _tiffload(filename, out, ffi.nullptr);
+    return _tiffloadOptions(filename, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), ffi.nullptr);
+  }
+  int tiffloadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsTiffloadBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _tiffloadBuffer(buf, len, out, ffi.nullptr);
+    return _tiffloadBufferOptions(buf, len, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), ffi.nullptr);
+  }
+  int tiffloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsTiffloadSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _tiffloadSource(source, out, ffi.nullptr);
+    return _tiffloadSourceOptions(source, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), ffi.nullptr);
+  }
+  int tiffsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _tiffsave(in$, filename, ffi.nullptr);
+  int tiffsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len) => _tiffsaveBuffer(in$, buf, len, ffi.nullptr);
+  int tiffsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _tiffsaveTarget(in$, target, ffi.nullptr);
+  int vipsload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _vipsload(filename, out, ffi.nullptr);
+  int vipsloadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _vipsloadSource(source, out, ffi.nullptr);
+  int vipssave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename) => _vipssave(in$, filename, ffi.nullptr);
+  int vipssaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target) => _vipssaveTarget(in$, target, ffi.nullptr);
+  int webpload(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsWebploadOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _webpload(filename, out, ffi.nullptr);
+    if (slots.doublesFirst) return _webploadOptionsD(filename, out, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), ffi.nullptr);
+    return _webploadOptions(filename, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int webploadBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsWebploadBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _webploadBuffer(buf, len, out, ffi.nullptr);
+    if (slots.doublesFirst) return _webploadBufferOptionsD(buf, len, out, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), ffi.nullptr);
+    return _webploadBufferOptions(buf, len, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int webploadSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, [VipsWebploadSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _webploadSource(source, out, ffi.nullptr);
+    if (slots.doublesFirst) return _webploadSourceOptionsD(source, out, slots.doubleKey(0), slots.doubleValue(0), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), ffi.nullptr);
+    return _webploadSourceOptions(source, out, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.doubleKey(0), slots.doubleValue(0), ffi.nullptr);
+  }
+  int webpsave(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Char> filename, [VipsWebpsaveOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _webpsave(in$, filename, ffi.nullptr);
+    return _webpsaveOptions(in$, filename, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.intKey(11), slots.intValue(11), slots.intKey(12), slots.intValue(12), slots.intKey(13), slots.intValue(13), slots.intKey(14), slots.intValue(14), ffi.nullptr);
+  }
+  int webpsaveBuffer(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Void>> buf, ffi.Pointer<ffi.Size> len, [VipsWebpsaveBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _webpsaveBuffer(in$, buf, len, ffi.nullptr);
+    return _webpsaveBufferOptions(in$, buf, len, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.intKey(11), slots.intValue(11), slots.intKey(12), slots.intValue(12), slots.intKey(13), slots.intValue(13), slots.intKey(14), slots.intValue(14), ffi.nullptr);
+  }
+  int webpsaveMime(ffi.Pointer<VipsImage> in$) => _webpsaveMime(in$, ffi.nullptr);
+  int webpsaveTarget(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsTarget> target, [VipsWebpsaveTargetOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _webpsaveTarget(in$, target, ffi.nullptr);
+    return _webpsaveTargetOptions(in$, target, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), slots.intKey(10), slots.intValue(10), slots.intKey(11), slots.intValue(11), slots.intKey(12), slots.intValue(12), slots.intKey(13), slots.intValue(13), slots.intKey(14), slots.intValue(14), ffi.nullptr);
+  }
+}
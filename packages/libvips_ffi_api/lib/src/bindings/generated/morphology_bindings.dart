@@ -0,0 +1,123 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsBandrankNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandrankDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCountlinesNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> nolines,
+  ffi.UnsignedInt direction,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCountlinesDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Double> nolines,
+  int direction,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFillNearestNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFillNearestDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLabelregionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> mask,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLabelregionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> mask,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMedianNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int size,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMedianDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int size,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMorphNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  ffi.UnsignedInt morph,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMorphDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> mask,
+  int morph,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRankNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.Int height,
+  ffi.Int index,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRankDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  int height,
+  int index,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Morphology variadic function bindings.
+class VipsGeneratedMorphologyBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedMorphologyBindings(this._lib);
+
+  late final _bandrank = _lib.lookup<ffi.NativeFunction<_VipsBandrankNative>>('vips_bandrank').asFunction<_VipsBandrankDart>();
+  late final _countlines = _lib.lookup<ffi.NativeFunction<_VipsCountlinesNative>>('vips_countlines').asFunction<_VipsCountlinesDart>();
+  late final _fillNearest = _lib.lookup<ffi.NativeFunction<_VipsFillNearestNative>>('vips_fill_nearest').asFunction<_VipsFillNearestDart>();
+  late final _labelregions = _lib.lookup<ffi.NativeFunction<_VipsLabelregionsNative>>('vips_labelregions').asFunction<_VipsLabelregionsDart>();
+  late final _median = _lib.lookup<ffi.NativeFunction<_VipsMedianNative>>('vips_median').asFunction<_VipsMedianDart>();
+  late final _morph = _lib.lookup<ffi.NativeFunction<_VipsMorphNative>>('vips_morph').asFunction<_VipsMorphDart>();
+  late final _rank = _lib.lookup<ffi.NativeFunction<_VipsRankNative>>('vips_rank').asFunction<_VipsRankDart>();
+
+  int bandrank(ffi.Pointer<ffi.Pointer<VipsImage>> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n) => _bandrank(in$, out, n, ffi.nullptr);
+  int countlines(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Double> nolines, int direction) => _countlines(in$, nolines, direction, ffi.nullptr);
+  int fillNearest(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _fillNearest(in$, out, ffi.nullptr);
+  int labelregions(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> mask) => _labelregions(in$, mask, ffi.nullptr);
+  int median(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int size) => _median(in$, out, size, ffi.nullptr);
+  int morph(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> mask, int morph) => _morph(in$, out, mask, morph, ffi.nullptr);
+  int rank(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, int height, int index) => _rank(in$, out, width, height, index, ffi.nullptr);
+}
@@ -0,0 +1,521 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsAllocateInputArrayNative = ffi.Pointer<ffi.Pointer<VipsImage>> Function(
+  ffi.Pointer<VipsImage> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAllocateInputArrayDart = ffi.Pointer<ffi.Pointer<VipsImage>> Function(
+  ffi.Pointer<VipsImage> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCaseNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> index,
+  ffi.Pointer<ffi.Pointer<VipsImage>> cases,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCaseDart = int Function(
+  ffi.Pointer<VipsImage> index,
+  ffi.Pointer<ffi.Pointer<VipsImage>> cases,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsClampNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsClampDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsComplexNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt cmplx,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsComplexDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int cmplx,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsComplex2Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt cmplx,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsComplex2Dart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int cmplx,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsComplexgetNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt get$,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsComplexgetDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int get$,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsConjNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsConjDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsCrossPhaseNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsCrossPhaseDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDE00Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDE00Dart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsDE76Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsDE76Dart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFindTrimNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Int> left,
+  ffi.Pointer<ffi.Int> top,
+  ffi.Pointer<ffi.Int> width,
+  ffi.Pointer<ffi.Int> height,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFindTrimDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Int> left,
+  ffi.Pointer<ffi.Int> top,
+  ffi.Pointer<ffi.Int> width,
+  ffi.Pointer<ffi.Int> height,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFloat2radNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFloat2radDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsGetpointNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Double>> vector,
+  ffi.Pointer<ffi.Int> n,
+  ffi.Int x,
+  ffi.Int y,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsGetpointDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<ffi.Double>> vector,
+  ffi.Pointer<ffi.Int> n,
+  int x,
+  int y,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHoughCircleNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHoughCircleDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsHoughLineNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsHoughLineDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImagNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImagDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsImagePipelinevNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> image,
+  ffi.Int hint,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsImagePipelinevDart = int Function(
+  ffi.Pointer<VipsImage> image,
+  int hint,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLinearNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> a,
+  ffi.Pointer<ffi.Double> b,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLinearDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> a,
+  ffi.Pointer<ffi.Double> b,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLinearOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> a,
+  ffi.Pointer<ffi.Double> b,
+  ffi.Int n,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsLinearOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> a,
+  ffi.Pointer<ffi.Double> b,
+  int n,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLinear1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double a,
+  ffi.Double b,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLinear1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double a,
+  double b,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMaplutNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> lut,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMaplutDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> lut,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsPolarNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsPolarDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRad2floatNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRad2floatDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRealNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRealDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRemainderNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRemainderDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRemainderConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRemainderConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRemainderConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRemainderConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSumNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSumDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSystemNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> cmd_format,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSystemDart = int Function(
+  ffi.Pointer<ffi.Char> cmd_format,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWopNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWopDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWopConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWopConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsWopConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsWopConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_linear`.
+class VipsLinearOptions {
+  static final _ucharKey = vipsOptionKey('uchar');
+
+  final bool? uchar;
+
+  const VipsLinearOptions({
+    this.uchar,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (uchar != null) slots.addInt(_ucharKey, uchar! ? 1 : 0);
+    return slots;
+  }
+}
+
+/// Other variadic function bindings.
+class VipsGeneratedOtherBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedOtherBindings(this._lib);
+
+  late final _allocateInputArray = _lib.lookup<ffi.NativeFunction<_VipsAllocateInputArrayNative>>('vips_allocate_input_array').asFunction<_VipsAllocateInputArrayDart>();
+  late final _case$ = _lib.lookup<ffi.NativeFunction<_VipsCaseNative>>('vips_case').asFunction<_VipsCaseDart>();
+  late final _clamp = _lib.lookup<ffi.NativeFunction<_VipsClampNative>>('vips_clamp').asFunction<_VipsClampDart>();
+  late final _complex = _lib.lookup<ffi.NativeFunction<_VipsComplexNative>>('vips_complex').asFunction<_VipsComplexDart>();
+  late final _complex2 = _lib.lookup<ffi.NativeFunction<_VipsComplex2Native>>('vips_complex2').asFunction<_VipsComplex2Dart>();
+  late final _complexget = _lib.lookup<ffi.NativeFunction<_VipsComplexgetNative>>('vips_complexget').asFunction<_VipsComplexgetDart>();
+  late final _conj = _lib.lookup<ffi.NativeFunction<_VipsConjNative>>('vips_conj').asFunction<_VipsConjDart>();
+  late final _crossPhase = _lib.lookup<ffi.NativeFunction<_VipsCrossPhaseNative>>('vips_cross_phase').asFunction<_VipsCrossPhaseDart>();
+  late final _dE00 = _lib.lookup<ffi.NativeFunction<_VipsDE00Native>>('vips_dE00').asFunction<_VipsDE00Dart>();
+  late final _dE76 = _lib.lookup<ffi.NativeFunction<_VipsDE76Native>>('vips_dE76').asFunction<_VipsDE76Dart>();
+  late final _findTrim = _lib.lookup<ffi.NativeFunction<_VipsFindTrimNative>>('vips_find_trim').asFunction<_VipsFindTrimDart>();
+  late final _float2rad = _lib.lookup<ffi.NativeFunction<_VipsFloat2radNative>>('vips_float2rad').asFunction<_VipsFloat2radDart>();
+  late final _getpoint = _lib.lookup<ffi.NativeFunction<_VipsGetpointNative>>('vips_getpoint').asFunction<_VipsGetpointDart>();
+  late final _houghCircle = _lib.lookup<ffi.NativeFunction<_VipsHoughCircleNative>>('vips_hough_circle').asFunction<_VipsHoughCircleDart>();
+  late final _houghLine = _lib.lookup<ffi.NativeFunction<_VipsHoughLineNative>>('vips_hough_line').asFunction<_VipsHoughLineDart>();
+  late final _imag = _lib.lookup<ffi.NativeFunction<_VipsImagNative>>('vips_imag').asFunction<_VipsImagDart>();
+  late final _imagePipelinev = _lib.lookup<ffi.NativeFunction<_VipsImagePipelinevNative>>('vips_image_pipelinev').asFunction<_VipsImagePipelinevDart>();
+  late final _linear = _lib.lookup<ffi.NativeFunction<_VipsLinearNative>>('vips_linear').asFunction<_VipsLinearDart>();
+  late final _linearOptions = _lib.lookup<ffi.NativeFunction<_VipsLinearOptionsNative>>('vips_linear').asFunction<_VipsLinearOptionsDart>();
+  late final _linear1 = _lib.lookup<ffi.NativeFunction<_VipsLinear1Native>>('vips_linear1').asFunction<_VipsLinear1Dart>();
+  late final _maplut = _lib.lookup<ffi.NativeFunction<_VipsMaplutNative>>('vips_maplut').asFunction<_VipsMaplutDart>();
+  late final _polar = _lib.lookup<ffi.NativeFunction<_VipsPolarNative>>('vips_polar').asFunction<_VipsPolarDart>();
+  late final _rad2float = _lib.lookup<ffi.NativeFunction<_VipsRad2floatNative>>('vips_rad2float').asFunction<_VipsRad2floatDart>();
+  late final _real = _lib.lookup<ffi.NativeFunction<_VipsRealNative>>('vips_real').asFunction<_VipsRealDart>();
+  late final _remainder = _lib.lookup<ffi.NativeFunction<_VipsRemainderNative>>('vips_remainder').asFunction<_VipsRemainderDart>();
+  late final _remainderConst = _lib.lookup<ffi.NativeFunction<_VipsRemainderConstNative>>('vips_remainder_const').asFunction<_VipsRemainderConstDart>();
+  late final _remainderConst1 = _lib.lookup<ffi.NativeFunction<_VipsRemainderConst1Native>>('vips_remainder_const1').asFunction<_VipsRemainderConst1Dart>();
+  late final _sum = _lib.lookup<ffi.NativeFunction<_VipsSumNative>>('vips_sum').asFunction<_VipsSumDart>();
+  late final _system = _lib.lookup<ffi.NativeFunction<_VipsSystemNative>>('vips_system').asFunction<_VipsSystemDart>();
+  late final _wop = _lib.lookup<ffi.NativeFunction<_VipsWopNative>>('vips_wop').asFunction<_VipsWopDart>();
+  late final _wopConst = _lib.lookup<ffi.NativeFunction<_VipsWopConstNative>>('vips_wop_const').asFunction<_VipsWopConstDart>();
+  late final _wopConst1 = _lib.lookup<ffi.NativeFunction<_VipsWopConst1Native>>('vips_wop_const1').asFunction<_VipsWopConst1Dart>();
+
+  ffi.Pointer<ffi.Pointer<VipsImage>> allocateInputArray(ffi.Pointer<VipsImage> out) => _allocateInputArray(out, ffi.nullptr);
+  int case$(ffi.Pointer<VipsImage> index, ffi.Pointer<ffi.Pointer<VipsImage>> cases, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n) => _case$(index, cases, out, n, ffi.nullptr);
+  int clamp(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _clamp(in$, out, ffi.nullptr);
+  int complex(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int cmplx) => _complex(in$, out, cmplx, ffi.nullptr);
+  int complex2(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out, int cmplx) => _complex2(left, right, out, cmplx, ffi.nullptr);
+  int complexget(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int get$) => _complexget(in$, out, get$, ffi.nullptr);
+  int conj(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _conj(in$, out, ffi.nullptr);
+  int crossPhase(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _crossPhase(left, right, out, ffi.nullptr);
+  int dE00(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _dE00(left, right, out, ffi.nullptr);
+  int dE76(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _dE76(left, right, out, ffi.nullptr);
+  int findTrim(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Int> left, ffi.Pointer<ffi.Int> top, ffi.Pointer<ffi.Int> width, ffi.Pointer<ffi.Int> height) => _findTrim(in$, left, top, width, height, ffi.nullptr);
+  int float2rad(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _float2rad(in$, out, ffi.nullptr);
+  int getpoint(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<ffi.Double>> vector, ffi.Pointer<ffi.Int> n, int x, int y) => _getpoint(in$, vector, n, x, y, ffi.nullptr);
+  int houghCircle(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _houghCircle(in$, out, ffi.nullptr);
+  int houghLine(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _houghLine(in$, out, ffi.nullptr);
+  int imag(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _imag(in$, out, ffi.nullptr);
+  int imagePipelinev(ffi.Pointer<VipsImage> image, int hint) => _imagePipelinev(image, hint, ffi.nullptr);
+  int linear(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> a, ffi.Pointer<ffi.Double> b, int n, [VipsLinearOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _linear(in$, out, a, b, n, ffi.nullptr);
+    return _linearOptions(in$, out, a, b, n, slots.intKey(0), slots.intValue(0), ffi.nullptr);
+  }
+  int linear1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double a, double b) => _linear1(in$, out, a, b, ffi.nullptr);
+  int maplut(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> lut) => _maplut(in$, out, lut, ffi.nullptr);
+  int polar(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _polar(in$, out, ffi.nullptr);
+  int rad2float(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rad2float(in$, out, ffi.nullptr);
+  int real(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _real(in$, out, ffi.nullptr);
+  int remainder(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _remainder(left, right, out, ffi.nullptr);
+  int remainderConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _remainderConst(in$, out, c, n, ffi.nullptr);
+  int remainderConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _remainderConst1(in$, out, c, ffi.nullptr);
+  int sum(ffi.Pointer<ffi.Pointer<VipsImage>> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n) => _sum(in$, out, n, ffi.nullptr);
+  int system(ffi.Pointer<ffi.Char> cmd_format) => _system(cmd_format, ffi.nullptr);
+  int wop(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _wop(left, right, out, ffi.nullptr);
+  int wopConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _wopConst(in$, out, c, n, ffi.nullptr);
+  int wopConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _wopConst1(in$, out, c, ffi.nullptr);
+}
@@ -0,0 +1,796 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+typedef _VipsAndimageNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAndimageDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAndimageConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAndimageConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAndimageConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAndimageConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandandNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandandDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandboolNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt boolean,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandboolDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int boolean,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandeorNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandeorDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandfoldNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandfoldDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandorNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandorDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBandunfoldNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBandunfoldDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBooleanNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt boolean,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBooleanDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int boolean,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBooleanConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt boolean,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBooleanConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int boolean,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsBooleanConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt boolean,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsBooleanConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int boolean,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsComplexformNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsComplexformDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEorimageNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEorimageDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEorimageConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEorimageConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEorimageConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEorimageConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEqualNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEqualDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEqualConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEqualConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsEqualConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsEqualConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsFastcorNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsFastcorDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsIfthenelseNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> cond,
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsIfthenelseDart = int Function(
+  ffi.Pointer<VipsImage> cond,
+  ffi.Pointer<VipsImage> in1,
+  ffi.Pointer<VipsImage> in2,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLessNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLessDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLessConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLessConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLessConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLessConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLesseqNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLesseqDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLesseqConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLesseqConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLesseqConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLesseqConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLshiftNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLshiftDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLshiftConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLshiftConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsLshiftConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsLshiftConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMoreNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMoreDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMoreConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMoreConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMoreConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMoreConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMoreeqNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMoreeqDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMoreeqConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMoreeqConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMoreeqConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMoreeqConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsNotequalNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsNotequalDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsNotequalConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsNotequalConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsNotequalConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsNotequalConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsOrimageNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsOrimageDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsOrimageConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsOrimageConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsOrimageConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsOrimageConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRelationalNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt relational,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRelationalDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int relational,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRelationalConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt relational,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRelationalConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int relational,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRelationalConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.UnsignedInt relational,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRelationalConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int relational,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRshiftNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRshiftDart = int Function(
+  ffi.Pointer<VipsImage> left,
+  ffi.Pointer<VipsImage> right,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRshiftConstNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRshiftConstDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Double> c,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRshiftConst1Native = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double c,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRshiftConst1Dart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double c,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSpcorNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSpcorDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<VipsImage> ref,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSwitchNative = ffi.Int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> tests,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int n,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSwitchDart = int Function(
+  ffi.Pointer<ffi.Pointer<VipsImage>> tests,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int n,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Relational variadic function bindings.
+class VipsGeneratedRelationalBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedRelationalBindings(this._lib);
+
+  late final _andimage = _lib.lookup<ffi.NativeFunction<_VipsAndimageNative>>('vips_andimage').asFunction<_VipsAndimageDart>();
+  late final _andimageConst = _lib.lookup<ffi.NativeFunction<_VipsAndimageConstNative>>('vips_andimage_const').asFunction<_VipsAndimageConstDart>();
+  late final _andimageConst1 = _lib.lookup<ffi.NativeFunction<_VipsAndimageConst1Native>>('vips_andimage_const1').asFunction<_VipsAndimageConst1Dart>();
+  late final _bandand = _lib.lookup<ffi.NativeFunction<_VipsBandandNative>>('vips_bandand').asFunction<_VipsBandandDart>();
+  late final _bandbool = _lib.lookup<ffi.NativeFunction<_VipsBandboolNative>>('vips_bandbool').asFunction<_VipsBandboolDart>();
+  late final _bandeor = _lib.lookup<ffi.NativeFunction<_VipsBandeorNative>>('vips_bandeor').asFunction<_VipsBandeorDart>();
+  late final _bandfold = _lib.lookup<ffi.NativeFunction<_VipsBandfoldNative>>('vips_bandfold').asFunction<_VipsBandfoldDart>();
+  late final _bandor = _lib.lookup<ffi.NativeFunction<_VipsBandorNative>>('vips_bandor').asFunction<_VipsBandorDart>();
+  late final _bandunfold = _lib.lookup<ffi.NativeFunction<_VipsBandunfoldNative>>('vips_bandunfold').asFunction<_VipsBandunfoldDart>();
+  late final _boolean = _lib.lookup<ffi.NativeFunction<_VipsBooleanNative>>('vips_boolean').asFunction<_VipsBooleanDart>();
+  late final _booleanConst = _lib.lookup<ffi.NativeFunction<_VipsBooleanConstNative>>('vips_boolean_const').asFunction<_VipsBooleanConstDart>();
+  late final _booleanConst1 = _lib.lookup<ffi.NativeFunction<_VipsBooleanConst1Native>>('vips_boolean_const1').asFunction<_VipsBooleanConst1Dart>();
+  late final _complexform = _lib.lookup<ffi.NativeFunction<_VipsComplexformNative>>('vips_complexform').asFunction<_VipsComplexformDart>();
+  late final _eorimage = _lib.lookup<ffi.NativeFunction<_VipsEorimageNative>>('vips_eorimage').asFunction<_VipsEorimageDart>();
+  late final _eorimageConst = _lib.lookup<ffi.NativeFunction<_VipsEorimageConstNative>>('vips_eorimage_const').asFunction<_VipsEorimageConstDart>();
+  late final _eorimageConst1 = _lib.lookup<ffi.NativeFunction<_VipsEorimageConst1Native>>('vips_eorimage_const1').asFunction<_VipsEorimageConst1Dart>();
+  late final _equal = _lib.lookup<ffi.NativeFunction<_VipsEqualNative>>('vips_equal').asFunction<_VipsEqualDart>();
+  late final _equalConst = _lib.lookup<ffi.NativeFunction<_VipsEqualConstNative>>('vips_equal_const').asFunction<_VipsEqualConstDart>();
+  late final _equalConst1 = _lib.lookup<ffi.NativeFunction<_VipsEqualConst1Native>>('vips_equal_const1').asFunction<_VipsEqualConst1Dart>();
+  late final _fastcor = _lib.lookup<ffi.NativeFunction<_VipsFastcorNative>>('vips_fastcor').asFunction<_VipsFastcorDart>();
+  late final _ifthenelse = _lib.lookup<ffi.NativeFunction<_VipsIfthenelseNative>>('vips_ifthenelse').asFunction<_VipsIfthenelseDart>();
+  late final _less = _lib.lookup<ffi.NativeFunction<_VipsLessNative>>('vips_less').asFunction<_VipsLessDart>();
+  late final _lessConst = _lib.lookup<ffi.NativeFunction<_VipsLessConstNative>>('vips_less_const').asFunction<_VipsLessConstDart>();
+  late final _lessConst1 = _lib.lookup<ffi.NativeFunction<_VipsLessConst1Native>>('vips_less_const1').asFunction<_VipsLessConst1Dart>();
+  late final _lesseq = _lib.lookup<ffi.NativeFunction<_VipsLesseqNative>>('vips_lesseq').asFunction<_VipsLesseqDart>();
+  late final _lesseqConst = _lib.lookup<ffi.NativeFunction<_VipsLesseqConstNative>>('vips_lesseq_const').asFunction<_VipsLesseqConstDart>();
+  late final _lesseqConst1 = _lib.lookup<ffi.NativeFunction<_VipsLesseqConst1Native>>('vips_lesseq_const1').asFunction<_VipsLesseqConst1Dart>();
+  late final _lshift = _lib.lookup<ffi.NativeFunction<_VipsLshiftNative>>('vips_lshift').asFunction<_VipsLshiftDart>();
+  late final _lshiftConst = _lib.lookup<ffi.NativeFunction<_VipsLshiftConstNative>>('vips_lshift_const').asFunction<_VipsLshiftConstDart>();
+  late final _lshiftConst1 = _lib.lookup<ffi.NativeFunction<_VipsLshiftConst1Native>>('vips_lshift_const1').asFunction<_VipsLshiftConst1Dart>();
+  late final _more = _lib.lookup<ffi.NativeFunction<_VipsMoreNative>>('vips_more').asFunction<_VipsMoreDart>();
+  late final _moreConst = _lib.lookup<ffi.NativeFunction<_VipsMoreConstNative>>('vips_more_const').asFunction<_VipsMoreConstDart>();
+  late final _moreConst1 = _lib.lookup<ffi.NativeFunction<_VipsMoreConst1Native>>('vips_more_const1').asFunction<_VipsMoreConst1Dart>();
+  late final _moreeq = _lib.lookup<ffi.NativeFunction<_VipsMoreeqNative>>('vips_moreeq').asFunction<_VipsMoreeqDart>();
+  late final _moreeqConst = _lib.lookup<ffi.NativeFunction<_VipsMoreeqConstNative>>('vips_moreeq_const').asFunction<_VipsMoreeqConstDart>();
+  late final _moreeqConst1 = _lib.lookup<ffi.NativeFunction<_VipsMoreeqConst1Native>>('vips_moreeq_const1').asFunction<_VipsMoreeqConst1Dart>();
+  late final _notequal = _lib.lookup<ffi.NativeFunction<_VipsNotequalNative>>('vips_notequal').asFunction<_VipsNotequalDart>();
+  late final _notequalConst = _lib.lookup<ffi.NativeFunction<_VipsNotequalConstNative>>('vips_notequal_const').asFunction<_VipsNotequalConstDart>();
+  late final _notequalConst1 = _lib.lookup<ffi.NativeFunction<_VipsNotequalConst1Native>>('vips_notequal_const1').asFunction<_VipsNotequalConst1Dart>();
+  late final _orimage = _lib.lookup<ffi.NativeFunction<_VipsOrimageNative>>('vips_orimage').asFunction<_VipsOrimageDart>();
+  late final _orimageConst = _lib.lookup<ffi.NativeFunction<_VipsOrimageConstNative>>('vips_orimage_const').asFunction<_VipsOrimageConstDart>();
+  late final _orimageConst1 = _lib.lookup<ffi.NativeFunction<_VipsOrimageConst1Native>>('vips_orimage_const1').asFunction<_VipsOrimageConst1Dart>();
+  late final _relational = _lib.lookup<ffi.NativeFunction<_VipsRelationalNative>>('vips_relational').asFunction<_VipsRelationalDart>();
+  late final _relationalConst = _lib.lookup<ffi.NativeFunction<_VipsRelationalConstNative>>('vips_relational_const').asFunction<_VipsRelationalConstDart>();
+  late final _relationalConst1 = _lib.lookup<ffi.NativeFunction<_VipsRelationalConst1Native>>('vips_relational_const1').asFunction<_VipsRelationalConst1Dart>();
+  late final _rshift = _lib.lookup<ffi.NativeFunction<_VipsRshiftNative>>('vips_rshift').asFunction<_VipsRshiftDart>();
+  late final _rshiftConst = _lib.lookup<ffi.NativeFunction<_VipsRshiftConstNative>>('vips_rshift_const').asFunction<_VipsRshiftConstDart>();
+  late final _rshiftConst1 = _lib.lookup<ffi.NativeFunction<_VipsRshiftConst1Native>>('vips_rshift_const1').asFunction<_VipsRshiftConst1Dart>();
+  late final _spcor = _lib.lookup<ffi.NativeFunction<_VipsSpcorNative>>('vips_spcor').asFunction<_VipsSpcorDart>();
+  late final _switch$ = _lib.lookup<ffi.NativeFunction<_VipsSwitchNative>>('vips_switch').asFunction<_VipsSwitchDart>();
+
+  int andimage(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _andimage(left, right, out, ffi.nullptr);
+  int andimageConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _andimageConst(in$, out, c, n, ffi.nullptr);
+  int andimageConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _andimageConst1(in$, out, c, ffi.nullptr);
+  int bandand(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandand(in$, out, ffi.nullptr);
+  int bandbool(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int boolean) => _bandbool(in$, out, boolean, ffi.nullptr);
+  int bandeor(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandeor(in$, out, ffi.nullptr);
+  int bandfold(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandfold(in$, out, ffi.nullptr);
+  int bandor(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandor(in$, out, ffi.nullptr);
+  int bandunfold(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _bandunfold(in$, out, ffi.nullptr);
+  int boolean(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out, int boolean) => _boolean(left, right, out, boolean, ffi.nullptr);
+  int booleanConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int boolean, ffi.Pointer<ffi.Double> c, int n) => _booleanConst(in$, out, boolean, c, n, ffi.nullptr);
+  int booleanConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int boolean, double c) => _booleanConst1(in$, out, boolean, c, ffi.nullptr);
+  int complexform(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _complexform(left, right, out, ffi.nullptr);
+  int eorimage(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _eorimage(left, right, out, ffi.nullptr);
+  int eorimageConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _eorimageConst(in$, out, c, n, ffi.nullptr);
+  int eorimageConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _eorimageConst1(in$, out, c, ffi.nullptr);
+  int equal(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _equal(left, right, out, ffi.nullptr);
+  int equalConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _equalConst(in$, out, c, n, ffi.nullptr);
+  int equalConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _equalConst1(in$, out, c, ffi.nullptr);
+  int fastcor(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsImage> ref, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _fastcor(in$, ref, out, ffi.nullptr);
+  int ifthenelse(ffi.Pointer<VipsImage> cond, ffi.Pointer<VipsImage> in1, ffi.Pointer<VipsImage> in2, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _ifthenelse(cond, in1, in2, out, ffi.nullptr);
+  int less(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _less(left, right, out, ffi.nullptr);
+  int lessConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _lessConst(in$, out, c, n, ffi.nullptr);
+  int lessConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _lessConst1(in$, out, c, ffi.nullptr);
+  int lesseq(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lesseq(left, right, out, ffi.nullptr);
+  int lesseqConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _lesseqConst(in$, out, c, n, ffi.nullptr);
+  int lesseqConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _lesseqConst1(in$, out, c, ffi.nullptr);
+  int lshift(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _lshift(left, right, out, ffi.nullptr);
+  int lshiftConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _lshiftConst(in$, out, c, n, ffi.nullptr);
+  int lshiftConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _lshiftConst1(in$, out, c, ffi.nullptr);
+  int more(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _more(left, right, out, ffi.nullptr);
+  int moreConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _moreConst(in$, out, c, n, ffi.nullptr);
+  int moreConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _moreConst1(in$, out, c, ffi.nullptr);
+  int moreeq(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _moreeq(left, right, out, ffi.nullptr);
+  int moreeqConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _moreeqConst(in$, out, c, n, ffi.nullptr);
+  int moreeqConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _moreeqConst1(in$, out, c, ffi.nullptr);
+  int notequal(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _notequal(left, right, out, ffi.nullptr);
+  int notequalConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _notequalConst(in$, out, c, n, ffi.nullptr);
+  int notequalConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _notequalConst1(in$, out, c, ffi.nullptr);
+  int orimage(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _orimage(left, right, out, ffi.nullptr);
+  int orimageConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _orimageConst(in$, out, c, n, ffi.nullptr);
+  int orimageConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _orimageConst1(in$, out, c, ffi.nullptr);
+  int relational(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out, int relational) => _relational(left, right, out, relational, ffi.nullptr);
+  int relationalConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int relational, ffi.Pointer<ffi.Double> c, int n) => _relationalConst(in$, out, relational, c, n, ffi.nullptr);
+  int relationalConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int relational, double c) => _relationalConst1(in$, out, relational, c, ffi.nullptr);
+  int rshift(ffi.Pointer<VipsImage> left, ffi.Pointer<VipsImage> right, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _rshift(left, right, out, ffi.nullptr);
+  int rshiftConst(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<ffi.Double> c, int n) => _rshiftConst(in$, out, c, n, ffi.nullptr);
+  int rshiftConst1(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double c) => _rshiftConst1(in$, out, c, ffi.nullptr);
+  int spcor(ffi.Pointer<VipsImage> in$, ffi.Pointer<VipsImage> ref, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _spcor(in$, ref, out, ffi.nullptr);
+  int switch$(ffi.Pointer<ffi.Pointer<VipsImage>> tests, ffi.Pointer<ffi.Pointer<VipsImage>> out, int n) => _switch$(tests, out, n, ffi.nullptr);
+}
@@ -0,0 +1,943 @@
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+
+import '../vips_option_slots.dart';
+
+typedef _VipsAffineNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double a,
+  ffi.Double b,
+  ffi.Double c,
+  ffi.Double d,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsAffineDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double a,
+  double b,
+  double c,
+  double d,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAffineOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double a,
+  ffi.Double b,
+  ffi.Double c,
+  ffi.Double d,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsAffineOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double a,
+  double b,
+  double c,
+  double d,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, double value5,
+  ffi.Pointer<ffi.Char> key6, double value6,
+  ffi.Pointer<ffi.Char> key7, double value7,
+  ffi.Pointer<ffi.Char> key8, double value8,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsAffineOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double a,
+  ffi.Double b,
+  ffi.Double c,
+  ffi.Double d,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsAffineOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double a,
+  double b,
+  double c,
+  double d,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Char> key2, double value2,
+  ffi.Pointer<ffi.Char> key3, double value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsMapimNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> index,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsMapimDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> index,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsQuadraticNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> coeff,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsQuadraticDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<VipsImage> coeff,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsReduceNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double hshrink,
+  ffi.Double vshrink,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsReduceDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double hshrink,
+  double vshrink,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsReducehNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double hshrink,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsReducehDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double hshrink,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsReducevNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double vshrink,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsReducevDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double vshrink,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsResizeNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double scale,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsResizeDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double scale,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsResizeOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double scale,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsResizeOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double scale,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Char> key2, double value2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsResizeOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double scale,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsResizeOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double scale,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRotateNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double angle,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsRotateDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double angle,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRotateOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double angle,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsRotateOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double angle,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, double value2,
+  ffi.Pointer<ffi.Char> key3, double value3,
+  ffi.Pointer<ffi.Char> key4, double value4,
+  ffi.Pointer<ffi.Char> key5, double value5,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsRotateOptionsDNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double angle,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.Double,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsRotateOptionsDDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double angle,
+  ffi.Pointer<ffi.Char> key0, double value0,
+  ffi.Pointer<ffi.Char> key1, double value1,
+  ffi.Pointer<ffi.Char> key2, double value2,
+  ffi.Pointer<ffi.Char> key3, double value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsShrinkNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Double hshrink,
+  ffi.Double vshrink,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsShrinkDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  double hshrink,
+  double vshrink,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsShrinkhNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int hshrink,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsShrinkhDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int hshrink,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsShrinkvNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int vshrink,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsShrinkvDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int vshrink,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsSimilarityNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsSimilarityDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsThumbnailDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsThumbnailOptionsDart = int Function(
+  ffi.Pointer<ffi.Char> filename,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailBufferNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsThumbnailBufferDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailBufferOptionsNative = ffi.Int Function(
+  ffi.Pointer<ffi.Void> buf,
+  ffi.Size len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsThumbnailBufferOptionsDart = int Function(
+  ffi.Pointer<ffi.Void> buf,
+  int len,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailImageNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsThumbnailImageDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailImageOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsThumbnailImageOptionsDart = int Function(
+  ffi.Pointer<VipsImage> in$,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailSourceNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _VipsThumbnailSourceDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+typedef _VipsThumbnailSourceOptionsNative = ffi.Int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  ffi.Int width,
+  ffi.VarArgs<(
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Char>, ffi.IntPtr,
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _VipsThumbnailSourceOptionsDart = int Function(
+  ffi.Pointer<VipsSource> source,
+  ffi.Pointer<ffi.Pointer<VipsImage>> out,
+  int width,
+  ffi.Pointer<ffi.Char> key0, int value0,
+  ffi.Pointer<ffi.Char> key1, int value1,
+  ffi.Pointer<ffi.Char> key2, int value2,
+  ffi.Pointer<ffi.Char> key3, int value3,
+  ffi.Pointer<ffi.Char> key4, int value4,
+  ffi.Pointer<ffi.Char> key5, int value5,
+  ffi.Pointer<ffi.Char> key6, int value6,
+  ffi.Pointer<ffi.Char> key7, int value7,
+  ffi.Pointer<ffi.Char> key8, int value8,
+  ffi.Pointer<ffi.Char> key9, int value9,
+  ffi.Pointer<ffi.Void> terminator,
+);
+
+/// Optional arguments of `vips_affine`.
+class VipsAffineOptions {
+  static final _interpolateKey = vipsOptionKey('interpolate');
+  static final _oareaKey = vipsOptionKey('oarea');
+  static final _odxKey = vipsOptionKey('odx');
+  static final _odyKey = vipsOptionKey('ody');
+  static final _idxKey = vipsOptionKey('idx');
+  static final _idyKey = vipsOptionKey('idy');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _premultipliedKey = vipsOptionKey('premultiplied');
+  static final _extendKey = vipsOptionKey('extend');
+
+  final ffi.Pointer<VipsInterpolate>? interpolate;
+  final ffi.Pointer<VipsArrayInt>? oarea;
+  final double? odx;
+  final double? ody;
+  final double? idx;
+  final double? idy;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final bool? premultiplied;
+  final VipsExtend? extend;
+
+  const VipsAffineOptions({
+    this.interpolate,
+    this.oarea,
+    this.odx,
+    this.ody,
+    this.idx,
+    this.idy,
+    this.background,
+    this.premultiplied,
+    this.extend,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (interpolate != null) slots.addInt(_interpolateKey, interpolate!.address);
+    if (oarea != null) slots.addInt(_oareaKey, oarea!.address);
+    if (odx != null) slots.addDouble(_odxKey, odx!);
+    if (ody != null) slots.addDouble(_odyKey, ody!);
+    if (idx != null) slots.addDouble(_idxKey, idx!);
+    if (idy != null) slots.addDouble(_idyKey, idy!);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (premultiplied != null) slots.addInt(_premultipliedKey, premultiplied! ? 1 : 0);
+    if (extend != null) slots.addInt(_extendKey, extend!.value);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_resize`.
+class VipsResizeOptions {
+  static final _kernelKey = vipsOptionKey('kernel');
+  static final _gapKey = vipsOptionKey('gap');
+  static final _vscaleKey = vipsOptionKey('vscale');
+
+  final VipsKernel? kernel;
+  final double? gap;
+  final double? vscale;
+
+  const VipsResizeOptions({
+    this.kernel,
+    this.gap,
+    this.vscale,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (kernel != null) slots.addInt(_kernelKey, kernel!.value);
+    if (gap != null) slots.addDouble(_gapKey, gap!);
+    if (vscale != null) slots.addDouble(_vscaleKey, vscale!);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_rotate`.
+class VipsRotateOptions {
+  static final _interpolateKey = vipsOptionKey('interpolate');
+  static final _backgroundKey = vipsOptionKey('background');
+  static final _odxKey = vipsOptionKey('odx');
+  static final _odyKey = vipsOptionKey('ody');
+  static final _idxKey = vipsOptionKey('idx');
+  static final _idyKey = vipsOptionKey('idy');
+
+  final ffi.Pointer<VipsInterpolate>? interpolate;
+  final ffi.Pointer<VipsArrayDouble>? background;
+  final double? odx;
+  final double? ody;
+  final double? idx;
+  final double? idy;
+
+  const VipsRotateOptions({
+    this.interpolate,
+    this.background,
+    this.odx,
+    this.ody,
+    this.idx,
+    this.idy,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (interpolate != null) slots.addInt(_interpolateKey, interpolate!.address);
+    if (background != null) slots.addInt(_backgroundKey, background!.address);
+    if (odx != null) slots.addDouble(_odxKey, odx!);
+    if (ody != null) slots.addDouble(_odyKey, ody!);
+    if (idx != null) slots.addDouble(_idxKey, idx!);
+    if (idy != null) slots.addDouble(_idyKey, idy!);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_thumbnail`.
+class VipsThumbnailOptions {
+  static final _heightKey = vipsOptionKey('height');
+  static final _sizeKey = vipsOptionKey('size');
+  static final _noRotateKey = vipsOptionKey('no_rotate');
+  static final _cropKey = vipsOptionKey('crop');
+  static final _linearKey = vipsOptionKey('linear');
+  static final _inputProfileKey = vipsOptionKey('input_profile');
+  static final _outputProfileKey = vipsOptionKey('output_profile');
+  static final _intentKey = vipsOptionKey('intent');
+  static final _failOnKey = vipsOptionKey('fail_on');
+
+  final int? height;
+  final VipsSize? size;
+  final bool? noRotate;
+  final int? crop;
+  final bool? linear;
+  final ffi.Pointer<ffi.Char>? inputProfile;
+  final ffi.Pointer<ffi.Char>? outputProfile;
+  final VipsIntent? intent;
+  final VipsFailOn? failOn;
+
+  const VipsThumbnailOptions({
+    this.height,
+    this.size,
+    this.noRotate,
+    this.crop,
+    this.linear,
+    this.inputProfile,
+    this.outputProfile,
+    this.intent,
+    this.failOn,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (height != null) slots.addInt(_heightKey, height!);
+    if (size != null) slots.addInt(_sizeKey, size!.value);
+    if (noRotate != null) slots.addInt(_noRotateKey, noRotate! ? 1 : 0);
+    if (crop != null) slots.addInt(_cropKey, crop!);
+    if (linear != null) slots.addInt(_linearKey, linear! ? 1 : 0);
+    if (inputProfile != null) slots.addInt(_inputProfileKey, inputProfile!.address);
+    if (outputProfile != null) slots.addInt(_outputProfileKey, outputProfile!.address);
+    if (intent != null) slots.addInt(_intentKey, intent!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_thumbnail_buffer`.
+class VipsThumbnailBufferOptions {
+  static final _heightKey = vipsOptionKey('height');
+  static final _sizeKey = vipsOptionKey('size');
+  static final _noRotateKey = vipsOptionKey('no_rotate');
+  static final _cropKey = vipsOptionKey('crop');
+  static final _linearKey = vipsOptionKey('linear');
+  static final _inputProfileKey = vipsOptionKey('input_profile');
+  static final _outputProfileKey = vipsOptionKey('output_profile');
+  static final _intentKey = vipsOptionKey('intent');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _optionStringKey = vipsOptionKey('option_string');
+
+  final int? height;
+  final VipsSize? size;
+  final bool? noRotate;
+  final int? crop;
+  final bool? linear;
+  final ffi.Pointer<ffi.Char>? inputProfile;
+  final ffi.Pointer<ffi.Char>? outputProfile;
+  final VipsIntent? intent;
+  final VipsFailOn? failOn;
+  final ffi.Pointer<ffi.Char>? optionString;
+
+  const VipsThumbnailBufferOptions({
+    this.height,
+    this.size,
+    this.noRotate,
+    this.crop,
+    this.linear,
+    this.inputProfile,
+    this.outputProfile,
+    this.intent,
+    this.failOn,
+    this.optionString,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (height != null) slots.addInt(_heightKey, height!);
+    if (size != null) slots.addInt(_sizeKey, size!.value);
+    if (noRotate != null) slots.addInt(_noRotateKey, noRotate! ? 1 : 0);
+    if (crop != null) slots.addInt(_cropKey, crop!);
+    if (linear != null) slots.addInt(_linearKey, linear! ? 1 : 0);
+    if (inputProfile != null) slots.addInt(_inputProfileKey, inputProfile!.address);
+    if (outputProfile != null) slots.addInt(_outputProfileKey, outputProfile!.address);
+    if (intent != null) slots.addInt(_intentKey, intent!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (optionString != null) slots.addInt(_optionStringKey, optionString!.address);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_thumbnail_image`.
+class VipsThumbnailImageOptions {
+  static final _heightKey = vipsOptionKey('height');
+  static final _sizeKey = vipsOptionKey('size');
+  static final _noRotateKey = vipsOptionKey('no_rotate');
+  static final _cropKey = vipsOptionKey('crop');
+  static final _linearKey = vipsOptionKey('linear');
+  static final _inputProfileKey = vipsOptionKey('input_profile');
+  static final _outputProfileKey = vipsOptionKey('output_profile');
+  static final _intentKey = vipsOptionKey('intent');
+  static final _failOnKey = vipsOptionKey('fail_on');
+
+  final int? height;
+  final VipsSize? size;
+  final bool? noRotate;
+  final int? crop;
+  final bool? linear;
+  final ffi.Pointer<ffi.Char>? inputProfile;
+  final ffi.Pointer<ffi.Char>? outputProfile;
+  final VipsIntent? intent;
+  final VipsFailOn? failOn;
+
+  const VipsThumbnailImageOptions({
+    this.height,
+    this.size,
+    this.noRotate,
+    this.crop,
+    this.linear,
+    this.inputProfile,
+    this.outputProfile,
+    this.intent,
+    this.failOn,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (height != null) slots.addInt(_heightKey, height!);
+    if (size != null) slots.addInt(_sizeKey, size!.value);
+    if (noRotate != null) slots.addInt(_noRotateKey, noRotate! ? 1 : 0);
+    if (crop != null) slots.addInt(_cropKey, crop!);
+    if (linear != null) slots.addInt(_linearKey, linear! ? 1 : 0);
+    if (inputProfile != null) slots.addInt(_inputProfileKey, inputProfile!.address);
+    if (outputProfile != null) slots.addInt(_outputProfileKey, outputProfile!.address);
+    if (intent != null) slots.addInt(_intentKey, intent!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    return slots;
+  }
+}
+
+/// Optional arguments of `vips_thumbnail_source`.
+class VipsThumbnailSourceOptions {
+  static final _heightKey = vipsOptionKey('height');
+  static final _sizeKey = vipsOptionKey('size');
+  static final _noRotateKey = vipsOptionKey('no_rotate');
+  static final _cropKey = vipsOptionKey('crop');
+  static final _linearKey = vipsOptionKey('linear');
+  static final _inputProfileKey = vipsOptionKey('input_profile');
+  static final _outputProfileKey = vipsOptionKey('output_profile');
+  static final _intentKey = vipsOptionKey('intent');
+  static final _failOnKey = vipsOptionKey('fail_on');
+  static final _optionStringKey = vipsOptionKey('option_string');
+
+  final int? height;
+  final VipsSize? size;
+  final bool? noRotate;
+  final int? crop;
+  final bool? linear;
+  final ffi.Pointer<ffi.Char>? inputProfile;
+  final ffi.Pointer<ffi.Char>? outputProfile;
+  final VipsIntent? intent;
+  final VipsFailOn? failOn;
+  final ffi.Pointer<ffi.Char>? optionString;
+
+  const VipsThumbnailSourceOptions({
+    this.height,
+    this.size,
+    this.noRotate,
+    this.crop,
+    this.linear,
+    this.inputProfile,
+    this.outputProfile,
+    this.intent,
+    this.failOn,
+    this.optionString,
+  });
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {
+    final slots = VipsOptionSlots();
+    if (height != null) slots.addInt(_heightKey, height!);
+    if (size != null) slots.addInt(_sizeKey, size!.value);
+    if (noRotate != null) slots.addInt(_noRotateKey, noRotate! ? 1 : 0);
+    if (crop != null) slots.addInt(_cropKey, crop!);
+    if (linear != null) slots.addInt(_linearKey, linear! ? 1 : 0);
+    if (inputProfile != null) slots.addInt(_inputProfileKey, inputProfile!.address);
+    if (outputProfile != null) slots.addInt(_outputProfileKey, outputProfile!.address);
+    if (intent != null) slots.addInt(_intentKey, intent!.value);
+    if (failOn != null) slots.addInt(_failOnKey, failOn!.value);
+    if (optionString != null) slots.addInt(_optionStringKey, optionString!.address);
+    return slots;
+  }
+}
+
+/// Resample variadic function bindings.
+class VipsGeneratedResampleBindings {
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedResampleBindings(this._lib);
+
+  late final _affine = _lib.lookup<ffi.NativeFunction<_VipsAffineNative>>('vips_affine').asFunction<_VipsAffineDart>();
+  late final _affineOptions = _lib.lookup<ffi.NativeFunction<_VipsAffineOptionsNative>>('vips_affine').asFunction<_VipsAffineOptionsDart>();
+  late final _affineOptionsD = _lib.lookup<ffi.NativeFunction<_VipsAffineOptionsDNative>>('vips_affine').asFunction<_VipsAffineOptionsDDart>();
+  late final _mapim = _lib.lookup<ffi.NativeFunction<_VipsMapimNative>>('vips_mapim').asFunction<_VipsMapimDart>();
+  late final _quadratic = _lib.lookup<ffi.NativeFunction<_VipsQuadraticNative>>('vips_quadratic').asFunction<_VipsQuadraticDart>();
+  late final _reduce = _lib.lookup<ffi.NativeFunction<_VipsReduceNative>>('vips_reduce').asFunction<_VipsReduceDart>();
+  late final _reduceh = _lib.lookup<ffi.NativeFunction<_VipsReducehNative>>('vips_reduceh').asFunction<_VipsReducehDart>();
+  late final _reducev = _lib.lookup<ffi.NativeFunction<_VipsReducevNative>>('vips_reducev').asFunction<_VipsReducevDart>();
+  late final _resize = _lib.lookup<ffi.NativeFunction<_VipsResizeNative>>('vips_resize').asFunction<_VipsResizeDart>();
+  late final _resizeOptions = _lib.lookup<ffi.NativeFunction<_VipsResizeOptionsNative>>('vips_resize').asFunction<_VipsResizeOptionsDart>();
+  late final _resizeOptionsD = _lib.lookup<ffi.NativeFunction<_VipsResizeOptionsDNative>>('vips_resize').asFunction<_VipsResizeOptionsDDart>();
+  late final _rotate = _lib.lookup<ffi.NativeFunction<_VipsRotateNative>>('vips_rotate').asFunction<_VipsRotateDart>();
+  late final _rotateOptions = _lib.lookup<ffi.NativeFunction<_VipsRotateOptionsNative>>('vips_rotate').asFunction<_VipsRotateOptionsDart>();
+  late final _rotateOptionsD = _lib.lookup<ffi.NativeFunction<_VipsRotateOptionsDNative>>('vips_rotate').asFunction<_VipsRotateOptionsDDart>();
+  late final _shrink = _lib.lookup<ffi.NativeFunction<_VipsShrinkNative>>('vips_shrink').asFunction<_VipsShrinkDart>();
+  late final _shrinkh = _lib.lookup<ffi.NativeFunction<_VipsShrinkhNative>>('vips_shrinkh').asFunction<_VipsShrinkhDart>();
+  late final _shrinkv = _lib.lookup<ffi.NativeFunction<_VipsShrinkvNative>>('vips_shrinkv').asFunction<_VipsShrinkvDart>();
+  late final _similarity = _lib.lookup<ffi.NativeFunction<_VipsSimilarityNative>>('vips_similarity').asFunction<_VipsSimilarityDart>();
+  late final _thumbnail = _lib.lookup<ffi.NativeFunction<_VipsThumbnailNative>>('vips_thumbnail').asFunction<_VipsThumbnailDart>();
+  late final _thumbnailOptions = _lib.lookup<ffi.NativeFunction<_VipsThumbnailOptionsNative>>('vips_thumbnail').asFunction<_VipsThumbnailOptionsDart>();
+  late final _thumbnailBuffer = _lib.lookup<ffi.NativeFunction<_VipsThumbnailBufferNative>>('vips_thumbnail_buffer').asFunction<_VipsThumbnailBufferDart>();
+  late final _thumbnailBufferOptions = _lib.lookup<ffi.NativeFunction<_VipsThumbnailBufferOptionsNative>>('vips_thumbnail_buffer').asFunction<_VipsThumbnailBufferOptionsDart>();
+  late final _thumbnailImage = _lib.lookup<ffi.NativeFunction<_VipsThumbnailImageNative>>('vips_thumbnail_image').asFunction<_VipsThumbnailImageDart>();
+  late final _thumbnailImageOptions = _lib.lookup<ffi.NativeFunction<_VipsThumbnailImageOptionsNative>>('vips_thumbnail_image').asFunction<_VipsThumbnailImageOptionsDart>();
+  late final _thumbnailSource = _lib.lookup<ffi.NativeFunction<_VipsThumbnailSourceNative>>('vips_thumbnail_source').asFunction<_VipsThumbnailSourceDart>();
+  late final _thumbnailSourceOptions = _lib.lookup<ffi.NativeFunction<_VipsThumbnailSourceOptionsNative>>('vips_thumbnail_source').asFunction<_VipsThumbnailSourceOptionsDart>();
+
+  int affine(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double a, double b, double c, double d, [VipsAffineOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _affine(in$, out, a, b, c, d, ffi.nullptr);
+    if (slots.doublesFirst) return _affineOptionsD(in$, out, a, b, c, d, slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), slots.doubleKey(2), slots.doubleValue(2), slots.doubleKey(3), slots.doubleValue(3), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), ffi.nullptr);
+    return _affineOptions(in$, out, a, b, c, d, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), slots.doubleKey(2), slots.doubleValue(2), slots.doubleKey(3), slots.doubleValue(3), ffi.nullptr);
+  }
+  int mapim(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> index) => _mapim(in$, out, index, ffi.nullptr);
+  int quadratic(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, ffi.Pointer<VipsImage> coeff) => _quadratic(in$, out, coeff, ffi.nullptr);
+  int reduce(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double hshrink, double vshrink) => _reduce(in$, out, hshrink, vshrink, ffi.nullptr);
+  int reduceh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double hshrink) => _reduceh(in$, out, hshrink, ffi.nullptr);
+  int reducev(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double vshrink) => _reducev(in$, out, vshrink, ffi.nullptr);
+  int resize(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double scale, [VipsResizeOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _resize(in$, out, scale, ffi.nullptr);
+    if (slots.doublesFirst) return _resizeOptionsD(in$, out, scale, slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), slots.intKey(0), slots.intValue(0), ffi.nullptr);
+    return _resizeOptions(in$, out, scale, slots.intKey(0), slots.intValue(0), slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), ffi.nullptr);
+  }
+  int rotate(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double angle, [VipsRotateOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _rotate(in$, out, angle, ffi.nullptr);
+    if (slots.doublesFirst) return _rotateOptionsD(in$, out, angle, slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), slots.doubleKey(2), slots.doubleValue(2), slots.doubleKey(3), slots.doubleValue(3), slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), ffi.nullptr);
+    return _rotateOptions(in$, out, angle, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.doubleKey(0), slots.doubleValue(0), slots.doubleKey(1), slots.doubleValue(1), slots.doubleKey(2), slots.doubleValue(2), slots.doubleKey(3), slots.doubleValue(3), ffi.nullptr);
+  }
+  int shrink(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, double hshrink, double vshrink) => _shrink(in$, out, hshrink, vshrink, ffi.nullptr);
+  int shrinkh(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int hshrink) => _shrinkh(in$, out, hshrink, ffi.nullptr);
+  int shrinkv(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int vshrink) => _shrinkv(in$, out, vshrink, ffi.nullptr);
+  int similarity(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out) => _similarity(in$, out, ffi.nullptr);
+  int thumbnail(ffi.Pointer<ffi.Char> filename, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, [VipsThumbnailOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _thumbnail(filename, out, width, ffi.nullptr);
+    return _thumbnailOptions(filename, out, width, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), ffi.nullptr);
+  }
+  int thumbnailBuffer(ffi.Pointer<ffi.Void> buf, int len, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, [VipsThumbnailBufferOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _thumbnailBuffer(buf, len, out, width, ffi.nullptr);
+    return _thumbnailBufferOptions(buf, len, out, width, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), ffi.nullptr);
+  }
+  int thumbnailImage(ffi.Pointer<VipsImage> in$, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, [VipsThumbnailImageOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _thumbnailImage(in$, out, width, ffi.nullptr);
+    return _thumbnailImageOptions(in$, out, width, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), ffi.nullptr);
+  }
+  int thumbnailSource(ffi.Pointer<VipsSource> source, ffi.Pointer<ffi.Pointer<VipsImage>> out, int width, [VipsThumbnailSourceOptions? options]) {
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _thumbnailSource(source, out, width, ffi.nullptr);
+    return _thumbnailSourceOptions(source, out, width, slots.intKey(0), slots.intValue(0), slots.intKey(1), slots.intValue(1), slots.intKey(2), slots.intValue(2), slots.intKey(3), slots.intValue(3), slots.intKey(4), slots.intValue(4), slots.intKey(5), slots.intValue(5), slots.intKey(6), slots.intValue(6), slots.intKey(7), slots.intValue(7), slots.intKey(8), slots.intValue(8), slots.intKey(9), slots.intValue(9), ffi.nullptr);
+  }
+}
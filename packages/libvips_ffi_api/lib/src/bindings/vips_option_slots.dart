@@ -0,0 +1,76 @@
+import 'dart:ffi' as ffi;
+
+import 'package:ffi/ffi.dart';
+
+// Support code for the generated option structs in generated/*_bindings.dart.
+// 生成的可选参数结构体的支持代码。
+//
+// Optional arguments are passed to libvips as a NULL-terminated
+// `name, value, name, value, ..., NULL` varargs list. Dart FFI needs the
+// varargs types at compile time, so every operation with options gets one
+// fixed layout: all integer-like slots (ints, booleans, enums, pointers as
+// addresses), then all double slots, then the terminator. Unused slots
+// after the last option carry a NULL name, which ends the list early.
+
+final Map<String, ffi.Pointer<ffi.Char>> _optionKeys = {};
+
+/// Native, NUL-terminated copy of an option name.
+///
+/// Keys are allocated once per process and never freed, so generated code
+/// can keep them in `static final` fields.
+ffi.Pointer<ffi.Char> vipsOptionKey(String name) =>
+    _optionKeys[name] ??= name.toNativeUtf8(allocator: malloc).cast();
+
+/// The options set for one call, laid out for the generated varargs slots.
+class VipsOptionSlots {
+  final List<ffi.Pointer<ffi.Char>> _intKeys = [];
+  final List<int> _intValues = [];
+  final List<ffi.Pointer<ffi.Char>> _doubleKeys = [];
+  final List<double> _doubleValues = [];
+
+  /// Add an integer-like option (int, bool, enum value or pointer address).
+  void addInt(ffi.Pointer<ffi.Char> key, int value) {
+    _intKeys.add(key);
+    _intValues.add(value);
+  }
+
+  /// Add a double option.
+  void addDouble(ffi.Pointer<ffi.Char> key, double value) {
+    _doubleKeys.add(key);
+    _doubleValues.add(value);
+  }
+
+  /// Whether no option was set.
+  bool get isEmpty => _intKeys.isEmpty && _doubleKeys.isEmpty;
+
+  /// Whether the double slots must come first.
+  ///
+  /// Integer slots lead the list, and when doubles follow, every integer
+  /// slot must hold a real option. With no integer option set, the generated
+  /// code uses a second layout that puts the double slots first.
+  bool get doublesFirst => _intKeys.isEmpty;
+
+  bool get _padInts => !doublesFirst && _doubleKeys.isNotEmpty;
+
+  /// Key for integer slot [i]: the option, or NULL to end the list.
+  ///
+  /// When doubles follow, spare integer slots repeat the last integer
+  /// option, which libvips simply sets again.
+  ffi.Pointer<ffi.Char> intKey(int i) {
+    if (i < _intKeys.length) return _intKeys[i];
+    return _padInts ? _intKeys.last : ffi.nullptr;
+  }
+
+  /// Value for integer slot [i].
+  int intValue(int i) {
+    if (i < _intValues.length) return _intValues[i];
+    return _padInts ? _intValues.last : 0;
+  }
+
+  /// Key for double slot [i]: the option, or NULL to end the list.
+  ffi.Pointer<ffi.Char> doubleKey(int i) =>
+      i < _doubleKeys.length ? _doubleKeys[i] : ffi.nullptr;
+
+  /// Value for double slot [i].
+  double doubleValue(int i) => i < _doubleValues.length ? _doubleValues[i] : 0;
+}
@@ -1,10 +1,14 @@
 import 'dart:ffi' as ffi;
+import 'dart:isolate';
 import 'dart:typed_data';
 
 import 'package:ffi/ffi.dart';
 import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
 
+import '../bindings/generated/generated_bindings.dart';
 import '../vips_api_init.dart';
+import 'vips_native_buffer.dart';
+import 'vips_stream.dart';
 
 /// High-level wrapper for VipsImage pointer.
 ///
@@ -13,11 +17,8 @@ import '../vips_api_init.dart';
 class VipsImg {
   ffi.Pointer<VipsImage> _pointer;
   bool _disposed = false;
-  
-  // Buffer pointer for images created from buffer (libvips uses lazy evaluation)
-  ffi.Pointer<ffi.Uint8>? _bufferPtr;
 
-  VipsImg._(this._pointer, [this._bufferPtr]);
+  VipsImg._(this._pointer);
 
   /// Create from a raw pointer (takes ownership).
   factory VipsImg.fromPointer(ffi.Pointer<VipsImage> pointer) {
@@ -28,11 +29,17 @@ class VipsImg {
   }
 
   /// Load image from file.
-  factory VipsImg.fromFile(String path) {
+  ///
+  /// [options] are passed to the loader, e.g.
+  /// `VipsImageNewFromFileOptions(access: VipsAccess.VIPS_ACCESS_SEQUENTIAL)`
+  /// for images that are read top to bottom once.
+  factory VipsImg.fromFile(String path, {VipsImageNewFromFileOptions? options}) {
     clearVipsError();
     final pathPtr = path.toNativeUtf8();
     try {
-      final ptr = apiBindings.imageNewFromFile(pathPtr.cast());
+      final ptr = options == null
+          ? apiBindings.imageNewFromFile(pathPtr.cast())
+          : generatedBindings.io.imageNewFromFile(pathPtr.cast(), options);
       if (ptr == ffi.nullptr) {
         throw VipsApiException(
           'Failed to load image: $path. ${getVipsError() ?? "Unknown error"}',
@@ -44,6 +51,29 @@ class VipsImg {
     }
   }
 
+  /// Load a thumbnail of a file, [width] pixels wide at most.
+  ///
+  /// Unlike loading and then resizing, libvips can shrink while it loads
+  /// (for example JPEG DCT scaling), so the full-size image is never
+  /// decoded. [options] are passed to `vips_thumbnail`.
+  factory VipsImg.fromThumbnail(String path, int width, {VipsThumbnailOptions? options}) {
+    clearVipsError();
+    final pathPtr = path.toNativeUtf8();
+    final outPtr = calloc<ffi.Pointer<VipsImage>>();
+    try {
+      final result = generatedBindings.resample.thumbnail(pathPtr.cast(), outPtr, width, options);
+      if (result != 0) {
+        throw VipsApiException(
+          'Failed to load thumbnail: $path. ${getVipsError() ?? "Unknown error"}',
+        );
+      }
+      return VipsImg._(outPtr.value);
+    } finally {
+      calloc.free(pathPtr);
+      calloc.free(outPtr);
+    }
+  }
+
   /// Load image from raw RGBA/RGB memory data.
   /// 
   /// [data] Raw pixel data in row-major order (RGBARGBA... or RGBRGB...)
@@ -80,27 +110,95 @@ class VipsImg {
   }
 
   /// Load image from buffer.
-  /// 
-  /// Note: The buffer data is copied to native memory and kept alive until
-  /// this VipsImg is disposed. This is necessary because libvips uses lazy
-  /// evaluation and may not decode the image until later operations.
-  factory VipsImg.fromBuffer(Uint8List data) {
+  ///
+  /// Note: The buffer data is copied to native memory once, and libvips
+  /// takes ownership of the copy: it stays alive for as long as libvips
+  /// needs it (libvips uses lazy evaluation and may not decode the image
+  /// until later operations), including in copies of this image.
+  /// Use [VipsImg.fromNativeBuffer] to avoid the copy.
+  ///
+  /// [options] are passed to the loader, as for [VipsImg.fromFile].
+  factory VipsImg.fromBuffer(Uint8List data, {VipsImageNewFromBufferOptions? options}) {
+    return VipsImg.fromNativeBuffer(
+      VipsNativeBuffer.fromBytes(data),
+      options: options == null
+          ? null
+          : VipsImageNewFromSourceOptions(
+              memory: options.memory,
+              access: options.access,
+              failOn: options.failOn,
+              revalidate: options.revalidate,
+            ),
+    );
+  }
+
+  /// Load image from encoded data in native memory, without copying it.
+  ///
+  /// Ownership of the memory passes to libvips (as a blob behind a memory
+  /// source), which frees it when the last image using it closes. [buffer]
+  /// no longer owns the memory afterwards, even if loading fails.
+  ///
+  /// [options] are passed to the loader, as for [VipsImg.fromFile].
+  factory VipsImg.fromNativeBuffer(VipsNativeBuffer buffer, {VipsImageNewFromSourceOptions? options}) {
     clearVipsError();
-    final dataPtr = calloc<ffi.Uint8>(data.length);
-    dataPtr.asTypedList(data.length).setAll(0, data);
-    final ptr = apiBindings.imageNewFromBuffer(
-      dataPtr.cast(),
-      data.length,
-      ''.toNativeUtf8().cast(), // empty option string
+    final length = buffer.length;
+    final data = buffer.release();
+    final blob = vipsBindings.vips_blob_new(
+      malloc.nativeFree.cast(),
+      data.cast(),
+      length,
     );
-    if (ptr == ffi.nullptr) {
-      calloc.free(dataPtr);
+    final source = vipsBindings.vips_source_new_from_blob(blob);
+    // The source holds its own reference to the blob
+    vipsBindings.vips_area_unref(blob.cast());
+    if (source == ffi.nullptr) {
+      throw VipsApiException(
+        'Failed to create source from buffer. ${getVipsError() ?? "Unknown error"}',
+      );
+    }
+    return VipsImg._fromSource(source, options, 'buffer');
+  }
+
+  /// Load image from a pipe or file descriptor, reading it as it decodes.
+  ///
+  /// Takes ownership of [descriptor] and closes it. For a pipe, such as the
+  /// one from [VipsStreamSource.takeDescriptor], libvips reads from its own
+  /// threads, so the writer must not be the calling isolate.
+  ///
+  /// [options] are passed to the loader, as for [VipsImg.fromFile].
+  factory VipsImg.fromDescriptor(int descriptor, {VipsImageNewFromSourceOptions? options}) {
+    clearVipsError();
+    // libvips dup() 描述符，原描述符由这里关闭
+    final source = vipsBindings.vips_source_new_from_descriptor(descriptor);
+    closeDescriptor(descriptor);
+    if (source == ffi.nullptr) {
       throw VipsApiException(
-        'Failed to load image from buffer. ${getVipsError() ?? "Unknown error"}',
+        'Failed to create source from descriptor. ${getVipsError() ?? "Unknown error"}',
       );
     }
-    // Keep buffer alive until dispose - libvips uses lazy evaluation
-    return VipsImg._(ptr, dataPtr);
+    return VipsImg._fromSource(source, options, 'descriptor');
+  }
+
+  /// Load from [source], consuming the caller's reference to it.
+  factory VipsImg._fromSource(
+    ffi.Pointer<VipsSource> source,
+    VipsImageNewFromSourceOptions? options,
+    String what,
+  ) {
+    final optionString = ''.toNativeUtf8();
+    try {
+      final ptr = generatedBindings.io.imageNewFromSource(source, optionString.cast(), options);
+      if (ptr == ffi.nullptr) {
+        throw VipsApiException(
+          'Failed to load image from $what. ${getVipsError() ?? "Unknown error"}',
+        );
+      }
+      return VipsImg._(ptr);
+    } finally {
+      // The image holds its own reference to the source
+      vipsBindings.g_object_unref(source.cast());
+      calloc.free(optionString);
+    }
   }
 
   /// Get the raw pointer (for internal use).
@@ -148,6 +246,26 @@ class VipsImg {
     return vipsBindings.vips_image_hasalpha(_pointer) != 0;
   }
 
+  /// A copy of the embedded ICC profile, or null if there is none.
+  Uint8List? get iccProfile {
+    _checkDisposed();
+    final name = 'icc-profile-data'.toNativeUtf8();
+    final data = calloc<ffi.Pointer<ffi.Void>>();
+    final length = calloc<ffi.Size>();
+    try {
+      if (vipsBindings.vips_image_get_typeof(_pointer, name.cast()) == 0) return null;
+      if (vipsBindings.vips_image_get_blob(_pointer, name.cast(), data, length) != 0) {
+        clearVipsError();
+        return null;
+      }
+      return Uint8List.fromList(data.value.cast<ffi.Uint8>().asTypedList(length.value));
+    } finally {
+      calloc.free(name);
+      calloc.free(data);
+      calloc.free(length);
+    }
+  }
+
   /// Write image to file.
   void writeToFile(String path) {
     _checkDisposed();
@@ -166,7 +284,83 @@ class VipsImg {
   }
 
   /// Write image to buffer with format suffix.
+  ///
+  /// The encoded bytes are copied onto the Dart heap and the libvips
+  /// buffer is freed at once. See [writeToExternalBuffer] and
+  /// [writeToTransferable] to avoid the copy.
   Uint8List writeToBuffer(String suffix) {
+    final (data, size) = _encode(suffix);
+    try {
+      return Uint8List.fromList(data.asTypedList(size));
+    } finally {
+      vipsBindings.g_free(data.cast());
+    }
+  }
+
+  /// Write image to buffer with format suffix, without copying the output.
+  ///
+  /// The returned list is a view of the buffer libvips encoded into; it is
+  /// freed with `g_free` when the list is garbage collected. The garbage
+  /// collector does not see the size of that memory, so prefer
+  /// [writeToBuffer] for many small results that are kept only briefly.
+  Uint8List writeToExternalBuffer(String suffix) {
+    final (data, size) = _encode(suffix);
+    return data.asTypedList(size, finalizer: _gFree);
+  }
+
+  /// Write image to buffer with format suffix, ready to send to another
+  /// isolate.
+  ///
+  /// The output is copied once into transferable memory and the libvips
+  /// buffer is freed at once; sending the result and calling
+  /// [TransferableTypedData.materialize] on the other side copy nothing.
+  TransferableTypedData writeToTransferable(String suffix) {
+    final (data, size) = _encode(suffix);
+    try {
+      return TransferableTypedData.fromList([data.asTypedList(size)]);
+    } finally {
+      vipsBindings.g_free(data.cast());
+    }
+  }
+
+  /// Write image to a pipe or file descriptor as it encodes.
+  ///
+  /// Takes ownership of [descriptor] and closes it, which signals the end
+  /// of the output to a pipe reader such as [VipsStreamTarget]. libvips
+  /// writes from its own threads, so the reader must not be the calling
+  /// isolate.
+  void writeToDescriptor(int descriptor, String suffix) {
+    _checkDisposed();
+    clearVipsError();
+    final target = vipsBindings.vips_target_new_to_descriptor(descriptor);
+    closeDescriptor(descriptor);
+    if (target == ffi.nullptr) {
+      throw VipsApiException(
+        'Failed to create target from descriptor. ${getVipsError() ?? "Unknown error"}',
+      );
+    }
+    final suffixPtr = suffix.toNativeUtf8();
+    try {
+      final result = generatedBindings.io.imageWriteToTarget(_pointer, suffixPtr.cast(), target);
+      if (result != 0) {
+        throw VipsApiException(
+          'Failed to write to descriptor. ${getVipsError() ?? "Unknown error"}',
+        );
+      }
+    } finally {
+      // 释放 target 时关闭 libvips 的副本，读端随之收到 EOF
+      vipsBindings.g_object_unref(target.cast());
+      calloc.free(suffixPtr);
+    }
+  }
+
+  /// `g_free` as a finalizer for external typed data.
+  static ffi.Pointer<ffi.NativeFinalizerFunction> get _gFree =>
+      __gFree ??= vipsLibrary.lookup<ffi.NativeFinalizerFunction>('g_free');
+  static ffi.Pointer<ffi.NativeFinalizerFunction>? __gFree;
+
+  /// Encode into a `g_malloc`'d buffer owned by the caller.
+  (ffi.Pointer<ffi.Uint8>, int) _encode(String suffix) {
     _checkDisposed();
     clearVipsError();
     final suffixPtr = suffix.toNativeUtf8();
@@ -185,12 +379,7 @@ class VipsImg {
           'Failed to write to buffer. ${getVipsError() ?? "Unknown error"}',
         );
       }
-
-      final size = sizePtr.value;
-      final dataPtr = bufPtr.value.cast<ffi.Uint8>();
-      final data = Uint8List.fromList(dataPtr.asTypedList(size));
-      vipsBindings.g_free(bufPtr.value);
-      return data;
+      return (bufPtr.value.cast<ffi.Uint8>(), sizePtr.value);
     } finally {
       calloc.free(suffixPtr);
       calloc.free(bufPtr);
@@ -372,11 +561,6 @@ class VipsImg {
   void dispose() {
     if (_disposed) return;
     vipsBindings.g_object_unref(_pointer.cast());
-    // Free buffer if this image was created from buffer
-    if (_bufferPtr != null) {
-      calloc.free(_bufferPtr!);
-      _bufferPtr = null;
-    }
     _disposed = true;
   }
 
@@ -0,0 +1,161 @@
+import 'dart:async';
+import 'dart:ffi' as ffi;
+import 'dart:io';
+import 'dart:isolate';
+import 'dart:typed_data';
+
+import 'package:ffi/ffi.dart';
+
+/// Sendable handle to a [VipsNativeBuffer] whose ownership is in transit.
+///
+/// Created by [VipsNativeBuffer.transfer] and turned back into a buffer
+/// with [VipsNativeBuffer.adopt], usually in another isolate. It holds only
+/// the address and length, so sending it copies no image data. Exactly one
+/// isolate must adopt it; a handle that is never adopted leaks its memory.
+class VipsNativeBufferHandle {
+  final int address;
+  final int length;
+
+  const VipsNativeBufferHandle._(this.address, this.length);
+}
+
+/// Encoded image data in native memory, with explicit ownership.
+///
+/// Data read straight into a native buffer ([fromFile], [fromStream]) can be
+/// handed to libvips without any further copy: [VipsImg.fromNativeBuffer]
+/// passes ownership of the memory to libvips, which frees it when the image
+/// closes. Between isolates, ownership moves with [transfer] and [adopt].
+///
+/// A buffer that is still owned when it is garbage collected is freed.
+class VipsNativeBuffer implements ffi.Finalizable {
+  static final _finalizer = ffi.NativeFinalizer(malloc.nativeFree);
+
+  ffi.Pointer<ffi.Uint8> _pointer;
+
+  /// Size in bytes.
+  final int length;
+
+  VipsNativeBuffer._(this._pointer, this.length) {
+    _finalizer.attach(this, _pointer.cast(), detach: this, externalSize: length);
+  }
+
+  /// Allocate [length] uninitialized bytes.
+  factory VipsNativeBuffer.allocate(int length) {
+    if (length <= 0) {
+      throw ArgumentError.value(length, 'length', 'must be positive');
+    }
+    return VipsNativeBuffer._(malloc<ffi.Uint8>(length), length);
+  }
+
+  /// Copy [data] into a new native buffer.
+  factory VipsNativeBuffer.fromBytes(List<int> data) {
+    final buffer = VipsNativeBuffer.allocate(data.length);
+    buffer.bytes.setAll(0, data);
+    return buffer;
+  }
+
+  /// Read a file directly into native memory (no copy on the Dart heap).
+  factory VipsNativeBuffer.fromFile(String path) {
+    final file = File(path).openSync();
+    try {
+      final buffer = VipsNativeBuffer.allocate(file.lengthSync());
+      final bytes = buffer.bytes;
+      var offset = 0;
+      while (offset < bytes.length) {
+        final read = file.readIntoSync(bytes, offset);
+        if (read == 0) {
+          buffer.free();
+          throw FileSystemException('File was truncated while reading', path);
+        }
+        offset += read;
+      }
+      return buffer;
+    } finally {
+      file.closeSync();
+    }
+  }
+
+  /// Materialize [data] (no copy) and copy it into native memory once.
+  factory VipsNativeBuffer.fromTransferable(TransferableTypedData data) {
+    return VipsNativeBuffer.fromBytes(data.materialize().asUint8List());
+  }
+
+  /// Take ownership of a buffer sent from another isolate.
+  factory VipsNativeBuffer.adopt(VipsNativeBufferHandle handle) {
+    return VipsNativeBuffer._(ffi.Pointer.fromAddress(handle.address), handle.length);
+  }
+
+  /// Collect [stream] into native memory, e.g. an HTTP response body.
+  ///
+  /// With [length] (such as a Content-Length) chunks are written straight
+  /// into the native buffer; otherwise they are collected first and copied
+  /// once.
+  static Future<VipsNativeBuffer> fromStream(Stream<List<int>> stream, {int? length}) async {
+    if (length == null) {
+      final builder = BytesBuilder(copy: false);
+      await stream.forEach(builder.add);
+      return VipsNativeBuffer.fromBytes(builder.takeBytes());
+    }
+
+    final buffer = VipsNativeBuffer.allocate(length);
+    final bytes = buffer.bytes;
+    var offset = 0;
+    try {
+      await for (final chunk in stream) {
+        if (offset + chunk.length > length) {
+          throw StateError('Stream is longer than $length bytes');
+        }
+        bytes.setRange(offset, offset + chunk.length, chunk);
+        offset += chunk.length;
+      }
+      if (offset != length) {
+        throw StateError('Stream ended after $offset of $length bytes');
+      }
+    } catch (_) {
+      buffer.free();
+      rethrow;
+    }
+    return buffer;
+  }
+
+  /// Whether this object still owns its memory.
+  bool get isOwned => _pointer != ffi.nullptr;
+
+  /// The native memory.
+  ffi.Pointer<ffi.Uint8> get pointer {
+    _checkOwned();
+    return _pointer;
+  }
+
+  /// A view of the native memory, valid while this buffer owns it.
+  Uint8List get bytes => pointer.asTypedList(length);
+
+  /// Give up ownership so another isolate can [adopt] the memory.
+  VipsNativeBufferHandle transfer() {
+    return VipsNativeBufferHandle._(release().address, length);
+  }
+
+  /// Give up ownership to native code, which must free the memory with
+  /// the C allocator (`malloc.nativeFree`).
+  ffi.Pointer<ffi.Uint8> release() {
+    final pointer = this.pointer;
+    _finalizer.detach(this);
+    _pointer = ffi.nullptr;
+    return pointer;
+  }
+
+  /// Free the memory now. Does nothing if ownership was given up.
+  void free() {
+    if (!isOwned) return;
+    malloc.free(release());
+  }
+
+  void _checkOwned() {
+    if (!isOwned) {
+      throw StateError('VipsNativeBuffer no longer owns its memory');
+    }
+  }
+
+  @override
+  String toString() => 'VipsNativeBuffer($length bytes${isOwned ? '' : ', released'})';
+}
@@ -0,0 +1,225 @@
+import 'dart:async';
+import 'dart:ffi' as ffi;
+import 'dart:io';
+import 'dart:typed_data';
+
+import 'package:ffi/ffi.dart';
+
+final _libc = ffi.DynamicLibrary.process();
+final _pipe = _libc.lookupFunction<ffi.Int Function(ffi.Pointer<ffi.Int>),
+    int Function(ffi.Pointer<ffi.Int>)>('pipe');
+final _close = _libc.lookupFunction<ffi.Int Function(ffi.Int), int Function(int)>('close');
+
+/// EPIPE on Linux, Android, macOS and iOS.
+const _epipe = 32;
+
+const _chunkSize = 64 * 1024;
+
+/// Create an OS pipe, returning its (read, write) descriptors.
+(int, int) _createPipe() {
+  if (Platform.isWindows) {
+    throw UnsupportedError('Streaming I/O is not supported on Windows');
+  }
+  final fds = calloc<ffi.Int>(2);
+  try {
+    if (_pipe(fds) != 0) {
+      throw const OSError('pipe() failed');
+    }
+    return (fds[0], fds[1]);
+  } finally {
+    calloc.free(fds);
+  }
+}
+
+/// Open [descriptor] as a file through `/dev/fd`, then close [descriptor].
+///
+/// The descriptor at the other end of the pipe must still be open, or the
+/// open blocks like a FIFO open without a peer.
+RandomAccessFile _openDescriptor(int descriptor, FileMode mode) {
+  try {
+    return File('/dev/fd/$descriptor').openSync(mode: mode);
+  } finally {
+    _close(descriptor);
+  }
+}
+
+/// Close a descriptor handed over by [VipsStreamSource.takeDescriptor] or
+/// [VipsStreamTarget.takeDescriptor].
+void closeDescriptor(int descriptor) {
+  _close(descriptor);
+}
+
+/// Feeds a Dart stream to libvips through an OS pipe.
+///
+/// The stream is pumped into the write end of the pipe as libvips reads
+/// the other end, so only about one pipe buffer of encoded data is held
+/// in memory. libvips reads pipes from its own threads, so the read end
+/// must be used in another isolate than the one that pumps the stream,
+/// for example with `PipelineSpec.inputStream` and a worker isolate.
+///
+/// ```dart
+/// final source = VipsStreamSource(httpResponse);
+/// final spec = PipelineSpec()..inputStream(source)..thumbnail(400);
+/// ```
+class VipsStreamSource {
+  int? _descriptor;
+  late final RandomAccessFile _file;
+  late final Future<void> _done;
+
+  /// Start pumping [stream] into a new pipe.
+  VipsStreamSource(Stream<List<int>> stream) {
+    final (read, write) = _createPipe();
+    try {
+      _file = _openDescriptor(write, FileMode.writeOnly);
+    } catch (_) {
+      _close(read);
+      rethrow;
+    }
+    _descriptor = read;
+    _done = _pump(stream);
+  }
+
+  /// Completes when [stream] has been written out, or when libvips closed
+  /// the pipe because it needs no more data. Fails with a stream error.
+  Future<void> get done => _done;
+
+  /// Give up the read end of the pipe, for libvips in another isolate.
+  ///
+  /// The receiver owns the descriptor and must close it, which
+  /// `VipsImg.fromDescriptor` does.
+  int takeDescriptor() {
+    final descriptor = _descriptor;
+    if (descriptor == null) {
+      throw StateError('VipsStreamSource descriptor was already taken');
+    }
+    _descriptor = null;
+    return descriptor;
+  }
+
+  Future<void> _pump(Stream<List<int>> stream) async {
+    try {
+      await for (final chunk in stream) {
+        await _file.writeFrom(chunk);
+      }
+    } on FileSystemException catch (e) {
+      // 读端已关闭：libvips 不再需要数据
+      if (e.osError?.errorCode != _epipe) rethrow;
+    } finally {
+      await _file.close();
+    }
+  }
+
+  /// Give up without reading: closes the read end if it was not taken,
+  /// which ends the pump.
+  void close() {
+    final descriptor = _descriptor;
+    _descriptor = null;
+    if (descriptor != null) _close(descriptor);
+  }
+}
+
+/// Forwards what libvips writes to an OS pipe into a Dart [StreamSink].
+///
+/// libvips writes the write end as it encodes, so the output never has to
+/// fit in memory at once. As with [VipsStreamSource], the write end must
+/// be used in another isolate than the one that owns the sink.
+class VipsStreamTarget {
+  int? _descriptor;
+  late final RandomAccessFile _file;
+  late final StreamController<Uint8List> _chunks;
+  late final Future<void> _done;
+  Completer<void>? _resumed;
+  bool _stopped = false;
+
+  /// Forward the read end of a new pipe into [sink].
+  ///
+  /// [sink] is not closed when the output ends.
+  VipsStreamTarget(StreamSink<List<int>> sink) {
+    final (read, write) = _createPipe();
+    try {
+      _file = _openDescriptor(read, FileMode.read);
+    } catch (_) {
+      _close(write);
+      rethrow;
+    }
+    _descriptor = write;
+    _chunks = StreamController<Uint8List>(
+      onListen: _forward,
+      onResume: _resume,
+      onCancel: _stop,
+    );
+    _done = sink.addStream(_chunks.stream);
+  }
+
+  /// Completes when libvips has closed the pipe and all output was added
+  /// to the sink, or when the target is aborted.
+  Future<void> get done => _done;
+
+  /// The write end of the pipe, still owned by this target until
+  /// [takeDescriptor] or [close].
+  int get descriptor {
+    final descriptor = _descriptor;
+    if (descriptor == null) {
+      throw StateError('VipsStreamTarget descriptor was already taken');
+    }
+    return descriptor;
+  }
+
+  /// Give up the write end of the pipe, for libvips in another isolate.
+  ///
+  /// The receiver owns the descriptor and must close it, which
+  /// `VipsImg.writeToDescriptor` does; [done] completes only after that.
+  int takeDescriptor() {
+    final descriptor = this.descriptor;
+    _descriptor = null;
+    return descriptor;
+  }
+
+  /// Give up without writing: closes the write end if it was not taken.
+  void close() {
+    final descriptor = _descriptor;
+    _descriptor = null;
+    if (descriptor != null) _close(descriptor);
+  }
+
+  /// Stop forwarding and complete [done] without waiting for the writer,
+  /// releasing the sink. For a writer that failed without closing the
+  /// descriptor it took; the read end is closed once the writer closes it.
+  void abort() {
+    close();
+    _stop();
+    if (!_chunks.isClosed) _chunks.close();
+  }
+
+  void _resume() {
+    final resumed = _resumed;
+    _resumed = null;
+    resumed?.complete();
+  }
+
+  void _stop() {
+    _stopped = true;
+    _resume();
+  }
+
+  Future<void> _forward() async {
+    try {
+      while (!_stopped) {
+        // 在 IO 线程阻塞读取，不阻塞事件循环
+        final chunk = await _file.read(_chunkSize);
+        if (chunk.isEmpty || _stopped) break;
+        _chunks.add(chunk);
+        // 接收端暂停时等待，保持背压
+        while (_chunks.isPaused && !_stopped) {
+          await (_resumed = Completer<void>()).future;
+        }
+      }
+    } catch (error, stackTrace) {
+      if (!_chunks.isClosed) _chunks.addError(error, stackTrace);
+    } finally {
+      // 关闭读端；写端仍在写入时会收到 EPIPE
+      await _file.close();
+      if (!_chunks.isClosed) _chunks.close();
+    }
+  }
+}
@@ -1,9 +1,12 @@
 import 'dart:ffi' as ffi;
+import 'dart:isolate';
 import 'dart:typed_data';
 
 import 'package:ffi/ffi.dart';
 
+import '../bindings/generated/generated_bindings.dart';
 import '../image/vips_img.dart';
+import '../image/vips_native_buffer.dart';
 import '../vips_api_init.dart';
 
 /// Chainable image processing pipeline.
@@ -16,13 +19,38 @@ class VipsPipeline {
   VipsPipeline._(this._image);
 
   /// Create pipeline from file.
-  factory VipsPipeline.fromFile(String path) {
-    return VipsPipeline._(VipsImg.fromFile(path));
+  ///
+  /// See [VipsImg.fromFile] for [options].
+  factory VipsPipeline.fromFile(String path, {VipsImageNewFromFileOptions? options}) {
+    return VipsPipeline._(VipsImg.fromFile(path, options: options));
+  }
+
+  /// Create pipeline from a thumbnail of a file (shrink-on-load).
+  ///
+  /// See [VipsImg.fromThumbnail] for [options].
+  factory VipsPipeline.fromThumbnail(String path, int width, {VipsThumbnailOptions? options}) {
+    return VipsPipeline._(VipsImg.fromThumbnail(path, width, options: options));
   }
 
   /// Create pipeline from buffer.
-  factory VipsPipeline.fromBuffer(Uint8List data) {
-    return VipsPipeline._(VipsImg.fromBuffer(data));
+  ///
+  /// See [VipsImg.fromBuffer] for [options].
+  factory VipsPipeline.fromBuffer(Uint8List data, {VipsImageNewFromBufferOptions? options}) {
+    return VipsPipeline._(VipsImg.fromBuffer(data, options: options));
+  }
+
+  /// Create pipeline from encoded data in native memory (no copy).
+  ///
+  /// See [VipsImg.fromNativeBuffer]; libvips takes ownership of [buffer].
+  factory VipsPipeline.fromNativeBuffer(VipsNativeBuffer buffer, {VipsImageNewFromSourceOptions? options}) {
+    return VipsPipeline._(VipsImg.fromNativeBuffer(buffer, options: options));
+  }
+
+  /// Create pipeline from a pipe or file descriptor (takes ownership).
+  ///
+  /// See [VipsImg.fromDescriptor].
+  factory VipsPipeline.fromDescriptor(int descriptor, {VipsImageNewFromSourceOptions? options}) {
+    return VipsPipeline._(VipsImg.fromDescriptor(descriptor, options: options));
   }
 
   /// Create pipeline from existing VipsImg (takes ownership).
@@ -51,6 +79,35 @@ class VipsPipeline {
     return data;
   }
 
+  /// Output as buffer without copying it off the native heap.
+  ///
+  /// See [VipsImg.writeToExternalBuffer].
+  Uint8List toExternalBuffer({String format = '.png'}) {
+    final data = _image.writeToExternalBuffer(format);
+    dispose();
+    return data;
+  }
+
+  /// Output as data to send to another isolate.
+  ///
+  /// See [VipsImg.writeToTransferable].
+  TransferableTypedData toTransferable({String format = '.png'}) {
+    final data = _image.writeToTransferable(format);
+    dispose();
+    return data;
+  }
+
+  /// Write to a pipe or file descriptor (takes ownership).
+  ///
+  /// See [VipsImg.writeToDescriptor].
+  void toDescriptor(int descriptor, {String format = '.png'}) {
+    try {
+      _image.writeToDescriptor(descriptor, format);
+    } finally {
+      dispose();
+    }
+  }
+
   /// Output as JPEG buffer.
   Uint8List toJpeg({int quality = 75}) {
     final suffix = quality != 75 ? '.jpg[Q=$quality]' : '.jpg';
@@ -1,3 +1,4 @@
+import 'dart:isolate';
 import 'dart:typed_data';
 
 import '../image/vips_img.dart';
@@ -144,7 +145,14 @@ class JoinPipelineSpec {
   /// Execute the join pipeline and return result buffer.
   ///
   /// Call this in the target isolate after initializing vips.
-  Uint8List execute() {
+  Uint8List execute() => _join().toBuffer(format: _output.format);
+
+  /// Execute the join pipeline and return the result ready to send back
+  /// to another isolate. See [VipsImg.writeToTransferable].
+  TransferableTypedData executeTransferable() =>
+      _join().toTransferable(format: _output.format);
+
+  VipsPipeline _join() {
     if (_inputs.length < 2) {
       throw StateError('At least 2 inputs are required for join. Got ${_inputs.length}.');
     }
@@ -169,7 +177,7 @@ class JoinPipelineSpec {
       }
     }
 
-    return pipeline!.toBuffer(format: _output.format);
+    return pipeline!;
   }
 
   /// Execute and save to file.
@@ -1,5 +1,10 @@
+import 'dart:isolate';
 import 'dart:typed_data';
 
+import '../bindings/generated/generated_bindings.dart';
+import '../image/vips_img.dart';
+import '../image/vips_native_buffer.dart';
+import '../image/vips_stream.dart';
 import '../pipeline/vips_pipeline.dart';
 import '../pipeline/extensions/resample_ext.dart';
 import '../pipeline/extensions/geometry_ext.dart';
@@ -13,6 +18,7 @@ import '../pipeline/extensions/histogram_ext.dart';
 import '../pipeline/extensions/morphology_ext.dart';
 import '../types/enums.dart';
 import 'operation_spec.dart';
+import 'spec_optimizer.dart';
 
 /// Output format specification.
 class OutputSpec {
@@ -37,25 +43,76 @@ class OutputSpec {
 ///
 /// Build a description of operations without executing them,
 /// then execute in any isolate.
+///
+/// Input from [inputNative] or [inputTransferable] is moved, not copied,
+/// when the spec is sent to another isolate. Such a spec owns its input
+/// and can be executed once, as can a spec reading from [inputStream].
+///
+/// Operations are optimized before execution (see [optimizeOperations]),
+/// and a leading resize or thumbnail of a file input shrinks on load.
+/// Call [optimize] with false to replay the operations literally.
 class PipelineSpec {
   String? _inputPath;
   Uint8List? _inputBuffer;
+  VipsNativeBufferHandle? _inputNative;
+  TransferableTypedData? _inputTransferable;
+  int? _inputDescriptor;
   final List<OperationSpec> _operations = [];
   OutputSpec _output = const OutputSpec('.png');
+  bool _optimize = true;
 
   PipelineSpec();
 
+  void _clearInput() {
+    _inputPath = null;
+    _inputBuffer = null;
+    _inputNative = null;
+    _inputTransferable = null;
+    _inputDescriptor = null;
+  }
+
   /// Set input from file path.
   PipelineSpec input(String path) {
+    _clearInput();
     _inputPath = path;
-    _inputBuffer = null;
     return this;
   }
 
   /// Set input from buffer.
+  ///
+  /// The bytes are copied when the spec is sent to another isolate and
+  /// again into native memory; see [inputNative] to avoid both.
   PipelineSpec inputBuffer(Uint8List data) {
+    _clearInput();
     _inputBuffer = data;
-    _inputPath = null;
+    return this;
+  }
+
+  /// Set input from native memory, taking ownership of [buffer].
+  ///
+  /// Only a handle travels with the spec; the executing isolate passes the
+  /// memory to libvips without copying it.
+  PipelineSpec inputNative(VipsNativeBuffer buffer) {
+    _clearInput();
+    _inputNative = buffer.transfer();
+    return this;
+  }
+
+  /// Set input from transferable data, which moves between isolates
+  /// without a copy and is copied once into native memory on execution.
+  PipelineSpec inputTransferable(TransferableTypedData data) {
+    _clearInput();
+    _inputTransferable = data;
+    return this;
+  }
+
+  /// Set input from a stream, taking the read end of [source]'s pipe.
+  ///
+  /// The image is decoded as the data arrives; execute the spec in another
+  /// isolate than the one pumping [source].
+  PipelineSpec inputStream(VipsStreamSource source) {
+    _clearInput();
+    _inputDescriptor = source.takeDescriptor();
     return this;
   }
 
@@ -279,23 +336,172 @@ class PipelineSpec {
 
   // ======= Execution =======
 
+  /// Operations in the order they were added.
+  List<OperationSpec> get operations => List.unmodifiable(_operations);
+
+  /// Enable or disable the optimization pass run before execution.
+  PipelineSpec optimize([bool enabled = true]) {
+    _optimize = enabled;
+    return this;
+  }
+
+  /// Move this spec into a copy to send to another isolate.
+  ///
+  /// Owned input (see [inputNative], [inputTransferable], [inputStream])
+  /// goes to the copy and is cleared here, so it can only be executed or
+  /// released once. If the copy is never executed, call [releaseInput].
+  PipelineSpec handOff() {
+    final spec = PipelineSpec()
+      .._inputPath = _inputPath
+      .._inputBuffer = _inputBuffer
+      .._inputNative = _inputNative
+      .._inputTransferable = _inputTransferable
+      .._inputDescriptor = _inputDescriptor
+      .._output = _output
+      .._optimize = _optimize;
+    spec._operations.addAll(_operations);
+    _inputNative = null;
+    _inputTransferable = null;
+    _inputDescriptor = null;
+    return spec;
+  }
+
+  /// Free owned input that will not be executed: native memory is freed
+  /// and a stream descriptor is closed.
+  void releaseInput() {
+    final native = _inputNative;
+    final descriptor = _inputDescriptor;
+    _inputNative = null;
+    _inputTransferable = null;
+    _inputDescriptor = null;
+    if (native != null) VipsNativeBuffer.adopt(native).free();
+    if (descriptor != null) closeDescriptor(descriptor);
+  }
+
   /// Execute the pipeline and return result buffer.
   ///
   /// Call this in the target isolate after initializing vips.
-  Uint8List execute() {
-    if (_inputPath == null && _inputBuffer == null) {
-      throw StateError('No input specified. Call input() or inputBuffer().');
+  Uint8List execute() => _run().toBuffer(format: _output.format);
+
+  /// Execute the pipeline and return the result without copying it off
+  /// the native heap. See [VipsPipeline.toExternalBuffer].
+  Uint8List executeExternal() => _run().toExternalBuffer(format: _output.format);
+
+  /// Execute the pipeline and write the result to [descriptor], such as
+  /// the write end from [VipsStreamTarget.takeDescriptor], closing it.
+  void executeToDescriptor(int descriptor) {
+    final VipsPipeline pipeline;
+    try {
+      pipeline = _run();
+    } catch (_) {
+      // 关闭写端，让读端结束
+      closeDescriptor(descriptor);
+      rethrow;
     }
+    pipeline.toDescriptor(descriptor, format: _output.format);
+  }
+
+  /// Execute the pipeline and return the result ready to send back to
+  /// another isolate. See [VipsPipeline.toTransferable].
+  TransferableTypedData executeTransferable() =>
+      _run().toTransferable(format: _output.format);
+
+  VipsPipeline _run() {
+    if (!_optimize) return _apply(_openInput(), _operations);
 
-    var pipeline = _inputPath != null
-        ? VipsPipeline.fromFile(_inputPath!)
-        : VipsPipeline.fromBuffer(_inputBuffer!);
+    final operations = optimizeOperations(_operations);
+    final path = _inputPath;
+    if (path != null && operations.isNotEmpty) {
+      final pipeline = _shrinkOnLoad(path, operations.first);
+      if (pipeline != null) return _apply(pipeline, operations.skip(1));
+    }
+    return _apply(_openInput(), operations);
+  }
 
-    for (final op in _operations) {
+  VipsPipeline _apply(VipsPipeline pipeline, Iterable<OperationSpec> operations) {
+    for (final op in operations) {
       pipeline = _applyOperation(pipeline, op);
     }
+    return pipeline;
+  }
+
+  /// Load [path] already reduced by [first] (a thumbnail or a downscale)
+  /// with `vips_thumbnail`, or return null.
+  ///
+  /// `vips_thumbnail` converts CMYK and other colourspaces to sRGB and
+  /// premultiplies alpha, which `resize` does not, so a downscale is only
+  /// done on load for sRGB or B_W 8-bit images without alpha or a CMYK
+  /// profile.
+  VipsPipeline? _shrinkOnLoad(String path, OperationSpec first) {
+    switch (first) {
+      case ThumbnailSpec(:final width):
+        return VipsPipeline.fromThumbnail(path, width);
+      case ResizeSpec(:final scale) when scale < 1:
+        // 只读取文件头，计算与 resize 相同的输出尺寸
+        final header = VipsImg.fromFile(path);
+        final int width;
+        final int height;
+        try {
+          if (!_thumbnailKeepsPixels(header)) return null;
+          width = (header.width * scale).round();
+          height = (header.height * scale).round();
+        } finally {
+          header.dispose();
+        }
+        if (width < 1 || height < 1) return null;
+        return VipsPipeline.fromThumbnail(
+          path,
+          width,
+          options: VipsThumbnailOptions(
+            height: height,
+            size: VipsSize.VIPS_SIZE_FORCE,
+            noRotate: true,
+          ),
+        );
+      default:
+        return null;
+    }
+  }
 
-    return pipeline.toBuffer(format: _output.format);
+  /// Whether `vips_thumbnail` leaves the pixels of [image] as `resize`
+  /// would: no colourspace conversion and no alpha premultiplication.
+  static bool _thumbnailKeepsPixels(VipsImg image) {
+    final interpretation = image.interpretation;
+    if (image.format != VipsBandFormat.uchar.value ||
+        image.hasAlpha ||
+        (interpretation != VipsInterpretation.srgb.value &&
+            interpretation != VipsInterpretation.bw.value)) {
+      return false;
+    }
+    // ICC 头部偏移 16 处为数据色彩空间
+    final profile = image.iccProfile;
+    return profile == null ||
+        profile.length < 20 ||
+        String.fromCharCodes(profile, 16, 20) != 'CMYK';
+  }
+
+  VipsPipeline _openInput() {
+    if (_inputPath != null) return VipsPipeline.fromFile(_inputPath!);
+    if (_inputBuffer != null) return VipsPipeline.fromBuffer(_inputBuffer!);
+
+    // Owned input is consumed by the first execution
+    final native = _inputNative;
+    final transferable = _inputTransferable;
+    final descriptor = _inputDescriptor;
+    _inputNative = null;
+    _inputTransferable = null;
+    _inputDescriptor = null;
+    if (native != null) {
+      return VipsPipeline.fromNativeBuffer(VipsNativeBuffer.adopt(native));
+    }
+    if (transferable != null) {
+      return VipsPipeline.fromNativeBuffer(VipsNativeBuffer.fromTransferable(transferable));
+    }
+    if (descriptor != null) return VipsPipeline.fromDescriptor(descriptor);
+    throw StateError(
+      'No input specified (or its owned input was already consumed). '
+      'Call input(), inputBuffer(), inputNative(), inputTransferable() or inputStream().',
+    );
   }
 
   VipsPipeline _applyOperation(VipsPipeline pipeline, OperationSpec op) {
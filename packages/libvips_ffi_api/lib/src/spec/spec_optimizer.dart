@@ -0,0 +1,104 @@
+import 'operation_spec.dart';
+
+/// Rewrite [operations] into an equivalent, shorter list.
+///
+/// Every libvips operation adds a node and an intermediate image, so
+/// chains of small adjustments are folded where the result is the same:
+///
+/// - consecutive [LinearSpec], [BrightnessSpec] and [ContrastSpec] become
+///   one [LinearSpec];
+/// - a [CropSpec] inside the previous crop is merged into it;
+/// - [Rot90Spec], [Rot180Spec] and [Rot270Spec] in a row become one turn,
+///   or nothing;
+/// - two flips in the same direction, and rotations by a multiple of 360
+///   degrees, are dropped.
+///
+/// Crops that fall outside the previous one are kept, so they still fail
+/// as they would have.
+List<OperationSpec> optimizeOperations(List<OperationSpec> operations) {
+  final optimized = <OperationSpec>[];
+  for (final op in operations) {
+    _push(optimized, op);
+  }
+  return optimized;
+}
+
+void _push(List<OperationSpec> optimized, OperationSpec op) {
+  if (_isNoOp(op)) return;
+  if (optimized.isNotEmpty) {
+    final merged = _merge(optimized.last, op);
+    if (merged != null) {
+      optimized.removeLast();
+      // 合并结果可能与新的末尾继续合并
+      if (merged is OperationSpec) _push(optimized, merged);
+      return;
+    }
+  }
+  optimized.add(op);
+}
+
+bool _isNoOp(OperationSpec op) => op is RotateSpec && op.angle % 360 == 0;
+
+/// Marks two operations that undo each other.
+class _Cancelled {
+  const _Cancelled();
+}
+
+/// The single operation equivalent to [first] then [second], [_Cancelled]
+/// if they undo each other, or null if they cannot be merged.
+Object? _merge(OperationSpec first, OperationSpec second) {
+  final linear1 = _asLinear(first);
+  final linear2 = _asLinear(second);
+  if (linear1 != null && linear2 != null) {
+    // (x * a1 + b1) * a2 + b2
+    final (a1, b1) = linear1;
+    final (a2, b2) = linear2;
+    return LinearSpec(a1 * a2, b1 * a2 + b2);
+  }
+
+  if (first is CropSpec && second is CropSpec) {
+    final inside = second.left >= 0 &&
+        second.top >= 0 &&
+        second.left + second.width <= first.width &&
+        second.top + second.height <= first.height;
+    if (!inside) return null;
+    return CropSpec(
+      first.left + second.left,
+      first.top + second.top,
+      second.width,
+      second.height,
+    );
+  }
+
+  if (first is FlipSpec && second is FlipSpec) {
+    return first.direction == second.direction ? const _Cancelled() : null;
+  }
+
+  final turns1 = _quarterTurns(first);
+  final turns2 = _quarterTurns(second);
+  if (turns1 != null && turns2 != null) {
+    return switch ((turns1 + turns2) % 4) {
+      1 => const Rot90Spec(),
+      2 => const Rot180Spec(),
+      3 => const Rot270Spec(),
+      _ => const _Cancelled(),
+    };
+  }
+
+  return null;
+}
+
+/// [op] as `x * a + b`, matching the VipsPipeline colour extensions.
+(double, double)? _asLinear(OperationSpec op) => switch (op) {
+      LinearSpec(:final a, :final b) => (a, b),
+      BrightnessSpec(:final factor) => (factor, 0.0),
+      ContrastSpec(:final factor) => (factor, 128 * (1 - factor)),
+      _ => null,
+    };
+
+int? _quarterTurns(OperationSpec op) => switch (op) {
+      Rot90Spec() => 1,
+      Rot180Spec() => 2,
+      Rot270Spec() => 3,
+      _ => null,
+    };
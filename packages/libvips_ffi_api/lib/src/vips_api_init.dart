@@ -17,6 +17,7 @@ import 'bindings/convolution_bindings.dart';
 import 'bindings/resample_bindings.dart';
 import 'bindings/complex_bindings.dart';
 import 'bindings/mosaicing_bindings.dart';
+import 'bindings/generated/generated_bindings.dart';
 
 /// Global VipsBindings instance from core package.
 VipsBindings? _vipsBindings;
@@ -39,6 +40,9 @@ VipsResampleBindings? _resampleBindings;
 VipsComplexBindings? _complexBindings;
 VipsMosaicingBindings? _mosaicingBindings;
 
+/// Generated variadic bindings (see tools/generate_api_bindings.py).
+VipsGeneratedBindings? _generatedBindings;
+
 /// Global DynamicLibrary instance.
 ffi.DynamicLibrary? _vipsLibrary;
 
@@ -114,6 +118,9 @@ VipsComplexBindings get complexBindings => _complexBindings ??= VipsComplexBindi
 /// Get mosaicing bindings.
 VipsMosaicingBindings get mosaicingBindings => _mosaicingBindings ??= VipsMosaicingBindings(vipsLibrary);
 
+/// Get generated variadic bindings for every operation, grouped by category.
+VipsGeneratedBindings get generatedBindings => _generatedBindings ??= VipsGeneratedBindings(vipsLibrary);
+
 /// Whether the api package has been initialized.
 bool get isVipsApiInitialized => _initialized;
 
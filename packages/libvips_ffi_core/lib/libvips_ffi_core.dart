@@ -51,6 +51,13 @@ export 'src/vips_core.dart'
 export 'src/loader/library_loader.dart'
     show VipsLibraryLoader, SystemVipsLoader, PathVipsLoader, DirectVipsLoader;
 
+export 'src/loader/bundle_manifest.dart'
+    show
+        VipsBundleManifest,
+        VipsBundleLibrary,
+        VipsIntegrityCheck,
+        ManifestVipsLoader;
+
 export 'src/platform_types.dart' show VipsPlatform, VipsArch;
 
 // Export enums for high-level API use.
@@ -0,0 +1,283 @@
+import 'dart:convert';
+import 'dart:ffi';
+import 'dart:io';
+import 'dart:isolate';
+import 'dart:typed_data';
+
+import 'package:crypto/crypto.dart';
+
+import 'library_loader.dart';
+
+/// 预编译库包中的单个库（manifest.json 中的一项）
+class VipsBundleLibrary {
+  /// 包内文件名
+  final String name;
+
+  /// 文件内容的 sha256（十六进制）
+  final String sha256;
+
+  /// 文件大小（字节）
+  final int size;
+
+  /// ELF 的 DT_SONAME 或 Mach-O 的 install name
+  final String? soname;
+
+  /// CPU 架构
+  final String? arch;
+
+  /// 依赖的包内文件名
+  final List<String> needed;
+
+  const VipsBundleLibrary({
+    required this.name,
+    required this.sha256,
+    required this.size,
+    this.soname,
+    this.arch,
+    this.needed = const [],
+  });
+
+  factory VipsBundleLibrary.fromJson(String name, Map<String, dynamic> json) {
+    return VipsBundleLibrary(
+      name: name,
+      sha256: json['sha256'] as String,
+      size: json['size'] as int,
+      soname: json['soname'] as String?,
+      arch: json['arch'] as String?,
+      needed: (json['needed'] as List? ?? const []).cast<String>(),
+    );
+  }
+}
+
+/// 预编译库清单
+///
+/// 由 `tools/find_libvips_deps.py --copy-to` 在库目录中生成的 `manifest.json`，
+/// 记录每个库的 sha256、大小、soname、架构和依赖关系，以及依赖在前的加载顺序。
+/// 加载器据此按顺序预加载，不再需要探测路径。
+class VipsBundleManifest {
+  /// 清单文件名
+  static const String fileName = 'manifest.json';
+
+  /// 支持的清单格式版本
+  static const int supportedVersion = 1;
+
+  /// 库所在目录
+  final String directory;
+
+  /// libvips 本身的文件名
+  final String root;
+
+  /// 加载顺序（依赖在前，[root] 在最后）
+  final List<String> loadOrder;
+
+  /// 文件名 -> 库信息
+  final Map<String, VipsBundleLibrary> libraries;
+
+  final String? platform;
+  final String? architecture;
+  final String? libvipsVersion;
+
+  const VipsBundleManifest({
+    required this.directory,
+    required this.root,
+    required this.loadOrder,
+    required this.libraries,
+    this.platform,
+    this.architecture,
+    this.libvipsVersion,
+  });
+
+  factory VipsBundleManifest.fromJson(
+    String directory,
+    Map<String, dynamic> json,
+  ) {
+    final version = json['version'];
+    if (version != supportedVersion) {
+      throw FormatException('Unsupported manifest version: $version');
+    }
+    final libraries = <String, VipsBundleLibrary>{
+      for (final entry in (json['libraries'] as Map<String, dynamic>).entries)
+        entry.key: VipsBundleLibrary.fromJson(
+          entry.key,
+          entry.value as Map<String, dynamic>,
+        ),
+    };
+    final root = json['root'] as String?;
+    if (root == null || !libraries.containsKey(root)) {
+      throw const FormatException('Manifest has no root library');
+    }
+    return VipsBundleManifest(
+      directory: directory,
+      root: root,
+      loadOrder: (json['load_order'] as List).cast<String>(),
+      libraries: libraries,
+      platform: json['platform'] as String?,
+      architecture: json['architecture'] as String?,
+      libvipsVersion: json['libvips_version'] as String?,
+    );
+  }
+
+  /// 读取 [directory] 中的清单，不存在时返回 null
+  static VipsBundleManifest? tryLoad(String directory) {
+    final file = File('$directory${Platform.pathSeparator}$fileName');
+    if (!file.existsSync()) return null;
+    final json = jsonDecode(file.readAsStringSync()) as Map<String, dynamic>;
+    return VipsBundleManifest.fromJson(directory, json);
+  }
+
+  /// 包内文件的完整路径
+  String pathOf(String name) => '$directory${Platform.pathSeparator}$name';
+
+  /// libvips 的完整路径
+  String get rootPath => pathOf(root);
+
+  /// 快速检查：每个库一次 stat，返回缺失或大小不符的文件名
+  List<String> checkSizes() {
+    return [
+      for (final library in libraries.values)
+        if (File(pathOf(library.name)).statSync().size != library.size)
+          library.name,
+    ];
+  }
+
+  /// 完整校验 sha256，返回不一致的文件名（同步读取全部文件）
+  List<String> verifySync() {
+    final mismatched = <String>[];
+    for (final library in libraries.values) {
+      try {
+        if (_sha256Of(pathOf(library.name)) != library.sha256) {
+          mismatched.add(library.name);
+        }
+      } on FileSystemException {
+        mismatched.add(library.name);
+      }
+    }
+    return mismatched;
+  }
+
+  /// 在后台 isolate 中校验 sha256
+  Future<List<String>> verify() => Isolate.run(verifySync);
+}
+
+String _sha256Of(String path) {
+  final output = _DigestSink();
+  final input = sha256.startChunkedConversion(output);
+  final file = File(path).openSync();
+  try {
+    final buffer = Uint8List(1 << 20);
+    while (true) {
+      final read = file.readIntoSync(buffer);
+      if (read == 0) break;
+      input.add(Uint8List.sublistView(buffer, 0, read));
+    }
+  } finally {
+    file.closeSync();
+  }
+  input.close();
+  return output.value.toString();
+}
+
+class _DigestSink implements Sink<Digest> {
+  late Digest value;
+
+  @override
+  void add(Digest data) => value = data;
+
+  @override
+  void close() {}
+}
+
+/// 完整性校验策略
+enum VipsIntegrityCheck {
+  /// 不校验
+  none,
+
+  /// 加载前只比较文件大小（每个库一次 stat）
+  size,
+
+  /// 加载前比较大小，加载后在后台校验 sha256
+  lazy,
+
+  /// 加载前校验 sha256
+  eager,
+}
+
+/// 按清单加载预编译库
+///
+/// 按 [VipsBundleManifest.loadOrder] 逐个以完整路径打开依赖库，
+/// 之后打开 libvips 时动态链接器直接复用已加载的库，无需搜索路径。
+class ManifestVipsLoader implements VipsLibraryLoader {
+  final VipsBundleManifest manifest;
+
+  final VipsIntegrityCheck integrityCheck;
+
+  /// 后台 sha256 校验发现不一致时调用（[VipsIntegrityCheck.lazy]）
+  final void Function(List<String> mismatched)? onIntegrityFailure;
+
+  Future<List<String>>? _verification;
+
+  ManifestVipsLoader(
+    this.manifest, {
+    this.integrityCheck = VipsIntegrityCheck.lazy,
+    this.onIntegrityFailure,
+  });
+
+  /// 从目录读取清单创建加载器，目录中没有清单时返回 null
+  static ManifestVipsLoader? fromDirectory(
+    String directory, {
+    VipsIntegrityCheck integrityCheck = VipsIntegrityCheck.lazy,
+    void Function(List<String> mismatched)? onIntegrityFailure,
+  }) {
+    final manifest = VipsBundleManifest.tryLoad(directory);
+    if (manifest == null) return null;
+    return ManifestVipsLoader(
+      manifest,
+      integrityCheck: integrityCheck,
+      onIntegrityFailure: onIntegrityFailure,
+    );
+  }
+
+  /// 后台校验结果（[VipsIntegrityCheck.lazy] 时在 [load] 之后可用）
+  Future<List<String>>? get verification => _verification;
+
+  @override
+  DynamicLibrary load() {
+    if (integrityCheck != VipsIntegrityCheck.none) {
+      _throwIfMismatched(
+        integrityCheck == VipsIntegrityCheck.eager
+            ? manifest.verifySync()
+            : manifest.checkSizes(),
+      );
+    }
+
+    DynamicLibrary? root;
+    for (final name in manifest.loadOrder) {
+      final library = DynamicLibrary.open(manifest.pathOf(name));
+      if (name == manifest.root) root = library;
+    }
+    root ??= DynamicLibrary.open(manifest.rootPath);
+
+    if (integrityCheck == VipsIntegrityCheck.lazy) {
+      _verification = manifest.verify()
+        ..then(
+          (mismatched) {
+            if (mismatched.isNotEmpty) onIntegrityFailure?.call(mismatched);
+          },
+          // 校验本身失败时不影响已加载的库
+          onError: (Object _) {},
+        );
+    }
+    return root;
+  }
+
+  void _throwIfMismatched(List<String> mismatched) {
+    if (mismatched.isEmpty) return;
+    throw StateError(
+      'Bundled libraries are missing or modified in ${manifest.directory}: '
+      '${mismatched.join(', ')}',
+    );
+  }
+
+  @override
+  bool isAvailable() => File(manifest.rootPath).existsSync();
+}
@@ -42,8 +42,21 @@ export 'package:libvips_ffi_linux/libvips_ffi_linux.dart'
 
 /// 初始化 libvips (桌面端自动选择平台)
 ///
-/// 根据当前平台自动选择对应的加载器。
-void initVipsDesktop([String appName = 'libvips_ffi']) {
+/// 如果 [bundleDirectory]（默认为应用自带库的目录：Linux 的 `lib/`、
+/// macOS 的 `Frameworks/`、Windows 的可执行文件目录）中有 `manifest.json`，
+/// 按清单顺序预加载，跳过路径探测；否则根据当前平台自动选择对应的加载器。
+void initVipsDesktop([
+  String appName = 'libvips_ffi',
+  String? bundleDirectory,
+]) {
+  final manifestLoader = ManifestVipsLoader.fromDirectory(
+    bundleDirectory ?? _defaultBundleDirectory(),
+  );
+  if (manifestLoader != null) {
+    initVipsWithLoader(manifestLoader, appName);
+    return;
+  }
+
   if (Platform.isMacOS) {
     initVipsMacos(appName);
   } else if (Platform.isWindows) {
@@ -57,3 +70,11 @@ void initVipsDesktop([String appName = 'libvips_ffi']) {
     );
   }
 }
+
+/// 应用自带库的默认目录
+String _defaultBundleDirectory() {
+  final execDir = File(Platform.resolvedExecutable).parent.path;
+  if (Platform.isMacOS) return '$execDir/../Frameworks';
+  if (Platform.isLinux) return '$execDir/lib';
+  return execDir;
+}
@@ -26,6 +26,11 @@ class VipsLoader {
   ///
   /// [appName] libvips 初始化时使用的应用名称。
   ///
+  /// 如果库所在目录中有 `manifest.json`（由 `tools/find_libvips_deps.py
+  /// --copy-to` 生成），会按清单中的顺序预加载依赖库，不再探测路径；
+  /// [integrityCheck] 决定校验方式，默认加载后在后台校验 sha256，
+  /// 发现不一致时调用 [onIntegrityFailure]。
+  ///
   /// 示例:
   /// ```dart
   /// await VipsLoader.init(
@@ -52,6 +57,8 @@ class VipsLoader {
     required VipsLibraryProvider provider,
     VipsLoadingCallback? onStateChanged,
     String appName = 'libvips_ffi',
+    VipsIntegrityCheck integrityCheck = VipsIntegrityCheck.lazy,
+    void Function(List<String> mismatched)? onIntegrityFailure,
   }) async {
     final request = VipsLibraryRequest(
       platform: VipsPlatform.current,
@@ -76,9 +83,23 @@ class VipsLoader {
 
     onStateChanged?.call(VipsLoadingState.loading);
 
-    // 加载库
+    // 加载库（有清单时按清单顺序预加载）
     try {
-      initVipsWithLibrary(DynamicLibrary.open(libraryPath), appName);
+      final manifestLoader = ManifestVipsLoader.fromDirectory(
+        p.dirname(libraryPath),
+        integrityCheck: integrityCheck,
+        onIntegrityFailure: onIntegrityFailure,
+      );
+      // 提供者返回的可能是指向 libvips 的符号链接（如 libvips.so.42）
+      final library = manifestLoader != null &&
+              p.equals(
+                File(manifestLoader.manifest.rootPath)
+                    .resolveSymbolicLinksSync(),
+                File(libraryPath).resolveSymbolicLinksSync(),
+              )
+          ? manifestLoader.load()
+          : DynamicLibrary.open(libraryPath);
+      initVipsWithLibrary(library, appName);
       onStateChanged?.call(VipsLoadingState.ready);
     } catch (e) {
       onStateChanged?.call(VipsLoadingState.error);
@@ -0,0 +1,141 @@
+"""Tests for tools/macho_rewrite.py on the committed macOS dylibs (runs on any host)."""
+
+import shutil
+import struct
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'tools'))
+
+from macho_rewrite import DylibEdits, HeaderPaddingError, read_link_info, rewrite, rewrite_file, verify_edits  # noqa: E402
+
+LIBRARIES_DIR = PROJECT_ROOT / 'packages' / 'libvips_ffi_macos' / 'macos' / 'Libraries'
+FIXTURE = 'libcgif.0.dylib'
+INSTALL_NAME = '@rpath/libcgif.0.dylib'
+SYSTEM_LIB = '/usr/lib/libSystem.B.dylib'
+
+FAT_MAGIC = 0xcafebabe
+FAT_ALIGN = 14  # 16 KiB, as lipo uses for arm64
+
+
+def fixture_path(arch: str) -> Path:
+    path = LIBRARIES_DIR / arch / FIXTURE
+    if not path.is_file():
+        pytest.skip(f'{path} is not available')
+    return path
+
+
+def make_universal(slices):
+    """A fat file holding the thin Mach-O images in `slices`."""
+    align = 1 << FAT_ALIGN
+    offset = align
+    headers, body = [], b''
+    for data in slices:
+        cputype, cpusubtype = struct.unpack_from('<ii', data, 4)
+        headers.append(struct.pack('>iiIII', cputype, cpusubtype, offset, len(data), FAT_ALIGN))
+        body += data.ljust((len(data) + align - 1) // align * align, b'\0')
+        offset += (len(data) + align - 1) // align * align
+    header = struct.pack('>II', FAT_MAGIC, len(slices)) + b''.join(headers)
+    return header.ljust(align, b'\0') + body
+
+
+@pytest.fixture(params=['thin', 'universal'])
+def dylib(request, tmp_path) -> Path:
+    arm64 = fixture_path('arm64')
+    path = tmp_path / FIXTURE
+    if request.param == 'thin':
+        shutil.copyfile(arm64, path)
+    else:
+        path.write_bytes(make_universal([arm64.read_bytes(), fixture_path('x86_64').read_bytes()]))
+    return path
+
+
+def test_reads_fixture(dylib):
+    infos = read_link_info(dylib.read_bytes())
+    assert infos
+    for info in infos:
+        assert info.install_name == INSTALL_NAME
+        assert SYSTEM_LIB in info.dependencies
+        assert info.header_padding > 0
+
+
+def test_id(dylib):
+    edits = DylibEdits(install_name='@rpath/libcgif.0.0.0.dylib')
+    changed, infos = rewrite_file(dylib, edits)
+    assert changed
+    assert read_link_info(dylib.read_bytes()) == infos
+    assert all(info.install_name == '@rpath/libcgif.0.0.0.dylib' for info in infos)
+
+
+def test_change(dylib):
+    edits = DylibEdits(changes={SYSTEM_LIB: '@rpath/libSystem.B.dylib'})
+    rewrite_file(dylib, edits)
+    for info in read_link_info(dylib.read_bytes()):
+        assert SYSTEM_LIB not in info.dependencies
+        assert '@rpath/libSystem.B.dylib' in info.dependencies
+
+
+def test_add_and_delete_rpath(dylib):
+    rewrite_file(dylib, DylibEdits(add_rpaths=['@loader_path', '@loader_path/../lib']))
+    infos = read_link_info(dylib.read_bytes())
+    assert all(info.rpaths[-2:] == ['@loader_path', '@loader_path/../lib'] for info in infos)
+
+    rewrite_file(dylib, DylibEdits(delete_rpaths=['@loader_path']))
+    infos = read_link_info(dylib.read_bytes())
+    assert all('@loader_path' not in info.rpaths for info in infos)
+    assert all('@loader_path/../lib' in info.rpaths for info in infos)
+
+
+def test_unchanged_file_is_not_rewritten(dylib):
+    before = dylib.read_bytes()
+    changed, _ = rewrite_file(dylib, DylibEdits(install_name=INSTALL_NAME))
+    assert not changed
+    assert dylib.read_bytes() == before
+
+
+def test_revert_is_byte_identical(dylib):
+    original = dylib.read_bytes()
+    rewrite_file(dylib, DylibEdits(
+        install_name='@rpath/libcgif-renamed.dylib',
+        changes={SYSTEM_LIB: '/usr/lib/libSystem.dylib'},
+        add_rpaths=['@loader_path/Frameworks'],
+    ))
+    assert dylib.read_bytes() != original
+
+    rewrite_file(dylib, DylibEdits(
+        install_name=INSTALL_NAME,
+        changes={'/usr/lib/libSystem.dylib': SYSTEM_LIB},
+        delete_rpaths=['@loader_path/Frameworks'],
+    ))
+    assert dylib.read_bytes() == original
+
+
+def test_header_padding_overflow(dylib):
+    original = dylib.read_bytes()
+    padding = max(info.header_padding for info in read_link_info(original))
+    edits = DylibEdits(add_rpaths=['@loader_path/' + 'x' * padding])
+    with pytest.raises(HeaderPaddingError):
+        rewrite_file(dylib, edits)
+    # Nothing is written when a slice does not fit
+    assert dylib.read_bytes() == original
+
+
+def test_verify_edits_reports_problems(dylib):
+    infos = read_link_info(dylib.read_bytes())
+    edits = DylibEdits(
+        install_name='@rpath/other.dylib',
+        changes={SYSTEM_LIB: '@rpath/libSystem.B.dylib'},
+        add_rpaths=['@loader_path'],
+    )
+    problems = verify_edits(infos, edits)
+    assert len(problems) == 3 * len(infos)
+    assert any('install name is' in problem for problem in problems)
+    assert any(f'still depends on {SYSTEM_LIB}' in problem for problem in problems)
+    assert any('missing rpath @loader_path' in problem for problem in problems)
+
+    data = bytearray(dylib.read_bytes())
+    assert rewrite(data, edits)
+    assert verify_edits(read_link_info(data), edits) == []
@@ -7,17 +7,42 @@ Analyze native library sizes for Android and iOS.
 - Android APK: Uses ZIP deflate compression (APK is a ZIP file)
 - iOS IPA/App Store: Uses LZMA for estimation (App Store uses similar compression)
 
+Compression runs in a process pool, one task per file. Results are cached
+in tools/.lib_sizes_cache.json keyed by (path, size, mtime, sha256, codec,
+level), so unchanged libraries are never compressed again.
+
+An LZMA worker needs about 10.5 times its dictionary, which is capped at the
+file size and 64 MiB (so up to ~700 MB). Without --jobs, the pool is sized to
+fit the available memory (cgroup limit or free RAM) as well as the CPUs.
+
+`--breakdown` reads each library in-process (ar, ELF and Mach-O via mmap,
+see binary_reader.py) and splits raw and compressed size by library,
+archive member and section.
+
+`--save-baseline` writes a JSON report of sizes per ABI and per library;
+`--compare` checks the current libraries against such a report and exits
+non-zero when compressed sizes grow past the thresholds.
+
 Usage:
     python tools/analyze_lib_sizes.py
+    python tools/analyze_lib_sizes.py --jobs 4 --no-cache
+    python tools/analyze_lib_sizes.py --breakdown --top 20 --symbols 10
+    python tools/analyze_lib_sizes.py --save-baseline docs/native_library_sizes.json
+    python tools/analyze_lib_sizes.py --compare docs/native_library_sizes.json --max-growth-percent 2
 """
 
+import argparse
+import hashlib
+import json
 import os
+import sys
 import zlib
 import lzma
-import zipfile
-import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from binary_reader import ELF_MAGIC, ElfFile, describe, open_mmap
 
 # Project root
 SCRIPT_DIR = Path(__file__).parent
@@ -28,6 +53,22 @@ FLUTTER_PACKAGE = PROJECT_ROOT / "packages" / "libvips_ffi"
 ANDROID_JNILIB = FLUTTER_PACKAGE / "android" / "src" / "main" / "jniLibs"
 IOS_XCFRAMEWORK = FLUTTER_PACKAGE / "ios" / "Frameworks" / "libvips.xcframework"
 
+# Compression settings
+ZIP_LEVEL = 9
+LZMA_PRESET = 9
+CHUNK_SIZE = 1024 * 1024
+LZMA_MAX_DICT = 64 * 1024 * 1024
+# xz's bt4 match finder at preset 9 (674 MiB for a 64 MiB dictionary)
+LZMA_MEMORY_PER_DICT_BYTE = 10.5
+
+# Compressed size cache
+CACHE_FILE = SCRIPT_DIR / ".lib_sizes_cache.json"
+CACHE_VERSION = 2
+
+# Size baseline
+DEFAULT_BASELINE = PROJECT_ROOT / "docs" / "native_library_sizes.json"
+BASELINE_VERSION = 1
+
 
 def format_size(size_bytes: int) -> str:
     """Format bytes to human readable string."""
@@ -41,128 +82,370 @@ def format_size(size_bytes: int) -> str:
         return f"{size_bytes} B"
 
 
-def get_zip_compressed_size(file_path: Path) -> int:
+def get_streamed_compressed_size(file_path: Path, compressor) -> int:
+    """
+    Feed a file through `compressor` in fixed-size chunks and count the
+    output bytes without keeping them, so memory use does not grow with
+    the file size.
+    """
+    buffer = bytearray(CHUNK_SIZE)
+    view = memoryview(buffer)
+    total = 0
+    with open(file_path, 'rb', buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            total += len(compressor.compress(view[:n]))
+    return total + len(compressor.flush())
+
+
+def get_zip_compressed_size(file_path: Path, level: int = ZIP_LEVEL) -> int:
     """
     Get ZIP deflate compressed size (used in APK).
-    APK uses ZIP format with DEFLATE compression.
+    APK uses ZIP format with DEFLATE compression: raw deflate stream, the
+    same as a zipfile member's compressed data.
     """
-    with open(file_path, 'rb') as f:
-        data = f.read()
-    
-    # Create in-memory ZIP with DEFLATE compression (level 9)
-    buffer = io.BytesIO()
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
-        zf.writestr('file', data)
-    
-    # Return compressed size (subtract ZIP overhead ~30 bytes for single file)
-    return max(0, buffer.tell() - 30)
+    return get_streamed_compressed_size(file_path, zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS))
 
 
-def get_lzma_compressed_size(file_path: Path) -> int:
+def get_lzma_compressed_size(file_path: Path, preset: int = LZMA_PRESET) -> int:
     """
     Get LZMA compressed size (approximation for iOS App Store).
     App Store uses proprietary compression similar to LZMA/LZFSE.
     """
-    with open(file_path, 'rb') as f:
-        data = f.read()
-    
-    # Use LZMA with preset 9 (maximum compression)
-    compressed = lzma.compress(data, preset=9)
-    return len(compressed)
+    size = file_path.stat().st_size
+    return get_streamed_compressed_size(file_path, new_region_compressor('lzma', preset, size))
+
 
+CODECS = {
+    'zip': (get_zip_compressed_size, ZIP_LEVEL),
+    'lzma': (get_lzma_compressed_size, LZMA_PRESET),
+}
 
-def get_dir_size_android(dir_path: Path, extensions: List[str] = None) -> Tuple[int, int]:
+
+def file_sha256(file_path: str) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compressed_size(file_path: str, codec: str, level: int) -> int:
+    """Compressed size of one file (runs in a worker process)."""
+    compress, _ = CODECS[codec]
+    return compress(Path(file_path), level)
+
+
+def get_buffer_compressed_size(view: memoryview, compressor) -> int:
+    """Compressed size of an in-memory (e.g. mmap) slice, fed in chunks."""
+    total = 0
+    for start in range(0, len(view), CHUNK_SIZE):
+        total += len(compressor.compress(view[start:start + CHUNK_SIZE]))
+    return total + len(compressor.flush())
+
+
+def lzma_dict_size(size: int) -> int:
+    """LZMA dictionary for `size` bytes of input: larger would not be used."""
+    return max(4096, min(size, LZMA_MAX_DICT))
+
+
+def available_memory() -> Optional[int]:
+    """Bytes this process may still use: the cgroup limit or free RAM."""
+    limits = []
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            value = Path(path).read_text().strip()
+        except OSError:
+            continue
+        if value.isdigit():
+            limits.append(int(value))
+    try:
+        limits.append(os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE'))
+    except (ValueError, OSError, AttributeError):
+        pass
+    return min(limits) if limits else None
+
+
+def default_jobs(codec: str, largest: int) -> int:
+    """Worker processes that fit both the CPUs and the memory (see module docstring)."""
+    jobs = os.cpu_count() or 1
+    memory = available_memory()
+    if codec == 'lzma' and memory is not None:
+        per_worker = int(lzma_dict_size(largest) * LZMA_MEMORY_PER_DICT_BYTE) + CHUNK_SIZE
+        jobs = min(jobs, memory // per_worker)
+    return max(1, jobs)
+
+
+def new_region_compressor(codec: str, level: int, size: int):
     """
-    Get total size and ZIP compressed size for Android (APK).
-    
-    Returns:
-        Tuple of (raw_size, apk_compressed_size)
+    Compressor for one region. LZMA's dictionary is capped at the region
+    size: the output is the same, but small regions do not each allocate
+    the ~700 MB match finder of preset 9.
     """
-    raw_total = 0
-    compressed_total = 0
-    
-    if not dir_path.exists():
-        return 0, 0
-    
-    for file_path in dir_path.rglob('*'):
-        if file_path.is_file():
-            if extensions and file_path.suffix not in extensions:
-                continue
-            size = file_path.stat().st_size
-            raw_total += size
-            compressed_total += get_zip_compressed_size(file_path)
-    
-    return raw_total, compressed_total
+    if codec == 'zip':
+        return zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    dict_size = lzma_dict_size(size)
+    return lzma.LZMACompressor(filters=[{'id': lzma.FILTER_LZMA2, 'preset': level, 'dict_size': dict_size}])
 
 
-def get_dir_size_ios(dir_path: Path, extensions: List[str] = None) -> Tuple[int, int]:
+def breakdown_file(file_path: str, codec: str, level: int,
+                   symbols: int = 0) -> Tuple[List[Tuple[str, str, int, int]], List[Tuple[str, int]]]:
     """
-    Get total size and LZMA compressed size for iOS (App Store).
-    
-    Returns:
-        Tuple of (raw_size, appstore_compressed_size)
+    Split one library into (member, section, raw, compressed) rows, and
+    list its `symbols` largest ELF symbols (runs in a worker process).
     """
-    raw_total = 0
-    compressed_total = 0
-    
+    buf = open_mmap(Path(file_path))
+    view = memoryview(buf)
+    rows = []
+    largest: List[Tuple[str, int]] = []
+    try:
+        for region in describe(buf):
+            data = view[region.offset:region.offset + region.size]
+            compressed = get_buffer_compressed_size(data, new_region_compressor(codec, level, region.size))
+            data.release()
+            rows.append((region.member, region.section, region.size, compressed))
+        if symbols and bytes(buf[:4]) == ELF_MAGIC:
+            elf_symbols = ElfFile(buf).symbols()
+            largest = sorted(((sym.name, sym.size) for sym in elf_symbols if sym.size),
+                             key=lambda item: -item[1])[:symbols]
+    finally:
+        view.release()
+        if hasattr(buf, 'close'):
+            buf.close()
+    return rows, largest
+
+
+class SizeCache:
+    """Compressed sizes keyed by (path, size, mtime, sha256, codec, level)."""
+
+    def __init__(self, path: Optional[Path] = CACHE_FILE):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+                if data.get('version') == CACHE_VERSION:
+                    self.entries = data['entries']
+            except (ValueError, KeyError):
+                pass
+        # Same content under another path (e.g. a copied slice) is a hit too
+        self.by_hash: Dict[str, int] = {
+            f"{e['sha256']}|{e['codec']}|{e['level']}": e['compressed'] for e in self.entries.values()
+        }
+
+    @staticmethod
+    def _key(file_path: Path, codec: str, level: int) -> str:
+        return f'{file_path}|{codec}|{level}'
+
+    def lookup(self, file_path: Path, st: os.stat_result, codec: str, level: int) -> Optional[int]:
+        """Cached size if the file's size and mtime are unchanged."""
+        entry = self.entries.get(self._key(file_path, codec, level))
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            return entry['compressed']
+        return None
+
+    def lookup_hash(self, sha256: str, codec: str, level: int) -> Optional[int]:
+        """Cached size for identical content at any path."""
+        return self.by_hash.get(f'{sha256}|{codec}|{level}')
+
+    def store(self, file_path: Path, st: os.stat_result, sha256: str, codec: str, level: int, compressed: int):
+        self.entries[self._key(file_path, codec, level)] = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha256': sha256,
+            'codec': codec,
+            'level': level,
+            'compressed': compressed,
+        }
+        self.by_hash[f'{sha256}|{codec}|{level}'] = compressed
+
+    def save(self):
+        """Write the cache atomically, dropping entries for deleted files."""
+        if self.path is None:
+            return
+        entries = {k: v for k, v in self.entries.items() if Path(k.split('|', 1)[0]).exists()}
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        tmp.write_text(json.dumps({'version': CACHE_VERSION, 'entries': entries}), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+def measure_files(files: List[Path], codec: str, cache: SizeCache,
+                  jobs: Optional[int] = None) -> Dict[Path, Tuple[int, int]]:
+    """
+    Get (raw_size, compressed_size) for each file.
+
+    Cache misses are hashed and then compressed in a process pool, one task
+    per file.
+    """
+    _, level = CODECS[codec]
+    results: Dict[Path, Tuple[int, int]] = {}
+    stats: Dict[Path, os.stat_result] = {}
+    pending: List[Path] = []
+
+    for file_path in dict.fromkeys(files):
+        st = file_path.stat()
+        stats[file_path] = st
+        cached = cache.lookup(file_path, st, codec, level)
+        if cached is not None:
+            results[file_path] = (st.st_size, cached)
+        else:
+            pending.append(file_path)
+
+    if not pending:
+        return results
+
+    if jobs is None:
+        jobs = default_jobs(codec, max(stats[p].st_size for p in pending))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        hashes = list(pool.map(file_sha256, [str(p) for p in pending]))
+        to_compress = []
+        for file_path, sha256 in zip(pending, hashes):
+            cached = cache.lookup_hash(sha256, codec, level)
+            if cached is not None:
+                cache.store(file_path, stats[file_path], sha256, codec, level, cached)
+                results[file_path] = (stats[file_path].st_size, cached)
+            else:
+                to_compress.append((file_path, sha256))
+
+        futures = [
+            (file_path, sha256, pool.submit(compressed_size, str(file_path), codec, level))
+            for file_path, sha256 in to_compress
+        ]
+        for file_path, sha256, future in futures:
+            compressed = future.result()
+            cache.store(file_path, stats[file_path], sha256, codec, level, compressed)
+            results[file_path] = (stats[file_path].st_size, compressed)
+
+    return results
+
+
+def list_files(dir_path: Path, extensions: List[str] = None) -> List[Path]:
+    """Files under `dir_path` whose suffix is in `extensions` (all if None)."""
     if not dir_path.exists():
-        return 0, 0
-    
-    for file_path in dir_path.rglob('*'):
-        if file_path.is_file():
-            if extensions and file_path.suffix not in extensions:
-                continue
-            size = file_path.stat().st_size
-            raw_total += size
-            compressed_total += get_lzma_compressed_size(file_path)
-    
-    return raw_total, compressed_total
+        return []
+    return [
+        file_path for file_path in dir_path.rglob('*')
+        if file_path.is_file() and (not extensions or file_path.suffix in extensions)
+    ]
 
 
-def analyze_android() -> Dict[str, Tuple[int, int]]:
-    """
-    Analyze Android native libraries by architecture.
-    Uses ZIP deflate compression (same as APK).
-    """
-    results = {}
+def sum_sizes(files: List[Path], sizes: Dict[Path, Tuple[int, int]]) -> Tuple[int, int]:
+    """Total (raw, compressed) of `files`."""
+    return (sum(sizes[f][0] for f in files), sum(sizes[f][1] for f in files))
+
+
+def android_files() -> Dict[str, List[Path]]:
+    """Native libraries of each Android ABI."""
+    files = {}
     
     if not ANDROID_JNILIB.exists():
         print(f"Warning: Android jniLibs not found at {ANDROID_JNILIB}")
-        return results
+        return files
     
     for arch_dir in ANDROID_JNILIB.iterdir():
         if arch_dir.is_dir() and not arch_dir.name.startswith('.'):
             if arch_dir.name in ['arm64-v8a', 'armeabi-v7a', 'x86_64', 'x86']:
-                raw, compressed = get_dir_size_android(arch_dir, ['.so'])
-                results[arch_dir.name] = (raw, compressed)
+                files[arch_dir.name] = list_files(arch_dir, ['.so'])
     
-    return results
+    return files
 
 
-def analyze_ios() -> Dict[str, Tuple[int, int]]:
-    """
-    Analyze iOS frameworks by architecture.
-    Uses LZMA compression (approximation for App Store).
-    """
-    results = {}
+def ios_files() -> Dict[str, List[Path]]:
+    """Library binaries of each iOS xcframework slice."""
+    files = {}
     
     if not IOS_XCFRAMEWORK.exists():
         print(f"Warning: iOS xcframework not found at {IOS_XCFRAMEWORK}")
-        return results
+        return files
     
     for arch_dir in IOS_XCFRAMEWORK.iterdir():
         if arch_dir.is_dir() and arch_dir.name.startswith('ios-'):
-            raw, compressed = get_dir_size_ios(arch_dir, ['.a', '.dylib', ''])
-            # Also count framework binaries (no extension)
+            arch_files = list_files(arch_dir, ['.a', '.dylib', ''])
+            # Also count framework binaries (no extension), which the
+            # listing above usually has already: keep each file once
             for framework_dir in arch_dir.glob('*.framework'):
                 binary = framework_dir / framework_dir.stem
                 if binary.exists():
-                    size = binary.stat().st_size
-                    raw += size
-                    compressed += get_lzma_compressed_size(binary)
-            results[arch_dir.name] = (raw, compressed)
+                    arch_files.append(binary)
+            files[arch_dir.name] = list(dict.fromkeys(arch_files))
     
-    return results
+    return files
+
+
+PLATFORMS = {
+    'android': (android_files, 'zip', ANDROID_JNILIB),
+    'ios': (ios_files, 'lzma', IOS_XCFRAMEWORK),
+}
+
+
+def build_report(cache: SizeCache, jobs: Optional[int] = None) -> Dict:
+    """Raw and compressed sizes per platform, architecture and library."""
+    report = {'version': BASELINE_VERSION, 'platforms': {}}
+    for platform, (list_platform_files, codec, root) in PLATFORMS.items():
+        files = list_platform_files()
+        sizes = measure_files([f for fs in files.values() for f in fs], codec, cache, jobs)
+        archs = {}
+        for arch, arch_files in sorted(files.items()):
+            libraries = {}
+            for file_path in sorted(arch_files):
+                raw, compressed = sizes[file_path]
+                libraries[file_path.relative_to(root / arch).as_posix()] = {'raw': raw, 'compressed': compressed}
+            raw, compressed = sum_sizes(arch_files, sizes)
+            archs[arch] = {'raw': raw, 'compressed': compressed, 'libraries': libraries}
+        report['platforms'][platform] = {'codec': codec, 'level': CODECS[codec][1], 'archs': archs}
+    return report
+
+
+def arch_totals(report: Dict, platform: str) -> Dict[str, Tuple[int, int]]:
+    """{arch: (raw, compressed)} of one platform in a report."""
+    archs = report['platforms'].get(platform, {}).get('archs', {})
+    return {arch: (data['raw'], data['compressed']) for arch, data in archs.items()}
+
+
+def save_baseline(report: Dict, path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    print(f"\nBaseline written: {path}")
+
+
+def format_delta(delta: int) -> str:
+    sign = '+' if delta > 0 else '-' if delta < 0 else ''
+    return f"{sign}{format_size(abs(delta))}"
+
+
+def compare_reports(baseline: Dict, current: Dict, max_bytes: int, max_percent: float) -> List[str]:
+    """
+    Print compressed-size deltas per architecture and library.
+
+    An entry regresses when its compressed size grows by more than
+    `max_bytes` and by more than `max_percent`. Returns the regressions.
+    """
+    regressions = []
+    for platform in sorted(set(baseline['platforms']) | set(current['platforms'])):
+        old_archs = baseline['platforms'].get(platform, {}).get('archs', {})
+        new_archs = current['platforms'].get(platform, {}).get('archs', {})
+        for arch in sorted(set(old_archs) | set(new_archs)):
+            old_arch = old_archs.get(arch, {'raw': 0, 'compressed': 0, 'libraries': {}})
+            new_arch = new_archs.get(arch, {'raw': 0, 'compressed': 0, 'libraries': {}})
+            print(f"\n{platform} {arch}")
+            print(f"  {'Library':<40} {'Baseline':>12} {'Current':>12} {'Delta':>12} {'%':>8}")
+            rows = [(name, old_arch['libraries'].get(name, {}).get('compressed', 0),
+                     new_arch['libraries'].get(name, {}).get('compressed', 0))
+                    for name in sorted(set(old_arch['libraries']) | set(new_arch['libraries']))]
+            rows.append(('TOTAL', old_arch['compressed'], new_arch['compressed']))
+            for name, old, new in rows:
+                delta = new - old
+                percent = (delta / old * 100) if old else (100.0 if new else 0.0)
+                regressed = delta > max_bytes and percent > max_percent
+                marker = '  <-- regression' if regressed else ''
+                print(f"  {name:<40} {format_size(old):>12} {format_size(new):>12} "
+                      f"{format_delta(delta):>12} {percent:>7.1f}%{marker}")
+                if regressed:
+                    regressions.append(f"{platform} {arch} {name}: {format_delta(delta)} ({percent:.1f}%)")
+    return regressions
 
 
 def print_table(title: str, data: Dict[str, Tuple[int, int]], compress_label: str = "Compressed"):
@@ -434,17 +717,101 @@ def print_markdown_table(android_data: Dict, ios_data: Dict):
     print("> Simulator slice is not included in App Store builds.")
 
 
+def print_breakdown(platform: str, files: Dict[str, List[Path]], codec: str,
+                    top: int, symbols: int, jobs: Optional[int] = None):
+    """Print per-library, per-member and per-section sizes."""
+    _, level = CODECS[codec]
+    unique = list(dict.fromkeys(f for fs in files.values() for f in fs))
+    if jobs is None:
+        jobs = default_jobs(codec, max((f.stat().st_size for f in unique), default=0))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {f: pool.submit(breakdown_file, str(f), codec, level, symbols) for f in unique}
+        results = {f: future.result() for f, future in futures.items()}
+
+    for arch, arch_files in sorted(files.items()):
+        print(f"\n{'=' * 90}")
+        print(f" {platform} {arch} - {codec} level {level} (per-region compression)")
+        print(f"{'=' * 90}")
+        for file_path in sorted(arch_files, key=lambda f: -sum(r[2] for r in results[f][0])):
+            rows, largest = results[file_path]
+            raw = sum(r[2] for r in rows)
+            compressed = sum(r[3] for r in rows)
+            print(f"\n{file_path.name:<58} {format_size(raw):>14} {format_size(compressed):>14}")
+
+            members: Dict[str, List[int]] = {}
+            sections: Dict[str, List[int]] = {}
+            for member, section, raw_size, compressed_size in rows:
+                for key, table in ((member, members), (section, sections)):
+                    totals = table.setdefault(key, [0, 0])
+                    totals[0] += raw_size
+                    totals[1] += compressed_size
+
+            if len(members) > 1:
+                print(f"  {'Member':<56} {'Raw':>14} {'Compressed':>14}")
+                for member, (raw_size, compressed_size) in sorted(members.items(), key=lambda i: -i[1][1])[:top]:
+                    print(f"  {member:<56} {format_size(raw_size):>14} {format_size(compressed_size):>14}")
+            print(f"  {'Section':<56} {'Raw':>14} {'Compressed':>14}")
+            for section, (raw_size, compressed_size) in sorted(sections.items(), key=lambda i: -i[1][1])[:top]:
+                print(f"  {section:<56} {format_size(raw_size):>14} {format_size(compressed_size):>14}")
+            if largest:
+                print(f"  {'Symbol':<56} {'Size':>14}")
+                for name, size in largest:
+                    print(f"  {name[:56]:<56} {format_size(size):>14}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Analyze native library sizes for Android and iOS.')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker processes for compression (default: CPU count, fewer if an '
+                             'LZMA worker per CPU, up to ~700 MB each, would not fit in memory)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the size cache')
+    parser.add_argument('--breakdown', action='store_true',
+                        help='Break sizes down by library, archive member and section')
+    parser.add_argument('--top', type=int, default=15, help='Rows per table in --breakdown (default: 15)')
+    parser.add_argument('--symbols', type=int, default=0,
+                        help='Also list the N largest ELF symbols per library in --breakdown')
+    parser.add_argument('--save-baseline', type=Path, nargs='?', const=DEFAULT_BASELINE, metavar='PATH',
+                        help=f'Write sizes per ABI and library as JSON (default: {DEFAULT_BASELINE.relative_to(PROJECT_ROOT)})')
+    parser.add_argument('--compare', type=Path, metavar='BASELINE',
+                        help='Compare against a baseline JSON and exit non-zero on regressions')
+    parser.add_argument('--max-growth-bytes', type=int, default=16 * 1024,
+                        help='Compressed growth in bytes tolerated per library/ABI (default: 16384)')
+    parser.add_argument('--max-growth-percent', type=float, default=1.0,
+                        help='Compressed growth in percent tolerated per library/ABI (default: 1.0)')
+    args = parser.parse_args()
+    
+    if args.breakdown:
+        print_breakdown('Android', android_files(), 'zip', args.top, args.symbols, args.jobs)
+        print_breakdown('iOS', ios_files(), 'lzma', args.top, args.symbols, args.jobs)
+        return
+    
+    cache = SizeCache(None if args.no_cache else CACHE_FILE)
+    
     print("=" * 70)
     print(" libvips_ffi Native Library Size Analysis")
     print(" 原生库大小分析")
     print("=" * 70)
     
-    print("\nAnalyzing Android libraries...")
-    android_data = analyze_android()
+    print("\nAnalyzing Android and iOS libraries...")
+    report = build_report(cache, args.jobs)
+    android_data = arch_totals(report, 'android')
+    ios_data = arch_totals(report, 'ios')
+    
+    cache.save()
+    
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding='utf-8'))
+        regressions = compare_reports(baseline, report, args.max_growth_bytes, args.max_growth_percent)
+        if regressions:
+            print(f"\n{len(regressions)} size regression(s) against {args.compare}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"\nNo size regressions against {args.compare}")
+        return
     
-    print("Analyzing iOS libraries...")
-    ios_data = analyze_ios()
+    if args.save_baseline:
+        save_baseline(report, args.save_baseline)
     
     # Print console tables
     print_table("Android Native Libraries (.so) - ZIP Deflate", android_data, "Download (APK)")
@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Pure-Python readers for ar archives, ELF and Mach-O files.
+
+纯 Python 实现的 ar / ELF / Mach-O 文件解析，无需调用外部命令。
+
+Everything works on a buffer (bytes, mmap or memoryview), so callers can
+mmap a file and slice sections out of it without copying.
+
+Usage:
+    python tools/binary_reader.py path/to/libvips.so
+"""
+
+import mmap
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+AR_MAGIC = b'!<arch>\n'
+ELF_MAGIC = b'\x7fELF'
+
+MH_MAGIC = 0xfeedface
+MH_MAGIC_64 = 0xfeedfacf
+FAT_MAGIC = 0xcafebabe
+FAT_MAGIC_64 = 0xcafebabf
+
+# ELF section types
+SHT_SYMTAB = 2
+SHT_NOBITS = 8
+SHT_DYNSYM = 11
+
+# ELF program header types
+PT_LOAD = 1
+PT_DYNAMIC = 2
+PT_NOTE = 4
+
+# ELF dynamic tags
+DT_NULL = 0
+DT_NEEDED = 1
+DT_STRTAB = 5
+DT_STRSZ = 10
+DT_SONAME = 14
+DT_RPATH = 15
+DT_RUNPATH = 29
+
+NT_GNU_BUILD_ID = 3
+
+ELF_MACHINES = {
+    3: 'i386',
+    40: 'arm',
+    62: 'x86_64',
+    183: 'aarch64',
+    243: 'riscv64',
+}
+
+# Mach-O load commands and section types
+LC_SEGMENT = 0x1
+LC_SEGMENT_64 = 0x19
+LC_UUID = 0x1b
+LC_ID_DYLIB = 0xd
+_MACHO_ZEROFILL = {0x1, 0xc, 0x12}
+
+MACHO_CPU_TYPES = {
+    7: 'i386',
+    0x01000007: 'x86_64',
+    12: 'arm',
+    0x0100000c: 'arm64',
+    0x0200000c: 'arm64_32',
+}
+
+
+class Region(NamedTuple):
+    """A byte range of a file: `member` is the archive member or fat slice."""
+    member: str
+    section: str
+    offset: int
+    size: int
+
+
+@dataclass
+class ArMember:
+    name: str
+    offset: int  # start of member data
+    size: int
+
+
+@dataclass
+class ElfSection:
+    name: str
+    type: int
+    flags: int
+    addr: int
+    offset: int
+    size: int
+    link: int
+    info: int
+    entsize: int
+
+    @property
+    def file_size(self) -> int:
+        return 0 if self.type == SHT_NOBITS else self.size
+
+
+@dataclass
+class ElfSegment:
+    type: int
+    flags: int
+    offset: int
+    vaddr: int
+    filesz: int
+    memsz: int
+
+
+@dataclass
+class ElfDynamic:
+    """The dynamic-linking information a loader needs."""
+    needed: List[str]
+    soname: Optional[str]
+    rpath: List[str]
+    runpath: List[str]
+
+
+@dataclass
+class ElfSymbol:
+    name: str
+    value: int
+    size: int
+    info: int
+    shndx: int
+
+
+class ElfFile:
+    """ELF header and section table of a buffer starting at `base`."""
+
+    def __init__(self, buf, base: int = 0):
+        self.buf = buf
+        self.base = base
+        ident = bytes(buf[base:base + 16])
+        if ident[:4] != ELF_MAGIC:
+            raise ValueError('Not an ELF file')
+        self.is64 = ident[4] == 2
+        self.endian = '<' if ident[5] == 1 else '>'
+        e = self.endian
+        if self.is64:
+            fields = struct.unpack_from(e + 'HHIQQQIHHHHHH', buf, base + 16)
+        else:
+            fields = struct.unpack_from(e + 'HHIIIIIHHHHHH', buf, base + 16)
+        (self.type, self.machine, _, self.entry, self.phoff, self.shoff, self.flags,
+         _, self.phentsize, self.phnum, self.shentsize, shnum, shstrndx) = fields
+        self.sections = self._read_sections(shnum, shstrndx)
+        self.segments = self._read_segments()
+
+    @property
+    def arch(self) -> str:
+        return ELF_MACHINES.get(self.machine, str(self.machine))
+
+    def _read_segments(self) -> List[ElfSegment]:
+        segments = []
+        for i in range(self.phnum if self.phoff else 0):
+            offset = self.base + self.phoff + i * self.phentsize
+            if self.is64:
+                ptype, flags, p_offset, vaddr, _, filesz, memsz, _ = struct.unpack_from(
+                    self.endian + 'IIQQQQQQ', self.buf, offset)
+            else:
+                ptype, p_offset, vaddr, _, filesz, memsz, flags, _ = struct.unpack_from(
+                    self.endian + 'IIIIIIII', self.buf, offset)
+            segments.append(ElfSegment(ptype, flags, p_offset, vaddr, filesz, memsz))
+        return segments
+
+    def vaddr_to_offset(self, vaddr: int) -> Optional[int]:
+        """File offset of a virtual address inside a PT_LOAD segment."""
+        for segment in self.segments:
+            if segment.type == PT_LOAD and segment.vaddr <= vaddr < segment.vaddr + segment.filesz:
+                return vaddr - segment.vaddr + segment.offset
+        return None
+
+    def dynamic_entries(self) -> List[Tuple[int, int]]:
+        """(tag, value) pairs of the PT_DYNAMIC segment, up to DT_NULL."""
+        dynamic = next((s for s in self.segments if s.type == PT_DYNAMIC), None)
+        if dynamic is None:
+            return []
+        fmt = self.endian + ('qQ' if self.is64 else 'iI')
+        entry_size = struct.calcsize(fmt)
+        entries = []
+        for offset in range(dynamic.offset, dynamic.offset + dynamic.filesz - entry_size + 1, entry_size):
+            tag, value = struct.unpack_from(fmt, self.buf, self.base + offset)
+            if tag == DT_NULL:
+                break
+            entries.append((tag, value))
+        return entries
+
+    def dynamic(self) -> ElfDynamic:
+        """DT_NEEDED, DT_SONAME, DT_RPATH and DT_RUNPATH, read without section headers."""
+        entries = self.dynamic_entries()
+        strtab_addr = next((v for t, v in entries if t == DT_STRTAB), None)
+        strsz = next((v for t, v in entries if t == DT_STRSZ), 0)
+        strtab = self.vaddr_to_offset(strtab_addr) if strtab_addr is not None else None
+        if strtab is None:
+            return ElfDynamic([], None, [], [])
+
+        def string(offset: int) -> str:
+            start = self.base + strtab + offset
+            end = self.buf.find(b'\0', start, self.base + strtab + strsz)
+            return bytes(self.buf[start:end if end >= 0 else start]).decode('utf-8', errors='replace')
+
+        def paths(tag: int) -> List[str]:
+            return [p for t, v in entries if t == tag for p in string(v).split(':') if p]
+
+        soname = next((string(v) for t, v in entries if t == DT_SONAME), None)
+        return ElfDynamic([string(v) for t, v in entries if t == DT_NEEDED], soname,
+                          paths(DT_RPATH), paths(DT_RUNPATH))
+
+    def build_id(self) -> Optional[str]:
+        """Hex GNU build-id from the PT_NOTE segments, if present."""
+        for segment in self.segments:
+            if segment.type != PT_NOTE:
+                continue
+            offset = self.base + segment.offset
+            end = offset + segment.filesz
+            while offset + 12 <= end:
+                namesz, descsz, ntype = struct.unpack_from(self.endian + 'III', self.buf, offset)
+                name_start = offset + 12
+                desc_start = name_start + ((namesz + 3) & ~3)
+                if ntype == NT_GNU_BUILD_ID and bytes(self.buf[name_start:name_start + namesz]) == b'GNU\0':
+                    return bytes(self.buf[desc_start:desc_start + descsz]).hex()
+                offset = desc_start + ((descsz + 3) & ~3)
+        return None
+
+    def _section_header(self, index: int) -> ElfSection:
+        fmt = 'IIQQQQIIQQ' if self.is64 else 'IIIIIIIIII'
+        name, stype, flags, addr, offset, size, link, info, _, entsize = struct.unpack_from(
+            self.endian + fmt, self.buf, self.base + self.shoff + index * self.shentsize)
+        return ElfSection(str(name), stype, flags, addr, offset, size, link, info, entsize)
+
+    def _read_sections(self, shnum: int, shstrndx: int) -> List[ElfSection]:
+        if not self.shoff:
+            return []
+        if shnum == 0 or shstrndx == 0xffff:
+            first = self._section_header(0)
+            shnum = shnum or first.size
+            shstrndx = first.link if shstrndx == 0xffff else shstrndx
+        sections = [self._section_header(i) for i in range(shnum)]
+        if shstrndx < len(sections):
+            strtab = sections[shstrndx]
+            for section in sections:
+                section.name = self.string(strtab, int(section.name))
+        return sections
+
+    def string(self, strtab: ElfSection, offset: int) -> str:
+        """NUL-terminated string at `offset` in a string table section."""
+        start = self.base + strtab.offset + offset
+        end = start
+        buf = self.buf
+        limit = self.base + strtab.offset + strtab.size
+        while end < limit and buf[end] != 0:
+            end += 1
+        return bytes(buf[start:end]).decode('utf-8', errors='replace')
+
+    def symbols(self, dynamic: bool = False) -> List[ElfSymbol]:
+        """Entries of .symtab (or .dynsym if `dynamic` or there is no .symtab)."""
+        wanted = [SHT_DYNSYM] if dynamic else [SHT_SYMTAB, SHT_DYNSYM]
+        for stype in wanted:
+            table = next((s for s in self.sections if s.type == stype), None)
+            if table is not None:
+                break
+        else:
+            return []
+        strtab = self.sections[table.link]
+        fmt = self.endian + ('IBBHQQ' if self.is64 else 'IIIBBH')
+        entsize = table.entsize or struct.calcsize(fmt)
+        result = []
+        for i in range(table.size // entsize):
+            fields = struct.unpack_from(fmt, self.buf, self.base + table.offset + i * entsize)
+            if self.is64:
+                name, info, _, shndx, value, size = fields
+            else:
+                name, value, size, info, _, shndx = fields
+            result.append(ElfSymbol(self.string(strtab, name), value, size, info, shndx))
+        return result
+
+
+@dataclass
+class MachOSection:
+    segment: str
+    name: str
+    offset: int  # file offset relative to the Mach-O header
+    size: int
+    flags: int
+
+    @property
+    def file_size(self) -> int:
+        return 0 if (self.flags & 0xff) in _MACHO_ZEROFILL else self.size
+
+
+@dataclass
+class MachOSegment:
+    name: str
+    fileoff: int
+    filesize: int
+    sections: List[MachOSection]
+
+
+@dataclass
+class LoadCommand:
+    cmd: int
+    offset: int  # offset of the command relative to the Mach-O header
+    size: int
+
+
+class MachOFile:
+    """Header, load commands and segments of a thin Mach-O at `base`."""
+
+    def __init__(self, buf, base: int = 0):
+        self.buf = buf
+        self.base = base
+        magic = struct.unpack_from('<I', buf, base)[0]
+        if magic not in (MH_MAGIC, MH_MAGIC_64):
+            raise ValueError('Not a little-endian Mach-O file')
+        self.is64 = magic == MH_MAGIC_64
+        (_, self.cputype, self.cpusubtype, self.filetype, self.ncmds,
+         self.sizeofcmds, self.flags) = struct.unpack_from('<IiiIIII', buf, base)
+        self.header_size = 32 if self.is64 else 28
+        self.commands: List[LoadCommand] = []
+        self.segments: List[MachOSegment] = []
+
+        offset = self.header_size
+        for _ in range(self.ncmds):
+            cmd, cmdsize = struct.unpack_from('<II', buf, base + offset)
+            self.commands.append(LoadCommand(cmd, offset, cmdsize))
+            if cmd in (LC_SEGMENT, LC_SEGMENT_64):
+                self.segments.append(self._segment(offset, cmd == LC_SEGMENT_64))
+            offset += cmdsize
+
+    @property
+    def arch(self) -> str:
+        return MACHO_CPU_TYPES.get(self.cputype & 0xffffffff, str(self.cputype))
+
+    def uuid(self) -> Optional[str]:
+        """LC_UUID as hex (the Mach-O counterpart of a GNU build-id)."""
+        for command in self.commands:
+            if command.cmd == LC_UUID:
+                start = self.base + command.offset + 8
+                return bytes(self.buf[start:start + 16]).hex()
+        return None
+
+    def install_name(self) -> Optional[str]:
+        """LC_ID_DYLIB name of a dylib (its counterpart of DT_SONAME)."""
+        for command in self.commands:
+            if command.cmd == LC_ID_DYLIB:
+                start = self.base + command.offset
+                name_offset = struct.unpack_from('<I', self.buf, start + 8)[0]
+                return _cstr(bytes(self.buf[start + name_offset:start + command.size]))
+        return None
+
+    def _segment(self, offset: int, is64: bool) -> MachOSegment:
+        buf, base = self.buf, self.base
+        if is64:
+            _, _, segname, _, _, fileoff, filesize, _, _, nsects, _ = struct.unpack_from(
+                '<II16sQQQQiiII', buf, base + offset)
+            sect_fmt, sect_off, sect_size = '<16s16sQQIIIIIIII', 72, 80
+        else:
+            _, _, segname, _, _, fileoff, filesize, _, _, nsects, _ = struct.unpack_from(
+                '<II16sIIIIiiII', buf, base + offset)
+            sect_fmt, sect_off, sect_size = '<16s16sIIIIIIIII', 56, 68
+        sections = []
+        for i in range(nsects):
+            fields = struct.unpack_from(sect_fmt, buf, base + offset + sect_off + i * sect_size)
+            sectname, sect_seg, _, size, sect_fileoff = fields[:5]
+            flags = fields[8]
+            sections.append(MachOSection(_cstr(sect_seg), _cstr(sectname), sect_fileoff, size, flags))
+        return MachOSegment(_cstr(segname), fileoff, filesize, sections)
+
+
+def _cstr(raw: bytes) -> str:
+    return raw.split(b'\0', 1)[0].decode('utf-8', errors='replace')
+
+
+def fat_slices(buf, base: int = 0) -> Optional[List[Tuple[str, int, int]]]:
+    """[(arch, offset, size)] of a universal binary, or None if not fat."""
+    if len(buf) - base < 8:
+        return None
+    magic, nfat = struct.unpack_from('>II', buf, base)
+    if magic not in (FAT_MAGIC, FAT_MAGIC_64) or nfat > 32:  # 0xcafebabe is also a Java class
+        return None
+    slices = []
+    offset = base + 8
+    for _ in range(nfat):
+        if magic == FAT_MAGIC:
+            cputype, _, slice_off, size, _ = struct.unpack_from('>iiIII', buf, offset)
+            offset += 20
+        else:
+            cputype, _, slice_off, size, _, _ = struct.unpack_from('>iiQQII', buf, offset)
+            offset += 32
+        slices.append((MACHO_CPU_TYPES.get(cputype & 0xffffffff, str(cputype)), base + slice_off, size))
+    return slices
+
+
+def iter_ar_members(buf, base: int = 0, end: Optional[int] = None) -> Iterator[ArMember]:
+    """Members of an ar archive (GNU and BSD long names supported)."""
+    end = len(buf) if end is None else end
+    offset = base + len(AR_MAGIC)
+    long_names = b''
+    while offset + 60 <= end:
+        header = bytes(buf[offset:offset + 60])
+        name = header[:16].decode('utf-8', errors='replace').rstrip()
+        size = int(header[48:58].decode().strip() or 0)
+        data = offset + 60
+        data_size = size
+        if name.startswith('#1/'):  # BSD: name follows the header
+            name_len = int(name[3:])
+            name = bytes(buf[data:data + name_len]).split(b'\0', 1)[0].decode('utf-8', errors='replace')
+            data += name_len
+            data_size -= name_len
+        elif name == '//':  # GNU long name table
+            long_names = bytes(buf[data:data + size])
+        elif name.startswith('/') and name[1:].isdigit():
+            start = int(name[1:])
+            name = long_names[start:long_names.index(b'\n', start)].decode('utf-8', errors='replace')
+        name = name[:-1] if name.endswith('/') and name not in ('/', '//') else name
+        yield ArMember(name, data, data_size)
+        offset += 60 + size + (size & 1)
+
+
+def _object_regions(buf, member: str, start: int, size: int) -> List[Region]:
+    """Section regions of one ELF or Mach-O object; the gaps are '[other]'."""
+    regions = []
+    head = bytes(buf[start:start + 4])
+    try:
+        if head == ELF_MAGIC:
+            elf = ElfFile(buf, start)
+            for section in elf.sections:
+                if section.file_size and section.name:
+                    regions.append(Region(member, section.name, start + section.offset, section.file_size))
+        elif len(head) == 4 and struct.unpack('<I', head)[0] in (MH_MAGIC, MH_MAGIC_64):
+            macho = MachOFile(buf, start)
+            for segment in macho.segments:
+                if segment.sections:
+                    for section in segment.sections:
+                        if section.file_size:
+                            regions.append(Region(member, f'{section.segment},{section.name}',
+                                                  start + section.offset, section.file_size))
+                elif segment.filesize:
+                    regions.append(Region(member, segment.name, start + segment.fileoff, segment.filesize))
+    except (struct.error, ValueError, IndexError):
+        regions = []
+
+    # Sections may overlap (or a segment its sections); '[other]' is every
+    # byte of the object that no region covers
+    end = start + size
+    position = start
+    for offset, length in sorted((r.offset, r.size) for r in regions):
+        offset, region_end = max(offset, start), min(offset + length, end)
+        if offset > position:
+            regions.append(Region(member, '[other]', position, offset - position))
+        position = max(position, region_end)
+    if position < end:
+        regions.append(Region(member, '[other]', position, end - position))
+    return regions
+
+
+def describe(buf, base: int = 0, size: Optional[int] = None, member: str = '') -> List[Region]:
+    """
+    Break a file down into regions: archive members and fat slices are
+    opened recursively, objects are split by section.
+    """
+    size = len(buf) - base if size is None else size
+    if bytes(buf[base:base + len(AR_MAGIC)]) == AR_MAGIC:
+        regions = []
+        for m in iter_ar_members(buf, base, base + size):
+            regions.extend(describe(buf, m.offset, m.size, f'{member}/{m.name}' if member else m.name))
+        return regions
+    slices = fat_slices(buf, base)
+    if slices is not None:
+        regions = []
+        for arch, offset, slice_size in slices:
+            regions.extend(describe(buf, offset, slice_size, f'{member}[{arch}]' if member else f'[{arch}]'))
+        return regions
+    return _object_regions(buf, member, base, size)
+
+
+def open_mmap(path: Path):
+    """Read-only mmap of a file (an empty bytes object for empty files)."""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def read_build_id(path: Path) -> Optional[str]:
+    """GNU build-id of an ELF file or LC_UUID(s) of a Mach-O file, if any."""
+    try:
+        buf = open_mmap(path)
+    except OSError:
+        return None
+    try:
+        magic = bytes(buf[:4])
+        if magic == ELF_MAGIC:
+            return ElfFile(buf).build_id()
+        slices = fat_slices(buf)
+        if slices is not None:
+            uuids = [f'{arch}:{MachOFile(buf, offset).uuid()}' for arch, offset, _ in slices]
+            return ','.join(uuids)
+        if magic in (MH_MAGIC.to_bytes(4, 'little'), MH_MAGIC_64.to_bytes(4, 'little')):
+            return MachOFile(buf).uuid()
+        return None
+    except (struct.error, ValueError, IndexError):
+        return None
+    finally:
+        if hasattr(buf, 'close'):
+            buf.close()
+
+
+def main():
+    for arg in sys.argv[1:]:
+        buf = open_mmap(Path(arg))
+        print(arg)
+        for region in sorted(describe(buf), key=lambda r: -r.size)[:40]:
+            print(f'  {region.size:>12}  {region.member or "-":<30} {region.section}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Incremental, parallel copying of native libraries into a bundle directory.
+
+增量并行复制库文件：内容未变则跳过，优先 reflink（硬链接需显式开启），并保留版本化的符号链接链。
+
+For each file the cheapest safe method is used:
+
+1. skip: the destination already holds identical content (same inode, or
+   same size and SHA-256)
+2. reflink: copy-on-write clone (FICLONE; Btrfs, XFS, ...)
+3. hardlink: only when the caller opts in (`allow_hardlinks`,
+   `--allow-hardlinks`). A hardlink shares the inode of the system or
+   Homebrew library, so a later in-place edit or upgrade changes both.
+4. copy_file_range / sendfile: in-kernel copy, then shutil as a last resort
+
+Files are written to a temporary name and renamed into place, so a
+hardlinked destination is never modified through its other links. Without
+hardlinks, a destination still hardlinked to its source by an earlier run
+is copied again.
+Versioned symlink chains (libz.so.1 -> libz.so.1.3.1) are recreated as
+relative symlinks instead of being copied once per name.
+
+Usage:
+    python tools/copy_engine.py /usr/lib/x86_64-linux-gnu/libz.so.1 output/libs/
+"""
+
+import argparse
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+CHUNK_SIZE = 1024 * 1024
+
+# Errors meaning "this method is not available here", not "the copy failed"
+_UNSUPPORTED = {errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.ENOTSUP,
+                errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EMLINK, errno.EACCES}
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def symlink_chain(path: Path) -> Tuple[List[Tuple[str, str]], Path]:
+    """
+    Follow `path` through its symlinks.
+
+    Returns ([(link name, target name)], real file). Only file names are
+    kept, so the chain can be rebuilt as relative links in one directory.
+    """
+    links: List[Tuple[str, str]] = []
+    seen = set()
+    current = path
+    while current.is_symlink() and current not in seen:
+        seen.add(current)
+        target = current.parent / os.readlink(current)
+        if target.name != current.name:
+            links.append((current.name, target.name))
+        current = target
+    return links, current.resolve()
+
+
+@dataclass
+class CopyResult:
+    files: List[Path] = field(default_factory=list)  # regular files in the destination
+    symlinks: Dict[str, str] = field(default_factory=dict)  # name -> target name
+    methods: Counter = field(default_factory=Counter)  # method -> number of files
+
+
+class CopyEngine:
+    """Copies files into `dest` with the cheapest method that works."""
+
+    def __init__(self, dest: Path, allow_hardlinks: bool = False, jobs: Optional[int] = None):
+        self.dest = Path(dest)
+        self.allow_hardlinks = allow_hardlinks
+        self.jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+        # Methods that failed once are not tried again for this destination
+        self._disabled = set()
+        self._lock = threading.Lock()
+
+    def _disable(self, method: str):
+        with self._lock:
+            self._disabled.add(method)
+
+    def _tmp_name(self, dst: Path) -> Path:
+        return dst.with_name(f'.{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+    def is_unchanged(self, src: Path, dst: Path) -> bool:
+        """Whether `dst` already holds the content of `src`.
+
+        A hardlink to `src` left by an earlier run only counts when hardlinks
+        are allowed; otherwise it is copied again to break the link, so that
+        editing `dst` in place cannot modify the original.
+        """
+        if dst.is_symlink() or not dst.is_file():
+            return False
+        src_st, dst_st = src.stat(), dst.stat()
+        if (src_st.st_dev, src_st.st_ino) == (dst_st.st_dev, dst_st.st_ino):
+            return self.allow_hardlinks
+        return src_st.st_size == dst_st.st_size and file_sha256(src) == file_sha256(dst)
+
+    def _reflink(self, src: Path, tmp: Path) -> bool:
+        if fcntl is None or 'reflink' in self._disabled:
+            return False
+        with open(src, 'rb') as fsrc, open(tmp, 'wb') as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED:
+                    raise
+                self._disable('reflink')
+                cloned = False
+            else:
+                cloned = True
+        if not cloned:
+            tmp.unlink()
+            return False
+        shutil.copystat(src, tmp)
+        return True
+
+    def _hardlink(self, src: Path, tmp: Path) -> bool:
+        if not self.allow_hardlinks or 'hardlink' in self._disabled:
+            return False
+        try:
+            os.link(src, tmp)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            self._disable('hardlink')
+            return False
+        return True
+
+    def _kernel_copy(self, src: Path, tmp: Path) -> str:
+        """copy_file_range, then sendfile, then a plain read/write loop."""
+        with open(src, 'rb') as fsrc, open(tmp, 'wb') as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            for method in ('copy_file_range', 'sendfile'):
+                if method in self._disabled or not hasattr(os, method):
+                    continue
+                copy = getattr(os, method)
+                offset = 0
+                try:
+                    while offset < size:
+                        if method == 'copy_file_range':
+                            sent = copy(fsrc.fileno(), fdst.fileno(), size - offset, offset, offset)
+                        else:
+                            sent = copy(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                        if sent == 0:
+                            break
+                        offset += sent
+                except OSError as e:
+                    if e.errno not in _UNSUPPORTED or offset:
+                        raise
+                    self._disable(method)
+                    continue
+                if offset == size:
+                    break
+                fdst.seek(0)
+                fdst.truncate()
+            else:
+                method = 'copy'
+                fsrc.seek(0)
+                shutil.copyfileobj(fsrc, fdst, CHUNK_SIZE)
+        shutil.copystat(src, tmp)
+        return method
+
+    def copy_file(self, src: Path, dst: Path) -> str:
+        """Copy one regular file; returns the method used ('unchanged' if skipped)."""
+        if self.is_unchanged(src, dst):
+            return 'unchanged'
+        tmp = self._tmp_name(dst)
+        try:
+            if self._reflink(src, tmp):
+                method = 'reflink'
+            elif self._hardlink(src, tmp):
+                method = 'hardlink'
+            else:
+                method = self._kernel_copy(src, tmp)
+            os.replace(tmp, dst)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return method
+
+    def link(self, name: str, target: str) -> str:
+        """Create dest/name -> target; falls back to a copy where symlinks are not allowed."""
+        dst = self.dest / name
+        if dst.is_symlink() and os.readlink(dst) == target:
+            return 'unchanged'
+        tmp = self._tmp_name(dst)
+        try:
+            os.symlink(target, tmp)
+        except OSError:  # e.g. Windows without the symlink privilege
+            return self.copy_file(self.dest / target, dst)
+        os.replace(tmp, dst)
+        return 'symlink'
+
+    def copy_all(self, libraries: Dict[str, str]) -> CopyResult:
+        """
+        Copy {name: path} into dest, preserving symlink chains.
+
+        Each real file is copied once, under its own name; the names that
+        lead to it become relative symlinks.
+        """
+        self.dest.mkdir(parents=True, exist_ok=True)
+        real_files: Dict[Path, str] = {}
+        links: Dict[str, str] = {}
+        for name, path in libraries.items():
+            src = Path(path)
+            if not src.exists():
+                continue
+            chain, real = symlink_chain(src)
+            if chain and chain[0][0] != name:
+                chain.insert(0, (name, chain[0][0]))
+            elif not chain and real.name != name:
+                chain = [(name, real.name)]
+            real_files.setdefault(real, real.name)
+            for link_name, target in chain:
+                if link_name != real.name:
+                    links.setdefault(link_name, target)
+
+        result = CopyResult()
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            futures = {pool.submit(self.copy_file, src, self.dest / name): name
+                       for src, name in real_files.items()}
+            for future, name in futures.items():
+                result.methods[future.result()] += 1
+                result.files.append(self.dest / name)
+
+        # Links last, so the fallback copy finds its target
+        for name, target in sorted(links.items()):
+            result.methods[self.link(name, target)] += 1
+            result.symlinks[name] = target
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Copy libraries into a bundle directory incrementally.')
+    parser.add_argument('sources', nargs='+', help='Library files (symlinks are preserved)')
+    parser.add_argument('dest', help='Destination directory')
+    parser.add_argument('--allow-hardlinks', action='store_true',
+                        help='Hardlink when reflink is unavailable (copies must never be modified)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Parallel copies')
+    args = parser.parse_args()
+
+    engine = CopyEngine(Path(args.dest), allow_hardlinks=args.allow_hardlinks, jobs=args.jobs)
+    result = engine.copy_all({Path(s).name: s for s in args.sources})
+    print(', '.join(f'{method}: {count}' for method, count in sorted(result.methods.items())))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+In-process ELF dependency resolution (a replacement for `ldd`).
+
+在进程内解析 ELF 的 DT_NEEDED / DT_RPATH / DT_RUNPATH，并按动态链接器的规则查找依赖，
+不运行动态链接器，也可用于交叉架构的 sysroot。
+
+Libraries are found in the same order as glibc's ld.so: DT_RPATH (only if
+there is no DT_RUNPATH), LD_LIBRARY_PATH, DT_RUNPATH, /etc/ld.so.cache
+(parsed directly), then the default directories. Candidates whose ELF
+class or machine differs from the requesting library are skipped, as
+ld.so does.
+
+Usage:
+    python tools/elf_deps.py /usr/lib/x86_64-linux-gnu/libvips.so.42
+"""
+
+import glob
+import os
+import struct
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from binary_reader import ELF_MAGIC, ElfFile, open_mmap
+
+LD_SO_CACHE = 'etc/ld.so.cache'
+LD_SO_CONF = 'etc/ld.so.conf'
+
+_OLD_CACHE_MAGIC = b'ld.so-1.7.0'
+_NEW_CACHE_MAGIC = b'glibc-ld.so.cache1.1'
+
+DEFAULT_DIRS_64 = ['lib64', 'usr/lib64', 'lib', 'usr/lib']
+DEFAULT_DIRS_32 = ['lib', 'usr/lib']
+
+
+def _cstring(data: bytes, offset: int) -> str:
+    end = data.find(b'\0', offset)
+    return data[offset:end if end >= 0 else len(data)].decode('utf-8', errors='replace')
+
+
+def parse_ld_so_cache(data: bytes) -> Dict[str, List[str]]:
+    """
+    {soname: [paths]} from the contents of an ld.so.cache file.
+
+    Both the new glibc format and the old format (alone or followed by a
+    new-format table) are understood; the new table wins when present.
+    """
+    entries: Dict[str, List[str]] = {}
+    new_start = None
+
+    if data.startswith(_OLD_CACHE_MAGIC):
+        nlibs = struct.unpack_from('<I', data, 12)[0]
+        old_end = 16 + nlibs * 12
+        new_start = (old_end + 7) & ~7
+        if not data.startswith(_NEW_CACHE_MAGIC, new_start):
+            strings = old_end
+            for i in range(nlibs):
+                _, key, value = struct.unpack_from('<iII', data, 16 + i * 12)
+                entries.setdefault(_cstring(data, strings + key), []).append(_cstring(data, strings + value))
+            return entries
+    elif data.startswith(_NEW_CACHE_MAGIC):
+        new_start = 0
+    else:
+        return entries
+
+    nlibs = struct.unpack_from('<I', data, new_start + 20)[0]
+    for i in range(nlibs):
+        _, key, value, _, _ = struct.unpack_from('<iIIIQ', data, new_start + 48 + i * 24)
+        entries.setdefault(_cstring(data, new_start + key), []).append(_cstring(data, new_start + value))
+    return entries
+
+
+def parse_ld_so_conf(root: Path, conf: str = LD_SO_CONF, seen: Optional[set] = None) -> List[str]:
+    """Library directories listed in ld.so.conf (following `include`), as target paths."""
+    seen = seen if seen is not None else set()
+    path = root / conf.lstrip('/')
+    if path in seen:
+        return []
+    seen.add(path)
+    try:
+        lines = path.read_text(encoding='utf-8', errors='replace').splitlines()
+    except OSError:
+        return []
+    dirs: List[str] = []
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith('include'):
+            for pattern in line.split()[1:]:
+                if not os.path.isabs(pattern):
+                    pattern = os.path.join(os.path.dirname('/' + conf.lstrip('/')), pattern)
+                for included in sorted(glob.glob(str(root / pattern.lstrip('/')))):
+                    dirs.extend(parse_ld_so_conf(root, '/' + os.path.relpath(included, root), seen))
+        elif line.startswith('hwcap'):
+            continue
+        else:
+            dirs.append(line)
+    return dirs
+
+
+@dataclass
+class ElfInfo:
+    """What the resolver needs to know about one ELF file."""
+    path: str
+    arch: str
+    is64: bool
+    needed: List[str]
+    soname: Optional[str]
+    rpath: List[str]
+    runpath: List[str]
+    build_id: Optional[str]
+
+
+def read_elf_info(path: str) -> Optional[ElfInfo]:
+    """Parse one ELF file via mmap; None if it is not an ELF file."""
+    try:
+        buf = open_mmap(Path(path))
+    except OSError:
+        return None
+    try:
+        if bytes(buf[:4]) != ELF_MAGIC:
+            return None
+        elf = ElfFile(buf)
+        dynamic = elf.dynamic()
+        return ElfInfo(path, elf.arch, elf.is64, dynamic.needed, dynamic.soname,
+                       dynamic.rpath, dynamic.runpath, elf.build_id())
+    except (struct.error, ValueError, IndexError):
+        return None
+    finally:
+        if hasattr(buf, 'close'):
+            buf.close()
+
+
+class ElfResolver:
+    """
+    Resolves DT_NEEDED names the way ld.so does, inside `root`.
+
+    With the default root ('/') this mirrors the host; any other root is
+    treated as a sysroot: absolute search paths, RPATHs and ld.so.cache
+    entries are all looked up below it.
+    """
+
+    def __init__(self, root: str = '/', library_path: Optional[List[str]] = None,
+                 extra_dirs: Optional[List[str]] = None):
+        self.root = Path(root)
+        if library_path is None and self.is_host:
+            library_path = [p for p in os.environ.get('LD_LIBRARY_PATH', '').split(':') if p]
+        self.library_path = library_path or []
+        self.extra_dirs = extra_dirs or []
+        self.cache = self._load_cache()
+        # An extracted root may have no (or a stale) ld.so.cache, so the
+        # directories ldconfig would have cached are searched as well.
+        self.conf_dirs = [] if self.is_host else parse_ld_so_conf(self.root)
+        self._info: Dict[str, Optional[ElfInfo]] = {}
+
+    @property
+    def is_host(self) -> bool:
+        return self.root == Path('/')
+
+    def _load_cache(self) -> Dict[str, List[str]]:
+        try:
+            return parse_ld_so_cache((self.root / LD_SO_CACHE).read_bytes())
+        except OSError:
+            return {}
+
+    def _in_root(self, path: str) -> Path:
+        """Map an absolute path inside the target system to the real file system."""
+        if self.is_host or not os.path.isabs(path):
+            return Path(path)
+        return self.root / path.lstrip('/')
+
+    def target_path(self, path: str) -> str:
+        """Inverse of _in_root: the absolute path a file has inside the target."""
+        if self.is_host:
+            return path
+        try:
+            return '/' + Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return path
+
+    def info(self, path: str) -> Optional[ElfInfo]:
+        """Memoised read_elf_info."""
+        if path not in self._info:
+            self._info[path] = read_elf_info(path)
+        return self._info[path]
+
+    def _expand(self, entry: str, origin: str, is64: bool) -> str:
+        return (entry.replace('${ORIGIN}', origin).replace('$ORIGIN', origin)
+                .replace('${LIB}', 'lib64' if is64 else 'lib').replace('$LIB', 'lib64' if is64 else 'lib'))
+
+    def _matches(self, candidate: Path, parent: ElfInfo) -> bool:
+        if not candidate.is_file():
+            return False
+        info = self.info(str(candidate))
+        return info is not None and info.arch == parent.arch and info.is64 == parent.is64
+
+    def search_dirs(self, parent: ElfInfo) -> List[Tuple[str, Path]]:
+        """(source, directory) in ld.so search order, cache excluded."""
+        origin = str(Path(parent.path).parent)
+        dirs: List[Tuple[str, Path]] = []
+
+        def add(source: str, entries: List[str], in_target: bool):
+            for entry in entries:
+                expanded = self._expand(entry, origin, parent.is64)
+                # $ORIGIN already expands to a real directory
+                if in_target and 'ORIGIN' not in entry:
+                    dirs.append((source, self._in_root(expanded)))
+                else:
+                    dirs.append((source, Path(expanded)))
+
+        if not parent.runpath:
+            add('rpath', parent.rpath, True)
+        add('LD_LIBRARY_PATH', self.library_path, False)
+        add('runpath', parent.runpath, True)
+        return dirs
+
+    def default_dirs(self, is64: bool) -> List[Path]:
+        """ld.so.conf directories (sysroots only), defaults, then extra_dirs."""
+        defaults = DEFAULT_DIRS_64 if is64 else DEFAULT_DIRS_32
+        return ([self._in_root(d) for d in self.conf_dirs] + [self.root / d for d in defaults]
+                + [Path(d) for d in self.extra_dirs])
+
+    def resolve(self, name: str, parent: ElfInfo) -> Optional[str]:
+        """Path of DT_NEEDED `name` requested by `parent`, or None."""
+        if '/' in name:
+            candidate = self._in_root(self._expand(name, str(Path(parent.path).parent), parent.is64))
+            return str(candidate) if self._matches(candidate, parent) else None
+
+        for _, directory in self.search_dirs(parent):
+            candidate = directory / name
+            if self._matches(candidate, parent):
+                return str(candidate)
+        for cached in self.cache.get(name, []):
+            candidate = self._in_root(cached)
+            if self._matches(candidate, parent):
+                return str(candidate)
+        for directory in self.default_dirs(parent.is64):
+            candidate = directory / name
+            if self._matches(candidate, parent):
+                return str(candidate)
+        return None
+
+    def find_in_cache(self, prefix: str) -> List[str]:
+        """Cached library paths whose soname starts with `prefix` (like `ldconfig -p | grep`)."""
+        return [str(self._in_root(p)) for name, paths in sorted(self.cache.items())
+                if name.startswith(prefix) for p in paths]
+
+    def dependencies(self, path: str) -> Tuple[List[str], List[str]]:
+        """(resolved paths, unresolved names) of one library's DT_NEEDED entries."""
+        info = self.info(path)
+        if info is None:
+            return [], []
+        resolved, missing = [], []
+        for name in info.needed:
+            dep = self.resolve(name, info)
+            if dep is None:
+                missing.append(name)
+            else:
+                resolved.append(dep)
+        return resolved, missing
+
+
+def main():
+    resolver = ElfResolver()
+    for arg in sys.argv[1:]:
+        info = resolver.info(arg)
+        if info is None:
+            print(f'{arg}: not an ELF file')
+            continue
+        print(f'{arg} ({info.arch}, {"64" if info.is64 else "32"}-bit)')
+        for name in info.needed:
+            print(f'  {name} => {resolver.resolve(name, info) or "not found"}')
+
+
+if __name__ == '__main__':
+    main()
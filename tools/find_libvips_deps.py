@@ -6,7 +6,8 @@ Find libvips library and all its dependencies.
 
 Supports:
 - macOS: Homebrew, MacPorts (arm64/x86_64)
-- Linux: apt, dnf, pacman (x86_64/aarch64)
+- Linux: apt, dnf, pacman (x86_64/aarch64), ELF parsed in-process (no ldd)
+- Sysroots: extracted Debian/Fedora roots, Android NDK sysroot or jniLibs (any arch, offline)
 - Windows: vcpkg, Chocolatey, official releases (x64)
 
 Usage:
@@ -16,27 +17,54 @@ Usage:
     # Export to JSON
     python tools/find_libvips_deps.py --output output/libvips_deps.json
     
-    # Copy libraries to directory
+    # Copy libraries to directory (also writes metadata.json and manifest.json
+    # with hashes, sonames, needed edges and the load order)
     python tools/find_libvips_deps.py --copy-to output/libs/
     
     # Copy and fix library paths (macOS)
     python tools/find_libvips_deps.py --copy-to output/libs/ --fix-paths
     
+    # Offline, cross-arch: resolve inside an extracted root (no ldd/otool)
+    python tools/find_libvips_deps.py --sysroot rootfs-arm64/ --arch aarch64
+    
     # Generate shell script for copying
     python tools/find_libvips_deps.py --generate-script output/copy_libs.sh
+
+The resolved graph is cached in tools/.libvips_deps_cache.json; later runs
+only re-resolve libraries whose size, mtime or build-id changed, and
+nothing is reused once the resolution inputs (ld.so.cache, LD_LIBRARY_PATH,
+Homebrew opt/ links) change.
 """
 
 import argparse
+import hashlib
 import json
 import os
 import platform
 import re
-import shutil
 import stat
 import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+from binary_reader import ELF_MAGIC, MH_MAGIC, MH_MAGIC_64, MachOFile, fat_slices, open_mmap, read_build_id
+from copy_engine import CopyEngine, file_sha256, symlink_chain
+from elf_deps import ElfResolver, read_elf_info
+from prune_deps import analyze as analyze_pruning, binding_symbols, print_report as print_prune_report
+
+# Project root
+SCRIPT_DIR = Path(__file__).parent
+
+DEPS_CACHE_FILE = SCRIPT_DIR / '.libvips_deps_cache.json'
+DEPS_CACHE_VERSION = 3
+
+MANIFEST_FILE = 'manifest.json'
+MANIFEST_VERSION = 1
+
 
 def get_platform() -> str:
     """Get current platform."""
@@ -66,47 +94,270 @@ def run_command(cmd: List[str], check: bool = False) -> Tuple[int, str, str]:
         return e.returncode, e.stdout, e.stderr
 
 
+class ResolutionCache:
+    """
+    Thread-safe memo of find_dependencies() results, optionally kept on disk.
+    
+    Entries are keyed by library path and record the real path, size, inode,
+    mtime and build-id (GNU build-id / LC_UUID). A later run revalidates an
+    entry with one stat; if the stat changed but the build-id did not (a
+    copy or a touch), the entry is still reused. An entry whose dependencies
+    disappeared, or that was resolved in another context (the finder's
+    fingerprint of ld.so.cache, LD_LIBRARY_PATH or the Homebrew opt/ links),
+    is resolved again: an old Homebrew keg stays on disk until
+    `brew cleanup`, so existence alone does not mean it is still current.
+    
+    Discovery results (libvips path, Homebrew prefix) are kept as well, so
+    `ldconfig`, `pkg-config` and `brew` are not run again while they hold.
+    They are stored as discovered (e.g. through an opt/ link) and reused
+    only while that path still resolves to the same file.
+    One instance can be shared by several finders (arches, package managers).
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self.discovery: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._stats: Dict[str, Optional[os.stat_result]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+                if data.get('version') == DEPS_CACHE_VERSION:
+                    self.entries = data['entries']
+                    self.discovery = data['discovery']
+            except (ValueError, KeyError):
+                pass
+    
+    def stat(self, lib_path: str) -> Optional[os.stat_result]:
+        """os.stat() once per path and run; None if the file is missing."""
+        if lib_path not in self._stats:
+            try:
+                self._stats[lib_path] = os.stat(lib_path)
+            except OSError:
+                self._stats[lib_path] = None
+        return self._stats[lib_path]
+    
+    @staticmethod
+    def _same_file(entry: Dict, st: os.stat_result) -> bool:
+        return (entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+                and entry['inode'] == st.st_ino)
+    
+    def get(self, lib_path: str, context: str = '') -> Optional[Tuple[List[str], List[str]]]:
+        """Cached (dependencies, unresolved names) if the library and all its
+        dependencies still hold and they were resolved in the same `context`."""
+        st = self.stat(lib_path)
+        with self._lock:
+            entry = self.entries.get(lib_path)
+        if st is None or entry is None or entry['context'] != context:
+            deps = None
+        elif self._same_file(entry, st):
+            deps = entry['deps']
+        elif entry['build_id'] and read_build_id(Path(lib_path)) == entry['build_id']:
+            entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns, inode=st.st_ino)
+            deps = entry['deps']
+        else:
+            deps = None
+        if deps is not None and any(self.stat(d) is None for d in deps):
+            deps = None
+        with self._lock:
+            if deps is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return None if deps is None else (deps, entry['missing'])
+    
+    def put(self, lib_path: str, deps: List[str], context: str = '', missing: List[str] = ()):
+        st = self.stat(lib_path)
+        if st is None:
+            return
+        entry = {
+            'context': context,
+            'realpath': os.path.realpath(lib_path),
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'inode': st.st_ino,
+            'build_id': read_build_id(Path(lib_path)),
+            'deps': deps,
+            'missing': list(missing),
+        }
+        with self._lock:
+            self.entries[lib_path] = entry
+    
+    def remember(self, scope: str, key: str, compute) -> Optional[str]:
+        """
+        Cached discovery value for (scope, key), else compute().
+        
+        compute() returns the value, or (path as discovered, value) when the
+        value was resolved from a path that can be repointed, such as
+        /opt/homebrew/opt/vips/lib/libvips.dylib. The value is reused while
+        the discovered path resolves to the same real path.
+        """
+        record = self.discovery.get(scope, {}).get(key)
+        if (record is not None and os.path.exists(record['source'])
+                and os.path.realpath(record['source']) == record['realpath']):
+            return record['value']
+        result = compute()
+        if result is None:
+            return None
+        source, value = result if isinstance(result, tuple) else (result, result)
+        self.discovery.setdefault(scope, {})[key] = {
+            'source': source,
+            'realpath': os.path.realpath(source),
+            'value': value,
+        }
+        return value
+    
+    def save(self):
+        """Write the cache atomically, dropping entries for deleted files."""
+        if self.path is None:
+            return
+        entries = {k: v for k, v in self.entries.items() if self.stat(k) is not None}
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        tmp.write_text(json.dumps({
+            'version': DEPS_CACHE_VERSION,
+            'discovery': self.discovery,
+            'entries': entries,
+        }), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class DependencyGraph:
+    """Library dependency graph keyed by path, with edges in both directions."""
+    root: str
+    edges: Dict[str, List[str]] = field(default_factory=dict)  # lib -> [deps]
+    reverse_edges: Dict[str, List[str]] = field(default_factory=dict)  # lib -> [dependents]
+    levels: List[List[str]] = field(default_factory=list)  # BFS frontiers from root
+    
+    def add_node(self, lib_path: str):
+        self.edges.setdefault(lib_path, [])
+        self.reverse_edges.setdefault(lib_path, [])
+    
+    def add_edge(self, lib_path: str, dep_path: str):
+        self.add_node(lib_path)
+        self.add_node(dep_path)
+        if dep_path not in self.edges[lib_path]:
+            self.edges[lib_path].append(dep_path)
+            self.reverse_edges[dep_path].append(lib_path)
+    
+    def to_dict(self) -> Dict:
+        return {
+            'root': self.root,
+            'edges': self.edges,
+            'reverse_edges': self.reverse_edges,
+            'levels': self.levels,
+        }
+
+
 class LibraryFinder:
     """Base class for finding libraries."""
     
-    def __init__(self):
+    def __init__(self, resolution_cache: Optional[ResolutionCache] = None, jobs: Optional[int] = None):
         self.platform = get_platform()
         self.libraries: Dict[str, str] = {}  # name -> path
         self.dependencies: Dict[str, List[str]] = {}  # lib -> [deps]
+        self.graph: Optional[DependencyGraph] = None
+        self.missing: Dict[str, List[str]] = {}  # lib name -> [DT_NEEDED names not found]
+        self.conflicts: Dict[str, List[str]] = {}  # name -> [paths] sharing one file name
+        self.unresolved: Dict[str, List[str]] = {}  # lib path -> [names find_dependencies() could not find]
+        self.resolution_cache = resolution_cache or ResolutionCache()
+        self.jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+        self._resolution_context: Optional[str] = None
     
-    def find_libvips(self) -> Optional[str]:
-        """Find libvips library path."""
+    def find_libvips(self) -> Optional[Tuple[str, str]]:
+        """Find libvips: (path as discovered, library path to use)."""
         raise NotImplementedError
     
     def find_dependencies(self, lib_path: str) -> List[str]:
         """Find dependencies of a library."""
         raise NotImplementedError
     
-    def collect_all_deps(self, lib_path: str, visited: Set[str] = None) -> Dict[str, str]:
-        """Recursively collect all dependencies."""
-        if visited is None:
-            visited = set()
-        
-        if lib_path in visited:
-            return {}
-        visited.add(lib_path)
+    @property
+    def cache_scope(self) -> str:
+        """Key for this finder's discovery results in the resolution cache."""
+        return f'{self.platform}:{type(self).__name__}'
+    
+    def resolution_inputs(self) -> List[str]:
+        """What, besides the library files, decides how dependencies resolve."""
+        return [self.cache_scope]
+    
+    @property
+    def resolution_context(self) -> str:
+        """Fingerprint of resolution_inputs(), computed once per run."""
+        if self._resolution_context is None:
+            digest = hashlib.sha256('\0'.join(self.resolution_inputs()).encode('utf-8'))
+            self._resolution_context = digest.hexdigest()[:16]
+        return self._resolution_context
+    
+    def cached_dependencies(self, lib_path: str) -> List[str]:
+        """find_dependencies() memoised in the resolution cache."""
+        cached = self.resolution_cache.get(lib_path, self.resolution_context)
+        if cached is None:
+            deps = self.find_dependencies(lib_path)
+            self.resolution_cache.put(lib_path, deps, self.resolution_context,
+                                      self.unresolved.get(lib_path, []))
+        else:
+            deps, missing = cached
+            if missing:
+                self.unresolved[lib_path] = missing
+        return deps
+    
+    def collect_all_deps(self, lib_path: str) -> Dict[str, str]:
+        """
+        Collect the dependency closure of `lib_path` breadth-first.
         
-        result = {}
-        lib_name = Path(lib_path).name
-        result[lib_name] = lib_path
+        Each frontier level is resolved concurrently on a thread pool.
+        Returns {file name: path}; the graph itself is kept in self.graph.
+        """
+        graph = DependencyGraph(lib_path)
+        graph.add_node(lib_path)
+        seen: Set[str] = {lib_path}
+        frontier = [lib_path]
         
-        deps = self.find_dependencies(lib_path)
-        self.dependencies[lib_name] = [Path(d).name for d in deps]
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while frontier:
+                graph.levels.append(frontier)
+                next_frontier = []
+                for lib, deps in zip(frontier, pool.map(self.cached_dependencies, frontier)):
+                    for dep in deps:
+                        if not dep or self.resolution_cache.stat(dep) is None:
+                            continue
+                        graph.add_edge(lib, dep)
+                        if dep not in seen:
+                            seen.add(dep)
+                            next_frontier.append(dep)
+                frontier = next_frontier
         
-        for dep in deps:
-            if dep and Path(dep).exists():
-                result.update(self.collect_all_deps(dep, visited))
+        self.graph = graph
         
+        # Name views for the JSON output and copying; the closest library
+        # to the root wins when two paths share a file name.
+        result: Dict[str, str] = {}
+        for level in graph.levels:
+            for path in level:
+                name = Path(path).name
+                if name not in result:
+                    result[name] = path
+                elif result[name] != path:
+                    self.conflicts.setdefault(name, [result[name]]).append(path)
+        self.dependencies = {
+            Path(path).name: [Path(d).name for d in deps]
+            for path, deps in graph.edges.items()
+            if result.get(Path(path).name) == path
+        }
+        self.missing = {
+            Path(path).name: names
+            for path, names in sorted(self.unresolved.items())
+            if path in graph.edges and names
+        }
         return result
     
     def run(self) -> Dict[str, any]:
         """Run the finder and return results."""
-        libvips_path = self.find_libvips()
+        libvips_path = self.resolution_cache.remember(self.cache_scope, 'libvips_path', self.find_libvips)
         if not libvips_path:
             return {'error': 'libvips not found', 'platform': self.platform}
         
@@ -117,6 +368,9 @@ class LibraryFinder:
             'libvips_path': libvips_path,
             'libraries': self.libraries,
             'dependencies': self.dependencies,
+            'graph': self.graph.to_dict(),
+            'conflicts': self.conflicts,
+            'missing': self.missing,
             'total_count': len(self.libraries),
             'total_size': sum(Path(p).stat().st_size for p in self.libraries.values() if Path(p).exists())
         }
@@ -125,9 +379,10 @@ class LibraryFinder:
 class MacOSFinder(LibraryFinder):
     """Find libraries on macOS."""
     
-    def __init__(self):
-        super().__init__()
-        self.homebrew_prefix = self._get_homebrew_prefix()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.homebrew_prefix = self.resolution_cache.remember(
+            self.cache_scope, 'homebrew_prefix', self._get_homebrew_prefix)
     
     def _get_homebrew_prefix(self) -> str:
         """Get Homebrew prefix."""
@@ -139,15 +394,25 @@ class MacOSFinder(LibraryFinder):
             return '/opt/homebrew'
         return '/usr/local'
     
-    def find_libvips(self) -> Optional[str]:
+    def resolution_inputs(self) -> List[str]:
+        # `brew upgrade` repoints opt/<formula> at the new keg
+        opt_dir = Path(self.homebrew_prefix) / 'opt'
+        links = []
+        if opt_dir.is_dir():
+            for link in sorted(opt_dir.iterdir()):
+                if link.is_symlink():
+                    links.append(f'{link.name}={os.readlink(link)}')
+        return super().resolution_inputs() + [self.homebrew_prefix] + links
+    
+    def find_libvips(self) -> Optional[Tuple[str, str]]:
         """Find libvips on macOS."""
-        # Try Homebrew
+        # Try Homebrew (`brew --prefix vips` is the opt/ link)
         code, stdout, _ = run_command(['brew', '--prefix', 'vips'])
         if code == 0:
             vips_prefix = stdout.strip()
             lib_path = Path(vips_prefix) / 'lib' / 'libvips.dylib'
             if lib_path.exists():
-                return str(lib_path.resolve())
+                return str(lib_path), str(lib_path.resolve())
         
         # Try common paths
         common_paths = [
@@ -157,7 +422,7 @@ class MacOSFinder(LibraryFinder):
         ]
         for path in common_paths:
             if Path(path).exists():
-                return str(Path(path).resolve())
+                return path, str(Path(path).resolve())
         
         return None
     
@@ -216,18 +481,38 @@ class MacOSFinder(LibraryFinder):
 
 
 class LinuxFinder(LibraryFinder):
-    """Find libraries on Linux."""
+    """Find libraries on Linux.
     
-    def find_libvips(self) -> Optional[str]:
+    ELF files are parsed in-process (see elf_deps.py) instead of running
+    `ldd`, so no binary is ever executed.
+    """
+    
+    # Loader and libc libraries that are never bundled
+    SYSTEM_LIBS = ['libc.so', 'libm.so', 'libpthread', 'libdl', 'ld-linux']
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.resolver = ElfResolver()
+    
+    def resolution_inputs(self) -> List[str]:
+        root = self.resolver.root
+        inputs = super().resolution_inputs() + [str(root), ':'.join(self.resolver.library_path)]
+        inputs.extend(self.resolver.extra_dirs)
+        # ldconfig rewrites the cache whenever a package adds or moves a library
+        for name in ('etc/ld.so.cache', 'etc/ld.so.conf'):
+            try:
+                st = os.stat(root / name)
+                inputs.append(f'{name}:{st.st_size}:{st.st_mtime_ns}')
+            except OSError:
+                inputs.append(f'{name}:-')
+        return inputs
+    
+    def find_libvips(self) -> Optional[Tuple[str, str]]:
         """Find libvips on Linux."""
-        # Try ldconfig
-        code, stdout, _ = run_command(['ldconfig', '-p'])
-        if code == 0:
-            for line in stdout.split('\n'):
-                if 'libvips.so' in line:
-                    match = re.search(r'=>\s*(.+)$', line)
-                    if match:
-                        return match.group(1).strip()
+        # Try ld.so.cache (what `ldconfig -p` prints)
+        for path in self.resolver.find_in_cache('libvips.so'):
+            if Path(path).exists():
+                return path, path
         
         # Try pkg-config
         code, stdout, _ = run_command(['pkg-config', '--variable=libdir', 'vips'])
@@ -235,7 +520,7 @@ class LinuxFinder(LibraryFinder):
             lib_dir = stdout.strip()
             lib_path = Path(lib_dir) / 'libvips.so'
             if lib_path.exists():
-                return str(lib_path.resolve())
+                return str(lib_path), str(lib_path.resolve())
         
         # Try common paths
         common_paths = [
@@ -247,38 +532,125 @@ class LinuxFinder(LibraryFinder):
         for path in common_paths:
             p = Path(path)
             if p.exists():
-                return str(p.resolve())
+                return path, str(p.resolve())
             # Try with version suffix
             for versioned in p.parent.glob(f'{p.name}.*'):
                 if versioned.exists():
-                    return str(versioned.resolve())
+                    return str(versioned), str(versioned.resolve())
         
         return None
     
+    def is_system_library(self, dep_path: str) -> bool:
+        """Whether a resolved dependency is provided by the target system."""
+        target = self.resolver.target_path(dep_path)
+        return ((target.startswith('/lib/') or target.startswith('/lib64/'))
+                and any(x in target for x in self.SYSTEM_LIBS))
+    
+    def is_system_name(self, name: str) -> bool:
+        """Whether an unresolved DT_NEEDED name is provided by the target system."""
+        return any(x in name for x in self.SYSTEM_LIBS)
+    
     def find_dependencies(self, lib_path: str) -> List[str]:
-        """Find dependencies using ldd."""
-        code, stdout, _ = run_command(['ldd', lib_path])
-        if code != 0:
-            return []
+        """Find dependencies from DT_NEEDED/DT_RUNPATH/DT_RPATH."""
+        resolved, missing = self.resolver.dependencies(lib_path)
+        missing = [name for name in missing if not self.is_system_name(name)]
+        if missing:
+            self.unresolved[lib_path] = missing
         
-        deps = []
-        for line in stdout.split('\n'):
-            line = line.strip()
-            if not line or 'not found' in line:
-                continue
-            # Format: libname.so => /path/to/lib.so (0x...)
-            match = re.search(r'=>\s*(/\S+)', line)
-            if match:
-                dep_path = match.group(1)
-                # Skip system libraries
-                if dep_path.startswith('/lib/') or dep_path.startswith('/lib64/'):
-                    # Keep some important ones
-                    if not any(x in dep_path for x in ['libc.so', 'libm.so', 'libpthread', 'libdl', 'ld-linux']):
-                        deps.append(dep_path)
-                elif Path(dep_path).exists():
-                    deps.append(dep_path)
+        # Skip system libraries
+        return [dep_path for dep_path in resolved if not self.is_system_library(dep_path)]
+
+
+# --arch value -> (ELF machine, Debian multiarch triplet, Android ABI, NDK triplet)
+SYSROOT_ARCHES = {
+    'aarch64': ('aarch64', 'aarch64-linux-gnu', 'arm64-v8a', 'aarch64-linux-android'),
+    'armv7': ('arm', 'arm-linux-gnueabihf', 'armeabi-v7a', 'arm-linux-androideabi'),
+    'x86_64': ('x86_64', 'x86_64-linux-gnu', 'x86_64', 'x86_64-linux-android'),
+    'x86': ('i386', 'i386-linux-gnu', 'x86', 'i686-linux-android'),
+}
+# Stable NDK platform libraries, present on every device
+ANDROID_SYSTEM_LIBS = {
+    'libc.so', 'libm.so', 'libdl.so', 'liblog.so', 'libz.so', 'libandroid.so',
+    'libjnigraphics.so', 'libEGL.so', 'libGLESv1_CM.so', 'libGLESv2.so', 'libGLESv3.so',
+    'libvulkan.so', 'libOpenSLES.so', 'libOpenMAXAL.so', 'libmediandk.so', 'libcamera2ndk.so',
+    'libaaudio.so', 'libamidi.so', 'libnativewindow.so', 'libsync.so', 'libneuralnetworks.so',
+    'libbinder_ndk.so', 'libstdc++.so',
+}
+SYSROOT_ARCH_ALIASES = {'arm64': 'aarch64', 'arm64-v8a': 'aarch64', 'arm': 'armv7',
+                        'armeabi-v7a': 'armv7', 'amd64': 'x86_64', 'i386': 'x86', 'i686': 'x86'}
+
+
+class SysrootFinder(LinuxFinder):
+    """Find libraries inside an extracted Linux or Android tree for one arch.
+    
+    Works offline and cross-arch: everything is read with the in-process ELF
+    parser, nothing from the host (or the target) is executed.
+    
+    `sysroot` may be a Debian/Fedora root file system (ld.so.cache and
+    ld.so.conf are read from it), an Android NDK sysroot, or a jniLibs-style
+    tree with one directory per ABI.
+    """
+    
+    def __init__(self, sysroot: str, arch: str, **kwargs):
+        self.arch = SYSROOT_ARCH_ALIASES.get(arch, arch)
+        if self.arch not in SYSROOT_ARCHES:
+            raise ValueError(f'Unsupported arch: {arch} (use one of {", ".join(SYSROOT_ARCHES)})')
+        self.sysroot = Path(sysroot).resolve()
+        self.elf_machine, triplet, abi, ndk_triplet = SYSROOT_ARCHES[self.arch]
         
-        return deps
+        # Android: NDK stubs in usr/lib/<triplet>[/<api>], app libs per ABI
+        ndk_dir = self.sysroot / 'usr/lib' / ndk_triplet
+        self.ndk_dirs = [ndk_dir] + sorted((d for d in ndk_dir.glob('[0-9]*') if d.is_dir()),
+                                           key=lambda d: -int(d.name) if d.name.isdigit() else 0)
+        abi_dirs = [self.sysroot / abi, self.sysroot / 'lib' / abi, self.sysroot / 'jniLibs' / abi]
+        self.is_android = any(d.is_dir() for d in self.ndk_dirs + abi_dirs)
+        multiarch_dirs = [self.sysroot / 'lib' / triplet, self.sysroot / 'usr/lib' / triplet,
+                          self.sysroot / 'usr/local/lib']
+        self.search_dirs = [d for d in abi_dirs + multiarch_dirs + self.ndk_dirs if d.is_dir()]
+        
+        super().__init__(**kwargs)
+        self.platform = 'android' if self.is_android else 'linux'
+        self.resolver = ElfResolver(root=str(self.sysroot), library_path=[],
+                                    extra_dirs=[str(d) for d in self.search_dirs])
+    
+    @property
+    def cache_scope(self) -> str:
+        return f'{self.platform}:{self.arch}:{self.sysroot}'
+    
+    def _is_target_arch(self, lib_path: Path) -> bool:
+        info = self.resolver.info(str(lib_path))
+        return info is not None and info.arch == self.elf_machine
+    
+    def find_libvips(self) -> Optional[Tuple[str, str]]:
+        """Find libvips for the requested arch inside the sysroot."""
+        candidates = [Path(p) for p in self.resolver.find_in_cache('libvips.so')]
+        for directory in self.resolver.default_dirs(True) + self.resolver.default_dirs(False):
+            candidates.extend(sorted(directory.glob('libvips.so*')))
+        for path in candidates:
+            if path.is_file() and self._is_target_arch(path):
+                return str(path), str(path)
+        return None
+    
+    def is_system_name(self, name: str) -> bool:
+        if self.is_android and name in ANDROID_SYSTEM_LIBS:
+            return True
+        return super().is_system_name(name)
+    
+    def is_system_library(self, dep_path: str) -> bool:
+        # Android platform libraries only exist as NDK stubs
+        if self.is_android and any(Path(dep_path).parent == d for d in self.ndk_dirs):
+            return True
+        # Extracted roots may lack the merged-/usr `lib -> usr/lib` link
+        target = self.resolver.target_path(dep_path)
+        if target.startswith('/usr/lib') and any(x in target for x in self.SYSTEM_LIBS):
+            return True
+        return super().is_system_library(dep_path)
+    
+    def run(self) -> Dict[str, any]:
+        results = super().run()
+        results['architecture'] = self.arch
+        results['sysroot'] = str(self.sysroot)
+        return results
 
 
 class WindowsFinder(LibraryFinder):
@@ -337,15 +709,17 @@ class WindowsFinder(LibraryFinder):
         return [str(p) for p in lib_dir.glob('*.dll') if p.name != Path(lib_path).name]
 
 
-def get_finder() -> LibraryFinder:
-    """Get the appropriate finder for the current platform."""
+def get_finder(sysroot: Optional[str] = None, arch: Optional[str] = None, **kwargs) -> LibraryFinder:
+    """Get the appropriate finder for the current platform (or a sysroot)."""
+    if sysroot:
+        return SysrootFinder(sysroot, arch or platform.machine(), **kwargs)
     plat = get_platform()
     if plat == 'macos':
-        return MacOSFinder()
+        return MacOSFinder(**kwargs)
     elif plat == 'linux':
-        return LinuxFinder()
+        return LinuxFinder(**kwargs)
     elif plat == 'windows':
-        return WindowsFinder()
+        return WindowsFinder(**kwargs)
     else:
         raise RuntimeError(f'Unsupported platform: {plat}')
 
@@ -364,6 +738,8 @@ def print_results(results: Dict):
     print('=' * 70)
     print(f' libvips Dependencies Finder')
     print(f' Platform: {results["platform"]}')
+    if 'sysroot' in results:
+        print(f' Sysroot: {results["sysroot"]} ({results["architecture"]})')
     print('=' * 70)
     
     if 'error' in results:
@@ -394,27 +770,43 @@ def print_results(results: Dict):
                 print(f'    -> {dep}')
             if len(deps) > 5:
                 print(f'    ... and {len(deps) - 5} more')
+    
+    if results.get('missing'):
+        print('\n' + '-' * 70)
+        print(' Unresolved Dependencies (not in the closure)')
+        print('-' * 70)
+        for name, needed in sorted(results['missing'].items()):
+            print(f'  {name}: {", ".join(needed)}')
+    
+    if results.get('conflicts'):
+        print('\n' + '-' * 70)
+        print(' Name Conflicts (first path is used)')
+        print('-' * 70)
+        for name, paths in sorted(results['conflicts'].items()):
+            print(f'  {name}:')
+            for path in paths:
+                print(f'    {path}')
 
 
-def copy_libraries(results: Dict, dest_dir: str, fix_paths: bool = False):
-    """Copy all libraries to destination directory."""
+def copy_libraries(results: Dict, dest_dir: str, fix_paths: bool = False, jobs: Optional[int] = None,
+                   allow_hardlinks: bool = False):
+    """Copy all libraries to destination directory (incremental, see copy_engine.py)."""
     dest = Path(dest_dir)
     dest.mkdir(parents=True, exist_ok=True)
     
     plat = results.get('platform', get_platform())
-    arch = platform.machine()
+    arch = results.get('architecture', platform.machine())
     
     print(f'\nCopying libraries to {dest}...')
     print(f'Platform: {plat}, Architecture: {arch}')
     
-    copied_files = []
-    for name, path in results['libraries'].items():
-        src = Path(path)
-        if src.exists():
-            dst = dest / name
-            shutil.copy2(src, dst)
-            copied_files.append(dst)
-            print(f'  Copied: {name}')
+    # install_name_tool edits files in place, so never hardlink the sources
+    engine = CopyEngine(dest, allow_hardlinks=allow_hardlinks and not fix_paths, jobs=jobs)
+    copied = engine.copy_all(results['libraries'])
+    copied_files = sorted(copied.files)
+    for name, target in sorted(copied.symlinks.items()):
+        print(f'  Linked: {name} -> {target}')
+    print('  ' + ', '.join(f'{method}: {count}' for method, count in sorted(copied.methods.items())))
     
     # Fix library paths on macOS
     if fix_paths and plat == 'macos':
@@ -428,7 +820,8 @@ def copy_libraries(results: Dict, dest_dir: str, fix_paths: bool = False):
         'libvips_version': get_libvips_version(results.get('libvips_path', '')),
         'total_count': len(copied_files),
         'total_size': sum(f.stat().st_size for f in copied_files if f.exists()),
-        'libraries': [f.name for f in copied_files]
+        'libraries': [f.name for f in copied_files],
+        'symlinks': copied.symlinks,
     }
     
     metadata_file = dest / 'metadata.json'
@@ -436,9 +829,107 @@ def copy_libraries(results: Dict, dest_dir: str, fix_paths: bool = False):
         json.dump(metadata, f, indent=2)
     print(f'\nMetadata saved to: {metadata_file}')
     
+    # Written after fixing paths, so the hashes match the shipped files
+    manifest = build_manifest(results, copied_files, copied.symlinks, metadata, jobs)
+    manifest_file = dest / MANIFEST_FILE
+    with open(manifest_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    print(f'Manifest saved to: {manifest_file}')
+    
     print(f'\nDone! {len(copied_files)} libraries copied.')
 
 
+def library_identity(path: Path) -> Tuple[Optional[str], Optional[str]]:
+    """(soname or install name, arch) of an ELF or Mach-O library."""
+    info = read_elf_info(str(path))
+    if info is not None:
+        return info.soname, info.arch
+    try:
+        buf = open_mmap(path)
+    except OSError:
+        return None, None
+    try:
+        slices = fat_slices(buf)
+        if slices is not None:
+            macho = MachOFile(buf, slices[0][1])
+            return macho.install_name(), '+'.join(arch for arch, _, _ in slices)
+        if len(buf) >= 4 and bytes(buf[:4]) != ELF_MAGIC and \
+                int.from_bytes(bytes(buf[:4]), 'little') in (MH_MAGIC, MH_MAGIC_64):
+            macho = MachOFile(buf)
+            return macho.install_name(), macho.arch
+    except (ValueError, IndexError):
+        pass
+    finally:
+        if hasattr(buf, 'close'):
+            buf.close()
+    return None, None
+
+
+def load_order(needed: Dict[str, List[str]]) -> List[str]:
+    """Libraries with every dependency before its dependents (cycles are cut)."""
+    order: List[str] = []
+    state: Dict[str, int] = {}  # 1 = visiting, 2 = done
+    
+    def visit(name: str):
+        if state.get(name):
+            return
+        state[name] = 1
+        for dep in sorted(needed.get(name, [])):
+            visit(dep)
+        state[name] = 2
+        order.append(name)
+    
+    for name in sorted(needed):
+        visit(name)
+    return order
+
+
+def build_manifest(results: Dict, files: List[Path], symlinks: Dict[str, str],
+                   metadata: Dict, jobs: Optional[int] = None) -> Dict:
+    """
+    Per-library sha256, size, soname, arch and needed edges of a copied bundle,
+    plus a load order, so loaders can preload without probing paths.
+    """
+    # Source path -> file name in the bundle (symlink chains end in the real file)
+    bundle_names = {path: symlink_chain(Path(path))[1].name for path in results['libraries'].values()}
+    edges = results.get('graph', {}).get('edges', {})
+    copied = {f.name for f in files}
+    
+    needed: Dict[str, List[str]] = {name: [] for name in copied}
+    for src, name in bundle_names.items():
+        if name not in copied:
+            continue
+        for dep in edges.get(src, []):
+            dep_name = bundle_names.get(dep)
+            if dep_name in copied and dep_name != name and dep_name not in needed[name]:
+                needed[name].append(dep_name)
+    
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        hashes = dict(zip(files, pool.map(file_sha256, files)))
+    
+    libraries = {}
+    for f in sorted(files):
+        soname, arch = library_identity(f)
+        libraries[f.name] = {
+            'sha256': hashes[f],
+            'size': f.stat().st_size,
+            'soname': soname,
+            'arch': arch or metadata['architecture'],
+            'needed': sorted(needed[f.name]),
+        }
+    
+    return {
+        'version': MANIFEST_VERSION,
+        'platform': metadata['platform'],
+        'architecture': metadata['architecture'],
+        'libvips_version': metadata['libvips_version'],
+        'root': bundle_names.get(results.get('libvips_path', '')),
+        'load_order': load_order(needed),
+        'libraries': libraries,
+        'symlinks': symlinks,
+    }
+
+
 def get_libvips_version(libvips_path: str) -> str:
     """Get libvips version from library path or vips command."""
     # Try to extract from path
@@ -497,7 +988,7 @@ def generate_copy_script(results: Dict, script_path: str):
     
     lines = ['#!/bin/bash', '', '# Auto-generated script to copy libvips dependencies', '']
     lines.append(f'# Platform: {plat}')
-    lines.append(f'# Architecture: {platform.machine()}')
+    lines.append(f'# Architecture: {results.get("architecture", platform.machine())}')
     lines.append(f'# Total libraries: {results.get("total_count", 0)}')
     lines.append('')
     
@@ -541,6 +1032,13 @@ Examples:
   
   # Generate shell script
   python find_libvips_deps.py --generate-script output/copy_libs.sh
+  
+  # Report dependencies the Dart bindings never reach
+  python find_libvips_deps.py --prune
+  
+  # Cross-arch, offline: extracted Debian arm64 root or Android jniLibs
+  python find_libvips_deps.py --sysroot rootfs-arm64/ --arch aarch64 -c output/linux-arm64/
+  python find_libvips_deps.py --sysroot android/src/main/jniLibs --arch arm64-v8a
 """
     )
     parser.add_argument(
@@ -556,10 +1054,39 @@ Examples:
         action='store_true',
         help='Fix library paths after copying (macOS only, uses install_name_tool)'
     )
+    parser.add_argument(
+        '--allow-hardlinks',
+        action='store_true',
+        help='Hardlink libraries when reflink is unavailable (ignored with --fix-paths)'
+    )
     parser.add_argument(
         '--generate-script',
         help='Generate a shell script for copying libraries'
     )
+    parser.add_argument(
+        '--sysroot',
+        help='Resolve inside an extracted Linux root, Android NDK sysroot or jniLibs tree (offline)'
+    )
+    parser.add_argument(
+        '--arch',
+        help=f'Target arch for --sysroot: {", ".join(SYSROOT_ARCHES)} (default: host)'
+    )
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=None,
+        help='Threads used to resolve each dependency level and to copy (default: CPU count + 4)'
+    )
+    parser.add_argument(
+        '--prune',
+        action='store_true',
+        help='Report libraries the Dart bindings never reach (ELF only, see prune_deps.py)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Ignore and do not update {DEPS_CACHE_FILE.name}'
+    )
     parser.add_argument(
         '--quiet', '-q',
         action='store_true',
@@ -568,11 +1095,30 @@ Examples:
     
     args = parser.parse_args()
     
-    finder = get_finder()
+    cache = ResolutionCache(None if args.no_cache else DEPS_CACHE_FILE)
+    if args.arch and not args.sysroot:
+        parser.error('--arch requires --sysroot')
+    try:
+        finder = get_finder(args.sysroot, args.arch, resolution_cache=cache, jobs=args.jobs)
+    except ValueError as e:
+        parser.error(str(e))
     results = finder.run()
+    cache.save()
+    for name, needed in sorted(results.get('missing', {}).items()):
+        print(f'Warning: {name} needs {", ".join(needed)}, not found', file=sys.stderr)
+    
+    if args.prune and 'error' not in results:
+        if isinstance(finder, LinuxFinder):
+            graph = finder.graph
+            report = analyze_pruning(graph.root, graph.levels, graph.edges, binding_symbols())
+            results['pruning'] = report.to_dict()
+        else:
+            print('--prune reads ELF symbol tables and only supports Linux and --sysroot closures')
     
     if not args.quiet:
         print_results(results)
+        if 'pruning' in results:
+            print_prune_report(report, {p: Path(p).stat().st_size for p in finder.graph.edges})
     
     if args.output:
         output_path = Path(args.output)
@@ -585,8 +1131,14 @@ Examples:
         generate_copy_script(results, args.generate_script)
     
     if args.copy_to and 'libraries' in results:
-        copy_libraries(results, args.copy_to, fix_paths=args.fix_paths)
+        copy_libraries(results, args.copy_to, fix_paths=args.fix_paths, jobs=args.jobs,
+                       allow_hardlinks=args.allow_hardlinks)
+    
+    # A sysroot closure is used to verify bundles: an incomplete one fails
+    if args.sysroot and results.get('missing'):
+        return 1
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -2,112 +2,146 @@
 """Fix macOS dylib files for distribution.
 
 This script:
-1. Fixes dylib dependencies to use full version names (for arm64)
-2. Re-signs all dylib files with ad-hoc signature
+1. Fixes dylib dependencies and install names to use full version names
+   (Xcode copies only real files, not the short-name symlinks)
+2. Verifies that every @rpath dependency is a real file in the same directory
+3. Re-signs all dylib files with ad-hoc signature (macOS only)
+
+Load commands are read and rewritten in-process (see macho_rewrite.py), one
+write per file, with the dylibs of all architecture directories processed
+concurrently. Steps 1 and 2 also run on Linux; there, signing is skipped
+and left for a macOS machine.
+
+The hash of every dylib after fixing (and signing) is kept in a state file,
+so a dylib that has not changed since, in a directory whose set of dylibs
+has not changed either, is neither rewritten nor re-signed.
 
 Run this script after updating the pre-compiled libraries.
+
+Usage:
+    python tools/fix_macos_dylibs.py
+    python tools/fix_macos_dylibs.py packages/libvips_ffi_macos/macos/Libraries --jobs 8
+    python tools/fix_macos_dylibs.py --force
 """
 
+import argparse
+import hashlib
+import json
 import os
+import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+from copy_engine import file_sha256
+from macho_rewrite import DylibEdits, LinkInfo, read_link_info, rewrite_file
 
-def get_dylib_deps(dylib_path: str) -> list[str]:
-    """Get @rpath dependencies of a dylib."""
-    result = subprocess.run(
-        ["otool", "-L", dylib_path],
-        capture_output=True,
-        text=True,
-    )
-    deps = []
-    for line in result.stdout.split("\n"):
-        if "@rpath/" in line:
-            dep = line.strip().split()[0].replace("@rpath/", "")
-            deps.append(dep)
-    return deps
+# Project root
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
 
+DEFAULT_LIBRARIES_DIR = PROJECT_ROOT / 'packages/libvips_ffi_macos/macos/Libraries'
+STATE_FILE = SCRIPT_DIR / '.macos_dylibs_state.json'
+STATE_VERSION = 1
+RPATH_PREFIX = '@rpath/'
+SYSTEM_PREFIXES = ('/usr/lib/', '/System/')
 
-def get_install_name(dylib_path: str) -> str:
-    """Get the install name of a dylib."""
-    result = subprocess.run(
-        ["otool", "-D", dylib_path],
-        capture_output=True,
-        text=True,
-    )
-    lines = result.stdout.strip().split("\n")
-    if len(lines) >= 2:
-        return lines[-1].strip()
-    return ""
+
+def real_dylibs(lib_dir: Path) -> List[Path]:
+    """Real dylib files (not symlinks) in a directory."""
+    return sorted(f for f in lib_dir.glob("*.dylib") if not f.is_symlink())
 
 
-def build_name_map(lib_dir: Path) -> dict[str, str]:
+def discover_arch_dirs(base_dir: Path) -> List[Path]:
+    """Subdirectories of `base_dir` holding dylibs, or `base_dir` itself if it does."""
+    if real_dylibs(base_dir):
+        return [base_dir]
+    return [d for d in sorted(base_dir.iterdir()) if d.is_dir() and real_dylibs(d)]
+
+
+def dir_layout(lib_dir: Path) -> str:
+    """
+    Fingerprint of the dylib names in a directory.
+
+    The fixes of one dylib depend on which other names exist (the short
+    name map and the @rpath check), so state for the directory only holds
+    while this stays the same.
+    """
+    names = sorted(f"{f.name}{'@' if f.is_symlink() else ''}" for f in lib_dir.glob("*.dylib"))
+    return hashlib.sha256("\n".join(names).encode()).hexdigest()
+
+
+def build_name_map(lib_dir: Path) -> Dict[str, str]:
     """Build a mapping from short names to full names."""
     name_map = {}
-    
+
     for dylib in lib_dir.glob("*.dylib"):
         if dylib.is_symlink():
             continue
-        
+
         base = dylib.name
         name = base.replace(".dylib", "")
         parts = name.split(".")
-        
+
         # Create mappings for shorter versions
         # e.g., libwebp.7.1.10.dylib -> libwebp.7.dylib, libwebp.7.1.dylib
         for i in range(2, len(parts)):
             short_name = ".".join(parts[:i]) + ".dylib"
             name_map[short_name] = base
-    
+
     return name_map
 
 
-def fix_dylib_deps(dylib_path: Path, name_map: dict[str, str]) -> bool:
-    """Fix a dylib's dependencies. Returns True if modified."""
-    modified = False
-    
-    # Fix dependencies
-    deps = get_dylib_deps(str(dylib_path))
-    for dep in deps:
-        if dep in name_map and dep != name_map[dep]:
-            full_name = name_map[dep]
-            print(f"    Fixing dep: @rpath/{dep} -> @rpath/{full_name}")
-            subprocess.run([
-                "install_name_tool", "-change",
-                f"@rpath/{dep}", f"@rpath/{full_name}",
-                str(dylib_path)
-            ], check=True, capture_output=True)
-            modified = True
-    
-    # Fix install name if needed
-    install_name = get_install_name(str(dylib_path))
-    if install_name:
-        install_base = os.path.basename(install_name)
-        if install_base in name_map and install_base != name_map[install_base]:
-            full_name = name_map[install_base]
-            print(f"    Fixing id: @rpath/{install_base} -> @rpath/{full_name}")
-            subprocess.run([
-                "install_name_tool", "-id",
-                f"@rpath/{full_name}",
-                str(dylib_path)
-            ], check=True, capture_output=True)
-            modified = True
-    
-    return modified
+def plan_edits(infos: List[LinkInfo], name_map: Dict[str, str]) -> DylibEdits:
+    """The install_name_tool -id / -change edits that replace short names."""
+    edits = DylibEdits()
+    for info in infos:
+        for dep in info.dependencies:
+            base = dep[len(RPATH_PREFIX):] if dep.startswith(RPATH_PREFIX) else None
+            if base in name_map and base != name_map[base]:
+                edits.changes[dep] = RPATH_PREFIX + name_map[base]
+        if info.install_name:
+            base = os.path.basename(info.install_name)
+            if base in name_map and base != name_map[base]:
+                edits.install_name = RPATH_PREFIX + name_map[base]
+    return edits
+
+
+def unresolved_dependencies(infos: List[LinkInfo], lib_dir: Path) -> List[str]:
+    """@rpath dependencies that do not resolve to a file in `lib_dir` (symlinks are followed)."""
+    missing = []
+    for info in infos:
+        for dep in info.dependencies:
+            if not dep.startswith(RPATH_PREFIX):
+                continue
+            path = lib_dir / dep[len(RPATH_PREFIX):]
+            if not path.is_file() and dep not in missing:
+                missing.append(dep)
+    return missing
+
+
+def external_dependencies(infos: List[LinkInfo]) -> List[str]:
+    """Absolute dependencies outside the system (e.g. Homebrew paths of the build machine)."""
+    return sorted({dep for info in infos for dep in info.dependencies
+                   if dep.startswith('/') and not dep.startswith(SYSTEM_PREFIXES)})
+
+
+def can_sign() -> bool:
+    return sys.platform == 'darwin' and shutil.which('codesign') is not None
 
 
 def sign_dylib(dylib_path: Path) -> bool:
-    """Sign a dylib with ad-hoc signature. Returns True if successful."""
+    """Sign a dylib with ad-hoc signature and verify it. Returns True if successful."""
     result = subprocess.run(
         ["codesign", "--force", "--sign", "-", str(dylib_path)],
         capture_output=True,
     )
-    return result.returncode == 0
-
-
-def verify_signature(dylib_path: Path) -> bool:
-    """Verify dylib signature."""
+    if result.returncode != 0:
+        return False
     result = subprocess.run(
         ["codesign", "-v", str(dylib_path)],
         capture_output=True,
@@ -115,98 +149,241 @@ def verify_signature(dylib_path: Path) -> bool:
     return result.returncode == 0
 
 
-def process_arch_dir(lib_dir: Path) -> tuple[int, int, int]:
-    """Process all dylibs in an architecture directory.
-    
-    Returns: (total_files, deps_fixed, signed)
+class FixState:
     """
-    if not lib_dir.exists():
-        print(f"  Directory not found: {lib_dir}")
-        return 0, 0, 0
-    
-    # Get all real dylib files (not symlinks)
-    dylibs = [f for f in lib_dir.glob("*.dylib") if not f.is_symlink()]
-    total = len(dylibs)
-    
+    Post-fix state of processed dylibs, kept between runs.
+
+    Each entry holds the size, mtime and SHA-256 of a dylib as it was left
+    by the last successful run, whether it was signed, and the layout of
+    its directory. A dylib is done if its stat matches (or, after a copy or
+    a touch, its hash does), the layout is the same and it is signed or
+    signing is off.
+    """
+
+    def __init__(self, path: Optional[Path] = None, load: bool = True):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        if load and path is not None and path.exists():
+            try:
+                data = json.loads(path.read_text(encoding='utf-8'))
+                if data.get('version') == STATE_VERSION:
+                    self.entries = data['entries']
+            except (ValueError, KeyError):
+                pass
+
+    def done(self, dylib_path: Path, layout: str, sign: bool) -> Optional[Dict]:
+        """The entry of `dylib_path` if it needs no processing, else None."""
+        key = str(dylib_path.resolve())
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None or entry['layout'] != layout or (sign and not entry['signed']):
+            return None
+        try:
+            st = dylib_path.stat()
+        except OSError:
+            return None
+        if (entry['size'], entry['mtime_ns']) == (st.st_size, st.st_mtime_ns):
+            return entry
+        if entry['size'] == st.st_size and file_sha256(dylib_path) == entry['sha256']:
+            with self._lock:
+                entry['mtime_ns'] = st.st_mtime_ns
+            return entry
+        return None
+
+    def record(self, dylib_path: Path, layout: str, signed: bool, warnings: List[str]):
+        st = dylib_path.stat()
+        entry = {
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+            'sha256': file_sha256(dylib_path),
+            'signed': signed,
+            'layout': layout,
+            'warnings': warnings,
+        }
+        with self._lock:
+            self.entries[str(dylib_path.resolve())] = entry
+
+    def save(self):
+        """Write the state atomically, dropping entries for deleted files."""
+        if self.path is None:
+            return
+        entries = {k: v for k, v in self.entries.items() if os.path.exists(k)}
+        tmp = self.path.with_name(f'.{self.path.name}.tmp')
+        tmp.write_text(json.dumps({'version': STATE_VERSION, 'entries': entries}), encoding='utf-8')
+        os.replace(tmp, self.path)
+
+
+@dataclass
+class DylibResult:
+    name: str
+    edits: DylibEdits = field(default_factory=DylibEdits)
+    modified: bool = False
+    skipped: bool = False  # unchanged since the last run
+    signed: Optional[bool] = None  # None: signing skipped
+    problems: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
+def fix_dylib(dylib_path: Path, name_map: Dict[str, str], sign: bool, dry_run: bool = False,
+              state: Optional[FixState] = None, layout: str = '') -> DylibResult:
+    """Fix, verify and sign one dylib."""
+    result = DylibResult(dylib_path.name)
+    entry = state.done(dylib_path, layout, sign) if state is not None else None
+    if entry is not None:
+        result.skipped = True
+        result.warnings = entry['warnings']
+        return result
+
+    try:
+        infos = read_link_info(dylib_path.read_bytes())
+        result.edits = plan_edits(infos, name_map)
+        if result.edits and not dry_run:
+            result.modified, infos = rewrite_file(dylib_path, result.edits)
+    except (OSError, ValueError) as e:
+        result.problems.append(str(e))
+        return result
+
+    # Missing libraries are reported, not fatal: the bundle may not ship optional ones
+    result.warnings.extend(f'unresolved dependency {dep}'
+                           for dep in unresolved_dependencies(infos, dylib_path.parent)
+                           if dep not in result.edits.changes)
+    result.warnings.extend(f'depends on {dep}' for dep in external_dependencies(infos))
+    if dry_run:
+        return result
+    if sign:
+        result.signed = sign_dylib(dylib_path)
+        if not result.signed:
+            result.problems.append('signing failed')
+    # Failed dylibs are not recorded, so they are processed again next time
+    if state is not None and not result.problems:
+        state.record(dylib_path, layout, bool(result.signed), result.warnings)
+    return result
+
+
+def process_arch_dirs(lib_dirs: List[Path], jobs: Optional[int] = None, sign: bool = True,
+                      dry_run: bool = False, state: Optional[FixState] = None
+                      ) -> Dict[Path, List[DylibResult]]:
+    """Process the dylibs of several architecture directories on one thread pool."""
+    futures: Dict[Path, List[Future]] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for lib_dir in lib_dirs:
+            name_map = build_name_map(lib_dir)
+            layout = dir_layout(lib_dir)
+            futures[lib_dir] = [pool.submit(fix_dylib, dylib, name_map, sign, dry_run, state, layout)
+                                for dylib in real_dylibs(lib_dir)]
+    return {lib_dir: [f.result() for f in dir_futures] for lib_dir, dir_futures in futures.items()}
+
+
+def report_arch_dir(lib_dir: Path, results: List[DylibResult], dry_run: bool = False) -> Tuple[int, int, int, int, int]:
+    """Print the results of one directory.
+
+    Returns: (total_files, deps_fixed, signed, skipped, failed)
+    """
+    total = len(results)
     if total == 0:
-        print(f"  No dylib files found")
-        return 0, 0, 0
-    
-    print(f"  Found {total} dylib files")
-    
-    # Build name map for dependency fixing
-    name_map = build_name_map(lib_dir)
-    print(f"  Found {len(name_map)} short name mappings")
-    
-    deps_fixed = 0
-    signed = 0
-    
-    for dylib in sorted(dylibs):
-        print(f"  Processing: {dylib.name}")
-        
-        # Fix dependencies if needed
-        if fix_dylib_deps(dylib, name_map):
+        print("  No dylib files found")
+        return 0, 0, 0, 0, 0
+
+    skipped = sum(1 for result in results if result.skipped)
+    print(f"  Found {total} dylib files, {skipped} unchanged since the last run")
+
+    deps_fixed = signed = failed = 0
+    for result in results:
+        if result.edits:
+            print(f"  {result.name}")
+            if result.edits.install_name:
+                print(f"    {'Would fix' if dry_run else 'Fixed'} id: {result.edits.install_name}")
+            for old, new in result.edits.changes.items():
+                print(f"    {'Would fix' if dry_run else 'Fixed'} dep: {old} -> {new}")
+        if result.modified or (dry_run and result.edits):
             deps_fixed += 1
-        
-        # Sign the dylib
-        if sign_dylib(dylib):
+        if result.signed:
             signed += 1
-        else:
-            print(f"    WARNING: Failed to sign {dylib.name}")
-    
-    return total, deps_fixed, signed
+        for warning in result.warnings:
+            print(f"    WARNING: {result.name}: {warning}")
+        if result.problems:
+            failed += 1
+            for problem in result.problems:
+                print(f"    ERROR: {result.name}: {problem}")
+
+    return total, deps_fixed, signed, skipped, failed
+
+
+def process_arch_dir(lib_dir: Path, jobs: Optional[int] = None, sign: bool = True,
+                     dry_run: bool = False, state: Optional[FixState] = None) -> Tuple[int, int, int, int, int]:
+    """Process all dylibs in an architecture directory.
+
+    Returns: (total_files, deps_fixed, signed, skipped, failed)
+    """
+    if not lib_dir.exists():
+        print(f"  Directory not found: {lib_dir}")
+        return 0, 0, 0, 0, 0
+    results = process_arch_dirs([lib_dir], jobs, sign, dry_run, state)
+    return report_arch_dir(lib_dir, results[lib_dir], dry_run)
 
 
 def main():
-    # Default to libvips_ffi_macos Libraries directory
-    base_dir = Path(sys.argv[1] if len(sys.argv) > 1 else 
-                    "/Users/cai/code/flutter/self/libvips_ffi/packages/libvips_ffi_macos/macos/Libraries")
-    
+    parser = argparse.ArgumentParser(description='Fix install names of the bundled macOS dylibs and re-sign them.')
+    parser.add_argument('base_dir', nargs='?', default=str(DEFAULT_LIBRARIES_DIR),
+                        help='Directory with one subdirectory per architecture (or a single one)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Dylibs processed in parallel')
+    parser.add_argument('--dry-run', '-n', action='store_true', help='Only report what would change')
+    parser.add_argument('--no-sign', action='store_true', help='Do not re-sign (default on non-macOS hosts)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help=f'Process every dylib, ignoring {STATE_FILE.name}')
+    parser.add_argument('--state', default=str(STATE_FILE), help='State file of the last run')
+    args = parser.parse_args()
+
+    base_dir = Path(args.base_dir)
+    if not base_dir.is_dir():
+        parser.error(f'Directory not found: {base_dir}')
+    sign = not args.no_sign and can_sign()
+    # --force starts over, but still writes the new state
+    state = None if args.dry_run else FixState(Path(args.state), load=not args.force)
+
     print(f"Fixing macOS dylibs in: {base_dir}")
+    if not sign and not args.no_sign:
+        print("codesign is not available: signing skipped, re-sign on macOS")
     print()
-    
+
+    arch_dirs = discover_arch_dirs(base_dir)
+    if not arch_dirs:
+        print("No dylib files found")
+        sys.exit(1)
+
+    results = process_arch_dirs(arch_dirs, args.jobs, sign, args.dry_run, state)
+    if state is not None:
+        state.save()
+
     total_files = 0
     total_deps_fixed = 0
     total_signed = 0
-    
-    # Process each architecture
-    for arch in ["arm64", "x86_64"]:
-        arch_dir = base_dir / arch
-        print(f"=== Processing {arch} ===")
-        
-        files, deps_fixed, signed = process_arch_dir(arch_dir)
+    total_skipped = 0
+    total_failed = 0
+
+    for arch_dir in arch_dirs:
+        print(f"=== {arch_dir.name} ===")
+
+        files, deps_fixed, signed, skipped, failed = report_arch_dir(arch_dir, results[arch_dir], args.dry_run)
         total_files += files
         total_deps_fixed += deps_fixed
         total_signed += signed
-        
+        total_skipped += skipped
+        total_failed += failed
+
         print()
-    
+
     print("=== Summary ===")
     print(f"Total files processed: {total_files}")
+    print(f"Unchanged since the last run: {total_skipped}")
     print(f"Dependencies fixed: {total_deps_fixed}")
     print(f"Files signed: {total_signed}")
-    
-    # Verify all signatures
-    print()
-    print("=== Verifying signatures ===")
-    failed = 0
-    for arch in ["arm64", "x86_64"]:
-        arch_dir = base_dir / arch
-        if not arch_dir.exists():
-            continue
-        for dylib in arch_dir.glob("*.dylib"):
-            if dylib.is_symlink():
-                continue
-            if not verify_signature(dylib):
-                print(f"  FAILED: {arch}/{dylib.name}")
-                failed += 1
-    
-    if failed == 0:
-        print("  All signatures valid!")
-    else:
-        print(f"  {failed} files have invalid signatures")
+
+    if total_failed:
+        print(f"  {total_failed} files failed verification")
         sys.exit(1)
-    
+
     print()
     print("Done!")
 
@@ -2,14 +2,28 @@
 """
 Generate full API bindings for libvips_ffi_api package.
 Analyzes vips_bindings_generated.dart and creates variadic bindings.
+
+Writes one `generated/<category>_bindings.dart` file per category, with a
+lazily looked-up VarArgs binding for every variadic function, plus
+`generated/generated_bindings.dart` grouping them. Files whose content is
+unchanged are left untouched.
+
+Whether a function is variadic comes from vips_introspection.json (scanned
+from the libvips C headers); the name-based rules in vips_function_rules.json
+are only used for functions missing from that file.
 """
 
+import os
 import re
 import sys
 from pathlib import Path
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
+
+from vips_bindings_index import BindingsIndex, load_index
+from vips_classifier import classify
+from vips_introspection import Introspection, load_introspection
 
 @dataclass
 class FunctionDef:
@@ -18,127 +32,39 @@ class FunctionDef:
     params: List[tuple]  # [(type, name), ...]
     is_variadic: bool
     category: str
+    native_type: str = ''
+    dart_type: str = ''
+    null_terminated: bool = False
+    optional_args: Optional[Dict[str, Dict[str, str]]] = None
 
-def parse_functions(content: str) -> List[FunctionDef]:
-    """Parse function definitions from generated bindings."""
+def parse_functions(index: BindingsIndex,
+                    introspection: Optional[Introspection] = None) -> List[FunctionDef]:
+    """Build function definitions from the generated bindings index."""
     functions = []
     
-    # Pattern to match function definitions
-    # int vips_xxx( or ffi.Pointer<X> vips_xxx(
-    func_pattern = re.compile(
-        r'^\s+(int|void|ffi\.Pointer<[^>]+>|double|gpointer)\s+(vips_\w+)\s*\(\s*\n(.*?)\)',
-        re.MULTILINE | re.DOTALL
-    )
-    
-    for match in func_pattern.finditer(content):
-        ret_type = match.group(1)
-        func_name = match.group(2)
-        params_str = match.group(3)
-        
-        # Parse parameters
-        params = []
-        for line in params_str.split('\n'):
-            line = line.strip().rstrip(',')
-            if not line or line == ')':
-                continue
-            # Extract type and name
-            parts = line.rsplit(' ', 1)
-            if len(parts) == 2:
-                param_type = parts[0].strip()
-                param_name = parts[1].strip()
-                params.append((param_type, param_name))
-        
-        # Determine category
-        category = categorize_function(func_name)
-        
-        # Check if variadic (most vips functions with options are variadic)
-        is_variadic = is_variadic_function(func_name)
-        
+    for entry in index.functions('vips_'):
+        category, is_variadic = classify(entry.name)
+        null_terminated = is_variadic
+        optional_args = None
+        if introspection is not None and entry.name in introspection.functions:
+            info = introspection.functions[entry.name]
+            is_variadic = info['variadic']
+            null_terminated = info['null_terminated']
+            optional_args = introspection.optional_args(entry.name)
         functions.append(FunctionDef(
-            name=func_name,
-            return_type=ret_type,
-            params=params,
+            name=entry.name,
+            return_type=entry.return_type,
+            params=list(entry.params),
             is_variadic=is_variadic,
-            category=category
+            category=category,
+            native_type=entry.native_type,
+            dart_type=entry.dart_type,
+            null_terminated=null_terminated,
+            optional_args=optional_args,
         ))
     
     return functions
 
-def is_variadic_function(name: str) -> bool:
-    """Check if a function is likely variadic."""
-    # Most vips image processing functions are variadic
-    # Internal/utility functions typically are not
-    non_variadic_prefixes = [
-        'vips_image_get_', 'vips_image_set_', 'vips_image_remove',
-        'vips_image_print', 'vips_image_guess', 'vips_image_decode',
-        'vips_image_encode', 'vips_image_minimise', 'vips_image_invalidate',
-        'vips_image_wio', 'vips_image_pio', 'vips_image_pipeline',
-        'vips_image_build', 'vips_image_reorder', 'vips_image_copy_memory',
-        'vips_object_', 'vips_area_', 'vips_region_', 'vips_source_',
-        'vips_target_', 'vips_thread', 'vips_semaphore', 'vips_value_',
-        'vips_ref_string', 'vips_sbuf', 'vips_tracked', 'vips_interpolate',
-        'vips_argument', 'vips_type', 'vips_nickname', 'vips_rect',
-        'vips_window', 'vips_slist', 'vips_thing', 'vips_operation',
-        'vips_call', 'vips_error', 'vips_g_', 'g_', 'vips_buf_',
-        'vips_dbuf_', 'vips_blob_', 'vips_array_', 'vips_check_',
-        'vips_class_', 'vips_col_', 'vips_enum_', 'vips_flags_',
-        'vips__', 'vips_concurrency', 'vips_leak', 'vips_version',
-        'vips_init', 'vips_shutdown', 'vips_get_', 'vips_guess_',
-        'vips_buffer_', 'vips_format_', 'vips_foreign_', 'vips_hash_',
-        'vips_connection', 'vips_file_', 'vips_existsf', 'vips_realpath',
-        'vips_isprefix', 'vips_isdirf', 'vips_mkdirf', 'vips_rmdirf',
-        'vips_rename', 'vips_isvips', 'vips_ispoweroftwo', 'vips_iscasepostfix',
-        'vips_path_', 'vips_verror', 'vips_filename', 'vips_mode',
-        'vips_start', 'vips_stop', 'vips_sink', 'vips_generate',
-        'vips_demand', 'vips_pipe_read', 'vips_progress', 'vips_block',
-        'vips_break', 'vips_amiMSB', 'vips_strdup', 'vips_strtod',
-        'vips_malloc', 'vips_image_hasalpha', 'vips_image_new_memory',
-    ]
-    
-    for prefix in non_variadic_prefixes:
-        if name.startswith(prefix):
-            return False
-    
-    # Special non-variadic functions
-    non_variadic = {
-        'vips_image_get_width', 'vips_image_get_height', 'vips_image_get_bands',
-        'vips_image_get_format', 'vips_image_get_interpretation',
-        'vips_error_buffer', 'vips_error_clear',
-    }
-    if name in non_variadic:
-        return False
-    
-    return True
-
-def categorize_function(name: str) -> str:
-    """Categorize a function by its purpose."""
-    # Skip internal functions
-    if name.startswith('vips__') or name.startswith('vips_object'):
-        return 'internal'
-    
-    categories = {
-        'io': ['load', 'save', 'write_to', 'new_from'],
-        'colour': ['2Lab', '2XYZ', '2sRGB', '2CMYK', '2LCh', '2HSV', 'colour', 'Lab', 'XYZ', 'CMC', 'scRGB', 'HSV', 'Yxy', 'icc_'],
-        'arithmetic': ['add', 'subtract', 'multiply', 'divide', 'abs', 'sign', 'pow', 'exp', 'log', 'sin', 'cos', 'tan', 'math', 'round', 'floor', 'ceil', 'rint', 'avg', 'deviate', 'min', 'max', 'stats'],
-        'convolution': ['blur', 'sharpen', 'conv', 'sobel', 'canny', 'prewitt', 'scharr', 'compass'],
-        'resample': ['resize', 'rotate', 'shrink', 'reduce', 'thumbnail', 'affine', 'mapim', 'similarity', 'quadratic'],
-        'geometry': ['crop', 'flip', 'embed', 'extract', 'gravity', 'zoom', 'wrap', 'replicate', 'subsample', 'insert', 'join', 'grid', 'arrayjoin', 'smartcrop'],
-        'histogram': ['hist', 'percent', 'stdif', 'measure', 'profile', 'project'],
-        'morphology': ['morph', 'rank', 'median', 'dilate', 'erode', 'labelregions', 'countlines', 'fill'],
-        'create': ['black', 'text', 'xyz', 'grey', 'gaussnoise', 'perlin', 'worley', 'zone', 'sines', 'eye', 'logmat', 'gaussmat', 'mask_', 'sdf', 'fractsurf', 'identity', 'buildlut', 'invertlut', 'tonelut'],
-        'frequency': ['fft', 'spectrum', 'phasecor', 'freqmult'],
-        'conversion': ['cast', 'copy', 'flatten', 'premultiply', 'unpremultiply', 'gamma', 'invert', 'recomb', 'falsecolour', 'msb', 'byteswap', 'bandjoin', 'bandmean', 'extract_band', 'addalpha', 'sequential', 'cache', 'tilecache', 'linecache', 'autorot', 'rot', 'scale', 'transpose'],
-        'relational': ['equal', 'notequal', 'less', 'more', 'and', 'or', 'eor', 'lshift', 'rshift', 'relational', 'boolean', 'ifthenelse', 'switch'],
-        'composite': ['composite', 'merge', 'mosaic', 'match', 'globalbalance', 'remosaic'],
-        'draw': ['draw_'],
-    }
-    
-    for cat, patterns in categories.items():
-        if any(p in name for p in patterns):
-            return cat
-    
-    return 'other'
-
 def generate_dart_type(c_type: str) -> str:
     """Convert C type to Dart FFI type."""
     type_map = {
@@ -156,32 +82,422 @@ def generate_dart_type(c_type: str) -> str:
     
     return c_type
 
+# ============ Dart emitter ============
+
+DART_RESERVED = {
+    'assert', 'break', 'case', 'catch', 'class', 'const', 'continue', 'default',
+    'do', 'else', 'enum', 'extends', 'false', 'final', 'finally', 'for', 'if',
+    'in', 'is', 'new', 'null', 'rethrow', 'return', 'super', 'switch', 'this',
+    'throw', 'true', 'try', 'var', 'void', 'while', 'with',
+}
+
+FILE_TEMPLATE = """\
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+// ignore_for_file: type=lint
+
+import 'dart:ffi' as ffi;
+
+import 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart';
+{imports}
+{typedefs}
+{options}
+/// {title} variadic function bindings.
+class {class_name} {{
+  final ffi.DynamicLibrary _lib;
+
+  {class_name}(this._lib);
+
+{fields}
+
+{methods}
+}}
+"""
+
+TYPEDEF_TEMPLATE = """\
+typedef _{type_name}Native = {native_ret} Function(
+{native_params}
+  ffi.VarArgs<(ffi.Pointer<ffi.Void>,)>,
+);
+typedef _{type_name}Dart = {dart_ret} Function(
+{dart_params}
+  ffi.Pointer<ffi.Void> terminator,
+);"""
+
+FIELD_TEMPLATE = (
+    "  late final _{method} = _lib.lookup<ffi.NativeFunction<_{type_name}Native>>('{symbol}')"
+    ".asFunction<_{type_name}Dart>();"
+)
+
+METHOD_TEMPLATE = "  {dart_ret} {method}({signature}) => _{method}({args}ffi.nullptr);"
+
+SLOTS_TYPEDEF_TEMPLATE = """\
+typedef _{type_name}Native = {native_ret} Function(
+{native_params}
+  ffi.VarArgs<(
+{native_slots}
+    ffi.Pointer<ffi.Void>,
+  )>,
+);
+typedef _{type_name}Dart = {dart_ret} Function(
+{dart_params}
+{dart_slots}
+  ffi.Pointer<ffi.Void> terminator,
+);"""
+
+OPTIONS_TEMPLATE = """\
+/// Optional arguments of `{symbol}`.
+class {class_name} {{
+{keys}
+
+{fields}
+
+  const {class_name}({{
+{ctor_params}
+  }});
+
+  /// The options that are set, laid out for the varargs call.
+  VipsOptionSlots toSlots() {{
+    final slots = VipsOptionSlots();
+{adds}
+    return slots;
+  }}
+}}"""
+
+OPTIONS_METHOD_TEMPLATE = """\
+  {dart_ret} {method}({signature}[{options_class}? options]) {{
+    final slots = options?.toSlots();
+    if (slots == null || slots.isEmpty) return _{method}({args}ffi.nullptr);
+{calls}
+  }}"""
+
+# vips option type -> (Dart field type, slot kind, value expression)
+OPTION_SCALARS = {
+    'gboolean': ('bool', 'int', '{v}! ? 1 : 0'),
+    'gint': ('int', 'int', '{v}!'),
+    'gdouble': ('double', 'double', '{v}!'),
+    'gchararray': ('ffi.Pointer<ffi.Char>', 'int', '{v}!.address'),
+}
+OPTION_FLAGS = {'VipsForeignKeep', 'VipsForeignPngFilter', 'VipsForeignFlags'}
+OPTION_POINTERS = {'VipsArrayDouble', 'VipsArrayInt', 'VipsArrayImage', 'VipsImage', 'VipsInterpolate'}
+# The public API defines its own enums; options of those types take raw values
+# and ffigen's enums of the same name are not re-exported.
+PUBLIC_ENUM_FILES = [
+    'packages/libvips_ffi_api/lib/src/types/enums.dart',
+    'packages/libvips_ffi_core/lib/src/vips_enums.dart',
+]
+
+
+def public_enum_names(project_root: Path) -> Set[str]:
+    """Names of the enums declared in `PUBLIC_ENUM_FILES`."""
+    names = set()
+    for rel in PUBLIC_ENUM_FILES:
+        path = project_root / rel
+        if path.exists():
+            names.update(re.findall(r'^enum (\w+)', path.read_text(encoding='utf-8'), re.MULTILINE))
+    return names
+
+
+OPTION_INT_ENUMS = public_enum_names(Path(__file__).parent.parent)
+
+AGGREGATE_TEMPLATE = """\
+// GENERATED CODE - DO NOT MODIFY BY HAND
+// Generated by tools/generate_api_bindings.py
+
+import 'dart:ffi' as ffi;
+
+{imports}
+
+{exports}
+
+/// All generated variadic bindings, grouped by category.
+class VipsGeneratedBindings {{
+  final ffi.DynamicLibrary _lib;
+
+  VipsGeneratedBindings(this._lib);
+
+{fields}
+}}
+"""
+
+
+def split_function_type(fn_type: str) -> Tuple[str, List[str]]:
+    """Split `Ret Function(A, B<C, D>)` into ('Ret', ['A', 'B<C, D>'])."""
+    head, sep, rest = fn_type.partition(' Function(')
+    if not sep or not rest.endswith(')'):
+        raise ValueError(f'Not a function type: {fn_type}')
+    args, depth, current = [], 0, []
+    for ch in rest[:-1]:
+        if ch in '<(':
+            depth += 1
+        elif ch in '>)':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            args.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+    if ''.join(current).strip():
+        args.append(''.join(current).strip())
+    return head, args
+
+
+def pascal_case(name: str) -> str:
+    return ''.join(part[:1].upper() + part[1:] for part in name.split('_') if part)
+
+
+def method_name(func_name: str) -> str:
+    """vips_jpegload_buffer -> jpegloadBuffer (reserved words get a `$`)."""
+    pascal = pascal_case(func_name[len('vips_'):])
+    name = pascal[:1].lower() + pascal[1:]
+    return f'{name}$' if name in DART_RESERVED else name
+
+
+def option_field(name: str) -> str:
+    """optimize_coding -> optimizeCoding, Q -> q."""
+    pascal = pascal_case(name)
+    field = pascal[:1].lower() + pascal[1:]
+    return f'{field}$' if field in DART_RESERVED else field
+
+
+def map_option(vips_type: str) -> Optional[Tuple[str, str, str]]:
+    """(Dart type, slot kind, value expression) for a vips option type."""
+    if vips_type in OPTION_SCALARS:
+        return OPTION_SCALARS[vips_type]
+    if vips_type in OPTION_FLAGS or vips_type in OPTION_INT_ENUMS:
+        return ('int', 'int', '{v}!')
+    if vips_type in OPTION_POINTERS:
+        return (f'ffi.Pointer<{vips_type}>', 'int', '{v}!.address')
+    if vips_type.startswith('Vips'):
+        return (vips_type, 'int', '{v}!.value')
+    return None
+
+
+def input_options(func: FunctionDef) -> List[Tuple[str, str, str, str]]:
+    """[(option name, Dart type, slot kind, value expression)] for settable options."""
+    options = []
+    for name, info in (func.optional_args or {}).items():
+        mapped = map_option(info['type'])
+        if info['direction'] == 'input' and mapped is not None:
+            options.append((name, *mapped))
+    return options
+
+
+def render_options(func: FunctionDef, class_name: str, options: List[Tuple[str, str, str, str]]) -> str:
+    """Render the option struct for one function."""
+    keys, fields, ctor_params, adds = [], [], [], []
+    for name, dart_type, kind, value in options:
+        field = option_field(name)
+        key = f'_{field.rstrip("$")}Key'
+        keys.append(f"  static final {key} = vipsOptionKey('{name}');")
+        fields.append(f'  final {dart_type}? {field};')
+        ctor_params.append(f'    this.{field},')
+        add = 'addInt' if kind == 'int' else 'addDouble'
+        adds.append(f'    if ({field} != null) slots.{add}({key}, {value.format(v=field)});')
+    return OPTIONS_TEMPLATE.format(
+        symbol=func.name,
+        class_name=class_name,
+        keys='\n'.join(keys),
+        fields='\n'.join(fields),
+        ctor_params='\n'.join(ctor_params),
+        adds='\n'.join(adds),
+    )
+
+
+def slot_layouts(int_slots: int, double_slots: int) -> List[Tuple[str, List[str]]]:
+    """[(suffix, slot kinds)] of the varargs layouts an option struct needs."""
+    if not int_slots:
+        return [('Options', ['double'] * double_slots)]
+    layouts = [('Options', ['int'] * int_slots + ['double'] * double_slots)]
+    if double_slots:
+        layouts.append(('OptionsD', ['double'] * double_slots + ['int'] * int_slots))
+    return layouts
+
+
+def render_slots_call(method: str, suffix: str, names: List[str], kinds: List[str]) -> str:
+    """`_methodOptions(a, b, slots.intKey(0), slots.intValue(0), ..., ffi.nullptr)`."""
+    seen = {'int': 0, 'double': 0}
+    args = list(names)
+    for kind in kinds:
+        args.append(f'slots.{kind}Key({seen[kind]})')
+        args.append(f'slots.{kind}Value({seen[kind]})')
+        seen[kind] += 1
+    args.append('ffi.nullptr')
+    return f'_{method}{suffix}({", ".join(args)})'
+
+
+def render_category(category: str, functions: List[FunctionDef]) -> str:
+    """Render one generated/<category>_bindings.dart file."""
+    typedefs, option_classes, fields, methods = [], [], [], []
+    for func in functions:
+        native_ret, native_args = split_function_type(func.native_type)
+        dart_ret, dart_args = split_function_type(func.dart_type)
+        names = [name for _, name in func.params]
+        type_name = pascal_case(func.name)
+        method = method_name(func.name)
+
+        typedefs.append(TYPEDEF_TEMPLATE.format(
+            type_name=type_name,
+            native_ret=native_ret,
+            native_params='\n'.join(f'  {t} {n},' for t, n in zip(native_args, names)),
+            dart_ret=dart_ret,
+            dart_params='\n'.join(f'  {t} {n},' for t, n in zip(dart_args, names)),
+        ).replace('(\n\n', '(\n'))
+        fields.append(FIELD_TEMPLATE.format(method=method, type_name=type_name, symbol=func.name))
+
+        signature = ', '.join(f'{t} {n}' for t, n in zip(dart_args, names))
+        args = ''.join(f'{n}, ' for n in names)
+        options = input_options(func)
+        if not options:
+            methods.append(METHOD_TEMPLATE.format(
+                dart_ret=dart_ret, method=method, signature=signature, args=args))
+            continue
+
+        options_class = f'{type_name}Options'
+        option_classes.append(render_options(func, options_class, options))
+        int_slots = sum(1 for *_, kind, _ in options if kind == 'int')
+        layouts = slot_layouts(int_slots, len(options) - int_slots)
+        for suffix, kinds in layouts:
+            slot_type = f'{type_name}{suffix}'
+            typedefs.append(SLOTS_TYPEDEF_TEMPLATE.format(
+                type_name=slot_type,
+                native_ret=native_ret,
+                native_params='\n'.join(f'  {t} {n},' for t, n in zip(native_args, names)),
+                native_slots='\n'.join(
+                    f'    ffi.Pointer<ffi.Char>, {"ffi.IntPtr" if k == "int" else "ffi.Double"},' for k in kinds),
+                dart_ret=dart_ret,
+                dart_params='\n'.join(f'  {t} {n},' for t, n in zip(dart_args, names)),
+                dart_slots='\n'.join(
+                    f'  ffi.Pointer<ffi.Char> key{i}, {k} value{i},' for i, k in enumerate(kinds)),
+            ).replace('(\n\n', '(\n'))
+            fields.append(FIELD_TEMPLATE.format(method=f'{method}{suffix}', type_name=slot_type, symbol=func.name))
+
+        calls = []
+        if len(layouts) == 2:
+            calls.append(f'    if (slots.doublesFirst) return {render_slots_call(method, "OptionsD", names, layouts[1][1])};')
+        calls.append(f'    return {render_slots_call(method, "Options", names, layouts[0][1])};')
+        methods.append(OPTIONS_METHOD_TEMPLATE.format(
+            dart_ret=dart_ret,
+            method=method,
+            signature=f'{signature}, ' if signature else '',
+            options_class=options_class,
+            args=args,
+            calls='\n'.join(calls),
+        ))
+
+    return FILE_TEMPLATE.format(
+        typedefs='\n\n'.join(typedefs),
+        imports="\nimport '../vips_option_slots.dart';\n" if option_classes else '',
+        options=''.join(f'\n{c}\n' for c in option_classes),
+        title=category.capitalize(),
+        class_name=category_class_name(category),
+        fields='\n'.join(fields),
+        methods='\n'.join(methods),
+    )
+
+
+def category_class_name(category: str) -> str:
+    return f'VipsGenerated{pascal_case(category)}Bindings'
+
+
+def render_aggregate(categories: List[str], option_types: Dict[str, List[str]]) -> str:
+    """Render generated/generated_bindings.dart.
+
+    `option_types` maps each category to the option structs it defines; they
+    are re-exported together with the enums their fields use.
+    """
+    imports = [f"import '{cat}_bindings.dart';" for cat in categories]
+    fields = [f'  late final {cat} = {category_class_name(cat)}(_lib);' for cat in categories]
+    exports = []
+    for cat in categories:
+        classes = [t for t in option_types.get(cat, []) if t.endswith('Options')]
+        if classes:
+            exports.append(f"export '{cat}_bindings.dart'\n    show {', '.join(classes)};")
+    enums = sorted({t for types in option_types.values() for t in types if not t.endswith('Options')})
+    if exports:
+        exports.append("export '../vips_option_slots.dart' show VipsOptionSlots;")
+    if enums:
+        exports.insert(0, "export 'package:libvips_ffi_core/src/bindings/vips_bindings_generated.dart'\n"
+                          f"    show {', '.join(enums)};")
+    return AGGREGATE_TEMPLATE.format(
+        imports='\n'.join(imports), exports='\n'.join(exports), fields='\n'.join(fields))
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically write `content` to `path` unless it already matches.
+
+    Returns True if the file was written.
+    """
+    encoded = content.encode('utf-8')
+    try:
+        if path.read_bytes() == encoded:
+            return False
+    except FileNotFoundError:
+        pass
+    tmp = path.with_name(f'.{path.name}.tmp')
+    tmp.write_bytes(encoded)
+    os.replace(tmp, path)
+    return True
+
+
+def emittable(func: FunctionDef) -> bool:
+    """Whether a binding should be emitted (NULL-terminated option lists only)."""
+    return func.null_terminated and func.category not in ('internal', 'core') and bool(func.params)
+
+
+def emit_bindings(functions: List[FunctionDef], output_dir: Path) -> Dict[str, int]:
+    """Write the per-category binding files. Returns {category: count}."""
+    by_category: Dict[str, List[FunctionDef]] = defaultdict(list)
+    for func in functions:
+        if emittable(func):
+            by_category[func.category].append(func)
+
+    categories = sorted(by_category)
+    outputs = {output_dir / f'{cat}_bindings.dart': render_category(cat, by_category[cat]) for cat in categories}
+    option_types: Dict[str, List[str]] = {}
+    for cat in categories:
+        types = set()
+        for func in by_category[cat]:
+            options = input_options(func)
+            if options:
+                types.add(f'{pascal_case(func.name)}Options')
+                types.update(t for _, t, _, _ in options if t.startswith('Vips'))
+        option_types[cat] = sorted(types)
+    outputs[output_dir / 'generated_bindings.dart'] = render_aggregate(categories, option_types)
+
+    written = 0
+    for path, content in outputs.items():
+        if write_if_changed(path, content):
+            written += 1
+            print(f"  Wrote {path.name}")
+
+    for stale in output_dir.glob('*_bindings.dart'):
+        if stale not in outputs:
+            stale.unlink()
+            print(f"  Removed stale {stale.name}")
+
+    print(f"{written} of {len(outputs)} binding files changed")
+    return {cat: len(funcs) for cat, funcs in by_category.items()}
+
 def main():
     project_root = Path(__file__).parent.parent
-    binding_file = project_root / "packages/libvips_ffi_core/lib/src/bindings/vips_bindings_generated.dart"
     output_dir = project_root / "packages/libvips_ffi_api/lib/src/bindings/generated"
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    content = binding_file.read_text()
-    
-    # Count variadic functions by checking the C header comments or function patterns
-    # For now, let's create a summary
-    
-    # Find all vips_ function names
-    func_names = re.findall(r'\b(vips_\w+)\s*\(', content)
-    unique_funcs = sorted(set(func_names))
+    introspection = load_introspection()
+    if introspection is None:
+        print("vips_introspection.json not found, falling back to name-based rules")
+    functions = parse_functions(load_index(), introspection)
     
     # Categorize
     categories = defaultdict(list)
     variadic_funcs = []
     
-    for name in unique_funcs:
-        cat = categorize_function(name)
-        is_var = is_variadic_function(name)
-        categories[cat].append((name, is_var))
-        if is_var:
-            variadic_funcs.append(name)
+    for func in functions:
+        categories[func.category].append((func.name, func.is_variadic))
+        if func.is_variadic:
+            variadic_funcs.append(func.name)
     
     # Print summary
     print("=" * 60)
@@ -201,20 +517,25 @@ def main():
     print(f"{'=' * 60}")
     
     # Write variadic function list to file
+    lines = [
+        "# Variadic functions requiring VarArgs binding\n",
+        "# Generated by generate_api_bindings.py\n\n",
+    ]
+    for cat in sorted(categories.keys()):
+        if cat == 'internal':
+            continue
+        funcs = [(name, is_var) for name, is_var in categories[cat] if is_var]
+        if funcs:
+            lines.append(f"\n## {cat.upper()}\n")
+            lines.extend(f"{name}\n" for name, _ in sorted(funcs))
     output_file = output_dir / "variadic_functions.txt"
-    with open(output_file, 'w') as f:
-        f.write("# Variadic functions requiring VarArgs binding\n")
-        f.write("# Generated by generate_api_bindings.py\n\n")
-        for cat in sorted(categories.keys()):
-            if cat == 'internal':
-                continue
-            funcs = [(name, is_var) for name, is_var in categories[cat] if is_var]
-            if funcs:
-                f.write(f"\n## {cat.upper()}\n")
-                for name, _ in sorted(funcs):
-                    f.write(f"{name}\n")
+    write_if_changed(output_file, ''.join(lines))
     
     print(f"\nVariadic function list written to: {output_file}")
+    
+    print("\nEmitting Dart bindings...")
+    emitted = emit_bindings(functions, output_dir)
+    print(f"Emitted {sum(emitted.values())} bindings in {len(emitted)} categories to: {output_dir}")
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+In-process Mach-O load-command rewriting (a replacement for `install_name_tool`).
+
+在进程内读取并改写 Mach-O 的 LC_ID_DYLIB / LC_LOAD_DYLIB / LC_RPATH，一次写入全部修改，
+可在 Linux 上运行；只有 ad-hoc 签名仍需在 macOS 上完成。
+
+All edits for a file are collected in a DylibEdits and applied to every
+slice in one pass: the load commands are re-encoded and written back into
+the header padding (the space between the end of the load commands and
+the first section), exactly as install_name_tool does. Nothing after the
+header moves, so segments, fixups and the symbol table stay valid.
+
+A rewrite invalidates an existing code signature; re-sign the file with
+`codesign --force --sign -` on macOS afterwards.
+
+Usage:
+    python tools/macho_rewrite.py libfoo.dylib
+    python tools/macho_rewrite.py -id @rpath/libfoo.1.dylib -change @rpath/libz.dylib @rpath/libz.1.dylib libfoo.dylib
+"""
+
+import argparse
+import os
+import struct
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from binary_reader import LC_ID_DYLIB, MH_MAGIC, MH_MAGIC_64, MachOFile, _cstr, fat_slices
+
+LC_REQ_DYLD = 0x80000000
+LC_LOAD_DYLIB = 0xc
+LC_LOAD_WEAK_DYLIB = 0x18 | LC_REQ_DYLD
+LC_REEXPORT_DYLIB = 0x1f | LC_REQ_DYLD
+LC_LAZY_LOAD_DYLIB = 0x20
+LC_LOAD_UPWARD_DYLIB = 0x23 | LC_REQ_DYLD
+LC_RPATH = 0x1c | LC_REQ_DYLD
+LC_CODE_SIGNATURE = 0x1d
+
+# Commands naming a dependency (struct dylib_command)
+DYLIB_LOAD_COMMANDS = {LC_LOAD_DYLIB, LC_LOAD_WEAK_DYLIB, LC_REEXPORT_DYLIB,
+                       LC_LAZY_LOAD_DYLIB, LC_LOAD_UPWARD_DYLIB}
+
+DYLIB_COMMAND_SIZE = 24  # cmd, cmdsize, name offset, timestamp, versions
+RPATH_COMMAND_SIZE = 12  # cmd, cmdsize, path offset
+
+
+class HeaderPaddingError(ValueError):
+    """The new load commands do not fit in the header padding."""
+
+
+@dataclass
+class DylibEdits:
+    """Changes for one file, named after the install_name_tool options."""
+    install_name: Optional[str] = None  # -id
+    changes: Dict[str, str] = field(default_factory=dict)  # -change old new
+    rpath_changes: Dict[str, str] = field(default_factory=dict)  # -rpath old new
+    add_rpaths: List[str] = field(default_factory=list)  # -add_rpath
+    delete_rpaths: List[str] = field(default_factory=list)  # -delete_rpath
+
+    def __bool__(self) -> bool:
+        return bool(self.install_name is not None or self.changes or self.rpath_changes
+                    or self.add_rpaths or self.delete_rpaths)
+
+
+@dataclass
+class LinkInfo:
+    """Linking-related load commands of one Mach-O slice (what `otool -D -L -l` shows)."""
+    arch: str
+    install_name: Optional[str]
+    dependencies: List[str]
+    rpaths: List[str]
+    signed: bool
+    header_padding: int  # free bytes after the load commands
+
+
+def _slices(data) -> List[int]:
+    """Header offsets of the thin Mach-O images in `data`."""
+    slices = fat_slices(data)
+    if slices is not None:
+        return [offset for _, offset, _ in slices]
+    if len(data) >= 4 and struct.unpack_from('<I', data, 0)[0] in (MH_MAGIC, MH_MAGIC_64):
+        return [0]
+    raise ValueError('Not a Mach-O file')
+
+
+def _command_path(raw: bytes) -> str:
+    """The string of a dylib or rpath command (its offset is the third field)."""
+    name_offset = struct.unpack_from('<I', raw, 8)[0]
+    return _cstr(raw[name_offset:])
+
+
+def _commands_end_limit(macho: MachOFile) -> int:
+    """Offset of the first byte after the header that belongs to file content."""
+    limit = None
+    for segment in macho.segments:
+        if segment.fileoff and segment.filesize:
+            limit = segment.fileoff if limit is None else min(limit, segment.fileoff)
+        for section in segment.sections:
+            if section.file_size and section.offset:
+                limit = section.offset if limit is None else min(limit, section.offset)
+    return limit if limit is not None else macho.header_size + macho.sizeofcmds
+
+
+def _encode_path_command(cmd: int, fixed: bytes, path: str, align: int) -> bytes:
+    """Re-encode a command as `fixed` fields followed by `path`, padded to `align`."""
+    encoded = path.encode('utf-8') + b'\0'
+    size = 8 + len(fixed) + len(encoded)
+    size = (size + align - 1) & ~(align - 1)
+    return struct.pack('<II', cmd, size) + fixed + encoded.ljust(size - 8 - len(fixed), b'\0')
+
+
+def read_link_info(data) -> List[LinkInfo]:
+    """LinkInfo for every slice of a (thin or universal) Mach-O file."""
+    result = []
+    for base in _slices(data):
+        macho = MachOFile(data, base)
+        install_name, dependencies, rpaths, signed = None, [], [], False
+        for command in macho.commands:
+            if command.cmd == LC_ID_DYLIB or command.cmd in DYLIB_LOAD_COMMANDS or command.cmd == LC_RPATH:
+                start = base + command.offset
+                path = _command_path(bytes(data[start:start + command.size]))
+                if command.cmd == LC_ID_DYLIB:
+                    install_name = path
+                elif command.cmd == LC_RPATH:
+                    rpaths.append(path)
+                else:
+                    dependencies.append(path)
+            elif command.cmd == LC_CODE_SIGNATURE:
+                signed = True
+        padding = _commands_end_limit(macho) - macho.header_size - macho.sizeofcmds
+        result.append(LinkInfo(macho.arch, install_name, dependencies, rpaths, signed, padding))
+    return result
+
+
+def _rewrite_slice(data: bytearray, base: int, edits: DylibEdits) -> bool:
+    macho = MachOFile(data, base)
+    align = 8 if macho.is64 else 4
+    start = base + macho.header_size
+    old_blob = bytes(data[start:start + macho.sizeofcmds])
+
+    commands: List[bytes] = []
+    rpaths: List[str] = []
+    for command in macho.commands:
+        raw = old_blob[command.offset - macho.header_size:command.offset - macho.header_size + command.size]
+        if command.cmd == LC_ID_DYLIB or command.cmd in DYLIB_LOAD_COMMANDS:
+            name = _command_path(raw)
+            new = edits.install_name if command.cmd == LC_ID_DYLIB else edits.changes.get(name)
+            if new is not None and new != name:
+                raw = _encode_path_command(command.cmd, raw[8:DYLIB_COMMAND_SIZE], new, align)
+        elif command.cmd == LC_RPATH:
+            path = _command_path(raw)
+            if path in edits.delete_rpaths:
+                continue
+            new = edits.rpath_changes.get(path)
+            if new is not None and new != path:
+                raw = _encode_path_command(command.cmd, raw[8:RPATH_COMMAND_SIZE], new, align)
+                path = new
+            rpaths.append(path)
+        commands.append(raw)
+    for path in edits.add_rpaths:
+        if path not in rpaths:
+            commands.append(_encode_path_command(LC_RPATH, struct.pack('<I', RPATH_COMMAND_SIZE), path, align))
+            rpaths.append(path)
+
+    new_blob = b''.join(commands)
+    if new_blob == old_blob:
+        return False
+    available = _commands_end_limit(macho) - macho.header_size
+    if len(new_blob) > available:
+        raise HeaderPaddingError(
+            f'load commands need {len(new_blob)} bytes, only {available} available '
+            f'(relink with -headerpad_max_install_names)')
+
+    # Zero what the old commands used beyond the new ones
+    data[start:start + max(len(new_blob), len(old_blob))] = new_blob.ljust(len(old_blob), b'\0')
+    struct.pack_into('<II', data, base + 16, len(commands), len(new_blob))
+    return True
+
+
+def rewrite(data: bytearray, edits: DylibEdits) -> bool:
+    """Apply `edits` to every slice of `data` in place; True if anything changed."""
+    changed = False
+    for base in _slices(data):
+        changed |= _rewrite_slice(data, base, edits)
+    return changed
+
+
+def verify_edits(infos: List[LinkInfo], edits: DylibEdits) -> List[str]:
+    """Ways in which re-parsed slices do not reflect `edits` (empty if they all do)."""
+    problems = []
+    for info in infos:
+        if edits.install_name is not None and info.install_name not in (None, edits.install_name):
+            problems.append(f'{info.arch}: install name is {info.install_name}')
+        for old, new in edits.changes.items():
+            if old in info.dependencies and old != new:
+                problems.append(f'{info.arch}: still depends on {old}')
+        for old, new in edits.rpath_changes.items():
+            if old in info.rpaths and old != new:
+                problems.append(f'{info.arch}: still has rpath {old}')
+        problems.extend(f'{info.arch}: still has rpath {path}'
+                        for path in edits.delete_rpaths if path in info.rpaths)
+        problems.extend(f'{info.arch}: missing rpath {path}'
+                        for path in edits.add_rpaths if path not in info.rpaths)
+    return problems
+
+
+def rewrite_file(path: Path, edits: DylibEdits) -> Tuple[bool, List[LinkInfo]]:
+    """
+    Apply `edits` to a file and verify the result by parsing it again.
+
+    The file is replaced atomically, and only if something changed.
+    Returns (changed, LinkInfo of the result).
+    """
+    data = bytearray(path.read_bytes())
+    changed = rewrite(data, edits)
+    infos = read_link_info(data)
+    problems = verify_edits(infos, edits)
+    if problems:
+        raise ValueError(f'{path.name}: ' + '; '.join(problems))
+    if changed:
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        try:
+            tmp.write_bytes(data)
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+    return changed, infos
+
+
+def print_link_info(path: Path, infos: List[LinkInfo]):
+    for info in infos:
+        print(f'{path} ({info.arch}{", signed" if info.signed else ""}, {info.header_padding} bytes of header padding):')
+        if info.install_name:
+            print(f'  id: {info.install_name}')
+        for dep in info.dependencies:
+            print(f'  {dep}')
+        for rpath in info.rpaths:
+            print(f'  rpath: {rpath}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rewrite dylib install names, dependencies and rpaths.')
+    parser.add_argument('files', nargs='+', help='Mach-O files to edit (or print, without options)')
+    parser.add_argument('-id', dest='install_name', help='Set the install name')
+    parser.add_argument('-change', nargs=2, action='append', default=[], metavar=('OLD', 'NEW'),
+                        help='Change a dependency')
+    parser.add_argument('-rpath', nargs=2, action='append', default=[], metavar=('OLD', 'NEW'),
+                        help='Change an rpath')
+    parser.add_argument('-add_rpath', action='append', default=[], help='Add an rpath')
+    parser.add_argument('-delete_rpath', action='append', default=[], help='Delete an rpath')
+    args = parser.parse_args()
+
+    edits = DylibEdits(args.install_name, dict(args.change), dict(args.rpath),
+                       args.add_rpath, args.delete_rpath)
+    status = 0
+    for name in args.files:
+        path = Path(name)
+        try:
+            if edits:
+                changed, infos = rewrite_file(path, edits)
+                if changed and any(info.signed for info in infos):
+                    print(f'{path}: signature invalidated, re-sign with codesign --force --sign -')
+            else:
+                infos = read_link_info(path.read_bytes())
+        except (OSError, ValueError, struct.error) as e:
+            print(f'{path}: {e}', file=sys.stderr)
+            status = 1
+            continue
+        if not edits:
+            print_link_info(path, infos)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
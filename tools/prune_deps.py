@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Symbol-level dead-dependency analysis of a bundled libvips closure.
+
+从 Dart 绑定实际查找的符号出发，沿动态符号表分析依赖闭包，找出可以删除或延迟加载的库。
+
+Roots are the symbols the Dart bindings look up (`lookup<...>('vips_...')`
+in vips_bindings_generated.dart and libvips_ffi_api/lib/src/bindings).
+Every undefined dynamic symbol of a library is bound to the first library
+in load order (breadth-first from libvips, as ld.so does) that exports it.
+A library is kept if a kept library binds a symbol to it.
+
+The analysis works at library granularity: once any symbol of a library is
+used, all its imports count as used. This is exact for dependencies that
+nothing binds to (droppable: a DT_NEEDED without --as-needed), and for
+optional libvips format backends (poppler, openslide, ImageMagick, ...)
+it reports the libraries that only serve operations the bindings never
+look up (lazy-loadable: build libvips with -Dmodules=enabled, or drop the
+format). Generic entry points such as vips_image_new_from_file dispatch to
+every loader at runtime, so when the bindings look one up, loader backends
+are reported as needed only if the app never opens that format instead
+(and likewise for savers).
+
+ELF only (Linux and Android closures, including --sysroot ones).
+
+Usage:
+    python tools/prune_deps.py
+    python tools/prune_deps.py --sysroot rootfs-arm64/ --arch aarch64 --output output/prune.json
+"""
+
+import argparse
+import json
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from binary_reader import ELF_MAGIC, ElfFile, open_mmap
+
+# Project root
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+BINDING_SOURCES = [
+    PROJECT_ROOT / 'packages/libvips_ffi_core/lib/src/bindings/vips_bindings_generated.dart',
+    PROJECT_ROOT / 'packages/libvips_ffi_api/lib/src/bindings',
+]
+
+# `_lookup<ffi.NativeFunction<...>>('vips_foo')`, possibly across lines
+_LOOKUP_RE = re.compile(r"lookup<[^']*?>>\(\s*'([A-Za-z_]\w*)'")
+
+STB_GLOBAL = 1
+STB_WEAK = 2
+STT_SECTION = 3
+STT_FILE = 4
+
+# Optional libvips format backends: library name prefix -> operations using it.
+# libvips can build each of these as a loadable module (-Dmodules=enabled).
+OPTIONAL_BACKENDS = {
+    'libpoppler-glib': ['pdfload'],
+    'libpdfium': ['pdfload'],
+    'libopenslide': ['openslideload'],
+    'libMagickCore': ['magickload', 'magicksave'],
+    'libMagickWand': ['magickload', 'magicksave'],
+    'libGraphicsMagick': ['magickload', 'magicksave'],
+    'libheif': ['heifload', 'heifsave'],
+    'libjxl': ['jxlload', 'jxlsave'],
+    'libopenjp2': ['jp2kload', 'jp2ksave'],
+    'libcfitsio': ['fitsload', 'fitssave'],
+    'libmatio': ['matload'],
+    'libOpenEXR': ['openexrload'],
+    'librsvg-2': ['svgload'],
+    'libarchive': ['dzsave'],
+    'libnifti': ['niftiload', 'niftisave'],
+}
+
+# Entry points that pick a loader or saver backend at runtime by file name,
+# suffix or content: operation kind -> symbols
+GENERIC_ENTRY_POINTS = {
+    'load': {'vips_image_new_from_file', 'vips_image_new_from_buffer', 'vips_image_new_from_source',
+             'vips_foreign_find_load', 'vips_foreign_find_load_buffer', 'vips_foreign_find_load_source'},
+    'save': {'vips_image_write_to_file', 'vips_image_write_to_buffer', 'vips_image_write_to_target',
+             'vips_foreign_find_save', 'vips_foreign_find_save_buffer', 'vips_foreign_find_save_target'},
+}
+
+
+def binding_symbols(sources: Optional[List[Path]] = None) -> Set[str]:
+    """Native symbols looked up by the Dart bindings."""
+    symbols: Set[str] = set()
+    for source in sources or BINDING_SOURCES:
+        files = sorted(source.rglob('*.dart')) if source.is_dir() else [source]
+        for dart_file in files:
+            text = dart_file.read_text(encoding='utf-8', errors='replace')
+            symbols.update(_LOOKUP_RE.findall(text))
+    return symbols
+
+
+@dataclass
+class LibrarySymbols:
+    """Dynamic symbols of one library."""
+    path: str
+    exports: Set[str] = field(default_factory=set)
+    imports: Set[str] = field(default_factory=set)
+    weak_imports: Set[str] = field(default_factory=set)
+
+
+def read_dynamic_symbols(path: str) -> Optional[LibrarySymbols]:
+    """Exported and imported .dynsym entries of an ELF library."""
+    try:
+        buf = open_mmap(Path(path))
+    except OSError:
+        return None
+    try:
+        if bytes(buf[:4]) != ELF_MAGIC:
+            return None
+        result = LibrarySymbols(path)
+        for sym in ElfFile(buf).symbols(dynamic=True):
+            binding, stype = sym.info >> 4, sym.info & 0xf
+            if not sym.name or binding not in (STB_GLOBAL, STB_WEAK) or stype in (STT_SECTION, STT_FILE):
+                continue
+            if sym.shndx != 0:
+                result.exports.add(sym.name)
+            elif binding == STB_WEAK:
+                result.weak_imports.add(sym.name)
+            else:
+                result.imports.add(sym.name)
+        return result
+    except (struct.error, ValueError, IndexError):
+        return None
+    finally:
+        if hasattr(buf, 'close'):
+            buf.close()
+
+
+@dataclass
+class PruneReport:
+    roots: List[str]
+    used: List[str]
+    droppable: List[str]
+    lazy_loadable: Dict[str, List[str]]  # backend library -> libraries it alone keeps
+    format_only: Dict[str, List[str]]  # same, for backends reachable through generic load/save
+    unused_needed: Dict[str, List[str]]  # library -> DT_NEEDED entries nothing binds to
+    unresolved_roots: List[str]
+    bindings: Dict[str, Dict[str, int]]  # library -> {provider: number of symbols}
+
+    def to_dict(self) -> Dict:
+        return {
+            'roots': self.roots,
+            'used': self.used,
+            'droppable': self.droppable,
+            'lazy_loadable': self.lazy_loadable,
+            'format_only': self.format_only,
+            'unused_needed': self.unused_needed,
+            'unresolved_roots': self.unresolved_roots,
+            'bindings': self.bindings,
+        }
+
+
+def _backend_ops(lib_path: str) -> Optional[List[str]]:
+    name = Path(lib_path).name
+    for prefix, ops in OPTIONAL_BACKENDS.items():
+        if name.startswith(prefix + '.') or name.startswith(prefix + '-'):
+            return ops
+    return None
+
+
+def _reachable(start: Set[str], edges: Dict[str, Set[str]], removed: Set[Tuple[str, str]]) -> Set[str]:
+    seen = set(start)
+    stack = list(start)
+    while stack:
+        lib = stack.pop()
+        for dep in edges.get(lib, ()):
+            if dep not in seen and (lib, dep) not in removed:
+                seen.add(dep)
+                stack.append(dep)
+    return seen
+
+
+def analyze(root: str, levels: List[List[str]], needed_edges: Dict[str, List[str]],
+            roots: Set[str]) -> PruneReport:
+    """
+    Prune a dependency closure.
+
+    `levels` are the breadth-first levels from `root` (load order) and
+    `needed_edges` the DT_NEEDED graph, as built by find_libvips_deps.py.
+    """
+    order = [lib for level in levels for lib in level]
+    symbols = {lib: read_dynamic_symbols(lib) for lib in order}
+    symbols = {lib: s for lib, s in symbols.items() if s is not None}
+
+    providers: Dict[str, str] = {}
+    for lib in order:
+        if lib in symbols:
+            for name in symbols[lib].exports:
+                providers.setdefault(name, lib)
+
+    # Library -> libraries its imports bind to, with the symbols per edge
+    bound: Dict[str, Dict[str, Set[str]]] = {}
+    for lib, syms in symbols.items():
+        edges: Dict[str, Set[str]] = {}
+        for name in syms.imports | syms.weak_imports:
+            provider = providers.get(name)
+            if provider is not None and provider != lib:
+                edges.setdefault(provider, set()).add(name)
+        bound[lib] = edges
+    symbol_edges = {lib: set(edges) for lib, edges in bound.items()}
+
+    # dlsym() on the libvips handle searches libvips and its dependencies
+    start = {providers[name] for name in roots if name in providers} | {root}
+    unresolved = sorted(name for name in roots if name not in providers)
+    used = _reachable(start, symbol_edges, set())
+
+    droppable = [lib for lib in order if lib not in used]
+
+    # Optional backends: cut the edges to each backend, see what else goes
+    lazy: Dict[str, List[str]] = {}
+    format_only: Dict[str, List[str]] = {}
+    root_ops = {name[len('vips_'):] for name in roots if name.startswith('vips_')}
+    dispatched = {kind for kind, names in GENERIC_ENTRY_POINTS.items() if names & roots}
+    for lib in order:
+        ops = _backend_ops(lib)
+        if lib not in used or ops is None:
+            continue
+        if any(op == root_op or root_op.startswith(op + '_') for op in ops for root_op in root_ops):
+            continue
+        # Only libvips itself may need the backend
+        without = _reachable(start - {lib}, symbol_edges, {(root, lib)})
+        if lib not in without:
+            # A generic load/save call reaches the backend for its formats
+            target = format_only if any(op.endswith(kind) for op in ops for kind in dispatched) else lazy
+            target[lib] = sorted(used - without)
+
+    unused_needed = {}
+    for lib, deps in needed_edges.items():
+        unused = [Path(dep).name for dep in deps if dep not in bound.get(lib, {})]
+        if unused and lib in symbols:
+            unused_needed[lib] = unused
+
+    return PruneReport(
+        roots=sorted(roots),
+        used=[lib for lib in order if lib in used],
+        droppable=droppable,
+        lazy_loadable=lazy,
+        format_only=format_only,
+        unused_needed=unused_needed,
+        unresolved_roots=unresolved,
+        bindings={lib: {dep: len(names) for dep, names in sorted(edges.items())}
+                  for lib, edges in bound.items()},
+    )
+
+
+def print_report(report: PruneReport, sizes: Optional[Dict[str, int]] = None):
+    sizes = sizes or {}
+
+    def line(lib: str) -> str:
+        size = sizes.get(lib)
+        return f'  {Path(lib).name:<40} {f"{size / 1024:.0f} KB" if size is not None else "":>10}'
+
+    print('\n' + '-' * 70)
+    print(f' Dead-dependency analysis ({len(report.roots)} looked-up symbols)')
+    print('-' * 70)
+    print(f'Used libraries: {len(report.used)}')
+    if report.unresolved_roots:
+        print(f'Symbols not exported by any library: {len(report.unresolved_roots)}')
+        for name in report.unresolved_roots[:10]:
+            print(f'    {name}')
+        if len(report.unresolved_roots) > 10:
+            print(f'    ... and {len(report.unresolved_roots) - 10} more')
+
+    print(f'\nDroppable (nothing binds to them): {len(report.droppable)}')
+    for lib in report.droppable:
+        print(line(lib))
+
+    print(f'\nLazy-loadable backends (only serve operations the bindings never look up): {len(report.lazy_loadable)}')
+    for backend, libs in sorted(report.lazy_loadable.items()):
+        print(f'  {Path(backend).name} ({", ".join(_backend_ops(backend) or [])}):')
+        for lib in libs:
+            print('  ' + line(lib))
+
+    if report.format_only:
+        print(f'\nNeeded only if the app never opens or writes that format '
+              f'(reachable through generic load/save): {len(report.format_only)}')
+        for backend, libs in sorted(report.format_only.items()):
+            print(f'  {Path(backend).name} ({", ".join(_backend_ops(backend) or [])}):')
+            for lib in libs:
+                print('  ' + line(lib))
+
+    if report.unused_needed:
+        print('\nDT_NEEDED entries with no bound symbols (link with --as-needed):')
+        for lib, deps in sorted(report.unused_needed.items()):
+            print(f'  {Path(lib).name}: {", ".join(deps)}')
+
+
+def main():
+    # Imported here: find_libvips_deps.py imports this module
+    from find_libvips_deps import get_finder
+
+    parser = argparse.ArgumentParser(description='Report libraries of the libvips closure that can be dropped.')
+    parser.add_argument('--sysroot', help='Analyse a closure inside an extracted root (see find_libvips_deps.py)')
+    parser.add_argument('--arch', help='Target arch for --sysroot')
+    parser.add_argument('--output', '-o', help='Write the report as JSON')
+    args = parser.parse_args()
+
+    finder = get_finder(args.sysroot, args.arch)
+    results = finder.run()
+    if 'error' in results:
+        parser.error(results['error'])
+    graph = finder.graph
+    report = analyze(graph.root, graph.levels, graph.edges, binding_symbols())
+    print_report(report, {p: Path(p).stat().st_size for p in graph.edges})
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report.to_dict(), indent=2), encoding='utf-8')
+        print(f'\nReport saved to: {output_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+"""
+Estimate what loading each bundled library costs at DynamicLibrary.open time.
+
+估算每个库在 DynamicLibrary.open 时的加载开销（重定位、导出符号、初始化函数、预链接），并按开销排序。
+
+Read in-process from ELF and Mach-O (thin or universal) files:
+
+- relocations: relative (cheap), symbolic (one symbol lookup each) and
+  PLT/lazy binds (paid at load time only with BIND_NOW), including RELR
+  and Android packed (APS2, DT_ANDROID_RELR) tables;
+- exported and imported dynamic symbols;
+- initialisers: .init_array / DT_INIT, __mod_init_func / __init_offsets;
+- prelink (ELF) / prebinding (Mach-O), TEXTREL and a missing DT_GNU_HASH.
+
+The cost is a rough relative score (see the COST_* weights), meant for
+ranking libraries against each other, not a time. Libraries exporting
+many symbols are flagged: they were probably built without
+-fvisibility=hidden, and every exported function is a root for
+-Wl,--gc-sections / -dead_strip, so unused code is kept too.
+
+Usage:
+    # The libvips closure found by find_libvips_deps.py
+    python tools/startup_cost.py
+
+    # Files or directories (e.g. a copied bundle), or a cross-arch sysroot
+    python tools/startup_cost.py output/libs/
+    python tools/startup_cost.py --sysroot rootfs-arm64/ --arch aarch64 --json output/startup.json
+"""
+
+import argparse
+import json
+import struct
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from binary_reader import (ELF_MAGIC, MH_MAGIC, MH_MAGIC_64, ElfFile, MachOFile,
+                           fat_slices, open_mmap)
+
+# ELF dynamic tags used here
+DT_PLTRELSZ = 2
+DT_HASH = 4
+DT_RELA = 7
+DT_RELASZ = 8
+DT_RELAENT = 9
+DT_INIT = 12
+DT_REL = 17
+DT_RELSZ = 18
+DT_RELENT = 19
+DT_PLTREL = 20
+DT_TEXTREL = 22
+DT_BIND_NOW = 24
+DT_INIT_ARRAYSZ = 27
+DT_FLAGS = 30
+DT_PREINIT_ARRAYSZ = 33
+DT_RELRSZ = 35
+DT_RELR = 36
+DT_RELRENT = 37
+DT_ANDROID_REL = 0x6000000f
+DT_ANDROID_RELSZ = 0x60000010
+DT_ANDROID_RELA = 0x60000011
+DT_ANDROID_RELASZ = 0x60000012
+DT_ANDROID_RELR = 0x6fffe000
+DT_ANDROID_RELRSZ = 0x6fffe001
+DT_ANDROID_RELRENT = 0x6fffe003
+DT_GNU_PRELINKED = 0x6ffffdf5
+DT_GNU_HASH = 0x6ffffef5
+DT_RELACOUNT = 0x6ffffff9
+DT_RELCOUNT = 0x6ffffffa
+DT_FLAGS_1 = 0x6ffffffb
+DF_TEXTREL = 0x4
+DF_BIND_NOW = 0x8
+DF_1_NOW = 0x1
+
+# Android packed relocation (APS2) group flags
+APS2_GROUPED_BY_INFO = 0x1
+APS2_GROUPED_BY_OFFSET_DELTA = 0x2
+APS2_GROUPED_BY_ADDEND = 0x4
+APS2_GROUP_HAS_ADDEND = 0x8
+
+# Mach-O load commands, header flags and section types used here
+LC_DYSYMTAB = 0xb
+LC_DYLD_INFO = 0x22
+LC_DYLD_INFO_ONLY = 0x80000022
+LC_DYLD_CHAINED_FIXUPS = 0x80000034
+MH_BINDATLOAD = 0x8
+MH_PREBOUND = 0x10
+S_MOD_INIT_FUNC_POINTERS = 0x9
+S_INIT_FUNC_OFFSETS = 0x16
+
+# Relative cost weights (one symbolic relocation = 1)
+COST_SYMBOLIC = 1.0
+COST_RELATIVE = 0.05
+COST_LAZY_BIND = 0.1  # resolved on first call unless bound at load
+COST_INIT_FUNC = 25.0
+COST_EXPORT = 0.02  # hash table pages touched by every lookup
+
+# Export-count heuristics for build flags
+VISIBILITY_MAX_EXPORTS = 1000
+GC_SECTIONS_MAX_EXPORTS_PER_KB = 2.0
+
+
+@dataclass
+class LoadCost:
+    """Load-time figures of one library (or one slice of a universal binary)."""
+    path: str
+    format: str
+    arch: str
+    relative_relocs: int = 0
+    symbolic_relocs: int = 0
+    lazy_binds: int = 0
+    bind_now: bool = False
+    exports: int = 0
+    imports: int = 0
+    init_funcs: int = 0
+    text_size: int = 0
+    prelinked: bool = False
+    flags: List[str] = field(default_factory=list)
+
+    @property
+    def cost(self) -> float:
+        lazy = COST_SYMBOLIC if self.bind_now else COST_LAZY_BIND
+        return (self.symbolic_relocs * COST_SYMBOLIC + self.relative_relocs * COST_RELATIVE
+                + self.lazy_binds * lazy + self.init_funcs * COST_INIT_FUNC
+                + self.exports * COST_EXPORT)
+
+    def check_build_flags(self):
+        if self.exports > VISIBILITY_MAX_EXPORTS:
+            self.flags.append(f'{self.exports} exports: built without -fvisibility=hidden?')
+        text_kb = self.text_size / 1024
+        if text_kb and self.exports / text_kb > GC_SECTIONS_MAX_EXPORTS_PER_KB:
+            self.flags.append('exports keep most code alive: --gc-sections/-dead_strip ineffective')
+
+
+def _relr_count(elf: ElfFile, entries: Dict[int, int], tag: int = DT_RELR,
+                size_tag: int = DT_RELRSZ, ent_tag: int = DT_RELRENT) -> int:
+    """Number of relocations encoded in a DT_RELR (or DT_ANDROID_RELR) table."""
+    size = entries.get(size_tag, 0)
+    offset = elf.vaddr_to_offset(entries.get(tag, 0)) if size else None
+    if offset is None:
+        return 0
+    word = entries.get(ent_tag, 8 if elf.is64 else 4)
+    fmt = elf.endian + ('Q' if word == 8 else 'I')
+    count = 0
+    for i in range(size // word):
+        value = struct.unpack_from(fmt, elf.buf, elf.base + offset + i * word)[0]
+        # Even: one address; odd: a bitmap of the following words
+        count += 1 if value & 1 == 0 else bin(value >> 1).count('1')
+    return count
+
+
+def _table_relative_count(elf: ElfFile, entries: Dict[int, int], tag: int, size_tag: int,
+                          entsize: int) -> int:
+    """Relocations without a symbol in a REL/RELA table, for when the linker
+    emitted no DT_RELCOUNT/DT_RELACOUNT."""
+    size = entries.get(size_tag, 0)
+    offset = elf.vaddr_to_offset(entries.get(tag, 0)) if size else None
+    if offset is None or not entsize:
+        return 0
+    fmt, shift = (elf.endian + 'Q', 32) if elf.is64 else (elf.endian + 'I', 8)
+    word = 8 if elf.is64 else 4
+    count = 0
+    for i in range(size // entsize):
+        info = struct.unpack_from(fmt, elf.buf, elf.base + offset + i * entsize + word)[0]
+        count += info >> shift == 0
+    return count
+
+
+def _android_packed_counts(elf: ElfFile, entries: Dict[int, int], tag: int,
+                           size_tag: int) -> Optional[Tuple[int, int]]:
+    """(relative, symbolic) relocations in an Android packed (APS2) table,
+    or None if the table is not in that format."""
+    size = entries.get(size_tag, 0)
+    offset = elf.vaddr_to_offset(entries.get(tag, 0)) if size else None
+    if offset is None:
+        return None
+    data = bytes(elf.buf[elf.base + offset:elf.base + offset + size])
+    if data[:4] != b'APS2':
+        return None
+    shift = 32 if elf.is64 else 8
+    relative = symbolic = 0
+    try:
+        count, pos = _sleb(data, 4)
+        _, pos = _sleb(data, pos)  # initial r_offset
+        done = 0
+        while done < count:
+            group_size, pos = _sleb(data, pos)
+            group_flags, pos = _sleb(data, pos)
+            by_offset = group_flags & APS2_GROUPED_BY_OFFSET_DELTA
+            by_info = group_flags & APS2_GROUPED_BY_INFO
+            has_addend = group_flags & APS2_GROUP_HAS_ADDEND
+            by_addend = has_addend and group_flags & APS2_GROUPED_BY_ADDEND
+            info = 0
+            if by_offset:
+                _, pos = _sleb(data, pos)
+            if by_info:
+                info, pos = _sleb(data, pos)
+            if by_addend:
+                _, pos = _sleb(data, pos)
+            for _ in range(group_size):
+                if not by_offset:
+                    _, pos = _sleb(data, pos)
+                if not by_info:
+                    info, pos = _sleb(data, pos)
+                if has_addend and not by_addend:
+                    _, pos = _sleb(data, pos)
+                # No symbol: a relative relocation
+                if (info & ((1 << 64) - 1)) >> shift:
+                    symbolic += 1
+                else:
+                    relative += 1
+            done += max(group_size, 1)
+    except IndexError:
+        return None
+    return relative, symbolic
+
+
+def profile_elf(path: str, buf) -> LoadCost:
+    elf = ElfFile(buf)
+    entries: Dict[int, int] = {}
+    for tag, value in elf.dynamic_entries():
+        entries.setdefault(tag, value)
+    result = LoadCost(path, 'ELF', elf.arch)
+
+    word = 8 if elf.is64 else 4
+    rela_entry = entries.get(DT_RELAENT) or 3 * word
+    rel_entry = entries.get(DT_RELENT) or 2 * word
+    rela = entries.get(DT_RELASZ, 0) // rela_entry
+    rel = entries.get(DT_RELSZ, 0) // rel_entry
+    # Linkers may omit DT_RELACOUNT/DT_RELCOUNT (the bundled Android libraries do)
+    relative = (entries[DT_RELACOUNT] if DT_RELACOUNT in entries
+                else _table_relative_count(elf, entries, DT_RELA, DT_RELASZ, rela_entry))
+    relative += (entries[DT_RELCOUNT] if DT_RELCOUNT in entries
+                 else _table_relative_count(elf, entries, DT_REL, DT_RELSZ, rel_entry))
+    result.relative_relocs = (relative + _relr_count(elf, entries)
+                              + _relr_count(elf, entries, DT_ANDROID_RELR, DT_ANDROID_RELRSZ, DT_ANDROID_RELRENT))
+    result.symbolic_relocs = max(rela + rel - relative, 0)
+    for tag, size_tag in ((DT_ANDROID_RELA, DT_ANDROID_RELASZ), (DT_ANDROID_REL, DT_ANDROID_RELSZ)):
+        if tag not in entries:
+            continue
+        counts = _android_packed_counts(elf, entries, tag, size_tag)
+        if counts is None:
+            result.flags.append('unknown Android packed relocation format: relocations not counted')
+        else:
+            result.relative_relocs += counts[0]
+            result.symbolic_relocs += counts[1]
+    plt_is_rela = entries.get(DT_PLTREL, DT_RELA if elf.is64 else DT_REL) == DT_RELA
+    plt_entry = 3 * word if plt_is_rela else 2 * word
+    result.lazy_binds = entries.get(DT_PLTRELSZ, 0) // plt_entry
+
+    flags, flags_1 = entries.get(DT_FLAGS, 0), entries.get(DT_FLAGS_1, 0)
+    result.bind_now = DT_BIND_NOW in entries or bool(flags & DF_BIND_NOW) or bool(flags_1 & DF_1_NOW)
+    result.init_funcs = ((entries.get(DT_INIT_ARRAYSZ, 0) + entries.get(DT_PREINIT_ARRAYSZ, 0)) // word
+                         + (1 if DT_INIT in entries else 0))
+    result.prelinked = (DT_GNU_PRELINKED in entries
+                        or any(s.name == '.gnu.prelink_undo' for s in elf.sections))
+
+    for sym in elf.symbols(dynamic=True):
+        if not sym.name or (sym.info >> 4) not in (1, 2):  # STB_GLOBAL, STB_WEAK
+            continue
+        if sym.shndx:
+            result.exports += 1
+        else:
+            result.imports += 1
+    result.text_size = sum(s.size for s in elf.sections if s.name == '.text')
+
+    if DT_TEXTREL in entries or flags & DF_TEXTREL:
+        result.flags.append('TEXTREL: text pages are copied and written at load')
+    if DT_GNU_HASH not in entries and DT_HASH in entries:
+        result.flags.append('no DT_GNU_HASH: slower symbol lookups (link with --hash-style=gnu)')
+    result.check_build_flags()
+    return result
+
+
+def _uleb(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if byte < 0x80:
+            return value, pos
+
+
+def _sleb(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7f) << shift
+        shift += 7
+        if byte < 0x80:
+            if byte & 0x40:
+                value -= 1 << shift
+            return value, pos
+
+
+def _count_rebases(data: bytes) -> int:
+    """Rebases encoded in an LC_DYLD_INFO rebase opcode stream."""
+    count, pos = 0, 0
+    while pos < len(data):
+        opcode, imm = data[pos] & 0xf0, data[pos] & 0x0f
+        pos += 1
+        if opcode == 0x00:  # DONE
+            break
+        if opcode in (0x20, 0x30):  # SET_SEGMENT_AND_OFFSET_ULEB, ADD_ADDR_ULEB
+            _, pos = _uleb(data, pos)
+        elif opcode == 0x50:  # DO_REBASE_IMM_TIMES
+            count += imm
+        elif opcode == 0x60:  # DO_REBASE_ULEB_TIMES
+            times, pos = _uleb(data, pos)
+            count += times
+        elif opcode == 0x70:  # DO_REBASE_ADD_ADDR_ULEB
+            _, pos = _uleb(data, pos)
+            count += 1
+        elif opcode == 0x80:  # DO_REBASE_ULEB_TIMES_SKIPPING_ULEB
+            times, pos = _uleb(data, pos)
+            _, pos = _uleb(data, pos)
+            count += times
+    return count
+
+
+def _count_binds(data: bytes, lazy: bool = False) -> int:
+    """Binds encoded in an LC_DYLD_INFO bind opcode stream."""
+    count, pos = 0, 0
+    while pos < len(data):
+        opcode, imm = data[pos] & 0xf0, data[pos] & 0x0f
+        pos += 1
+        if opcode == 0x00:  # DONE (separates entries in the lazy stream)
+            if lazy:
+                continue
+            break
+        if opcode in (0x20, 0x60, 0x70, 0x80):  # ordinal, addend, segment, add addr
+            _, pos = _uleb(data, pos)
+        elif opcode == 0x40:  # SET_SYMBOL_TRAILING_FLAGS_IMM
+            pos = data.index(b'\0', pos) + 1
+        elif opcode in (0x90, 0xb0):  # DO_BIND, DO_BIND_ADD_ADDR_IMM_SCALED
+            count += 1
+        elif opcode == 0xa0:  # DO_BIND_ADD_ADDR_ULEB
+            _, pos = _uleb(data, pos)
+            count += 1
+        elif opcode == 0xc0:  # DO_BIND_ULEB_TIMES_SKIPPING_ULEB
+            times, pos = _uleb(data, pos)
+            _, pos = _uleb(data, pos)
+            count += times
+        elif opcode == 0xd0 and imm == 0:  # THREADED: SET_BIND_ORDINAL_TABLE_SIZE_ULEB
+            _, pos = _uleb(data, pos)
+    return count
+
+
+# pointer_format -> (stride, next shift, next mask, bind bit)
+_CHAINED_FORMATS = {
+    1: (8, 51, 0x7ff, 62),  # DYLD_CHAINED_PTR_ARM64E
+    2: (4, 51, 0xfff, 63),  # DYLD_CHAINED_PTR_64
+    6: (4, 51, 0xfff, 63),  # DYLD_CHAINED_PTR_64_OFFSET
+    9: (8, 51, 0x7ff, 62),  # DYLD_CHAINED_PTR_ARM64E_USERLAND
+    12: (8, 51, 0x7ff, 62),  # DYLD_CHAINED_PTR_ARM64E_USERLAND24
+}
+
+
+def _count_chained_fixups(macho: MachOFile, dataoff: int) -> Optional[Tuple[int, int]]:
+    """(rebases, binds) by walking LC_DYLD_CHAINED_FIXUPS chains; None if unsupported."""
+    buf, base = macho.buf, macho.base
+    header = base + dataoff
+    starts = header + struct.unpack_from('<I', buf, header + 4)[0]
+    seg_count = struct.unpack_from('<I', buf, starts)[0]
+    rebases = binds = 0
+    for i in range(min(seg_count, len(macho.segments))):
+        seg_info = struct.unpack_from('<I', buf, starts + 4 + i * 4)[0]
+        if not seg_info:
+            continue
+        info = starts + seg_info
+        _, page_size, pointer_format, _, _, page_count = struct.unpack_from('<IHHQIH', buf, info)
+        layout = _CHAINED_FORMATS.get(pointer_format)
+        if layout is None:
+            return None
+        stride, shift, mask, bind_bit = layout
+        for page in range(page_count):
+            page_start = struct.unpack_from('<H', buf, info + 22 + page * 2)[0]
+            if page_start == 0xffff:  # DYLD_CHAINED_PTR_START_NONE
+                continue
+            offset = base + macho.segments[i].fileoff + page * page_size + page_start
+            while True:
+                value = struct.unpack_from('<Q', buf, offset)[0]
+                if value >> bind_bit & 1:
+                    binds += 1
+                else:
+                    rebases += 1
+                step = value >> shift & mask
+                if not step:
+                    break
+                offset += step * stride
+    return rebases, binds
+
+
+def profile_macho(path: str, buf, base: int = 0) -> LoadCost:
+    macho = MachOFile(buf, base)
+    result = LoadCost(path, 'Mach-O', macho.arch)
+    result.bind_now = bool(macho.flags & MH_BINDATLOAD)
+    result.prelinked = bool(macho.flags & MH_PREBOUND)
+    word = 8 if macho.is64 else 4
+
+    for command in macho.commands:
+        at = base + command.offset + 8
+        if command.cmd == LC_DYSYMTAB:
+            fields = struct.unpack_from('<18I', buf, at)
+            result.exports, result.imports = fields[3], fields[5]
+            # Classic relocation entries (old or -r style binaries)
+            result.symbolic_relocs += fields[15]
+            result.relative_relocs += fields[17]
+        elif command.cmd in (LC_DYLD_INFO, LC_DYLD_INFO_ONLY):
+            (rebase_off, rebase_size, bind_off, bind_size, weak_off, weak_size,
+             lazy_off, lazy_size, _, _) = struct.unpack_from('<10I', buf, at)
+
+            def stream(offset: int, size: int) -> bytes:
+                return bytes(buf[base + offset:base + offset + size])
+
+            result.relative_relocs += _count_rebases(stream(rebase_off, rebase_size))
+            result.symbolic_relocs += (_count_binds(stream(bind_off, bind_size))
+                                       + _count_binds(stream(weak_off, weak_size)))
+            result.lazy_binds += _count_binds(stream(lazy_off, lazy_size), lazy=True)
+        elif command.cmd == LC_DYLD_CHAINED_FIXUPS:
+            dataoff = struct.unpack_from('<I', buf, at)[0]
+            counts = _count_chained_fixups(macho, dataoff)
+            if counts is None:
+                result.flags.append('unknown chained fixup format: relocations not counted')
+            else:
+                result.relative_relocs += counts[0]
+                result.symbolic_relocs += counts[1]
+            # Chained fixups are all applied at load
+            result.bind_now = True
+
+    for segment in macho.segments:
+        for section in segment.sections:
+            section_type = section.flags & 0xff
+            if section_type == S_MOD_INIT_FUNC_POINTERS:
+                result.init_funcs += section.size // word
+            elif section_type == S_INIT_FUNC_OFFSETS:
+                result.init_funcs += section.size // 4
+            elif (section.segment, section.name) == ('__TEXT', '__text'):
+                result.text_size += section.size
+
+    result.check_build_flags()
+    return result
+
+
+def profile_file(path: str) -> List[LoadCost]:
+    """Load costs of one file (one entry per slice of a universal binary)."""
+    try:
+        buf = open_mmap(Path(path))
+    except OSError:
+        return []
+    try:
+        magic = bytes(buf[:4])
+        if magic == ELF_MAGIC:
+            return [profile_elf(path, buf)]
+        slices = fat_slices(buf)
+        if slices is not None:
+            return [profile_macho(f'{path}[{arch}]', buf, offset) for arch, offset, _ in slices]
+        if len(magic) == 4 and struct.unpack('<I', magic)[0] in (MH_MAGIC, MH_MAGIC_64):
+            return [profile_macho(path, buf)]
+        return []
+    except (struct.error, ValueError, IndexError):
+        return []
+    finally:
+        if hasattr(buf, 'close'):
+            buf.close()
+
+
+def collect_paths(args: List[str]) -> List[str]:
+    """Files given directly, plus the regular files in given directories."""
+    paths = []
+    for arg in args:
+        p = Path(arg)
+        if p.is_dir():
+            paths.extend(str(f) for f in sorted(p.iterdir()) if f.is_file() and not f.is_symlink())
+        elif p.exists():
+            paths.append(str(p))
+    return paths
+
+
+def print_costs(costs: List[LoadCost], top: Optional[int] = None):
+    total = sum(c.cost for c in costs) or 1.0
+    print('=' * 100)
+    print(' Estimated load cost (relative units; 1 = one symbolic relocation)')
+    print('=' * 100)
+    print(f'  {"Library":<36} {"Cost":>9} {"Share":>6} {"Symbolic":>9} {"Relative":>9} '
+          f'{"Lazy":>7} {"Exports":>8} {"Init":>5}')
+    for c in (costs[:top] if top else costs):
+        print(f'  {Path(c.path).name[:36]:<36} {c.cost:>9.0f} {c.cost / total * 100:>5.1f}% '
+              f'{c.symbolic_relocs:>9} {c.relative_relocs:>9} {c.lazy_binds:>7} {c.exports:>8} '
+              f'{c.init_funcs:>5}')
+        notes = list(c.flags)
+        if c.bind_now:
+            notes.append('bind-now')
+        if c.prelinked:
+            notes.append('prelinked' if c.format == 'ELF' else 'prebound')
+        for note in notes:
+            print(f'      - {note}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank libraries by estimated load cost.')
+    parser.add_argument('paths', nargs='*', help='Libraries or directories (default: the libvips closure)')
+    parser.add_argument('--sysroot', help='Find the closure inside an extracted root (see find_libvips_deps.py)')
+    parser.add_argument('--arch', help='Target arch for --sysroot')
+    parser.add_argument('--top', type=int, default=None, help='Only show the N most expensive libraries')
+    parser.add_argument('--json', help='Write the figures as JSON')
+    args = parser.parse_args()
+
+    if args.paths:
+        paths = collect_paths(args.paths)
+    else:
+        from find_libvips_deps import get_finder
+
+        results = get_finder(args.sysroot, args.arch).run()
+        if 'error' in results:
+            parser.error(results['error'])
+        paths = list(results['libraries'].values())
+
+    costs = [cost for path in paths for cost in profile_file(path)]
+    costs.sort(key=lambda c: -c.cost)
+    print_costs(costs, args.top)
+
+    if args.json:
+        output = Path(args.json)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        data = [dict(asdict(c), cost=round(c.cost, 1)) for c in costs]
+        output.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        print(f'\nSaved to: {output}')
+
+
+if __name__ == '__main__':
+    main()
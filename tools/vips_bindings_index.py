@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Symbol index for vips_bindings_generated.dart.
+
+为 ffigen 生成的 vips_bindings_generated.dart 构建函数符号索引，供各绑定工具共享。
+
+The generated file is scanned once, line by line, and every method of the
+`VipsBindings` class is recorded with its return type, typed parameters,
+looked-up symbol name, native/Dart function types and byte offsets.
+
+The index is cached beside the bindings file, keyed by its sha256. When the
+file changes, only the regions whose per-function hashes differ are parsed
+again.
+
+Usage:
+    python tools/vips_bindings_index.py
+    python tools/vips_bindings_index.py --prefix vips_thumbnail
+    python tools/vips_bindings_index.py --no-cache
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Project root
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+BINDINGS_FILE = (
+    PROJECT_ROOT / "packages/libvips_ffi_core/lib/src/bindings/vips_bindings_generated.dart"
+)
+
+# `  int vips_resize(` or `  ffi.Pointer<VipsSourceCustom> vips_source_custom_new() {`
+_HEADER_RE = re.compile(r'^  (?P<ret>[A-Za-z_][\w.<>, ]*?) (?P<name>\w+)\((?P<empty>\) \{)?$')
+_LOOKUP_RE = re.compile(r"ffi\.NativeFunction<(?P<native>.*)>>\('(?P<symbol>\w+)'\)")
+_AS_FUNCTION_RE = re.compile(r'\.asFunction<(?P<dart>.*)>\(\)')
+
+_CLASS_START = 'class VipsBindings {'
+
+
+@dataclass
+class BindingEntry:
+    """A single function binding in the generated file."""
+    name: str
+    return_type: str
+    params: List[Tuple[str, str]]  # [(type, name), ...]
+    symbol: str
+    native_type: str
+    dart_type: str
+    offset: int  # byte offset of the method header
+    end: int  # byte offset just past the asFunction declaration
+
+
+def _normalize(text: str) -> str:
+    """Collapse a dart-formatted, multi-line type into a single line."""
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'([<(]) | (\.)', r'\1\2', text)
+    text = re.sub(r',? ?([>)])', r'\1', text)
+    return text.strip()
+
+
+class _EntryParser:
+    """Line-oriented state machine turning method blocks into entries."""
+
+    def __init__(self, in_class: bool = False):
+        self.in_class = in_class
+        self._state = 'scan'
+        self._current: Dict = {}
+        self._buffer: List[str] = []
+
+    def feed(self, line: str, offset: int, end: int) -> Optional[BindingEntry]:
+        """Consume one line. Returns an entry when its block is complete."""
+        if not self.in_class:
+            if line.startswith(_CLASS_START):
+                self.in_class = True
+            return None
+
+        state = self._state
+        if state == 'scan':
+            if line.startswith('}'):
+                self.in_class = False
+                return None
+            match = _HEADER_RE.match(line)
+            if match:
+                self._current = {
+                    'name': match.group('name'),
+                    'return_type': match.group('ret'),
+                    'params': [],
+                    'offset': offset,
+                }
+                self._state = 'body' if match.group('empty') else 'params'
+        elif state == 'params':
+            stripped = line.strip()
+            if stripped.startswith(')'):
+                self._state = 'body'
+            elif stripped:
+                parts = stripped.rstrip(',').rsplit(' ', 1)
+                if len(parts) == 2:
+                    self._current['params'].append((parts[0].strip(), parts[1].strip()))
+        elif state == 'body':
+            if line.lstrip().startswith(f"late final _{self._current['name']}Ptr"):
+                self._buffer = [line]
+                self._state = 'lookup'
+                if line.rstrip().endswith("');"):
+                    self._finish_lookup()
+        elif state == 'lookup':
+            self._buffer.append(line)
+            if line.rstrip().endswith("');"):
+                self._finish_lookup()
+        elif state == 'as_function':
+            if not self._buffer and not line.strip():
+                return None
+            self._buffer.append(line)
+            if line.rstrip().endswith('>();'):
+                return self._finish_entry(end)
+        return None
+
+    def _finish_lookup(self):
+        match = _LOOKUP_RE.search(_normalize(' '.join(self._buffer)))
+        if match:
+            self._current['native_type'] = match.group('native')
+            self._current['symbol'] = match.group('symbol')
+            self._state = 'as_function'
+        else:
+            self._state = 'scan'
+        self._buffer = []
+
+    def _finish_entry(self, end: int) -> Optional[BindingEntry]:
+        match = _AS_FUNCTION_RE.search(_normalize(' '.join(self._buffer)))
+        self._buffer = []
+        self._state = 'scan'
+        if not match:
+            return None
+        return BindingEntry(dart_type=match.group('dart'), end=end, **self._current)
+
+
+def iter_entries(
+    stream: BinaryIO,
+    base_offset: int = 0,
+    in_class: bool = False,
+    limit: Optional[int] = None,
+) -> Iterator[BindingEntry]:
+    """Stream entries from a binary file object positioned at `base_offset`.
+
+    If `limit` is given, stop once that byte offset is reached.
+    """
+    parser = _EntryParser(in_class=in_class)
+    offset = base_offset
+    for raw in stream:
+        if limit is not None and offset >= limit:
+            break
+        end = offset + len(raw)
+        entry = parser.feed(raw.decode('utf-8').rstrip('\r\n'), offset, end)
+        if entry is not None:
+            yield entry
+        offset = end
+
+
+class BindingsIndex:
+    """Name-keyed index of the functions in the generated bindings."""
+
+    def __init__(self, entries: Iterable[BindingEntry], source: Path = BINDINGS_FILE):
+        self.source = source
+        self.entries: Dict[str, BindingEntry] = {}
+        for entry in entries:
+            self.entries.setdefault(entry.name, entry)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[BindingEntry]:
+        return iter(self.entries.values())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def get(self, name: str) -> Optional[BindingEntry]:
+        """Look up a function by name."""
+        return self.entries.get(name)
+
+    def names(self, prefix: str = '') -> List[str]:
+        """Sorted function names, optionally restricted to a prefix."""
+        return sorted(name for name in self.entries if name.startswith(prefix))
+
+    def functions(self, prefix: str = 'vips_') -> List[BindingEntry]:
+        """Entries whose name starts with `prefix`, sorted by name."""
+        return [self.entries[name] for name in self.names(prefix)]
+
+
+def parse_bindings(path: Path = BINDINGS_FILE) -> BindingsIndex:
+    """Build an index by scanning the whole bindings file once."""
+    with open(path, 'rb') as f:
+        return BindingsIndex(iter_entries(f), source=path)
+
+
+# ============ On-disk cache ============
+
+CACHE_VERSION = 1
+
+
+def cache_path_for(path: Path) -> Path:
+    """Cache file stored beside the bindings file (hidden, so pub skips it)."""
+    return path.with_name(f'.{path.stem}.index.json.gz')
+
+
+def _segment_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _header_bytes(entry: BindingEntry) -> bytes:
+    """The method header line exactly as ffigen writes it."""
+    tail = '() {' if not entry.params else '('
+    return f'  {entry.return_type} {entry.name}{tail}\n'.encode('utf-8')
+
+
+def _class_body_start(data: bytes) -> int:
+    pos = data.find(_CLASS_START.encode('utf-8'))
+    if pos < 0:
+        return -1
+    newline = data.find(b'\n', pos)
+    return len(data) if newline < 0 else newline + 1
+
+
+def _parse_region(data: bytes, start: int, end: int) -> List[BindingEntry]:
+    """Reparse `data[start:end]`, which must begin between two methods."""
+    if start >= end:
+        return []
+    stream = io.BytesIO(data[start:end])
+    return list(iter_entries(stream, base_offset=start, in_class=True))
+
+
+def _segments(data: bytes, entries: List[BindingEntry]) -> Tuple[List[List], str]:
+    """Per-entry (segment start, hash) plus the hash of the trailing region.
+
+    A segment spans from the end of the previous entry to the end of this
+    one, so doc comments and blank lines between methods are covered too.
+    """
+    segments = []
+    cursor = _class_body_start(data)
+    for entry in entries:
+        segments.append([cursor, _segment_hash(data[cursor:entry.end])])
+        cursor = entry.end
+    return segments, _segment_hash(data[cursor:])
+
+
+def _update_entries(data: bytes, cache: Dict) -> Optional[List[BindingEntry]]:
+    """Reuse unchanged cached entries and reparse only the changed regions.
+
+    Each cached entry is located again by searching for its header line
+    after the previous match; if the bytes of its segment still hash the
+    same it is kept (with shifted offsets). Everything between kept
+    segments is reparsed. Returns None if the class cannot be found.
+    """
+    cursor = _class_body_start(data)
+    if cursor < 0:
+        return None
+
+    entries: List[BindingEntry] = []
+    dirty_start = cursor
+    for row, (seg_start, seg_hash) in zip(cache['entries'], cache['segments']):
+        cached = BindingEntry(*row[:2], [tuple(p) for p in row[2]], *row[3:])
+        pos = data.find(_header_bytes(cached), cursor)
+        if pos < 0:
+            continue
+        new_start = pos - (cached.offset - seg_start)
+        new_end = pos + (cached.end - cached.offset)
+        if new_start < dirty_start or _segment_hash(data[new_start:new_end]) != seg_hash:
+            continue
+        entries.extend(_parse_region(data, dirty_start, new_start))
+        shift = pos - cached.offset
+        cached.offset += shift
+        cached.end += shift
+        entries.append(cached)
+        cursor = dirty_start = new_end
+
+    if _segment_hash(data[dirty_start:]) != cache['tail']:
+        entries.extend(_parse_region(data, dirty_start, len(data)))
+    return entries
+
+
+def _write_cache(cache_file: Path, digest: str, data: bytes, entries: List[BindingEntry]):
+    segments, tail = _segments(data, entries)
+    payload = {
+        'version': CACHE_VERSION,
+        'sha256': digest,
+        'entries': [
+            [e.name, e.return_type, e.params, e.symbol, e.native_type, e.dart_type, e.offset, e.end]
+            for e in entries
+        ],
+        'segments': segments,
+        'tail': tail,
+    }
+    encoded = gzip.compress(json.dumps(payload, separators=(',', ':')).encode('utf-8'), mtime=0)
+    tmp = cache_file.with_name(cache_file.name + '.tmp')
+    try:
+        tmp.write_bytes(encoded)
+        os.replace(tmp, cache_file)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _read_cache(cache_file: Path) -> Optional[Dict]:
+    try:
+        cache = json.loads(gzip.decompress(cache_file.read_bytes()))
+    except (OSError, ValueError, EOFError):
+        return None
+    if cache.get('version') != CACHE_VERSION:
+        return None
+    return cache
+
+
+def load_index(path: Path = BINDINGS_FILE, use_cache: bool = True) -> BindingsIndex:
+    """Return the bindings index for `path`, using the on-disk cache if possible.
+
+    The cache is keyed by the file's sha256. When the hash differs, only the
+    regions whose per-entry hashes changed are reparsed and the cache is
+    rewritten.
+    """
+    if not use_cache:
+        return parse_bindings(path)
+
+    data = path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    cache_file = cache_path_for(path)
+    cache = _read_cache(cache_file)
+
+    if cache is not None and cache['sha256'] == digest:
+        entries = [BindingEntry(*row[:2], [tuple(p) for p in row[2]], *row[3:]) for row in cache['entries']]
+        return BindingsIndex(entries, source=path)
+
+    entries = _update_entries(data, cache) if cache is not None else None
+    if entries is None:
+        entries = list(iter_entries(io.BytesIO(data)))
+    entries.sort(key=lambda e: e.offset)
+    _write_cache(cache_file, digest, data, entries)
+    return BindingsIndex(entries, source=path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index functions in vips_bindings_generated.dart.')
+    parser.add_argument('--file', type=Path, default=BINDINGS_FILE, help='Bindings file to index')
+    parser.add_argument('--prefix', default='vips_', help='Only list functions with this prefix')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not write the on-disk index cache')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = load_index(args.file, use_cache=not args.no_cache)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for entry in index.functions(args.prefix):
+        params = ', '.join(f'{t} {n}' for t, n in entry.params)
+        print(f'{entry.offset:>9}  {entry.return_type} {entry.name}({params})')
+
+    print(f'\n{len(index)} functions indexed in {elapsed:.1f} ms', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Shared function classifier for the vips binding tools.
+
+根据 vips_function_rules.json 对 vips 函数进行分类，并判断是否为可变参数函数。
+
+The declarative rules are compiled once into a prefix trie (internal and
+non-variadic prefixes, exact names) and an Aho-Corasick automaton (category
+substrings). `classify()` then walks each name a single time and returns
+both its category and whether it is variadic.
+
+Usage:
+    python tools/vips_classifier.py vips_resize vips_image_get_width
+"""
+
+import json
+import sys
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+RULES_FILE = Path(__file__).parent / "vips_function_rules.json"
+
+# Flags stored on trie nodes
+_INTERNAL_PREFIX = 1
+_NON_VARIADIC_PREFIX = 2
+_CORE_NAME = 4
+_NON_VARIADIC_NAME = 8
+
+_NO_MATCH = sys.maxsize
+
+
+class _TrieNode:
+    __slots__ = ('children', 'prefix_flags', 'name_flags')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.prefix_flags = 0
+        self.name_flags = 0
+
+
+class FunctionClassifier:
+    """Categorises function names using precompiled rule tables."""
+
+    def __init__(self, rules: Dict):
+        self.categories: List[str] = [c['name'] for c in rules['categories']]
+
+        self._trie = _TrieNode()
+        for prefix in rules.get('internal', {}).get('prefixes', []):
+            self._insert(prefix).prefix_flags |= _INTERNAL_PREFIX
+        for prefix in rules.get('non_variadic', {}).get('prefixes', []):
+            self._insert(prefix).prefix_flags |= _NON_VARIADIC_PREFIX
+        for name in rules.get('core', {}).get('names', []):
+            self._insert(name).name_flags |= _CORE_NAME
+        for name in rules.get('non_variadic', {}).get('names', []):
+            self._insert(name).name_flags |= _NON_VARIADIC_NAME
+
+        self._build_automaton(rules['categories'])
+
+    @classmethod
+    def from_file(cls, path: Path = RULES_FILE) -> 'FunctionClassifier':
+        """Load and compile a rules file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def _insert(self, key: str) -> _TrieNode:
+        node = self._trie
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+        return node
+
+    def _build_automaton(self, categories: List[Dict]):
+        """Aho-Corasick automaton whose outputs are the best category index."""
+        goto: List[Dict[str, int]] = [{}]
+        best: List[int] = [_NO_MATCH]
+        for priority, category in enumerate(categories):
+            for pattern in category['patterns']:
+                state = 0
+                for ch in pattern:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][ch] = nxt
+                        goto.append({})
+                        best.append(_NO_MATCH)
+                    state = nxt
+                best[state] = min(best[state], priority)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                best[nxt] = min(best[nxt], best[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._best = best
+
+    def classify(self, name: str) -> Tuple[str, bool]:
+        """Return (category, is_variadic) for a function name."""
+        goto, fail, best = self._goto, self._fail, self._best
+        node = self._trie
+        prefix_flags = 0
+        state = 0
+        match = _NO_MATCH
+
+        for ch in name:
+            if node is not None:
+                node = node.children.get(ch)
+                if node is not None:
+                    prefix_flags |= node.prefix_flags
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if best[state] < match:
+                match = best[state]
+
+        name_flags = node.name_flags if node is not None else 0
+
+        if prefix_flags & _INTERNAL_PREFIX:
+            category = 'internal'
+        elif name_flags & _CORE_NAME:
+            category = 'core'
+        elif match != _NO_MATCH:
+            category = self.categories[match]
+        else:
+            category = 'other'
+
+        is_variadic = not (prefix_flags & _NON_VARIADIC_PREFIX or name_flags & _NON_VARIADIC_NAME)
+        return category, is_variadic
+
+
+@lru_cache(maxsize=None)
+def get_classifier(path: Path = RULES_FILE) -> FunctionClassifier:
+    """Compiled classifier for `path`, built once per process."""
+    return FunctionClassifier.from_file(path)
+
+
+def classify(name: str) -> Tuple[str, bool]:
+    """Classify a name with the default rules."""
+    return get_classifier().classify(name)
+
+
+def main():
+    for name in sys.argv[1:]:
+        category, is_variadic = classify(name)
+        print(f"{name}: {category}{' [V]' if is_variadic else ''}")
+
+
+if __name__ == '__main__':
+    main()
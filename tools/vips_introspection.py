@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Offline libvips introspection data for the binding generator.
+
+从 libvips C 头文件（以及可选的 `vips` 命令行）提取真实的可变参数签名和各操作的可选参数。
+
+Two kinds of data are kept in vips_introspection.json (committed to the repo):
+
+- `functions`: every `vips_*` prototype found in the C headers, with whether
+  it really ends in `...`. This replaces name-based guessing.
+- `operations`: the optional arguments of each vips operation (keyed by
+  nickname, e.g. `jpegload`), as printed by `vips <nickname>`.
+
+Usage:
+    # Rescan headers, keep the existing operations section
+    python tools/vips_introspection.py
+
+    # Also refresh optional arguments from an installed `vips` binary
+    python tools/vips_introspection.py --from-vips
+"""
+
+import argparse
+import json
+import re
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Project root
+SCRIPT_DIR = Path(__file__).parent
+PROJECT_ROOT = SCRIPT_DIR.parent
+
+HEADERS_DIR = PROJECT_ROOT / "packages/libvips_ffi_core/third_party/include/vips"
+INTROSPECTION_FILE = SCRIPT_DIR / "vips_introspection.json"
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/|//[^\n]*', re.DOTALL)
+_PREPROCESSOR_RE = re.compile(r'^[ \t]*#(?:[^\n]*\\\n)*[^\n]*', re.MULTILINE)
+_PROTOTYPE_RE = re.compile(
+    r'(?<![\w.])(?P<name>vips_\w+)\s*\((?P<params>[^;{}]*?)\)'
+    r'(?P<attrs>(?:\s*[A-Z_][A-Z0-9_]*(?:\s*\([^;{}()]*\))?)*)\s*;'
+)
+_VERSION_RE = re.compile(r'#define\s+VIPS_VERSION\s+"([^"]+)"')
+
+# `   kernel       - Resampling kernel, input VipsKernel`
+_USAGE_ARG_RE = re.compile(r'^\s+(?P<name>[\w-]+)\s+- .*, (?P<direction>input|output) (?P<type>\w+)\s*$')
+# `  VipsForeignLoadJpegFile (jpegload), load jpeg from file`
+_LIST_OP_RE = re.compile(r'^\s*\w+ \((?P<nickname>\w+)\),')
+
+
+def _split_params(params: str) -> List[str]:
+    """Split a C parameter list on top-level commas."""
+    result, depth, current = [], 0, []
+    for ch in params:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            result.append(' '.join(''.join(current).split()))
+            current = []
+        else:
+            current.append(ch)
+    last = ' '.join(''.join(current).split())
+    if last:
+        result.append(last)
+    return result
+
+
+def scan_headers(headers_dir: Path = HEADERS_DIR) -> Tuple[str, Dict[str, Dict]]:
+    """Return (libvips version, {function: info}) from the C headers."""
+    version = 'unknown'
+    functions: Dict[str, Dict] = {}
+    for header in sorted(headers_dir.glob('*.h')):
+        text = header.read_text(encoding='utf-8', errors='replace')
+        match = _VERSION_RE.search(text)
+        if match:
+            version = match.group(1)
+        text = _PREPROCESSOR_RE.sub('', _COMMENT_RE.sub('', text))
+        for match in _PROTOTYPE_RE.finditer(text):
+            params = _split_params(match.group('params'))
+            variadic = bool(params) and params[-1] == '...'
+            functions.setdefault(match.group('name'), {
+                'variadic': variadic,
+                'null_terminated': 'G_GNUC_NULL_TERMINATED' in match.group('attrs'),
+                'header': header.name,
+            })
+    return version, dict(sorted(functions.items()))
+
+
+def _run(cmd: List[str]) -> Optional[str]:
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    return result.stdout + result.stderr
+
+
+def parse_usage(usage: str) -> Dict[str, Dict[str, str]]:
+    """Optional arguments from the usage text printed by `vips <nickname>`."""
+    optional: Dict[str, Dict[str, str]] = {}
+    in_optional = False
+    for line in usage.splitlines():
+        if line.startswith('optional arguments:'):
+            in_optional = True
+            continue
+        if in_optional:
+            if line and not line[0].isspace():
+                break
+            match = _USAGE_ARG_RE.match(line)
+            if match:
+                optional[match.group('name').replace('-', '_')] = {
+                    'type': match.group('type'),
+                    'direction': match.group('direction'),
+                }
+    return optional
+
+
+def dump_operations(vips: str = 'vips') -> Optional[Dict[str, Dict]]:
+    """Query an installed `vips` binary for every operation's optional args."""
+    listing = _run([vips, '-l'])
+    if listing is None:
+        return None
+    operations: Dict[str, Dict] = {}
+    for line in listing.splitlines():
+        match = _LIST_OP_RE.match(line)
+        if not match:
+            continue
+        nickname = match.group('nickname')
+        usage = _run([vips, nickname]) or ''
+        optional = parse_usage(usage)
+        if optional:
+            operations[nickname] = {'optional': optional}
+    return dict(sorted(operations.items()))
+
+
+class Introspection:
+    """Read-only view of vips_introspection.json."""
+
+    def __init__(self, data: Dict):
+        self.version: str = data.get('version', 'unknown')
+        self.functions: Dict[str, Dict] = data.get('functions', {})
+        self.operations: Dict[str, Dict] = data.get('operations', {})
+
+    def is_variadic(self, name: str) -> Optional[bool]:
+        """True/False from the headers, or None if the function is unknown."""
+        info = self.functions.get(name)
+        return None if info is None else info['variadic']
+
+    def optional_args(self, name: str) -> Dict[str, Dict[str, str]]:
+        """Optional arguments of the operation behind a `vips_*` function."""
+        nickname = name[len('vips_'):] if name.startswith('vips_') else name
+        return self.operations.get(nickname, {}).get('optional', {})
+
+
+def load_introspection(path: Path = INTROSPECTION_FILE) -> Optional[Introspection]:
+    """Load the committed introspection data, or None if it is missing."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return Introspection(json.load(f))
+    except FileNotFoundError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Refresh vips_introspection.json from headers and vips.')
+    parser.add_argument('--headers', type=Path, default=HEADERS_DIR, help='Directory containing vips/*.h')
+    parser.add_argument('--output', type=Path, default=INTROSPECTION_FILE, help='JSON file to write')
+    parser.add_argument('--from-vips', action='store_true', help='Refresh optional arguments via `vips -l`')
+    parser.add_argument('--vips', default='vips', help='Path to the vips command line tool')
+    args = parser.parse_args()
+
+    version, functions = scan_headers(args.headers)
+    print(f'libvips {version}: {len(functions)} prototypes, '
+          f'{sum(1 for f in functions.values() if f["variadic"])} variadic')
+
+    existing = {}
+    if args.output.exists():
+        existing = json.loads(args.output.read_text(encoding='utf-8'))
+    operations = existing.get('operations', {})
+    operations_source = existing.get('operations_source', 'none')
+
+    if args.from_vips:
+        dumped = dump_operations(args.vips)
+        if dumped is None:
+            parser.error(f'`{args.vips}` not found')
+        operations = dumped
+        operations_source = f'vips {version} (vips -l)'
+        print(f'{len(operations)} operations with optional arguments')
+
+    data = {
+        'version': version,
+        'operations_source': operations_source,
+        'functions': functions,
+        'operations': operations,
+    }
+    args.output.write_text(json.dumps(data, indent=1, sort_keys=False) + '\n', encoding='utf-8')
+    print(f'Written: {args.output}')
+
+
+if __name__ == '__main__':
+    main()